@@ -14,7 +14,9 @@ from .process import process
 from .metadata import MetadataConstructor
 
 
-def load(name, task='default', data_dir='', verbose=True):
+def load(name, task='default', data_dir='', verbose=True, mmap=False, shared_memory=False,
+         hdf5_options=None, stats=False, stats_filepath=None, image_cache_bytes=None,
+         image_workers=4, image_pool='thread'):
     """Returns a metadata loader of a dataset.
 
     Returns a loader with the necessary functions to manage the selected dataset.
@@ -29,6 +31,32 @@ def load(name, task='default', data_dir='', verbose=True):
         Directory path to store the downloaded data.
     verbose : bool, optional
         Displays text information (if true).
+    mmap : bool, optional
+        Access the fields stored uncompressed with a contiguous layout
+        through zero-copy memory-mapped arrays (if true).
+    shared_memory : bool, optional
+        Share the fields loaded into memory (to_memory) with other
+        processes that load the same dataset/task (if true).
+    hdf5_options : dict, optional
+        Options used to open the metadata hdf5 file: size of the HDF5 raw
+        data chunk cache ('rdcc_nbytes', 'rdcc_nslots', 'rdcc_w0') or the
+        file driver ('driver', e.g. 'core' to read the whole file into
+        memory). Use 'rdcc_nbytes': 'auto' to size the chunk cache from the
+        largest chunk of the file.
+    stats : bool, optional
+        Record statistics of the reads of each field (if true).
+    stats_filepath : str, optional
+        Path of a JSON file where the read statistics are stored at exit
+        (enables the statistics). Worker processes store theirs in
+        '<name>.<pid>.json' files (see merge_stats_files()).
+    image_cache_bytes : int, optional
+        Size (in bytes) of the cache of decoded images read with the
+        loader's images() and iter_images() methods (disabled by default).
+    image_workers : int, optional
+        Number of threads/processes decoding images (0 decodes them in the
+        calling thread).
+    image_pool : str, optional
+        Type of the pool of workers decoding images ('thread' or 'process').
 
     Returns
     -------
@@ -49,13 +77,25 @@ def load(name, task='default', data_dir='', verbose=True):
     >>> print('Dataset name: ', mnist.db_name)
     Dataset name:  mnist
 
+    Load the COCO dataset with a bigger chunk cache for random accesses.
+
+    >>> coco = dbc.load('coco', hdf5_options={'rdcc_nbytes': 'auto'})
+
     """
     assert name, 'Must input a valid dataset name: {}'.format(name)
 
     loader = LoadAPI(name=name,
                      task=task,
                      data_dir=data_dir,
-                     verbose=verbose)
+                     verbose=verbose,
+                     mmap=mmap,
+                     shared_memory=shared_memory,
+                     hdf5_options=hdf5_options,
+                     stats=stats,
+                     stats_filepath=stats_filepath,
+                     image_cache_bytes=image_cache_bytes,
+                     image_workers=image_workers,
+                     image_pool=image_pool)
 
     data_loader = loader.run()
 
@@ -78,6 +118,23 @@ class LoadAPI(object):
         Directory path to store the downloaded data.
     verbose : bool
         Displays text information (if true).
+    mmap : bool, optional
+        Access the fields stored uncompressed with a contiguous layout
+        through zero-copy memory-mapped arrays (if true).
+    shared_memory : bool, optional
+        Share the fields loaded into memory with other processes (if true).
+    hdf5_options : dict, optional
+        Options used to open the metadata hdf5 file.
+    stats : bool, optional
+        Record statistics of the reads of each field (if true).
+    stats_filepath : str, optional
+        Path of a JSON file where the read statistics are stored at exit.
+    image_cache_bytes : int, optional
+        Size (in bytes) of the cache of decoded images.
+    image_workers : int, optional
+        Number of threads/processes decoding images.
+    image_pool : str, optional
+        Type of the pool of workers decoding images ('thread' or 'process').
 
     Attributes
     ----------
@@ -89,6 +146,23 @@ class LoadAPI(object):
         Directory path to store the downloaded data.
     verbose : bool
         Displays text information (if true).
+    mmap : bool
+        Access the fields stored uncompressed with a contiguous layout
+        through zero-copy memory-mapped arrays (if true).
+    shared_memory : bool
+        Share the fields loaded into memory with other processes (if true).
+    hdf5_options : dict
+        Options used to open the metadata hdf5 file.
+    stats : bool
+        Record statistics of the reads of each field (if true).
+    stats_filepath : str
+        Path of a JSON file where the read statistics are stored at exit.
+    image_cache_bytes : int
+        Size (in bytes) of the cache of decoded images.
+    image_workers : int
+        Number of threads/processes decoding images.
+    image_pool : str
+        Type of the pool of workers decoding images.
     cache_manager : CacheManager
         Cache manager object.
     available_datasets_list : list
@@ -96,16 +170,42 @@ class LoadAPI(object):
 
     """
 
-    def __init__(self, name, task, data_dir, verbose):
+    def __init__(self, name, task, data_dir, verbose, mmap=False, shared_memory=False,
+                 hdf5_options=None, stats=False, stats_filepath=None, image_cache_bytes=None,
+                 image_workers=4, image_pool='thread'):
         """Initialize class."""
         assert isinstance(name, str), 'Must input a valid dataset name.'
         assert isinstance(task, str), 'Must input a valid task name.'
         assert isinstance(data_dir, str), 'Must input a valid directory.'
         assert isinstance(verbose, bool), "Must input a valid boolean for verbose."
+        if not isinstance(mmap, bool):
+            raise TypeError("Must input a valid boolean for mmap.")
+        if not isinstance(shared_memory, bool):
+            raise TypeError("Must input a valid boolean for shared_memory.")
+        if hdf5_options is not None and not isinstance(hdf5_options, dict):
+            raise TypeError("Must input a valid dictionary for hdf5_options.")
+        if not isinstance(stats, bool):
+            raise TypeError("Must input a valid boolean for stats.")
+        if stats_filepath is not None and not isinstance(stats_filepath, str):
+            raise TypeError("Must input a valid file path for stats_filepath.")
+        if image_cache_bytes is not None and not isinstance(image_cache_bytes, int):
+            raise TypeError("Must input a valid number of bytes for image_cache_bytes.")
+        if not isinstance(image_workers, int) or image_workers < 0:
+            raise TypeError("Must input a valid number of workers for image_workers.")
+        if not isinstance(image_pool, str):
+            raise TypeError("Must input a valid pool type for image_pool.")
 
         self.name = name
         self.data_dir = data_dir
         self.verbose = verbose
+        self.mmap = mmap
+        self.shared_memory = shared_memory
+        self.hdf5_options = hdf5_options
+        self.stats = stats
+        self.stats_filepath = stats_filepath
+        self.image_cache_bytes = image_cache_bytes
+        self.image_workers = image_workers
+        self.image_pool = image_pool
         self.cache_manager = self.get_cache_manager()
         self.task = self.parse_task_name(task)
 
@@ -199,4 +299,12 @@ class LoadAPI(object):
         return DataLoader(name=self.name,
                           task=self.task,
                           data_dir=data_dir,
-                          hdf5_filepath=hdf5_filepath)
+                          hdf5_filepath=hdf5_filepath,
+                          mmap=self.mmap,
+                          shared_memory=self.shared_memory,
+                          hdf5_options=self.hdf5_options,
+                          stats=self.stats,
+                          stats_filepath=self.stats_filepath,
+                          image_cache_bytes=self.image_cache_bytes,
+                          image_workers=self.image_workers,
+                          image_pool=self.image_pool)
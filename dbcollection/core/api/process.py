@@ -11,7 +11,7 @@ from dbcollection.core.manager import CacheManager
 from .metadata import MetadataConstructor
 
 
-def process(name, task='default', verbose=True):
+def process(name, task='default', verbose=True, num_workers=0):
     """Process a dataset's metadata and stores it to file.
 
     The data is stored a a HSF5 file for each task composing the dataset's tasks.
@@ -20,10 +20,14 @@ def process(name, task='default', verbose=True):
     ----------
     name : str
         Name of the dataset.
-    task : str, optional
-        Name of the task to process.
+    task : str/list/tuple, optional
+        Name of the task to process (or list of task names). The annotation
+        files shared by several tasks are parsed only once.
     verbose : bool, optional
         Displays text information (if true).
+    num_workers : int, optional
+        Number of worker processes used to process the sets of a task. If
+        0, the sets are processed serially.
 
     Raises
     ------
@@ -38,12 +42,21 @@ def process(name, task='default', verbose=True):
 
     >>> dbc.process('cifar10', task='classification', verbose=False)
 
+    Process several tasks of the COCO dataset at once.
+
+    >>> dbc.process('coco', task=['detection_2015', 'detection_2016'])
+
+    Process the sets of a task in parallel with 4 worker processes.
+
+    >>> dbc.process('coco', task='detection_2016', num_workers=4)
+
     """
     assert name, 'Must input a valid dataset name.'
 
     processer = ProcessAPI(name=name,
                            task=task,
-                           verbose=verbose)
+                           verbose=verbose,
+                           num_workers=num_workers)
 
     processer.run()
 
@@ -59,19 +72,23 @@ class ProcessAPI(object):
     ----------
     name : str
         Name of the dataset.
-    task : str
-        Name of the task to process.
+    task : str/list/tuple
+        Name of the task to process (or list of task names).
     verbose : bool
         Displays text information (if true).
+    num_workers : int, optional
+        Number of worker processes used to process the sets of a task.
 
     Attributes
     ----------
     name : str
         Name of the dataset.
-    task : str
-        Name of the task to process.
+    task : str/list/tuple
+        Name of the task to process (or list of task names).
     verbose : bool
         Displays text information (if true).
+    num_workers : int
+        Number of worker processes used to process the sets of a task.
     extract_data : bool
         Flag to extract data (if True).
     cache_manager : CacheManager
@@ -81,18 +98,23 @@ class ProcessAPI(object):
     ------
     KeyError
         If a task does not exist for a dataset.
+    TypeError
+        If the number of workers is not a valid integer.
 
     """
 
-    def __init__(self, name, task, verbose):
+    def __init__(self, name, task, verbose, num_workers=0):
         """Initialize class."""
         assert isinstance(name, str), 'Must input a valid dataset name.'
-        assert isinstance(task, str), 'Must input a valid task name.'
+        assert isinstance(task, (str, list, tuple)), 'Must input a valid task name.'
         assert isinstance(verbose, bool), "Must input a valid boolean for verbose."
+        if not isinstance(num_workers, int) or num_workers < 0:
+            raise TypeError("Must input a valid number of workers for num_workers.")
 
         self.name = name
         self.task = task
         self.verbose = verbose
+        self.num_workers = num_workers
         self.extract_data = False
         self.cache_manager = self.get_cache_manager()
 
@@ -136,8 +158,13 @@ class ProcessAPI(object):
         """Process the dataset's metadata."""
         data_dir = self.get_dataset_data_dir_path()
         cache_dir = self.get_dataset_cache_dir_path()
-        task = self.parse_task_name(self.task)
-        self.check_if_task_exists_in_database(task)
+        if isinstance(self.task, str):
+            task = self.parse_task_name(self.task)
+            self.check_if_task_exists_in_database(task)
+        else:
+            task = [self.parse_task_name(task_name) for task_name in self.task]
+            for task_name in task:
+                self.check_if_task_exists_in_database(task_name)
         return self.process_dataset_metadata(data_dir, cache_dir, task)
 
     def get_dataset_constructor(self):
@@ -173,7 +200,7 @@ class ProcessAPI(object):
         """Check if task exists in the list of available tasks for processing."""
         if not self.exists_task(task):
             raise KeyError('The task \'{}\' does not exists for loading/processing.'
-                           .format(self.task))
+                           .format(task))
 
     def exists_task(self, task):
         """Checks if a task exists for a dataset."""
@@ -185,7 +212,8 @@ class ProcessAPI(object):
         db = constructor(data_path=data_dir,
                          cache_path=cache_dir,
                          extract_data=self.extract_data,
-                         verbose=self.verbose)
+                         verbose=self.verbose,
+                         num_workers=self.num_workers)
         task_info = db.process(task)
         return task_info
 
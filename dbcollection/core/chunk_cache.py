@@ -0,0 +1,189 @@
+"""
+Decompressed chunk cache for on-disk metadata reads.
+"""
+
+
+import os
+import numbers
+import threading
+from collections import OrderedDict
+
+
+class ChunkCache(object):
+    """Byte-bounded LRU cache of decompressed blocks of rows.
+
+    Reading a single row from a compressed hdf5 dataset forces the HDF5
+    library to decompress the entire chunk that contains it. This class
+    keeps the decompressed blocks of rows (one block per chunk row range)
+    in memory so neighbouring rows can be served without touching the file
+    again. The least recently used blocks are evicted once the total size
+    of the stored blocks exceeds the byte budget.
+
+    A single cache can be shared by several fields/sets, in which case the
+    byte budget is shared by all of them.
+
+    Parameters
+    ----------
+    max_bytes : int/np.integer
+        Maximum number of bytes of the stored blocks.
+
+    Attributes
+    ----------
+    max_bytes : int
+        Maximum number of bytes of the stored blocks.
+    nbytes : int
+        Number of bytes currently stored in the cache.
+    hits : int
+        Number of block requests served from the cache.
+    misses : int
+        Number of block requests that required reading from disk.
+    evictions : int
+        Number of blocks evicted from the cache.
+
+    """
+
+    def __init__(self, max_bytes):
+        """Initialize class."""
+        assert isinstance(max_bytes, numbers.Integral), 'Must input a valid number of bytes.'
+        assert max_bytes > 0, 'The cache size must be greater than zero.'
+
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get_block(self, key, read_fn):
+        """Returns a block of data from the cache or reads it from disk.
+
+        Parameters
+        ----------
+        key : tuple
+            Unique identifier of the block.
+        read_fn : function
+            Function that reads the block from disk when it is not cached.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only numpy array with the data of the block.
+
+        """
+        block = self.lookup(key)
+        if block is None:
+            block = self.add_block(key, read_fn())
+        return block
+
+    def lookup(self, key):
+        """Returns a block of data from the cache (None if it is not cached).
+
+        Parameters
+        ----------
+        key : tuple
+            Unique identifier of the block.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only numpy array with the data of the block.
+
+        """
+        self._check_fork()
+        with self._lock:
+            block = self._blocks.pop(key, None)
+            if block is not None:
+                self._blocks[key] = block  # mark as most recently used
+                self.hits += 1
+                return block
+            self.misses += 1
+        return None
+
+    def _check_fork(self):
+        """Replaces the lock when used in a forked process.
+
+        The lock could have been held by another thread of the parent
+        process when it forked. The cached blocks remain valid.
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+
+    def add_block(self, key, block):
+        """Stores a block of data in the cache (evicting the least recently used).
+
+        Parameters
+        ----------
+        key : tuple
+            Unique identifier of the block.
+        block : np.ndarray
+            Data of the block (it is made read-only).
+
+        Returns
+        -------
+        np.ndarray
+            Read-only numpy array with the data of the block.
+
+        """
+        block.flags.writeable = False
+        if block.nbytes > self.max_bytes:
+            return block  # blocks bigger than the budget are never stored
+        with self._lock:
+            if key in self._blocks:
+                return block
+            self._blocks[key] = block
+            self.nbytes += block.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._blocks.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+        return block
+
+    def clear(self):
+        """Removes all blocks from the cache and resets the counters."""
+        with self._lock:
+            self._blocks.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """Returns the usage counters of the cache.
+
+        Returns
+        -------
+        dict
+            Number of hits, misses, evictions, stored blocks and
+            bytes used/available of the cache.
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "blocks": len(self._blocks),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes
+            }
+
+    def __getstate__(self):
+        """Pickles only the size of the cache (not the cached blocks)."""
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_bytes"])
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def __str__(self):
+        s = 'ChunkCache: blocks<{}>, nbytes<{}/{}>, hits<{}>, misses<{}>' \
+            .format(len(self._blocks), self.nbytes, self.max_bytes, self.hits, self.misses)
+        return s
+
+    def __repr__(self):
+        return str(self)
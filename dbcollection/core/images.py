@@ -0,0 +1,183 @@
+"""
+Parallel reading of the image files of a dataset.
+"""
+
+
+import os
+from collections import OrderedDict
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+from PIL import Image
+
+from dbcollection.core.chunk_cache import ChunkCache
+
+
+POOL_TYPES = ('thread', 'process')
+
+
+def load_image(filepath, size=None, mode='RGB'):
+    """Decodes an image file into a numpy array.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the image file.
+    size : tuple, optional
+        Size (height, width) of the output image. If None, the image is
+        not resized.
+    mode : str, optional
+        PIL mode of the output image (e.g. 'RGB' or 'L'). If None, the mode
+        of the file is kept.
+
+    Returns
+    -------
+    np.ndarray
+        Array of pixels (height x width [x channels]).
+
+    """
+    with Image.open(filepath) as image:
+        if mode is not None and image.mode != mode:
+            image = image.convert(mode)
+        if size is not None:
+            image = image.resize((size[1], size[0]), Image.BILINEAR)
+        return np.array(image)
+
+
+def _load_image_args(args):
+    return load_image(*args)
+
+
+class ImageReader(object):
+    """Reads (decodes) batches of image files in parallel.
+
+    The image files of a batch are decoded concurrently by a pool of threads
+    (PIL releases the GIL while decoding) or processes, and optionally
+    resized to a fixed size. The decoded arrays are kept in a byte-bounded
+    LRU cache (see ChunkCache), so the images of small datasets are decoded
+    only once across epochs.
+
+    Parameters
+    ----------
+    cache_bytes : int, optional
+        Size (in bytes) of the cache of decoded images. The cache is
+        disabled by default.
+    num_workers : int, optional
+        Number of threads/processes decoding images. If 0, the images are
+        decoded in the calling thread.
+    pool : str, optional
+        Type of the pool of workers ('thread' or 'process').
+    mode : str, optional
+        PIL mode of the decoded images (e.g. 'RGB' or 'L'). If None, the
+        mode of each file is kept.
+
+    Attributes
+    ----------
+    cache : ChunkCache
+        Cache of decoded images (None if disabled).
+    num_workers : int
+        Number of threads/processes decoding images.
+    pool : str
+        Type of the pool of workers.
+    mode : str
+        PIL mode of the decoded images.
+
+    Raises
+    ------
+    ValueError
+        If the pool type is not valid.
+
+    """
+
+    def __init__(self, cache_bytes=None, num_workers=4, pool='thread', mode='RGB'):
+        """Initialize class."""
+        assert num_workers >= 0, 'Must input a valid number of workers.'
+        if pool not in POOL_TYPES:
+            raise ValueError('Invalid pool type \'{}\'. Valid types: {}'.format(pool, POOL_TYPES))
+
+        self.cache = ChunkCache(cache_bytes) if cache_bytes else None
+        self.num_workers = num_workers
+        self.pool = pool
+        self.mode = mode
+        self._workers = None
+        self._pid = os.getpid()
+
+    def _get_workers(self):
+        """Pool of workers, created on first use (and again in forked processes)."""
+        if self._workers is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            if self.pool == 'process':
+                self._workers = Pool(self.num_workers)
+            else:
+                self._workers = ThreadPool(self.num_workers)
+        return self._workers
+
+    def read(self, filepaths, size=None):
+        """Decodes a list of image files.
+
+        Parameters
+        ----------
+        filepaths : list/tuple
+            Paths of the image files.
+        size : tuple, optional
+            Size (height, width) of the output images.
+
+        Returns
+        -------
+        list
+            Array of pixels of each image (read-only if cached).
+
+        """
+        size = tuple(size) if size is not None else None
+        keys = [(filepath, size, self.mode) for filepath in filepaths]
+        images = [self.cache.lookup(key) if self.cache is not None else None for key in keys]
+        missing = list(OrderedDict.fromkeys(key for key, image in zip(keys, images)
+                                            if image is None))
+        if missing:
+            decoded = dict(zip(missing, self._decode(missing)))
+            images = [decoded[key] if image is None else image
+                      for key, image in zip(keys, images)]
+        return images
+
+    def _decode(self, keys):
+        if self.num_workers == 0 or len(keys) == 1:
+            images = [_load_image_args(key) for key in keys]
+        else:
+            images = self._get_workers().map(_load_image_args, keys)
+        if self.cache is not None:
+            images = [self.cache.add_block(key, image) for key, image in zip(keys, images)]
+        return images
+
+    def close(self):
+        """Stops the workers of the pool.
+
+        The reader can still be used: a new pool is created on the next read.
+        """
+        if self._workers is not None and self._pid == os.getpid():
+            self._workers.terminate()
+            self._workers.join()
+        self._workers = None
+
+    def __del__(self):
+        if getattr(self, '_workers', None) is not None:
+            self.close()
+
+    def __getstate__(self):
+        """Pickles only the options of the reader (not the workers or cached images)."""
+        return {
+            "cache_bytes": self.cache.max_bytes if self.cache is not None else None,
+            "num_workers": self.num_workers,
+            "pool": self.pool,
+            "mode": self.mode
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __str__(self):
+        return 'ImageReader: workers<{} {}>, mode<{}>, cache<{}>'.format(
+            self.num_workers, self.pool, self.mode, self.cache)
+
+    def __repr__(self):
+        return str(self)
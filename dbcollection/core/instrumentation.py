@@ -0,0 +1,361 @@
+"""
+Opt-in instrumentation of the read path of the metadata loaders.
+"""
+
+
+import os
+import re
+import glob
+import json
+import time
+import functools
+import threading
+from multiprocessing.util import Finalize
+import numpy as np
+
+
+LATENCY_BUCKETS_US = tuple(2 ** i for i in range(25))  # 1us to ~16s (upper bounds)
+
+
+class AccessStats(object):
+    """Per (set, field) statistics of the data read through the loaders.
+
+    Records the number of calls, rows and bytes returned, hits of the chunk
+    cache and a histogram of the latency (in power of two microsecond
+    buckets) of the instrumented read methods of each (set, field) pair.
+
+    Loaders only record statistics when an AccessStats object is given to
+    them, otherwise the instrumented methods run with a single extra check.
+
+    Each process records its own statistics. Copies of the object in other
+    processes (forked or unpickled, e.g. in data loading workers) start
+    empty and store their statistics at exit in a file of their own,
+    '<name>.<pid>.json' next to 'filepath', so no process overwrites the
+    statistics of another one. The statistics of all processes are combined
+    with merge_stats_files().
+
+    Parameters
+    ----------
+    filepath : str, optional
+        Path of a JSON file where the statistics are stored when the
+        process exits.
+
+    Attributes
+    ----------
+    filepath : str
+        Path of the JSON file where the statistics of the process that
+        created the object are stored at exit.
+
+    """
+
+    def __init__(self, filepath=None):
+        """Initialize class."""
+        self.filepath = filepath
+        self._fields = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._owner_pid = self._pid
+        if filepath:
+            self._register_dump_at_exit()
+
+    def _register_dump_at_exit(self):
+        # multiprocessing runs its finalizers at the exit of the main process
+        # and of its worker processes (which do not run the atexit handlers)
+        Finalize(None, self._dump_at_exit, exitpriority=10)
+
+    def record(self, set_name, field, rows, nbytes, seconds, cache_hits=0):
+        """Records a read of a field.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        field : str
+            Name of the field (or of the method of the set).
+        rows : int
+            Number of rows read.
+        nbytes : int
+            Number of bytes returned.
+        seconds : float
+            Duration of the read.
+        cache_hits : int, optional
+            Number of blocks served from the chunk cache.
+
+        """
+        self._check_fork()
+        bucket = min(np.searchsorted(LATENCY_BUCKETS_US, seconds * 1e6), len(LATENCY_BUCKETS_US))
+        with self._lock:
+            stats = self._fields.get((set_name, field))
+            if stats is None:
+                stats = self._fields[(set_name, field)] = {
+                    "calls": 0,
+                    "rows": 0,
+                    "nbytes": 0,
+                    "cache_hits": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "latency_histogram": [0] * (len(LATENCY_BUCKETS_US) + 1)
+                }
+            stats["calls"] += 1
+            stats["rows"] += rows
+            stats["nbytes"] += nbytes
+            stats["cache_hits"] += cache_hits
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["latency_histogram"][bucket] += 1
+
+    def _check_fork(self):
+        """Starts with empty statistics (and a new lock) in a forked process."""
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            self._fields = {}
+            if self.filepath:
+                self._register_dump_at_exit()
+
+    def to_dict(self, set_name=None):
+        """Returns the recorded statistics.
+
+        Parameters
+        ----------
+        set_name : str, optional
+            Name of the set. If not given, returns the statistics of all sets.
+
+        Returns
+        -------
+        dict
+            Statistics of each field of each set ({set: {field: stats}}).
+            The latency histogram maps the upper bound (in microseconds) of
+            each bucket with reads to its number of reads.
+
+        """
+        self._check_fork()
+        output = {}
+        with self._lock:
+            for (set_, field), stats in self._fields.items():
+                if set_name is not None and set_ != set_name:
+                    continue
+                field_stats = dict(stats)
+                field_stats["latency_histogram"] = _get_histogram_dict(stats["latency_histogram"])
+                output.setdefault(set_, {})[field] = field_stats
+        return output
+
+    def clear(self):
+        """Removes all recorded statistics."""
+        with self._lock:
+            self._fields = {}
+
+    def dump(self, filepath=None):
+        """Stores the statistics in a JSON file.
+
+        Parameters
+        ----------
+        filepath : str, optional
+            Path of the JSON file. Defaults to the file of the current
+            process (see get_process_filepath()).
+
+        """
+        filepath = filepath or self.get_process_filepath()
+        assert filepath, 'Must input a valid file path.'
+        with open(filepath, 'w') as file_json:
+            json.dump(self.to_dict(), file_json, sort_keys=True, indent=4)
+
+    def get_process_filepath(self):
+        """Returns the path of the JSON file of the statistics of the current process.
+
+        This is 'filepath' for the process that created the object and
+        '<name>.<pid>.json' for any other process (None if 'filepath' is not set).
+        """
+        if not self.filepath or os.getpid() == self._owner_pid:
+            return self.filepath
+        root, ext = os.path.splitext(self.filepath)
+        return '{}.{}{}'.format(root, os.getpid(), ext or '.json')
+
+    def _dump_at_exit(self):
+        if self._pid == os.getpid():
+            self.dump()
+
+    def print_info(self, set_name=None):
+        """Prints a summary of the statistics to the screen.
+
+        Parameters
+        ----------
+        set_name : str, optional
+            Name of the set. If not given, prints the statistics of all sets.
+
+        """
+        stats = self.to_dict(set_name)
+        print('\n> Read statistics:')
+        if not stats:
+            print('   - No reads recorded.')
+        for set_ in sorted(stats):
+            for field in sorted(stats[set_]):
+                field_stats = stats[set_][field]
+                print('   - {}/{}: calls: {}, rows: {}, bytes: {}, cache hits: {}, '
+                      'mean: {:.1f}us, p50: <{}us, p99: <{}us, max: {:.1f}us'.format(
+                          set_, field, field_stats["calls"], field_stats["rows"],
+                          field_stats["nbytes"], field_stats["cache_hits"],
+                          field_stats["total_seconds"] / field_stats["calls"] * 1e6,
+                          _get_percentile(field_stats["latency_histogram"], 0.5),
+                          _get_percentile(field_stats["latency_histogram"], 0.99),
+                          field_stats["max_seconds"] * 1e6))
+
+    def __getstate__(self):
+        """Pickled copies start with empty statistics (see get_process_filepath())."""
+        return {"filepath": self.filepath, "owner_pid": self._owner_pid}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.filepath = state["filepath"]
+        self._owner_pid = state["owner_pid"]
+        # copies in the process that owns the file must not overwrite it
+        if self.filepath and self._owner_pid != os.getpid():
+            self._register_dump_at_exit()
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __str__(self):
+        return 'AccessStats: fields<{}>'.format(len(self._fields))
+
+    def __repr__(self):
+        return str(self)
+
+
+def merge_stats_files(filepath):
+    """Combines the statistics stored by all processes for a file path.
+
+    Reads the statistics stored in 'filepath' by the process that created
+    the AccessStats object and in the '<name>.<pid>.json' files stored by
+    the other processes (e.g. data loading workers). The counters of each
+    field are summed, the maximum latency is the maximum of all processes
+    and the latency histograms are summed bucket by bucket.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the JSON file given to AccessStats.
+
+    Returns
+    -------
+    dict
+        Combined statistics of each field of each set ({set: {field: stats}}).
+
+    """
+    assert filepath, 'Must input a valid file path.'
+    root, ext = os.path.splitext(filepath)
+    ext = ext or '.json'
+    pattern = re.compile(re.escape(root) + r'\.\d+' + re.escape(ext) + '$')
+    filepaths = [filepath] if os.path.exists(filepath) else []
+    filepaths += sorted(path for path in glob.glob('{}.*{}'.format(root, ext))
+                        if pattern.match(path))
+
+    output = {}
+    for path in filepaths:
+        with open(path, 'r') as file_json:
+            stats = json.load(file_json)
+        for set_name, fields in stats.items():
+            for field, field_stats in fields.items():
+                merged = output.setdefault(set_name, {}).get(field)
+                if merged is None:
+                    output[set_name][field] = field_stats
+                    continue
+                for key in ("calls", "rows", "nbytes", "cache_hits", "total_seconds"):
+                    merged[key] += field_stats[key]
+                merged["max_seconds"] = max(merged["max_seconds"], field_stats["max_seconds"])
+                for bound, count in field_stats["latency_histogram"].items():
+                    merged["latency_histogram"][bound] = \
+                        merged["latency_histogram"].get(bound, 0) + count
+    return output
+
+
+def _get_histogram_dict(histogram):
+    bounds = [str(bound) for bound in LATENCY_BUCKETS_US] + ['inf']
+    return dict((bound, count) for bound, count in zip(bounds, histogram) if count)
+
+
+def _get_percentile(histogram, quantile):
+    """Returns the upper bound of the histogram bucket containing a percentile."""
+    buckets = sorted(histogram.items(), key=lambda item: float(item[0]))
+    total = sum(count for _, count in buckets)
+    accumulated = 0
+    for bound, count in buckets:
+        accumulated += count
+        if accumulated >= quantile * total:
+            return bound
+    return 'inf'
+
+
+def instrument(count_rows):
+    """Decorator that records the statistics of a read method of a loader.
+
+    The loader must have 'stats' and 'chunk_cache' attributes and a
+    '_get_stats_key()' method returning its (set, field) pair.
+
+    Parameters
+    ----------
+    count_rows : function
+        Function that receives the index of the read and the loader and
+        returns the number of rows read.
+
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, index=None, *args, **kwargs):
+            stats = self.stats
+            if stats is None:
+                return method(self, index, *args, **kwargs)
+            chunk_cache = self.chunk_cache
+            hits = chunk_cache.hits if chunk_cache is not None else 0
+            start = time.time()
+            output = method(self, index, *args, **kwargs)
+            seconds = time.time() - start
+            if chunk_cache is not None:
+                hits = chunk_cache.hits - hits
+            set_name, field = self._get_stats_key()
+            stats.record(set_name, field, count_rows(index, self), _get_nbytes(output),
+                         seconds, hits)
+            return output
+        return wrapper
+    return decorator
+
+
+def count_index_rows(index, loader):
+    """Number of rows of an index of the get() methods (None, int or list of ints)."""
+    if index is None:
+        return _get_num_rows(loader)
+    if isinstance(index, (int, np.integer)):
+        return 1
+    return len(index) or _get_num_rows(loader)  # empty lists retrieve all rows
+
+
+def count_item_rows(index, loader):
+    """Number of rows of an index of the __getitem__() methods."""
+    if isinstance(index, tuple):
+        index = index[0] if index else slice(None)
+    if isinstance(index, (int, np.integer)):
+        return 1
+    if isinstance(index, slice):
+        return len(range(*index.indices(_get_num_rows(loader))))
+    index = np.asarray(index)
+    if index.dtype == np.bool_:
+        return int(index.sum())
+    return index.size
+
+
+def _get_num_rows(loader):
+    try:
+        return len(loader)
+    except IndexError:
+        return 1  # scalar fields
+
+
+def _get_nbytes(data):
+    """Number of bytes of the arrays of a (nested list of) output(s)."""
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, (list, tuple)):
+        return sum(_get_nbytes(value) for value in data)
+    if isinstance(data, str):
+        return len(data)
+    return 0
@@ -3,10 +3,248 @@ Dataset's metadata loader classes.
 """
 
 
+import os
+import sys
+import json
 import h5py
+import numpy as np
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from dbcollection.core.chunk_cache import ChunkCache
+from dbcollection.core.images import ImageReader
+from dbcollection.core.instrumentation import (AccessStats, instrument, count_index_rows,
+                                               count_item_rows)
+from dbcollection.core.object_index import ObjectIndex
+from dbcollection.core.sampler import ChunkShuffleSampler, get_aligned_chunk_rows
+from dbcollection.core.shard import DataLoaderShard
+from dbcollection.core.shared_memory import SharedArray, get_segment_name
+from dbcollection.core.subset import SetLoaderSubset, get_object_aligned_fields
 from dbcollection.utils.string_ascii import convert_ascii_to_str
 
 
+class LazyDict(Mapping):
+    """Read-only dictionary whose values are created on first access.
+
+    The keys are known beforehand, but the values are only constructed
+    (and then cached) when they are accessed for the first time. This
+    avoids paying the cost of building loaders for sets/fields that are
+    never used.
+
+    Parameters
+    ----------
+    keys : tuple
+        List of keys of the dictionary.
+    constructor : function
+        Function that receives a key and returns its value.
+
+    """
+
+    def __init__(self, keys, constructor):
+        """Initialize class."""
+        self._keys = tuple(keys)
+        self._key_set = frozenset(self._keys)
+        self._constructor = constructor
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self._key_set:
+                raise
+        value = self._constructor(key)
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self._key_set
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def is_loaded(self, key):
+        """Returns True if the value of a key has already been constructed."""
+        return key in self._values
+
+    def loaded(self):
+        """Returns the keys whose values have already been constructed."""
+        return tuple(key for key in self._keys if key in self._values)
+
+    def __repr__(self):
+        return 'LazyDict({}, loaded={})'.format(list(self._keys), list(self.loaded()))
+
+
+class HDF5FileHandler(object):
+    """Process-aware handler of a hdf5 file opened in read mode.
+
+    hdf5 file handlers are not safe to use across a fork() of the process.
+    This class keeps track of the process that opened the file and,
+    when accessed from a different process (e.g., a data loading worker),
+    it transparently reopens the file. Objects that keep handlers of
+    groups/datasets of the file can compare the 'generation' counter to
+    know when their handlers must be fetched again.
+
+    The file can be opened with custom options (passed to h5py.File), for
+    example, to tune the raw data chunk cache of the HDF5 library
+    ('rdcc_nbytes', 'rdcc_nslots', 'rdcc_w0') or to select a file driver
+    (e.g. 'core' to read the whole file into memory). Setting 'rdcc_nbytes'
+    to 'auto' sizes the chunk cache (and its number of slots, if not given)
+    from the sizes of the chunks of the datasets in the file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the hdf5 file stored on disk.
+    hdf5_file : h5py._hl.files.File, optional
+        Handler of the file opened by the current process.
+    options : dict, optional
+        Options used to open the file.
+
+    Attributes
+    ----------
+    filepath : str
+        Path of the hdf5 file stored on disk.
+    options : dict
+        Options used to open the file (as given by the user).
+    generation : int
+        Number of times the file has been reopened.
+
+    """
+
+    def __init__(self, filepath, hdf5_file=None, options=None):
+        """Initialize class."""
+        assert filepath, 'Must input a valid path for the hdf5 file.'
+
+        self.filepath = filepath
+        self.options = options
+        self.generation = 0
+        self._pid = os.getpid()
+        self._file_options = self._get_file_options()
+        self._file = hdf5_file if hdf5_file is not None else self._open()
+
+    @classmethod
+    def from_hdf5_object(cls, hdf5_object):
+        """Returns a handler for the file of a hdf5 group/dataset."""
+        hdf5_file = hdf5_object.file
+        return cls(hdf5_file.filename, hdf5_file)
+
+    def _get_file_options(self):
+        """Returns the keyword arguments used to open the file with h5py.File."""
+        options = dict(self.options or {})
+        if options.get('rdcc_nbytes') == 'auto':
+            auto_options = get_auto_chunk_cache_options(self.filepath)
+            options['rdcc_nbytes'] = auto_options['rdcc_nbytes']
+            options.setdefault('rdcc_nslots', auto_options['rdcc_nslots'])
+        return options
+
+    def _open(self):
+        """Opens the file with the raw data chunk cache set on its access property list.
+
+        The chunk cache options are not passed to h5py.File, since older h5py
+        versions (< 2.9) ignore them or pass them to the file driver.
+        """
+        options = dict(self._file_options)
+        cache_options = dict((key, options.pop(key)) for key in CHUNK_CACHE_OPTIONS
+                             if options.get(key) is not None)
+        hdf5_file = h5py.File(self.filepath, 'r', libver='latest', **options)
+        if not cache_options:
+            return hdf5_file
+
+        # reopen the file with a copy of its access property list (driver and
+        # library version as set by h5py) with the requested cache sizes
+        fapl = hdf5_file.id.get_access_plist()
+        nmdc, nslots, nbytes, w0 = fapl.get_cache()
+        fapl.set_cache(nmdc,
+                       int(cache_options.get('rdcc_nslots', nslots)),
+                       int(cache_options.get('rdcc_nbytes', nbytes)),
+                       float(cache_options.get('rdcc_w0', w0)))
+        hdf5_file.close()
+        filepath = self.filepath
+        if not isinstance(filepath, bytes):
+            filepath = filepath.encode(sys.getfilesystemencoding())
+        return h5py.File(h5py.h5f.open(filepath, h5py.h5f.ACC_RDONLY, fapl=fapl))
+
+    @property
+    def file(self):
+        """hdf5 file handler that is valid for the current process."""
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._file = self._open()
+            self.generation += 1
+        return self._file
+
+    def __getitem__(self, name):
+        return self.file[name]
+
+    def __getstate__(self):
+        return {"filepath": self.filepath, "options": self.options}
+
+    def __setstate__(self, state):
+        self.__init__(state["filepath"], options=state["options"])
+
+
+CHUNK_CACHE_OPTIONS = ('rdcc_nslots', 'rdcc_nbytes', 'rdcc_w0')
+CHUNK_CACHE_MIN_BYTES = 1024 ** 2  # default size of the HDF5 library
+CHUNK_CACHE_MAX_BYTES = 256 * 1024 ** 2
+CHUNK_CACHE_NUM_CHUNKS = 32  # number of the largest chunks that fit in the cache
+CHUNK_CACHE_MAX_SLOTS = 2 ** 20
+
+
+def get_auto_chunk_cache_options(filepath):
+    """Returns chunk cache options suited for the datasets of a hdf5 file.
+
+    The cache holds several chunks of the largest size found in the file
+    (a chunk bigger than the cache is never cached by the HDF5 library),
+    bounded between 1 MB and 256 MB, and the number of hash table slots is
+    a prime number about 100 times the number of the smallest chunks that
+    fit in the cache (as recommended by the HDF5 documentation).
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the hdf5 file stored on disk.
+
+    Returns
+    -------
+    dict
+        Values for the 'rdcc_nbytes' and 'rdcc_nslots' options.
+
+    """
+    chunk_sizes = []
+
+    def add_chunk_size(name, hdf5_object):
+        if isinstance(hdf5_object, h5py.Dataset) and hdf5_object.chunks is not None:
+            chunk_sizes.append(int(np.prod(hdf5_object.chunks)) * hdf5_object.dtype.itemsize)
+
+    with h5py.File(filepath, 'r') as hdf5_file:
+        hdf5_file.visititems(add_chunk_size)
+
+    if not chunk_sizes:
+        return {"rdcc_nbytes": CHUNK_CACHE_MIN_BYTES, "rdcc_nslots": 521}  # library defaults
+    nbytes = min(max(chunk_sizes) * CHUNK_CACHE_NUM_CHUNKS, CHUNK_CACHE_MAX_BYTES)
+    nbytes = max(nbytes, max(chunk_sizes), CHUNK_CACHE_MIN_BYTES)
+    nslots = min(100 * (nbytes // max(min(chunk_sizes), 1)), CHUNK_CACHE_MAX_SLOTS)
+    return {"rdcc_nbytes": nbytes, "rdcc_nslots": _get_next_prime(nslots)}
+
+
+def _get_next_prime(number):
+    """Returns the smallest prime number greater or equal than a number."""
+    number = max(number, 2)
+    while any(number % divisor == 0 for divisor in range(2, int(number ** 0.5) + 1)):
+        number += 1
+    return number
+
+
 class FieldLoader(object):
     """Field metadata loader class.
 
@@ -20,6 +258,17 @@ class FieldLoader(object):
         hdf5 field object handler.
     obj_id : int, optional
         Position of the field in 'object_fields'.
+    chunk_cache : ChunkCache, optional
+        Cache of decompressed chunks used when reading from disk.
+    mmap : bool, optional
+        Access the data on disk through a memory-mapped array if the
+        field's storage layout allows it.
+    file_handler : HDF5FileHandler, optional
+        Handler of the hdf5 file containing the field.
+    shared_memory : bool, optional
+        Share the data loaded into memory with other processes.
+    stats : AccessStats, optional
+        Statistics where the reads of the field are recorded.
 
     Attributes
     ----------
@@ -37,22 +286,41 @@ class FieldLoader(object):
         Value used to pad arrays when storing the data in the hdf5 file.
     obj_id : int
         Identifier of the field if contained in the 'object_ids' list.
+    chunk_cache : ChunkCache
+        Cache of decompressed chunks used when reading from disk.
+    shared_memory : bool
+        Share the data loaded into memory with other processes.
+    access_count : int
+        Number of read requests of the field's data.
+    stats : AccessStats
+        Statistics where the reads of the field are recorded (None if disabled).
 
     """
 
-    def __init__(self, hdf5_field, obj_id=None):
+    def __init__(self, hdf5_field, obj_id=None, chunk_cache=None, mmap=False,
+                 file_handler=None, shared_memory=False, stats=None):
         """Initialize class."""
         assert hdf5_field, 'Must input a valid hdf5 dataset.'
 
-        self.data = hdf5_field
-        self.hdf5_handler = hdf5_field
+        self._file_handler = file_handler or HDF5FileHandler.from_hdf5_object(hdf5_field)
+        self._generation = self._file_handler.generation
+        self._hdf5_handler = hdf5_field
         self._in_memory = False
+        self._memory_data = None
+        self._shared_array = None
+        self._mmap_data = None
+        self.shared_memory = shared_memory
+        self.access_count = 0
+        self.stats = stats
         self.set = self._get_set_name()
         self.name = self._get_field_name()
-        self.shape = hdf5_field.shape
-        self.type = hdf5_field.dtype
-        self.fillvalue = hdf5_field.fillvalue
+        self.shape, self.type, self.fillvalue = self._get_field_properties(hdf5_field)
         self.obj_id = obj_id
+        self.chunk_cache = chunk_cache
+        self._chunk_rows = self._get_chunk_rows()
+        self._cache_key = (hdf5_field.file.filename, hdf5_field.name)
+        if mmap:
+            self.mmap = True
 
     def _get_set_name(self):
         hdf5_object_str = self._get_hdf5_object_str()
@@ -63,8 +331,40 @@ class FieldLoader(object):
         return hdf5_object_str[-1]
 
     def _get_hdf5_object_str(self):
-        return self.hdf5_handler.name.split('/')
+        return self._hdf5_handler.name.split('/')
+
+    def _get_field_properties(self, hdf5_field):
+        return hdf5_field.shape, hdf5_field.dtype, hdf5_field.fillvalue
+
+    def _get_hdf5_handler(self):
+        """hdf5 dataset handler that is valid for the current process."""
+        hdf5_file = self._file_handler.file
+        if self._generation != self._file_handler.generation:
+            self._hdf5_handler = hdf5_file[self._hdf5_handler.name]
+            self._generation = self._file_handler.generation
+        return self._hdf5_handler
+
+    hdf5_handler = property(_get_hdf5_handler)
+
+    def _get_data(self):
+        """Data container used to fetch data (numpy array or hdf5 dataset)."""
+        if self._in_memory:
+            return self._memory_data
+        elif self._mmap_data is not None:
+            return self._mmap_data
+        else:
+            return self.hdf5_handler
+
+    data = property(_get_data)
+
+    def _get_chunk_rows(self):
+        """Returns the number of rows of a chunk (None if not chunked)."""
+        chunks = self._hdf5_handler.chunks
+        if chunks is None or not self.shape:
+            return None
+        return chunks[0]
 
+    @instrument(count_index_rows)
     def get(self, index=None, convert_to_str=False):
         """Retrieves data of the field from the dataset's hdf5 metadata file.
 
@@ -74,7 +374,7 @@ class FieldLoader(object):
 
         Parameters
         ----------
-        index : int/list/tuple, optional
+        index : int/list/tuple/np.ndarray, optional
             Index number of he field. If it is a list, returns the data
             for all the value indexes of that list.
         convert_to_str : bool, optional
@@ -90,12 +390,14 @@ class FieldLoader(object):
 
         Note
         ----
-        When using lists/tuples of indexes, this method sorts the list
-        and removes duplicate values. This is because the h5py
-        api requires the indexing elements to be in increasing order when
-        retrieving data.
+        When using lists/tuples of indexes, the data is returned in the
+        same order as the input indexes, including any repeated values.
+        Since the h5py api requires the indexing elements to be in
+        increasing order, the data is fetched from disk in a single read
+        over the sorted unique indexes and then reordered in memory.
 
         """
+        self._record_access()
         if index is None:
             data = self._get_all_idx()
         else:
@@ -104,9 +406,15 @@ class FieldLoader(object):
             data = convert_ascii_to_str(data)
         return data
 
+    def _record_access(self):
+        self.access_count += 1
+
+    def _get_stats_key(self):
+        return self.set, self.name
+
     def _get_all_idx(self):
         """Return the full data array."""
-        if self._in_memory:
+        if self._is_numpy_data():
             return self.data
         else:
             return self.data.value
@@ -114,17 +422,117 @@ class FieldLoader(object):
     def _get_range_idx(self, idx):
         """Return a slice of the data array."""
         assert idx is not None
-        if isinstance(idx, int):
-            return self.data[idx]
+        if isinstance(idx, (int, np.integer)):
+            return self._get_row(idx)
         else:
             size = len(idx)
             if size > 1:
-                return self.data[sorted(set(idx))]
+                return self._get_batch_idx(idx)
             elif size == 1:
-                return self.data[idx[0]]
+                return self._get_row(idx[0])
             else:
                 return self._get_all_idx()
 
+    def _get_batch_idx(self, idx):
+        """Return the rows of a list of indexes in the same order as requested.
+
+        The indexes can be unsorted and contain repeated values. The rows are
+        fetched with a single read over the sorted unique indexes and then
+        scattered back to the requested order.
+        """
+        indexes = self._parse_batch_idx(idx)
+        if self._is_numpy_data():
+            return self.data[indexes]
+        unique_indexes, inverse = np.unique(indexes, return_inverse=True)
+        if self._use_chunk_cache():
+            data = self._get_rows_from_chunk_cache(unique_indexes)
+        else:
+            data = self.data[unique_indexes.tolist()]
+        if len(unique_indexes) == len(indexes) and np.array_equal(unique_indexes, indexes):
+            return data
+        return data[inverse.reshape(-1)]
+
+    def _parse_batch_idx(self, idx):
+        """Converts a list of indexes into a 1D array of non-negative ints."""
+        indexes = np.asarray(idx)
+        if indexes.ndim != 1 or not np.issubdtype(indexes.dtype, np.integer):
+            raise TypeError('Invalid input index format.')
+        return np.where(indexes < 0, indexes + self.shape[0], indexes)
+
+    def _is_numpy_data(self):
+        """Returns True if the data is accessed through a numpy array."""
+        return self._in_memory or self._mmap_data is not None
+
+    def _use_chunk_cache(self):
+        return self.chunk_cache is not None and self._chunk_rows is not None \
+            and not self._is_numpy_data()
+
+    def _get_row(self, idx):
+        """Return a single row of the data array."""
+        if not self._use_chunk_cache() or not -self.shape[0] <= idx < self.shape[0]:
+            return self.data[idx]
+        block_id, offset = divmod(int(idx) % self.shape[0], self._chunk_rows)
+        return self._get_chunk_block(block_id)[offset]
+
+    def _get_rows_from_chunk_cache(self, sorted_indexes):
+        """Return the rows of a sorted list of indexes using the chunk cache."""
+        block_ids = sorted_indexes // self._chunk_rows
+        unique_block_ids, block_starts = np.unique(block_ids, return_index=True)
+        block_ends = np.append(block_starts[1:], len(sorted_indexes))
+        data = np.empty((len(sorted_indexes),) + self.shape[1:], dtype=self.type)
+        for block_id, start, end in zip(unique_block_ids, block_starts, block_ends):
+            block = self._get_chunk_block(int(block_id))
+            offsets = sorted_indexes[start:end] - block_id * self._chunk_rows
+            data[start:end] = block[offsets]
+        return data
+
+    def _get_chunk_block(self, block_id):
+        """Return the rows of a chunk from the cache (or read them from disk)."""
+        start = block_id * self._chunk_rows
+        end = min(start + self._chunk_rows, self.shape[0])
+        key = self._cache_key + (block_id,)
+        return self.chunk_cache.get_block(key, lambda: self.hdf5_handler[start:end])
+
+    def get_list(self, index=None):
+        """Retrieves the rows of a list field without the padding values.
+
+        Parameters
+        ----------
+        index : int/list/tuple/np.ndarray, optional
+            Index number of the row. If it is a list, returns the rows
+            for all the value indexes of that list.
+
+        Returns
+        -------
+        np.ndarray/list
+            Numpy array with the values of the row, or a list of
+            numpy arrays if multiple rows are requested.
+
+        """
+        self._record_access()
+        if isinstance(index, (int, np.integer)):
+            return self._unpad_row(self._get_row(index))
+        if index is None:
+            rows = self._get_all_idx()
+        elif len(index) == 0:
+            return []
+        else:
+            rows = self._get_batch_idx(index)
+        return [self._unpad_row(row) for row in rows]
+
+    def _unpad_row(self, row):
+        return row[row != self.fillvalue]
+
+    def _get_nbytes(self):
+        """Size (in bytes) of the field's data when loaded into memory."""
+        return int(np.prod(self.shape)) * self.type.itemsize
+
+    nbytes = property(_get_nbytes)
+
+    def _get_data_owners(self):
+        """Loaders that hold the field's data when it is loaded into memory."""
+        return [self]
+
     def size(self):
         """Size of the field.
 
@@ -181,12 +589,28 @@ class FieldLoader(object):
 
         """
         assert isinstance(is_in_memory, bool), 'Invalid input. Must insert a boolean type.'
+        self._release_memory_data()
         if is_in_memory:
-            self.data = self.hdf5_handler.value
-        else:
-            self.data = self.hdf5_handler
+            self._memory_data = self._read_to_memory(self.hdf5_handler)
         self._in_memory = is_in_memory
 
+    def _read_to_memory(self, hdf5_field):
+        """Reads a dataset into a numpy array (shared if 'shared_memory' is True)."""
+        if not self.shared_memory:
+            return hdf5_field.value
+        filepath = self._file_handler.filepath
+        name = get_segment_name(os.path.realpath(filepath), os.path.getmtime(filepath),
+                                hdf5_field.name)
+        self._shared_array = SharedArray(name, hdf5_field.dtype, hdf5_field.shape,
+                                         hdf5_field.read_direct)
+        return self._shared_array.data
+
+    def _release_memory_data(self):
+        if self._shared_array is not None:
+            self._shared_array.release()
+            self._shared_array = None
+        self._memory_data = None
+
     def _get_to_memory(self):
         """Modifies how data is accessed and stored.
 
@@ -196,11 +620,73 @@ class FieldLoader(object):
         and all accesses are done in memory. Otherwise, data is kept in disk and
         accesses are done using the HDF5 object handler.
 
+        If 'shared_memory' is True, the data is loaded into a read-only array
+        shared by all processes that load the same field (see SharedArray).
+        The first process loads the data from disk and the others attach to
+        it without copying it. The shared array is removed once no process
+        uses it anymore.
+
         """
         return self._in_memory
 
     to_memory = property(_get_to_memory, _set_to_memory)
 
+    def _set_mmap(self, use_mmap):
+        """Accesses the data on disk through a memory-mapped array if True.
+
+        Parameters
+        ----------
+        use_mmap : bool
+            Memory-map the data (if True).
+
+        """
+        assert isinstance(use_mmap, bool), 'Invalid input. Must insert a boolean type.'
+        if use_mmap:
+            self._mmap_data = self._get_mmap_data()
+        else:
+            self._mmap_data = None
+
+    def _get_mmap_data(self):
+        """Returns a read-only memory-mapped array of the field's data.
+
+        Only fields stored uncompressed, with a contiguous layout and
+        allocated in a regular file on disk can be memory-mapped. For the
+        remaining fields, None is returned.
+        """
+        return self._memmap_hdf5_dataset(self.hdf5_handler)
+
+    def _memmap_hdf5_dataset(self, hdf5_field):
+        if not self._is_mmap_compatible(hdf5_field):
+            return None
+        offset = hdf5_field.id.get_offset()
+        if offset is None:
+            return None
+        return np.memmap(hdf5_field.file.filename, mode='r', dtype=hdf5_field.dtype,
+                         shape=hdf5_field.shape, offset=offset)
+
+    def _is_mmap_compatible(self, hdf5_field):
+        return hdf5_field.chunks is None \
+            and hdf5_field.size > 0 \
+            and hdf5_field.id.get_create_plist().get_nfilters() == 0 \
+            and not hdf5_field.dtype.hasobject \
+            and h5py.check_dtype(vlen=hdf5_field.dtype) is None \
+            and hdf5_field.file.driver in ('sec2', 'stdio')
+
+    def _get_mmap(self):
+        """Modifies how data is accessed from disk.
+
+        Data stored on disk can be accessed using the HDF5 object handler
+        or, if the field is stored uncompressed with a contiguous layout,
+        through a zero-copy memory-mapped numpy array. Enabling this option
+        for a field whose layout does not allow it keeps using the HDF5
+        object handler, and this property returns False.
+
+        """
+        return self._mmap_data is not None
+
+    mmap = property(_get_mmap, _set_mmap)
+
+    @instrument(count_item_rows)
     def __getitem__(self, index):
         """
         Parameters
@@ -214,6 +700,12 @@ class FieldLoader(object):
             Numpy data array.
 
         """
+        self._record_access()
+        if self._use_chunk_cache():
+            if isinstance(index, (int, np.integer)):
+                return self._get_row(index)
+            if isinstance(index, tuple) and index and isinstance(index[0], (int, np.integer)):
+                return self._get_row(index[0])[index[1:]]
         return self.data[index]
 
     def __len__(self):
@@ -226,10 +718,42 @@ class FieldLoader(object):
         """
         return self.shape[0]
 
+    def __getstate__(self):
+        """Pickles only the information needed to reopen the field."""
+        return {
+            "filepath": self._file_handler.filepath,
+            "hdf5_options": self._file_handler.options,
+            "hdf5_name": self._hdf5_handler.name,
+            "obj_id": self.obj_id,
+            "chunk_cache": self.chunk_cache,
+            "mmap": self.mmap,
+            "to_memory": self._in_memory,
+            "shared_memory": self.shared_memory,
+            "stats": self.stats
+        }
+
+    def __setstate__(self, state):
+        file_handler = HDF5FileHandler(state["filepath"], options=state["hdf5_options"])
+        self.__init__(file_handler[state["hdf5_name"]],
+                      obj_id=state["obj_id"],
+                      chunk_cache=state["chunk_cache"],
+                      mmap=state["mmap"],
+                      file_handler=file_handler,
+                      shared_memory=state["shared_memory"],
+                      stats=state["stats"])
+        if state["to_memory"]:
+            self.to_memory = True
+
     def __str__(self):
-        if self._in_memory:
+        if self._shared_array is not None:
+            s = 'FieldLoader: <shared numpy.memmap "{}": shape {}, type "{}">' \
+                .format(self.name, self.data.shape, self.data.dtype)
+        elif self._in_memory:
             s = 'FieldLoader: <numpy.ndarray "{}": shape {}, type "{}">' \
                 .format(self.name, self.data.shape, self.data.dtype)
+        elif self._mmap_data is not None:
+            s = 'FieldLoader: <numpy.memmap "{}": shape {}, type "{}">' \
+                .format(self.name, self.data.shape, self.data.dtype)
         else:
             s = 'FieldLoader: ' + self.data.__str__()
         return s
@@ -238,6 +762,441 @@ class FieldLoader(object):
         return str(self)
 
 
+class RaggedFieldLoader(FieldLoader):
+    """Field metadata loader class for lists stored in a ragged layout.
+
+    The rows of the field are stored as a flat array of values and an array
+    of offsets (see hdf5_write_ragged_data()), where the i'th row is stored
+    in values[offsets[i]:offsets[i+1]]. The unpadded rows are retrieved with
+    get_list(), while get() and indexing return the rows padded with
+    'fillvalue' to the length of the longest row (same as the padded list
+    fields).
+
+    Parameters
+    ----------
+    hdf5_field : h5py._hl.group.Group
+        hdf5 group containing the 'values' and 'offsets' datasets.
+    obj_id : int
+        Position of the field in 'object_fields'.
+    chunk_cache : ChunkCache, optional
+        Not used by ragged fields.
+    mmap : bool, optional
+        Memory-map the values if their storage layout allows it.
+    file_handler : HDF5FileHandler, optional
+        Handler of the hdf5 file containing the field.
+    shared_memory : bool, optional
+        Share the values loaded into memory with other processes.
+
+    Attributes
+    ----------
+    offsets : np.ndarray
+        Offsets of the rows in the array of values.
+
+    """
+
+    def __init__(self, hdf5_field, obj_id=None, chunk_cache=None, mmap=False,
+                 file_handler=None, shared_memory=False, stats=None):
+        """Initialize class."""
+        self._offsets = None
+        super(RaggedFieldLoader, self).__init__(hdf5_field, obj_id, chunk_cache, mmap,
+                                                file_handler, shared_memory, stats)
+
+    def _get_field_properties(self, hdf5_field):
+        return (_get_hdf5_field_shape(hdf5_field),
+                hdf5_field['values'].dtype,
+                hdf5_field.attrs['fillvalue'])
+
+    def _get_chunk_rows(self):
+        return None
+
+    def _get_data(self):
+        """Data container of the values (numpy array or hdf5 dataset)."""
+        if self._in_memory:
+            return self._memory_data
+        elif self._mmap_data is not None:
+            return self._mmap_data
+        else:
+            return self.hdf5_handler['values']
+
+    data = property(_get_data)
+
+    def _get_offsets(self):
+        if self._offsets is None:
+            self._offsets = self.hdf5_handler['offsets'][()]
+        return self._offsets
+
+    offsets = property(_get_offsets)
+
+    def _get_nbytes(self):
+        """Size (in bytes) of the field's values and offsets when loaded into memory."""
+        values = self.hdf5_handler['values']
+        offsets = self.hdf5_handler['offsets']
+        return values.size * values.dtype.itemsize + offsets.size * offsets.dtype.itemsize
+
+    nbytes = property(_get_nbytes)
+
+    def get_list(self, index=None):
+        """Retrieves the rows of the field without the padding values.
+
+        Each row is read in a single slice of the values array.
+
+        Parameters
+        ----------
+        index : int/list/tuple/np.ndarray, optional
+            Index number of the row. If it is a list, returns the rows
+            for all the value indexes of that list.
+
+        Returns
+        -------
+        np.ndarray/list
+            Numpy array with the values of the row, or a list of
+            numpy arrays if multiple rows are requested.
+
+        """
+        self._record_access()
+        if isinstance(index, (int, np.integer)):
+            start, end = self._get_row_span(index)
+            return self.data[start:end]
+        if index is None:
+            values, lengths = self._get_values(), np.diff(self.offsets)
+        elif len(index) == 0:
+            return []
+        else:
+            values, lengths = self._get_rows_values(self._parse_batch_idx(index))
+        if len(lengths) == 0:
+            return []
+        return np.split(values, np.cumsum(lengths)[:-1])
+
+    def _get_row_span(self, idx):
+        if not -self.shape[0] <= idx < self.shape[0]:
+            raise IndexError('Index ({}) out of range (0-{})'.format(idx, self.shape[0] - 1))
+        idx = int(idx) % self.shape[0]
+        return self.offsets[idx], self.offsets[idx + 1]
+
+    def _get_values(self):
+        if self._is_numpy_data():
+            return self.data
+        return self.data[()]
+
+    def _get_rows_values(self, rows):
+        """Returns the concatenated values and the lengths of a list of rows."""
+        starts = self.offsets[rows]
+        lengths = self.offsets[rows + 1] - starts
+        if len(rows) == 0:
+            return self._get_values()[:0], lengths
+        positions = np.arange(lengths.sum()) + np.repeat(starts - (np.cumsum(lengths) - lengths),
+                                                         lengths)
+        if self._is_numpy_data():
+            return self.data[positions], lengths
+        return self._read_spans(rows, positions), lengths
+
+    def _read_spans(self, rows, positions):
+        """Reads the values at the given positions from disk.
+
+        Only the spans of the requested rows are read: the rows are sorted and
+        de-duplicated, and the spans of adjacent rows are merged into a single
+        read.
+        """
+        unique_rows = np.unique(rows)
+        row_starts, row_ends = self.offsets[unique_rows], self.offsets[unique_rows + 1]
+        is_first = np.ones(len(unique_rows), dtype=bool)
+        is_first[1:] = row_starts[1:] != row_ends[:-1]
+        span_starts = row_starts[is_first]
+        span_ends = row_ends[np.append(is_first[1:], True)]
+        values = np.concatenate([self.data[start:end]
+                                 for start, end in zip(span_starts, span_ends)])
+        span_offsets = np.cumsum(span_ends - span_starts) - (span_ends - span_starts)
+        span_ids = np.searchsorted(span_starts, positions, side='right') - 1
+        return values[positions - span_starts[span_ids] + span_offsets[span_ids]]
+
+    def _pad_rows(self, values, lengths):
+        data = np.full((len(lengths),) + self.shape[1:], self.fillvalue, dtype=self.type)
+        data[np.arange(self.shape[1]) < lengths[:, None]] = values
+        return data
+
+    def _get_all_idx(self):
+        """Return the full data array padded with 'fillvalue'."""
+        return self._pad_rows(self._get_values(), np.diff(self.offsets))
+
+    def _get_batch_idx(self, idx):
+        """Return the padded rows of a list of indexes in the same order as requested."""
+        return self._pad_rows(*self._get_rows_values(self._parse_batch_idx(idx)))
+
+    def _get_row(self, idx):
+        """Return a single row padded with 'fillvalue'."""
+        start, end = self._get_row_span(idx)
+        data = np.full(self.shape[1:], self.fillvalue, dtype=self.type)
+        data[:end - start] = self.data[start:end]
+        return data
+
+    def _set_to_memory(self, is_in_memory):
+        """Stores the values of the field in a numpy array if True.
+
+        Parameters
+        ----------
+        is_in_memory : bool
+            Move the data to memory (if True).
+
+        """
+        assert isinstance(is_in_memory, bool), 'Invalid input. Must insert a boolean type.'
+        self._release_memory_data()
+        if is_in_memory:
+            self._memory_data = self._read_to_memory(self.hdf5_handler['values'])
+            self._get_offsets()
+        self._in_memory = is_in_memory
+
+    to_memory = property(FieldLoader._get_to_memory, _set_to_memory)
+
+    def _get_mmap_data(self):
+        """Returns a read-only memory-mapped array of the field's values."""
+        return self._memmap_hdf5_dataset(self.hdf5_handler['values'])
+
+    @instrument(count_item_rows)
+    def __getitem__(self, index):
+        """
+        Parameters
+        ----------
+        index : int/slice/list/tuple
+            Index
+
+        Returns
+        -------
+        np.ndarray
+            Numpy data array padded with 'fillvalue'.
+
+        """
+        self._record_access()
+        if isinstance(index, tuple) and index:
+            index, inner_index = index[0], index[1:]
+        else:
+            inner_index = ()
+        if isinstance(index, (int, np.integer)):
+            return self._get_row(index)[inner_index]
+        if isinstance(index, slice):
+            index = np.arange(self.shape[0])[index]
+        return self._get_batch_idx(index)[(slice(None),) + inner_index]
+
+    def __str__(self):
+        if self._in_memory:
+            container = 'numpy.ndarray'
+        elif self._mmap_data is not None:
+            container = 'numpy.memmap'
+        else:
+            container = 'HDF5 ragged dataset'
+        return 'FieldLoader: <{} "{}": shape {}, type "{}", values {}>' \
+            .format(container, self.name, self.shape, self.type, self.data.shape[0])
+
+
+class UnionFieldLoader(FieldLoader):
+    """Field metadata loader class for fields of a union of sets.
+
+    The rows of the field are the rows of the same field in each set
+    concatenated in order ('concat' mode) or, for fields whose rows have the
+    same meaning in all sets (e.g. a list of objects per class), the values
+    of the i'th row of all sets combined into a single row ('merge' mode).
+    Values that are row indexes of other fields are offset by the number of
+    rows of those fields in the preceding sets. No data is copied: each read
+    is split among the loaders of the field in each set, which keep their
+    own options (chunk cache, memory-mapping or data loaded into memory).
+
+    Parameters
+    ----------
+    field_loaders : list
+        Loaders of the field in each set.
+    set_name : str
+        Name of the union set.
+    obj_id : int, optional
+        Position of the field in 'object_fields'.
+    mode : str, optional
+        How the rows of the sets are combined ('concat' or 'merge').
+    value_offsets : np.ndarray, optional
+        Offset added to the (non-negative) values of each set. It has a
+        value per set, or a row per set with a value per column.
+    stats : AccessStats, optional
+        Statistics where the reads of the field are recorded.
+
+    Attributes
+    ----------
+    field_loaders : list
+        Loaders of the field in each set.
+    set : str
+        Name of the union set.
+    name : str
+        Name of the field.
+    type : type
+        Type of the field's data.
+    shape : tuple
+        Shape of the field's data.
+    fillvalue : int
+        Value used to pad arrays when storing the data in the hdf5 file.
+    obj_id : int
+        Identifier of the field if contained in the 'object_ids' list.
+    mode : str
+        How the rows of the sets are combined.
+    value_offsets : np.ndarray
+        Offset added to the values of each set.
+    access_count : int
+        Number of read requests of the field's data.
+    stats : AccessStats
+        Statistics where the reads of the field are recorded (None if disabled).
+
+    """
+
+    def __init__(self, field_loaders, set_name, obj_id=None, mode='concat', value_offsets=None,
+                 stats=None):
+        """Initialize class."""
+        assert field_loaders, 'Must input the loaders of the field in each set.'
+        assert mode in ('concat', 'merge'), 'Invalid union mode: {}'.format(mode)
+
+        self.field_loaders = list(field_loaders)
+        self.set = set_name
+        self.name = self.field_loaders[0].name
+        self.type = self.field_loaders[0].type
+        self.fillvalue = self.field_loaders[0].fillvalue
+        self.obj_id = obj_id
+        self.mode = mode
+        self.value_offsets = value_offsets
+        self.access_count = 0
+        self.stats = stats
+        self.chunk_cache = None
+        self.shared_memory = False
+        self._chunk_rows = None
+        self._row_starts = np.cumsum([0] + [len(f) for f in self.field_loaders])
+        self.shape = self._get_union_shape()
+
+    def _get_union_shape(self):
+        shapes = [field_loader.shape for field_loader in self.field_loaders]
+        assert all(len(shape) == len(shapes[0]) for shape in shapes), \
+            'The field must have the same number of dimensions in all sets.'
+        if self.mode == 'merge':
+            assert all(len(shape) == 2 and shape[0] == shapes[0][0] for shape in shapes), \
+                'Merged fields must have the same number of rows in all sets.'
+            return (shapes[0][0], sum(shape[1] for shape in shapes))
+        inner_shape = tuple(np.max([shape[1:] for shape in shapes], axis=0)) \
+            if len(shapes[0]) > 1 else ()
+        return (int(self._row_starts[-1]),) + tuple(int(size) for size in inner_shape)
+
+    def _get_all_idx(self):
+        return self._get_batch_idx(np.arange(self.shape[0]))
+
+    def _get_row(self, idx):
+        return self._get_batch_idx([idx])[0]
+
+    def _get_batch_idx(self, idx):
+        """Return the rows of a list of indexes read from the loaders of each set."""
+        indexes = self._parse_batch_idx(idx)
+        if len(indexes) and (indexes.min() < 0 or indexes.max() >= self.shape[0]):
+            raise IndexError('Index out of range for field \'{}\' with {} rows.'
+                             .format(self.name, self.shape[0]))
+        data = np.full((len(indexes),) + self.shape[1:], self.fillvalue, dtype=self.type)
+        if not len(indexes):
+            return data
+        if self.mode == 'merge':
+            blocks = [self._offset_values(i, field_loader._get_batch_idx(indexes))
+                      for i, field_loader in enumerate(self.field_loaders)]
+            return self._merge_rows(np.concatenate(blocks, axis=1))
+        set_ids = np.searchsorted(self._row_starts, indexes, side='right') - 1
+        for set_id in np.unique(set_ids):
+            mask = set_ids == set_id
+            set_indexes = indexes[mask] - self._row_starts[set_id]
+            rows = self.field_loaders[set_id]._get_batch_idx(set_indexes)
+            data[(mask,) + tuple(slice(0, size) for size in rows.shape[1:])] = \
+                self._offset_values(set_id, rows)
+        return data
+
+    def _offset_values(self, set_id, data):
+        if self.value_offsets is None or not np.any(self.value_offsets[set_id]):
+            return data
+        offset = self.value_offsets[set_id]
+        return np.where(data >= 0, data + offset, data).astype(data.dtype, copy=False)
+
+    def _merge_rows(self, data):
+        """Moves the padding values of each row to its end."""
+        order = np.argsort(data == self.fillvalue, axis=1, kind='mergesort')
+        return data[np.arange(len(data))[:, None], order]
+
+    def _set_to_memory(self, is_in_memory):
+        """Loads the field of all sets into memory if True (see FieldLoader.to_memory)."""
+        for field_loader in self.field_loaders:
+            field_loader.to_memory = is_in_memory
+
+    def _get_to_memory(self):
+        return all(field_loader.to_memory for field_loader in self.field_loaders)
+
+    def _get_data_owners(self):
+        """Loaders of the field in each set (the union does not hold data itself)."""
+        return [owner for field_loader in self.field_loaders
+                for owner in field_loader._get_data_owners()]
+
+    to_memory = property(_get_to_memory, _set_to_memory)
+
+    def _set_mmap(self, use_mmap):
+        """Memory-maps the field of all sets if True (see FieldLoader.mmap)."""
+        for field_loader in self.field_loaders:
+            field_loader.mmap = use_mmap
+
+    def _get_mmap(self):
+        return all(field_loader.mmap for field_loader in self.field_loaders)
+
+    mmap = property(_get_mmap, _set_mmap)
+
+    @instrument(count_item_rows)
+    def __getitem__(self, index):
+        """
+        Parameters
+        ----------
+        index : int/slice/list/tuple
+            Index
+
+        Returns
+        -------
+        np.ndarray
+            Numpy data array.
+
+        """
+        self._record_access()
+        if isinstance(index, tuple) and index:
+            index, inner_index = index[0], index[1:]
+        else:
+            inner_index = ()
+        if isinstance(index, (int, np.integer)):
+            return self._get_row(index)[inner_index]
+        if isinstance(index, slice):
+            index = np.arange(self.shape[0])[index]
+        return self._get_batch_idx(index)[(slice(None),) + inner_index]
+
+    def __getstate__(self):
+        return {
+            "field_loaders": self.field_loaders,
+            "set_name": self.set,
+            "obj_id": self.obj_id,
+            "mode": self.mode,
+            "value_offsets": self.value_offsets,
+            "stats": self.stats
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __str__(self):
+        return 'FieldLoader: <union of {} sets "{}": shape {}, type "{}">' \
+            .format(len(self.field_loaders), self.name, self.shape, self.type)
+
+
+def _is_ragged_hdf5_field(hdf5_object):
+    """Returns True if the hdf5 object stores a field in a ragged layout."""
+    return isinstance(hdf5_object, h5py.Group) and 'offsets' in hdf5_object
+
+
+def _get_hdf5_field_shape(hdf5_object):
+    """Returns the shape of a field (padded shape for ragged fields)."""
+    if _is_ragged_hdf5_field(hdf5_object):
+        values = hdf5_object['values']
+        num_rows = hdf5_object['offsets'].shape[0] - 1
+        return (num_rows, int(hdf5_object.attrs['width'])) + values.shape[1:]
+    return hdf5_object.shape
+
+
 class SetLoader(object):
     """Set metadata loader class.
 
@@ -249,11 +1208,27 @@ class SetLoader(object):
     ----------
     hdf5_group : h5py._hl.group.Group
         hdf5 group object handler.
+    chunk_cache : ChunkCache, optional
+        Cache of decompressed chunks shared by all fields of the set.
+    mmap : bool, optional
+        Memory-map the fields whose storage layout allows it.
+    file_handler : HDF5FileHandler, optional
+        Handler of the hdf5 file containing the set.
+    shared_memory : bool, optional
+        Share the fields loaded into memory with other processes.
 
     Attributes
     ----------
     hdf5_group : h5py._hl.group.Group
         hdf5 group object handler.
+    chunk_cache : ChunkCache
+        Cache of decompressed chunks shared by all fields of the set.
+    mmap : bool
+        Memory-map the fields whose storage layout allows it.
+    shared_memory : bool
+        Share the fields loaded into memory with other processes.
+    stats : AccessStats
+        Statistics where the reads of the set are recorded (None if disabled).
     set : str
         Name of the set.
     fields : tuple
@@ -265,20 +1240,44 @@ class SetLoader(object):
 
     """
 
-    def __init__(self, hdf5_group):
+    def __init__(self, hdf5_group, chunk_cache=None, mmap=False, file_handler=None,
+                 shared_memory=False, stats=None):
         """Initialize class."""
         assert hdf5_group, 'Must input a valid hdf5 group'
 
-        self.hdf5_group = hdf5_group
+        self._file_handler = file_handler or HDF5FileHandler.from_hdf5_object(hdf5_group)
+        self._generation = self._file_handler.generation
+        self._hdf5_group = hdf5_group
+        self.chunk_cache = chunk_cache
+        self.mmap = mmap
+        self.shared_memory = shared_memory
+        self.stats = stats
         self.set = self._get_set_name()
         self.object_fields = self._get_object_fields()
         self.nelems = self._get_num_elements()
         self._fields = self._get_field_names()
-        self.fields = self._load_hdf5_fields()  # add all hdf5 datasets as data fields
+        self.fields = self._load_hdf5_fields()  # add all hdf5 datasets as data fields (lazily)
+        self._fields_shape = {}
+
+        self.object_index = ObjectIndex(self, self._get_object_index_filepath())
+        self._object_aligned_fields = None
 
         self._fields_info = []
         self._lists_info = []
 
+    def _get_object_index_filepath(self):
+        return os.path.splitext(self._file_handler.filepath)[0] + '.index.h5'
+
+    def _get_hdf5_group(self):
+        """hdf5 group handler that is valid for the current process."""
+        hdf5_file = self._file_handler.file
+        if self._generation != self._file_handler.generation:
+            self._hdf5_group = hdf5_file[self._hdf5_group.name]
+            self._generation = self._file_handler.generation
+        return self._hdf5_group
+
+    hdf5_group = property(_get_hdf5_group)
+
     def _get_set_name(self):
         hdf5_object_str = self.hdf5_group.name
         str_split = hdf5_object_str.split('/')
@@ -298,11 +1297,19 @@ class SetLoader(object):
         return len(self.hdf5_group['object_ids'])
 
     def _load_hdf5_fields(self):
-        fields = {}
-        for field in self._fields:
-            obj_id = self._get_obj_id_field(field)
-            fields[field] = FieldLoader(self.hdf5_group[field], obj_id)
-        return fields
+        return LazyDict(self._fields, self._load_hdf5_field)
+
+    def _load_hdf5_field(self, field):
+        obj_id = self._get_obj_id_field(field)
+        hdf5_field = self.hdf5_group[field]
+        if _is_ragged_hdf5_field(hdf5_field):
+            field_loader_class = RaggedFieldLoader
+        else:
+            field_loader_class = FieldLoader
+        return field_loader_class(hdf5_field, obj_id, self.chunk_cache, self.mmap,
+                                  file_handler=self._file_handler,
+                                  shared_memory=self.shared_memory,
+                                  stats=self.stats)
 
     def _get_obj_id_field(self, field):
         if field in self.object_fields:
@@ -347,6 +1354,7 @@ class SetLoader(object):
         except KeyError:
             raise KeyError('\'{}\' does not exist in the \'{}\' set.'.format(field, self.set))
 
+    @instrument(count_index_rows)
     def object(self, index=None, convert_to_value=False):
         """Retrieves a list of all fields' indexes/values of an object composition.
 
@@ -372,57 +1380,418 @@ class SetLoader(object):
             Returns a list of indexes or, if convert_to_value is True,
             a list of data arrays/values.
 
+        Note
+        ----
+        When retrieving the values of multiple objects, each field is
+        fetched with a single read for all objects (see object_columns()).
+
+        """
+        indexes = self._get_object_indexes(index)
+        if convert_to_value:
+            indexes = self._convert(indexes)
+        return indexes
+
+    def _get_stats_key(self):
+        return self.set, 'object()'
+
+    def _get_object_indexes(self, index):
+        return self.get('object_ids', index)
+
+    def _convert(self, object_ids):
+        """Retrieve data from the dataset's hdf5 metadata file in the original format.
+
+        This method fetches all indices of an object(s), and then it looks up for the
+        value for each field in 'object_ids' for a certain index(es), and then it
+        groups the fetches data into a single list.
+
+        Parameters
+        ----------
+        object_ids : np.ndarray
+            Array of indexes of data fields of one (1D) or more (2D) objects.
+
+        Returns
+        -------
+        List
+            Value/list of a field from the metadata cache file.
+
+        Raises
+        ------
+        TypeError
+            If index is not a 1D or 2D array of ints.
+
+        """
+        object_ids = np.asarray(object_ids)
+        assert object_ids.size > 0, 'Must input a valid index.'
+        if object_ids.ndim == 1:
+            return self._convert_to_value_single_object(object_ids)
+        elif object_ids.ndim == 2:
+            return self._convert_to_value_multiple_objects(object_ids)
+        else:
+            raise TypeError("Invalid input index format.")
+
+    def _convert_to_value_single_object(self, idx):
+        data = []
+        for i, field in enumerate(self.object_fields):
+            if idx[i] >= 0:
+                data.append(self.get(field, int(idx[i])))
+            else:
+                data.append([])  # undefined index retrieves an empty list
+        return data
+
+    def _convert_to_value_multiple_objects(self, object_ids):
+        columns = self._get_object_columns(object_ids)
+        output = []
+        for i in range(len(object_ids)):
+            data = []
+            for field in self.object_fields:
+                if columns[field].mask[i].any():
+                    data.append([])  # undefined index retrieves an empty list
+                else:
+                    data.append(columns[field].data[i])
+            output.append(data)
+        return output
+
+    def object_columns(self, index=None):
+        """Retrieves the values of all fields of a batch of objects as columns.
+
+        The 'object_ids' rows of the objects are read once, and then each
+        field in 'object_fields' is fetched with a single read for all
+        objects of the batch.
+
+        Parameters
+        ----------
+        index : int/list/tuple/np.ndarray, optional
+            Index number(s) of the objects. If no index is used,
+            it returns the values of all objects.
+
+        Returns
+        -------
+        dict
+            Masked array of values for each field in 'object_fields'. The
+            first dimension indexes the objects in the same order as the
+            input indexes. Objects with an undefined index (-1) for a field
+            are masked.
+
+        """
+        if index is None:
+            object_ids = self._get_object_indexes(None)
+        else:
+            object_ids = self._get_object_indexes(np.atleast_1d(index))
+        object_ids = np.asarray(object_ids).reshape(-1, len(self.object_fields))
+        return self._get_object_columns(object_ids)
+
+    def _get_object_columns(self, object_ids, fields=None):
+        columns = {}
+        for i, field in enumerate(self.object_fields):
+            if fields is None or field in fields:
+                columns[field] = self._get_field_column(field, object_ids[:, i])
+        return columns
+
+    def _get_field_column(self, field, indexes):
+        """Fetch the values of a field for a list of indexes with a single read."""
+        field_loader = self.fields[field]
+        field_loader._record_access()
+        is_defined = indexes >= 0
+        data = np.zeros((len(indexes),) + field_loader.shape[1:], dtype=field_loader.type)
+        if is_defined.any():
+            data[is_defined] = field_loader._get_batch_idx(indexes[is_defined])
+        mask = np.ones(data.shape, dtype=bool)
+        mask[is_defined] = False
+        return np.ma.masked_array(data, mask=mask)
+
+    def where(self, **predicates):
+        """Retrieves the ids of the objects matching a set of predicates.
+
+        Predicates are passed as keyword arguments with the name of a field in
+        'object_fields', optionally followed by a comparison operator with the
+        format "<field>__<operator>" (valid operators: 'eq' (default), 'ne',
+        'lt', 'le', 'gt', 'ge' and 'in'). The objects must match all predicates.
+
+        For fields with a single value per row (1D fields), the objects' values
+        are compared. For string fields, the strings are compared. For the
+        remaining fields, the row index stored in 'object_ids' is compared.
+
+        The predicates are solved using secondary indexes of the object fields
+        (see ObjectIndex), which are built the first time a field is queried
+        and stored in a sidecar file next to the metadata file.
+
+        Parameters
+        ----------
+        **predicates
+            Values to compare the fields with.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted array of object ids.
+
+        Raises
+        ------
+        KeyError
+            If a field is not contained in 'object_fields'.
+        ValueError
+            If an operator is not valid.
+
+        Examples
+        --------
+        >>> set_loader.where(category='person', iscrowd=0, area__gt=32**2)
+        array([   0,    3,    7, ...])
+
+        """
+        return self.object_index.query(predicates)
+
+    def _get_object_aligned_fields(self):
+        """Fields aligned with the objects (computed once per set)."""
+        if self._object_aligned_fields is None:
+            self._object_aligned_fields = get_object_aligned_fields(self)
+        return self._object_aligned_fields
+
+    def select(self, fields=None, **predicates):
+        """Retrieves the values of the objects matching a set of predicates.
+
+        Parameters
+        ----------
+        fields : str/list/tuple, optional
+            Name(s) of the object fields to retrieve. By default, all
+            fields in 'object_fields' are retrieved.
+        **predicates
+            Values to compare the fields with (see where()).
+
+        Returns
+        -------
+        dict
+            Masked array of values for each field (see object_columns()) of
+            the matching objects sorted by object id.
+
+        Raises
+        ------
+        KeyError
+            If a field is not contained in 'object_fields'.
+        ValueError
+            If an operator is not valid.
+
+        """
+        if isinstance(fields, str):
+            fields = [fields]
+        for field in fields or ():
+            if field not in self.object_fields:
+                raise KeyError('\'{}\' is not contained in \'object_fields\'.'.format(field))
+        object_ids = self.where(**predicates)
+        if len(object_ids) > 0:
+            object_ids = self._get_object_indexes(object_ids)
+        object_ids = np.asarray(object_ids).reshape(-1, len(self.object_fields))
+        return self._get_object_columns(object_ids, fields)
+
+    def subset(self, indexes):
+        """Returns a view of a subset of the objects of the set.
+
+        The view has the same get(), object(), size() and list() methods as
+        the set, with indexes relative to the objects of the subset. The
+        indexes are mapped to the rows of the set when the data is read, so
+        no data is copied (see SetLoaderSubset). Views can be created from
+        other views (e.g. filtered folds) and pickled.
+
+        Parameters
+        ----------
+        indexes : list/tuple/np.ndarray
+            Indexes of the objects (rows of 'object_ids') or a boolean mask.
+
+        Returns
+        -------
+        SetLoaderSubset
+            View of the objects of the subset.
+
+        Raises
+        ------
+        TypeError
+            If the indexes are not a 1D list of ints or bools.
+        IndexError
+            If an index is out of range.
+
+        Examples
+        --------
+        >>> folds = [set_loader.subset(np.arange(len(set_loader))[k::5]) for k in range(5)]
+        >>> people = folds[0].subset(folds[0].where(category='person'))
+
+        """
+        return SetLoaderSubset(self, indexes)
+
+    def iter_batches(self, fields=None, batch_size=1, shuffle=False, seed=None,
+                     drop_last=False, prefetch=2):
+        """Iterates over batches of data of one or more fields of the set.
+
+        The rows of all fields are split into batches of indexes (optionally
+        shuffled) and the data of each batch is returned as a dictionary of
+        numpy arrays. While a batch is being consumed, the next 'prefetch'
+        batches are read in the background by a pool of threads, and the
+        reads of different fields of a batch are done concurrently.
+
+        Parameters
+        ----------
+        fields : str/list/tuple, optional
+            Name(s) of the fields to fetch. All fields must have the same
+            number of rows. By default, only 'object_ids' is fetched (the
+            values of the objects can be retrieved with object_columns()).
+        batch_size : int, optional
+            Number of rows per batch.
+        shuffle : bool/str, optional
+            Shuffle the order of the rows (if True). Use 'chunks' to shuffle
+            the rows in an order aligned to the chunks of the fields (see
+            sampler()).
+        seed : int, optional
+            Seed of the random generator used to shuffle the rows.
+        drop_last : bool, optional
+            Drop the last batch if it has fewer rows than 'batch_size'.
+        prefetch : int, optional
+            Number of batches to read ahead in the background. If 0,
+            batches are read only when requested.
+
+        Returns
+        -------
+        generator
+            Generator of dictionaries with the data (np.ndarray) of each field.
+
+        Raises
+        ------
+        KeyError
+            If a field does not exist in the set.
+        ValueError
+            If the fields do not have the same number of rows.
+
+        Examples
+        --------
+        >>> for batch in set_loader.iter_batches(['images', 'labels'], batch_size=32,
+        ...                                      shuffle=True, seed=0):
+        ...     images, labels = batch['images'], batch['labels']
+
         """
-        indexes = self._get_object_indexes(index)
-        if convert_to_value:
-            indexes = self._convert(indexes.tolist())
+        assert isinstance(batch_size, int) and batch_size > 0, 'Must input a valid batch size.'
+        assert isinstance(prefetch, int) and prefetch >= 0, 'Must input a valid prefetch size.'
+        field_loaders = self._get_batch_field_loaders(fields)
+        if shuffle == 'chunks':
+            indexes = self._get_sampler(field_loaders, seed=seed).get_indexes()
+        else:
+            indexes = self._get_rows_indexes(len(field_loaders[0]), shuffle, seed)
+        batches = self._get_batches_indexes(indexes, batch_size, drop_last)
+        if prefetch == 0:
+            return self._iter_batches_sync(field_loaders, batches)
+        else:
+            return self._iter_batches_prefetch(field_loaders, batches, prefetch)
+
+    def _get_batch_field_loaders(self, fields):
+        if fields is None:
+            fields = ['object_ids']
+        elif isinstance(fields, str):
+            fields = [fields]
+        assert fields, 'Must input a valid list of fields.'
+        field_loaders = []
+        for field in fields:
+            try:
+                field_loaders.append(self.fields[field])
+            except KeyError:
+                raise KeyError('\'{}\' does not exist in the \'{}\' set.'.format(field, self.set))
+        if len(set(len(field_loader) for field_loader in field_loaders)) > 1:
+            raise ValueError('All fields must have the same number of rows: {}'
+                             .format([(f.name, len(f)) for f in field_loaders]))
+        return field_loaders
+
+    def _get_rows_indexes(self, num_rows, shuffle, seed):
+        indexes = np.arange(num_rows)
+        if shuffle:
+            np.random.RandomState(seed).shuffle(indexes)
         return indexes
 
-    def _get_object_indexes(self, index):
-        return self.get('object_ids', index)
+    def _get_batches_indexes(self, indexes, batch_size, drop_last):
+        num_rows = len(indexes)
+        if drop_last:
+            num_rows = num_rows - num_rows % batch_size
+        return [indexes[i:i + batch_size] for i in range(0, num_rows, batch_size)]
 
-    def _convert(self, index):
-        """Retrieve data from the dataset's hdf5 metadata file in the original format.
+    def sampler(self, fields=None, chunks_per_group=1, buffer_size=None, seed=None):
+        """Returns a sampler of shuffled rows aligned to the chunks of the fields.
 
-        This method fetches all indices of an object(s), and then it looks up for the
-        value for each field in 'object_ids' for a certain index(es), and then it
-        groups the fetches data into a single list.
+        The order of the rows is random at the level of groups of consecutive
+        chunks and within a bounded window of rows (see ChunkShuffleSampler),
+        so reading the fields in this order decompresses each chunk (nearly)
+        once per epoch instead of once per row.
+
+        Only the fields read from disk are used to align the groups: if
+        they have different chunk sizes, groups are aligned to the least
+        common multiple of the sizes (or to the biggest one, if the multiple
+        is too large).
 
         Parameters
         ----------
-        index : list
-            List of indexes of data fields.
+        fields : str/list/tuple, optional
+            Name(s) of the fields to read. All fields must have the same
+            number of rows. By default, only 'object_ids' is used.
+        chunks_per_group : int, optional
+            Number of consecutive chunks of each group.
+        buffer_size : int, optional
+            Number of rows of the window where rows are shuffled.
+        seed : int, optional
+            Seed of the random generator.
 
         Returns
         -------
-        List
-            Value/list of a field from the metadata cache file.
+        ChunkShuffleSampler
+            Sampler of the rows of the fields.
 
         Raises
         ------
-        TypeError
-            If index is not a list of ints or a list of lists.
+        KeyError
+            If a field does not exist in the set.
+        ValueError
+            If the fields do not have the same number of rows.
+
+        Examples
+        --------
+        >>> sampler = set_loader.sampler('images', seed=0)
+        >>> for epoch in range(10):
+        ...     sampler.set_epoch(epoch)
+        ...     for idx in sampler:
+        ...         image = set_loader.get('images', idx)
 
         """
-        assert index, 'Must input a valid index.'
-        if isinstance(index[0], int):
-            output = self._convert_to_value_single_object(index)
-        elif isinstance(index[0], list):
-            output = []
-            for idx in index:
-                output.append(self._convert_to_value_single_object(idx))
-        else:
-            raise TypeError("Invalid input index format.")
-        return output
-
-    def _convert_to_value_single_object(self, idx):
-        data = []
-        for i, field in enumerate(self.object_fields):
-            if idx[i] >= 0:
-                data.append(self.get(field, idx[i]))
-            else:
-                data.append([])  # undefined index retrieves an empty list
-        return data
+        field_loaders = self._get_batch_field_loaders(fields)
+        return self._get_sampler(field_loaders, chunks_per_group, buffer_size, seed)
+
+    def _get_sampler(self, field_loaders, chunks_per_group=1, buffer_size=None, seed=None):
+        return ChunkShuffleSampler(len(field_loaders[0]),
+                                   chunk_rows=get_aligned_chunk_rows(field_loaders),
+                                   chunks_per_group=chunks_per_group,
+                                   buffer_size=buffer_size,
+                                   seed=seed)
+
+    def _iter_batches_sync(self, field_loaders, batches):
+        for batch_indexes in batches:
+            for field_loader in field_loaders:
+                field_loader._record_access()
+            yield dict((f.name, f._get_batch_idx(batch_indexes)) for f in field_loaders)
+
+    def _iter_batches_prefetch(self, field_loaders, batches, prefetch):
+        pool = ThreadPool(len(field_loaders))
+        try:
+            pending = deque()
+            batches = iter(batches)
+            for batch_indexes in batches:
+                pending.append(self._submit_batch(pool, field_loaders, batch_indexes))
+                if len(pending) > prefetch:
+                    yield self._collect_batch(pending.popleft())
+            while pending:
+                yield self._collect_batch(pending.popleft())
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _submit_batch(self, pool, field_loaders, batch_indexes):
+        for field_loader in field_loaders:
+            field_loader._record_access()
+        return [(f.name, pool.apply_async(f._get_batch_idx, (batch_indexes,)))
+                for f in field_loaders]
+
+    def _collect_batch(self, async_batch):
+        return dict((name, result.get()) for name, result in async_batch)
 
     def size(self, field='object_ids'):
         """Size of a field.
@@ -446,10 +1815,20 @@ class SetLoader(object):
 
         """
         try:
-            return self.fields[field].shape
+            return self._get_field_shape(field)
         except KeyError:
             raise KeyError('\'{}\' does not exist in the \'{}\' set.'.format(field, self.set))
 
+    def _get_field_shape(self, field):
+        """Returns the shape of a field without constructing its loader."""
+        if self.fields.is_loaded(field):
+            return self.fields[field].shape
+        if field not in self._fields_shape:
+            if field not in self.fields:
+                raise KeyError(field)
+            self._fields_shape[field] = _get_hdf5_field_shape(self.hdf5_group[field])
+        return self._fields_shape[field]
+
     def list(self):
         """List of all field names.
 
@@ -583,6 +1962,33 @@ class SetLoader(object):
         """
         return self.nelems
 
+    def __getstate__(self):
+        """Pickles only the information needed to reopen the set."""
+        return {
+            "filepath": self._file_handler.filepath,
+            "hdf5_options": self._file_handler.options,
+            "hdf5_name": self._hdf5_group.name,
+            "chunk_cache": self.chunk_cache,
+            "mmap": self.mmap,
+            "shared_memory": self.shared_memory,
+            "stats": self.stats,
+            "in_memory_fields": self._get_in_memory_fields()
+        }
+
+    def _get_in_memory_fields(self):
+        return [field for field in self.fields.loaded() if self.fields[field].to_memory]
+
+    def __setstate__(self, state):
+        file_handler = HDF5FileHandler(state["filepath"], options=state["hdf5_options"])
+        self.__init__(file_handler[state["hdf5_name"]],
+                      chunk_cache=state["chunk_cache"],
+                      mmap=state["mmap"],
+                      file_handler=file_handler,
+                      shared_memory=state["shared_memory"],
+                      stats=state["stats"])
+        for field in state["in_memory_fields"]:
+            self.fields[field].to_memory = True
+
     def __str__(self):
         s = 'SetLoader: set<{}>, len<{}>'.format(self.set, self.nelems)
         return s
@@ -591,6 +1997,121 @@ class SetLoader(object):
         return str(self)
 
 
+class UnionSetLoader(SetLoader):
+    """Set metadata loader class for a set stored as the union of other sets.
+
+    The set is stored as a group with the names of the sets it is composed
+    of and how their fields are combined (see hdf5_write_union_set()). Fields
+    shared by all sets are stored in the group (as hard links) and loaded as
+    usual, while the remaining fields are loaded with UnionFieldLoader, which
+    reads the rows from the fields of each set and offsets the values that
+    are row indexes of other fields (e.g. 'object_ids' or 'list_*' fields).
+
+    Parameters
+    ----------
+    hdf5_group : h5py._hl.group.Group
+        hdf5 group object handler of the union set.
+    set_loaders : list
+        Loaders of the sets of the union (in order).
+    chunk_cache : ChunkCache, optional
+        Cache of decompressed chunks shared by all fields of the set.
+    mmap : bool, optional
+        Memory-map the fields whose storage layout allows it.
+    file_handler : HDF5FileHandler, optional
+        Handler of the hdf5 file containing the set.
+    shared_memory : bool, optional
+        Share the fields loaded into memory with other processes.
+    stats : AccessStats, optional
+        Statistics where the reads of the set are recorded.
+
+    Attributes
+    ----------
+    set_loaders : list
+        Loaders of the sets of the union.
+
+    """
+
+    def __init__(self, hdf5_group, set_loaders, chunk_cache=None, mmap=False, file_handler=None,
+                 shared_memory=False, stats=None):
+        """Initialize class."""
+        assert set_loaders, 'Must input the loaders of the sets of the union.'
+        self.set_loaders = list(set_loaders)
+        self._union_fields = get_union_attrs(hdf5_group)["fields"]
+        super(UnionSetLoader, self).__init__(hdf5_group, chunk_cache, mmap, file_handler,
+                                             shared_memory, stats)
+
+    def _get_field_names(self):
+        return self.set_loaders[0].list()
+
+    def _get_num_elements(self):
+        return sum(len(set_loader) for set_loader in self.set_loaders)
+
+    def _load_hdf5_field(self, field):
+        if field in self.hdf5_group:
+            return super(UnionSetLoader, self)._load_hdf5_field(field)
+        mode, target = self._union_fields.get(field, ('concat', None))
+        return UnionFieldLoader([set_loader.fields[field] for set_loader in self.set_loaders],
+                                self.set,
+                                obj_id=self._get_obj_id_field(field),
+                                mode=mode,
+                                value_offsets=self._get_value_offsets(field, target),
+                                stats=self.stats)
+
+    def _get_value_offsets(self, field, target):
+        """Offsets of the values of a field that are row indexes of other fields."""
+        if field == 'object_ids':
+            offsets = [self._get_rows_offsets(target) for target in self.object_fields]
+            return np.stack(offsets, axis=1)
+        if target is not None:
+            return self._get_rows_offsets(target)
+        return None
+
+    def _get_rows_offsets(self, field):
+        """Number of rows of a field in the sets preceding each set."""
+        if field in self.hdf5_group:
+            return np.zeros(len(self.set_loaders), dtype=np.int64)  # shared by all sets
+        rows = [set_loader.size(field)[0] for set_loader in self.set_loaders]
+        return np.cumsum([0] + rows[:-1]).astype(np.int64)
+
+    def _get_field_shape(self, field):
+        if field not in self.fields:
+            raise KeyError(field)
+        return self.fields[field].shape
+
+    def __getstate__(self):
+        """Pickles only the information needed to reopen the set."""
+        state = super(UnionSetLoader, self).__getstate__()
+        state["set_loaders"] = self.set_loaders
+        return state
+
+    def __setstate__(self, state):
+        file_handler = HDF5FileHandler(state["filepath"], options=state["hdf5_options"])
+        self.__init__(file_handler[state["hdf5_name"]],
+                      state["set_loaders"],
+                      chunk_cache=state["chunk_cache"],
+                      mmap=state["mmap"],
+                      file_handler=file_handler,
+                      shared_memory=state["shared_memory"],
+                      stats=state["stats"])
+        for field in state["in_memory_fields"]:
+            self.fields[field].to_memory = True
+
+    def __str__(self):
+        s = 'SetLoader: set<{}>, len<{}>, union of <{}>'.format(
+            self.set, self.nelems, ', '.join(set_loader.set for set_loader in self.set_loaders))
+        return s
+
+
+def get_union_attrs(hdf5_group):
+    """Returns the sets and fields modes of a union set (None if not a union set)."""
+    if 'union' not in hdf5_group.attrs:
+        return None
+    attrs = hdf5_group.attrs['union']
+    if isinstance(attrs, bytes):
+        attrs = attrs.decode('utf-8')
+    return json.loads(attrs)
+
+
 class DataLoader(object):
     """Dataset metadata loader class.
 
@@ -607,6 +2128,35 @@ class DataLoader(object):
         Path of the dataset's data directory on disk.
     hdf5_filepath : str
         Path of the metadata cache file stored on disk.
+    chunk_cache_bytes : int, optional
+        Size (in bytes) of the cache of decompressed chunks shared by all
+        fields. The cache is disabled by default.
+    mmap : bool, optional
+        Access the fields stored uncompressed with a contiguous layout
+        through zero-copy memory-mapped arrays. The remaining fields are
+        accessed using the HDF5 object handlers.
+    shared_memory : bool, optional
+        Load the fields moved to memory into arrays shared by all processes
+        that load the same dataset/task (instead of private copies).
+    hdf5_options : dict, optional
+        Options used to open the hdf5 file (e.g. 'rdcc_nbytes', 'rdcc_nslots',
+        'rdcc_w0' or 'driver'). Set 'rdcc_nbytes' to 'auto' to size the HDF5
+        chunk cache from the chunks of the file.
+    stats : bool, optional
+        Record statistics (calls, rows, bytes, cache hits and latency) of the
+        reads of each field (see get_stats()).
+    stats_filepath : str, optional
+        Path of a JSON file where the statistics are stored at exit. Copies
+        of the loader in other processes store their statistics in files of
+        their own (see AccessStats).
+    image_cache_bytes : int, optional
+        Size (in bytes) of the cache of decoded images read with images()
+        and iter_images(). The cache is disabled by default.
+    image_workers : int, optional
+        Number of threads/processes decoding images. If 0, the images are
+        decoded in the calling thread.
+    image_pool : str, optional
+        Type of the pool of workers decoding images ('thread' or 'process').
 
     Attributes
     ----------
@@ -626,10 +2176,25 @@ class DataLoader(object):
         List of names of set splits (e.g. train, test, val, etc.)
     object_fields : dict
         Data field names for each set split.
+    chunk_cache : ChunkCache
+        Cache of decompressed chunks (None if disabled).
+    mmap : bool
+        Memory-map the fields whose storage layout allows it.
+    shared_memory : bool
+        Share the fields loaded into memory with other processes.
+    hdf5_options : dict
+        Options used to open the hdf5 file.
+    stats : AccessStats
+        Statistics of the reads of the fields (None if disabled).
+    image_reader : ImageReader
+        Reader used to decode the image files of the dataset.
 
     """
 
-    def __init__(self, name, task, data_dir, hdf5_filepath):
+    def __init__(self, name, task, data_dir, hdf5_filepath, chunk_cache_bytes=None,
+                 mmap=False, shared_memory=False, hdf5_options=None, stats=False,
+                 stats_filepath=None, image_cache_bytes=None, image_workers=4,
+                 image_pool='thread'):
         """Initialize class."""
         assert name, 'Must input a valid dataset name.'
         assert task, 'Must input a valid task name.'
@@ -640,33 +2205,68 @@ class DataLoader(object):
         self.task = task
         self.data_dir = data_dir
         self.hdf5_filepath = hdf5_filepath
-        self.hdf5_file = self._load_hdf5_file()
+        self.mmap = mmap
+        self.shared_memory = shared_memory
+        self.hdf5_options = hdf5_options
+        self._file_handler = self._load_hdf5_file()
+        self.chunk_cache = self._get_chunk_cache(chunk_cache_bytes)
+        self.stats = self._get_stats(stats, stats_filepath)
+        self.image_reader = ImageReader(image_cache_bytes, image_workers, image_pool)
         self.root_path = '/'
         self._sets = self._get_sets()
         self.object_fields = self._get_object_fields()
 
-        self.sets = self._get_set_loaders()
+        self.sets = self._get_set_loaders()  # set loaders are created on first access
 
     def _load_hdf5_file(self):
-        return h5py.File(self.hdf5_filepath, 'r', libver='latest')
+        return HDF5FileHandler(self.hdf5_filepath, options=self.hdf5_options)
+
+    def _get_hdf5_file(self):
+        """hdf5 file handler that is valid for the current process."""
+        return self._file_handler.file
+
+    hdf5_file = property(_get_hdf5_file)
+
+    def _get_chunk_cache(self, chunk_cache_bytes):
+        if chunk_cache_bytes:
+            return ChunkCache(chunk_cache_bytes)
+        else:
+            return None
+
+    def _get_stats(self, stats, stats_filepath):
+        if stats or stats_filepath:
+            return AccessStats(stats_filepath)
+        else:
+            return None
 
     def _get_sets(self):
         return tuple(sorted(self.hdf5_file['/'].keys()))
 
     def _get_object_fields(self):
         """# fetch list of field names that compose the object list."""
-        object_fields = {}
-        for set_name in self._sets:
-            data = self.hdf5_file['/{}/object_fields'.format(set_name)].value
-            object_fields[set_name] = tuple(convert_ascii_to_str(data))
-        return object_fields
+        return LazyDict(self._sets, self._get_object_fields_set)
+
+    def _get_object_fields_set(self, set_name):
+        data = self.hdf5_file['/{}/object_fields'.format(set_name)].value
+        return tuple(convert_ascii_to_str(data))
 
     def _get_set_loaders(self):
         """Return a dictionary with list of set loaders."""
-        sets = {}
-        for set_name in self._sets:
-            sets[set_name] = SetLoader(self.hdf5_file[set_name])
-        return sets
+        return LazyDict(self._sets, self._get_set_loader)
+
+    def _get_set_loader(self, set_name):
+        hdf5_group = self.hdf5_file[set_name]
+        union_attrs = get_union_attrs(hdf5_group)
+        if union_attrs is not None:
+            return UnionSetLoader(hdf5_group, [self.sets[name] for name in union_attrs["sets"]],
+                                  self.chunk_cache, self.mmap,
+                                  file_handler=self._file_handler,
+                                  shared_memory=self.shared_memory,
+                                  stats=self.stats)
+        return SetLoader(hdf5_group, self.chunk_cache, self.mmap,
+                         file_handler=self._file_handler,
+                         shared_memory=self.shared_memory,
+                         stats=self.stats)
 
     def get(self, set_name, field, index=None, convert_to_str=False):
         """Retrieves data from the dataset's hdf5 metadata file.
@@ -751,6 +2351,458 @@ class DataLoader(object):
         except KeyError:
             self._raise_error_invalid_set_name(set_name)
 
+    def object_columns(self, set_name, index=None):
+        """Retrieves the values of all fields of a batch of objects as columns.
+
+        The 'object_ids' rows of the objects are read once, and then each
+        field in 'object_fields' is fetched with a single read for all
+        objects of the batch.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        index : int/list/tuple/np.ndarray, optional
+            Index number(s) of the objects. If no index is used,
+            it returns the values of all objects.
+
+        Returns
+        -------
+        dict
+            Masked array of values for each field in 'object_fields'.
+            Objects with an undefined index (-1) for a field are masked.
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        assert set_name, 'Must input a valid set name.'
+        try:
+            return self.sets[set_name].object_columns(index)
+        except KeyError:
+            self._raise_error_invalid_set_name(set_name)
+
+    def where(self, set_name, **predicates):
+        """Retrieves the ids of the objects of a set matching a set of predicates.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        **predicates
+            Values to compare the fields with (see SetLoader.where()).
+
+        Returns
+        -------
+        np.ndarray
+            Sorted array of object ids.
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        assert set_name, 'Must input a valid set name.'
+        if set_name not in self.sets:
+            self._raise_error_invalid_set_name(set_name)
+        return self.sets[set_name].where(**predicates)
+
+    def select(self, set_name, fields=None, **predicates):
+        """Retrieves the values of the objects of a set matching a set of predicates.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        fields : str/list/tuple, optional
+            Name(s) of the object fields to retrieve.
+        **predicates
+            Values to compare the fields with (see SetLoader.where()).
+
+        Returns
+        -------
+        dict
+            Masked array of values for each field of the matching objects.
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        assert set_name, 'Must input a valid set name.'
+        if set_name not in self.sets:
+            self._raise_error_invalid_set_name(set_name)
+        return self.sets[set_name].select(fields, **predicates)
+
+    def sampler(self, set_name, fields=None, chunks_per_group=1, buffer_size=None, seed=None):
+        """Returns a sampler of shuffled rows aligned to the chunks of the fields of a set.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        fields : str/list/tuple, optional
+            Name(s) of the fields to read (see SetLoader.sampler()).
+        chunks_per_group : int, optional
+            Number of consecutive chunks of each group.
+        buffer_size : int, optional
+            Number of rows of the window where rows are shuffled.
+        seed : int, optional
+            Seed of the random generator.
+
+        Returns
+        -------
+        ChunkShuffleSampler
+            Sampler of the rows of the fields.
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        assert set_name, 'Must input a valid set name.'
+        if set_name not in self.sets:
+            self._raise_error_invalid_set_name(set_name)
+        return self.sets[set_name].sampler(fields, chunks_per_group, buffer_size, seed)
+
+    def images(self, set_name, index, size=None, field='image_filenames'):
+        """Reads (decodes) the image files of a set.
+
+        The file names stored in a field are resolved against the data
+        directory of the dataset and the files are decoded in parallel by
+        the image reader ('image_reader'), which keeps the decoded images in
+        a byte-bounded cache if 'image_cache_bytes' was set.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        index : int/list/tuple
+            Index number(s) of the rows of the field. An empty list returns
+            no images. To read all images of a set, use iter_images()
+            instead, which decodes them in batches.
+        size : tuple, optional
+            Size (height, width) to resize the images to.
+        field : str, optional
+            Name of the field with the image file names.
+
+        Returns
+        -------
+        np.ndarray/list
+            Array of pixels of the image, or a list of arrays if multiple
+            indexes are requested.
+
+        Raises
+        ------
+        KeyError
+            If set name or field are not valid or do not exist.
+
+        Examples
+        --------
+        >>> images = pascal.images('train', [0, 1, 2], size=(224, 224))
+
+        """
+        assert index is not None, 'Must input the index of the images ' \
+                                  '(use iter_images() to read all images of a set).'
+        if not isinstance(index, (int, np.integer)) and len(index) == 0:
+            return []  # an empty list would otherwise select all the rows of the field
+        filenames = self.get(set_name, field, index, convert_to_str=True)
+        if isinstance(filenames, str):
+            filenames = [filenames]
+        filepaths = [os.path.join(self.data_dir, filename) for filename in filenames]
+        images = self.image_reader.read(filepaths, size)
+        if isinstance(index, (int, np.integer)):
+            return images[0]
+        return images
+
+    def iter_images(self, set_name, indexes=None, batch_size=32, size=None,
+                    field='image_filenames', prefetch=2):
+        """Iterates over batches of decoded images of a set.
+
+        While a batch is being consumed, the file names of the next
+        'prefetch' batches are fetched and their images decoded in the
+        background (see images()).
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        indexes : list/tuple/np.ndarray, optional
+            Index numbers of the rows of the field (in order). If None,
+            iterates over all images of the set.
+        batch_size : int, optional
+            Number of images per batch.
+        size : tuple, optional
+            Size (height, width) to resize the images to.
+        field : str, optional
+            Name of the field with the image file names.
+        prefetch : int, optional
+            Number of batches to read ahead in the background. If 0,
+            batches are read only when requested.
+
+        Returns
+        -------
+        generator
+            Generator of lists of arrays of pixels.
+
+        Raises
+        ------
+        KeyError
+            If set name or field are not valid or do not exist.
+
+        """
+        assert isinstance(batch_size, int) and batch_size > 0, 'Must input a valid batch size.'
+        assert isinstance(prefetch, int) and prefetch >= 0, 'Must input a valid prefetch size.'
+        if indexes is None:
+            indexes = np.arange(self.size(set_name, field)[0])
+        batches = [np.asarray(indexes[i:i + batch_size]).tolist()
+                   for i in range(0, len(indexes), batch_size)]
+
+        def read_batch(batch):
+            return self.images(set_name, batch, size, field)
+
+        if prefetch == 0:
+            return (read_batch(batch) for batch in batches)
+        else:
+            return self._iter_images_prefetch(read_batch, batches, prefetch)
+
+    def _iter_images_prefetch(self, read_batch, batches, prefetch):
+        pool = ThreadPool(1)
+        try:
+            pending = deque()
+            for batch in batches:
+                pending.append(pool.apply_async(read_batch, (batch,)))
+                if len(pending) > prefetch:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def close(self):
+        """Stops the workers decoding images (see images()).
+
+        The loader can still be used: the workers are started again when
+        images are read.
+        """
+        self.image_reader.close()
+
+    def subset(self, set_name, indexes):
+        """Returns a view of a subset of the objects of a set.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        indexes : list/tuple/np.ndarray
+            Indexes of the objects (rows of 'object_ids') or a boolean mask.
+
+        Returns
+        -------
+        SetLoaderSubset
+            View of the objects of the subset (see SetLoader.subset()).
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        if set_name not in self.sets:
+            self._raise_error_invalid_set_name(set_name)
+        return self.sets[set_name].subset(indexes)
+
+    def shard(self, rank, world_size, by='chunk', seed=None, equal_length='pad',
+              class_field='classes'):
+        """Returns a view of the dataset restricted to the objects of a rank.
+
+        Splits the objects (rows of 'object_ids') of each set among
+        'world_size' ranks for distributed training. The returned view
+        supports get(), object() and size() with indexes relative to the
+        objects of the rank, without copying any data.
+
+        Splitting modes:
+
+        - 'chunk': each rank gets (groups of) consecutive chunks of objects,
+          so every rank reads its own chunks of the fields.
+        - 'stride': each rank gets every world_size'th object.
+        - 'class': the objects of each class are evenly split among ranks
+          (the class is read from the 'class_field' column of 'object_ids').
+
+        Parameters
+        ----------
+        rank : int
+            Rank of the shard (0 <= rank < world_size).
+        world_size : int
+            Number of ranks.
+        by : str, optional
+            Splitting mode ('chunk', 'stride' or 'class').
+        seed : int, optional
+            Seed used to shuffle the assignment of objects to ranks on every
+            epoch (see DataLoaderShard.set_epoch()). If None, the objects
+            are assigned in order. Must be the same for all ranks.
+        equal_length : str, optional
+            Pad the shards with repeated objects ('pad') or drop objects
+            ('drop') so all ranks have the same number of objects. If None,
+            the shards can have different lengths.
+        class_field : str, optional
+            Field in 'object_fields' with the class of the objects.
+
+        Returns
+        -------
+        DataLoaderShard
+            View of the dataset for the rank.
+
+        Raises
+        ------
+        ValueError
+            If the splitting mode or the equal length mode are not valid.
+
+        Examples
+        --------
+        >>> shard = coco.shard(rank, world_size, seed=0)
+        >>> for epoch in range(10):
+        ...     shard.set_epoch(epoch)
+        ...     for i in range(shard.size('train')[0]):
+        ...         obj = shard.object('train', i, convert_to_value=True)
+
+        """
+        return DataLoaderShard(self, rank, world_size, by=by, seed=seed,
+                               equal_length=equal_length, class_field=class_field)
+
+    def to_memory(self, budget_bytes, policy='frequency', priority=None, verbose=True):
+        """Loads the most useful fields into memory under a byte budget.
+
+        Computes the (decompressed) memory footprint of each field from its
+        shape and data type, ranks the fields by a policy and loads the best
+        ranked fields into memory until the budget is exhausted. Fields that
+        do not fit in the budget (or are not ranked) are removed from memory
+        and keep being read from disk. Fields already in memory are kept
+        as they are (they are not read again).
+
+        The fields of union sets hold no data: loading them into memory
+        loads the field of each of their sets, and only the bytes of the
+        sets' fields not already loaded by the plan count towards the budget.
+
+        Policies:
+
+        - 'frequency': ranks the fields by the number of times they were
+          read since the dataset was loaded. Fields never read are skipped.
+        - 'priority': ranks the fields by a user defined priority. Fields
+          without a (positive) priority are skipped.
+        - 'size': ranks the fields by their footprint (smallest first).
+
+        Ties are broken by the footprint of the fields (smallest first).
+
+        Parameters
+        ----------
+        budget_bytes : int
+            Maximum number of bytes of the fields loaded into memory.
+        policy : str, optional
+            Ranking policy ('frequency', 'priority' or 'size').
+        priority : dict, optional
+            Priority of the fields for the 'priority' policy. Keys can be
+            field names (applied to all sets) or (set, field) tuples.
+        verbose : bool, optional
+            Prints the resulting plan to the screen.
+
+        Returns
+        -------
+        dict
+            Plan of the fields loaded into memory: policy, budget, total
+            footprint of the loaded fields and the footprint, score and
+            memory placement of every ranked field.
+
+        Raises
+        ------
+        ValueError
+            If the policy is not valid.
+
+        """
+        assert budget_bytes >= 0, 'The budget must be a non-negative number of bytes.'
+        if policy not in ('frequency', 'priority', 'size'):
+            raise ValueError('Invalid policy \'{}\'. Valid policies: frequency, priority, size'
+                             .format(policy))
+        if policy == 'priority' and not priority:
+            raise ValueError('Must input the priorities of the fields for the \'priority\' policy.')
+
+        candidates = self._get_memory_plan_candidates(policy, priority)
+        plan_fields, nbytes, pinned = [], 0, {}
+        for score, field_loader in candidates:
+            owners = [owner for owner in field_loader._get_data_owners()
+                      if id(owner) not in pinned]
+            field_nbytes = sum(owner.nbytes for owner in owners)
+            fits = nbytes + field_nbytes <= budget_bytes
+            if fits:
+                nbytes += field_nbytes
+                pinned.update((id(owner), owner) for owner in owners)
+            plan_fields.append({
+                "set": field_loader.set,
+                "field": field_loader.name,
+                "nbytes": field_nbytes,
+                "score": score,
+                "to_memory": fits
+            })
+
+        owners = dict(pinned)
+        for set_name in self.sets.loaded():
+            for field in self.sets[set_name].fields.loaded():
+                for owner in self.sets[set_name].fields[field]._get_data_owners():
+                    owners[id(owner)] = owner
+        for owner_id, owner in owners.items():
+            to_memory = owner_id in pinned
+            if owner.to_memory != to_memory:
+                owner.to_memory = to_memory
+
+        plan = {
+            "policy": policy,
+            "budget_bytes": budget_bytes,
+            "nbytes": nbytes,
+            "fields": plan_fields
+        }
+        if verbose:
+            self._print_memory_plan(plan)
+        return plan
+
+    def _get_memory_plan_candidates(self, policy, priority):
+        """Returns the (score, field loader) pairs of the ranked fields, best first."""
+        candidates = []
+        if policy == 'frequency':
+            for set_name in self.sets.loaded():
+                for field in self.sets[set_name].fields.loaded():
+                    field_loader = self.sets[set_name].fields[field]
+                    if field_loader.access_count > 0:
+                        candidates.append((field_loader.access_count, field_loader))
+        else:
+            for set_name in self._sets:
+                for field in sorted(self.sets[set_name].fields):
+                    field_loader = self.sets[set_name].fields[field]
+                    if policy == 'size':
+                        candidates.append((field_loader.nbytes, field_loader))
+                        continue
+                    score = priority.get((set_name, field), priority.get(field, 0))
+                    if score > 0:
+                        candidates.append((score, field_loader))
+        if policy == 'size':
+            candidates.sort(key=lambda candidate: candidate[0])
+        else:
+            candidates.sort(key=lambda candidate: (-candidate[0], candidate[1].nbytes))
+        return candidates
+
+    def _print_memory_plan(self, plan):
+        print('> Memory plan (policy: {}): {}/{} bytes loaded into memory'
+              .format(plan["policy"], plan["nbytes"], plan["budget_bytes"]))
+        for field in plan["fields"]:
+            print('   - {}/{}: {} bytes, score: {}, {}'.format(
+                field["set"], field["field"], field["nbytes"], field["score"],
+                'memory' if field["to_memory"] else 'disk'))
+
     def size(self, set_name=None, field='object_ids'):
         """Size of a field.
 
@@ -873,6 +2925,9 @@ class DataLoader(object):
         If no 'set_name' is provided, it displays information for all available
         sets.
 
+        If statistics are enabled, it also displays the statistics of the
+        reads of the fields.
+
         This method only shows the most useful information about a set/fields
         internals, which should be enough for most users in helping to
         determine how to use/handle a specific dataset with little effort.
@@ -892,6 +2947,29 @@ class DataLoader(object):
             self._print_info_all_sets()
         else:
             self._print_info_single_set(set_name)
+        if self.stats is not None:
+            self.stats.print_info(set_name)
+
+    def get_stats(self, set_name=None):
+        """Returns the statistics of the reads of the fields.
+
+        Parameters
+        ----------
+        set_name : str, optional
+            Name of the set. If not given, returns the statistics of all sets.
+
+        Returns
+        -------
+        dict
+            Number of calls, rows and bytes read, chunk cache hits and
+            latency histogram of each field of each set. Reads of objects
+            are recorded as the 'object()' field. Empty if the statistics
+            are disabled.
+
+        """
+        if self.stats is None:
+            return {}
+        return self.stats.to_dict(set_name)
 
     def _print_info_all_sets(self):
         for set_name in sorted(self.sets):
@@ -907,6 +2985,49 @@ class DataLoader(object):
     def __len__(self):
         return len(self.sets)
 
+    def __getstate__(self):
+        """Pickles only the information needed to reopen the dataset."""
+        return {
+            "name": self.db_name,
+            "task": self.task,
+            "data_dir": self.data_dir,
+            "hdf5_filepath": self.hdf5_filepath,
+            "chunk_cache_bytes": self._get_chunk_cache_bytes(),
+            "mmap": self.mmap,
+            "shared_memory": self.shared_memory,
+            "hdf5_options": self.hdf5_options,
+            "stats": self.stats,
+            "image_reader": self.image_reader,
+            "in_memory_fields": self._get_in_memory_fields()
+        }
+
+    def _get_chunk_cache_bytes(self):
+        if self.chunk_cache is None:
+            return None
+        else:
+            return self.chunk_cache.max_bytes
+
+    def _get_in_memory_fields(self):
+        in_memory_fields = {}
+        for set_name in self.sets.loaded():
+            in_memory_fields[set_name] = self.sets[set_name]._get_in_memory_fields()
+        return in_memory_fields
+
+    def __setstate__(self, state):
+        self.__init__(name=state["name"],
+                      task=state["task"],
+                      data_dir=state["data_dir"],
+                      hdf5_filepath=state["hdf5_filepath"],
+                      chunk_cache_bytes=state["chunk_cache_bytes"],
+                      mmap=state["mmap"],
+                      shared_memory=state["shared_memory"],
+                      hdf5_options=state["hdf5_options"])
+        self.stats = state["stats"]  # shared by the set loaders (created on first access)
+        self.image_reader = state["image_reader"]
+        for set_name, fields in state["in_memory_fields"].items():
+            for field in fields:
+                self.sets[set_name].fields[field].to_memory = True
+
     def __str__(self):
         s = "DataLoader: {} ('{}' task)".format(self.db_name, self.task)
         return s
@@ -0,0 +1,285 @@
+"""
+Secondary indexes for querying the objects of a set.
+"""
+
+
+import os
+import operator as op
+import h5py
+import numpy as np
+
+from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.string_ascii import convert_ascii_to_str
+
+
+OPERATORS = ('eq', 'ne', 'lt', 'le', 'gt', 'ge', 'in')
+
+
+class ObjectIndex(object):
+    """Secondary indexes over the 'object_ids' of a set.
+
+    Each field in 'object_fields' gets its own index, built the first time
+    it is used in a query:
+
+    - fields with one value per row (1D fields, e.g. 'area' or 'iscrowd')
+      get a sorted index of the objects' values, so (range) comparisons are
+      solved with a binary search.
+    - the remaining fields get an inverted index which maps each row of
+      the field (the value stored in the field's column of 'object_ids') to
+      the sorted list of object ids that use it. For string fields (stored
+      as uint8 arrays, e.g. 'category'), the strings are compared first and
+      then the matching rows are mapped to objects.
+
+    Objects with an undefined index (-1) for a field never match a predicate
+    of that field.
+
+    Indexes are stored in a sidecar hdf5 file (if a file path is given) so
+    they are built only once per dataset. The sidecar is rebuilt when the
+    metadata file is modified. If the sidecar cannot be written, the indexes
+    are kept only in memory.
+
+    Parameters
+    ----------
+    set_loader : SetLoader
+        Loader of the set to index.
+    filepath : str, optional
+        Path of the sidecar hdf5 file to store the indexes.
+
+    Attributes
+    ----------
+    set_loader : SetLoader
+        Loader of the set to index.
+    filepath : str
+        Path of the sidecar hdf5 file to store the indexes.
+
+    """
+
+    def __init__(self, set_loader, filepath=None):
+        """Initialize class."""
+        self.set_loader = set_loader
+        self.filepath = filepath
+        self._indexes = {}
+        self._strings = {}
+
+    def query(self, predicates):
+        """Returns the ids of the objects matching all predicates.
+
+        Parameters
+        ----------
+        predicates : dict
+            Predicates to evaluate as "<field>" or "<field>__<operator>"
+            keys mapped to the value to compare with.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted array of object ids.
+
+        Raises
+        ------
+        KeyError
+            If a field is not contained in 'object_fields'.
+        ValueError
+            If an operator is not valid.
+
+        """
+        results = [self.lookup(field, operator, value)
+                   for (field, operator), value in self._parse_predicates(predicates)]
+        if not results:
+            return np.arange(self.set_loader.nelems)
+        results.sort(key=len)
+        object_ids = results[0]
+        for result in results[1:]:
+            object_ids = np.intersect1d(object_ids, result, assume_unique=True)
+        return object_ids
+
+    def _parse_predicates(self, predicates):
+        parsed = []
+        for key in sorted(predicates):
+            field, operator = key, 'eq'
+            if '__' in key and key not in self.set_loader.object_fields:
+                field, operator = key.rsplit('__', 1)
+            parsed.append(((field, operator), predicates[key]))
+        return parsed
+
+    def lookup(self, field, operator, value):
+        """Returns the ids of the objects whose field satisfies a comparison.
+
+        Parameters
+        ----------
+        field : str
+            Name of the field.
+        operator : str
+            Comparison operator ('eq', 'ne', 'lt', 'le', 'gt', 'ge' or 'in').
+        value : int/float/str/list
+            Value to compare with (list of values for the 'in' operator).
+
+        Returns
+        -------
+        np.ndarray
+            Sorted array of object ids.
+
+        """
+        if operator not in OPERATORS:
+            raise ValueError('Invalid operator \'{}\'. Valid operators: {}'
+                             .format(operator, OPERATORS))
+        index = self.get_index(field)
+        if 'values' in index:
+            return self._lookup_sorted_index(index, operator, value)
+        if self._is_string_field(field):
+            rows = np.flatnonzero(_compare(self._get_strings(field), operator, value))
+            return _get_postings(index, np.isin(index['keys'], rows))
+        return self._lookup_inverted_index(index, operator, value)
+
+    def _lookup_sorted_index(self, index, operator, value):
+        if operator in ('ne', 'in'):
+            return np.sort(index['ids'][_compare(index['values'], operator, value)])
+        start, end = _get_sorted_range(index['values'], operator, value)
+        if operator == 'eq':
+            return index['ids'][start:end]  # equal values keep the ids sorted
+        return np.sort(index['ids'][start:end])
+
+    def _lookup_inverted_index(self, index, operator, value):
+        if operator in ('ne', 'in'):
+            return _get_postings(index, _compare(index['keys'], operator, value))
+        start, end = _get_sorted_range(index['keys'], operator, value)
+        object_ids = index['ids'][index['offsets'][start]:index['offsets'][end]]
+        if end - start > 1:
+            object_ids = np.sort(object_ids)
+        return object_ids
+
+    def get_index(self, field):
+        """Returns the index of a field (loading or building it if needed).
+
+        Parameters
+        ----------
+        field : str
+            Name of the field.
+
+        Returns
+        -------
+        dict
+            Arrays of the index: 'values' and 'ids' for sorted indexes or
+            'keys', 'offsets' and 'ids' for inverted indexes.
+
+        Raises
+        ------
+        KeyError
+            If the field is not contained in 'object_fields'.
+
+        """
+        if field not in self._indexes:
+            if field not in self.set_loader.object_fields:
+                raise KeyError('\'{}\' is not contained in \'object_fields\'.'.format(field))
+            index = self._load_index(field)
+            if index is None:
+                index = self._build_index(field)
+                self._save_index(field, index)
+            self._indexes[field] = index
+        return self._indexes[field]
+
+    def _build_index(self, field):
+        obj_id = self.set_loader.object_fields.index(field)
+        rows = np.asarray(self.set_loader.fields['object_ids'][:, obj_id])
+        object_ids = np.flatnonzero(rows >= 0)
+        rows = rows[object_ids]
+        if len(self.set_loader.size(field)) == 1:
+            values = np.asarray(self.set_loader.fields[field].get())[rows]
+            order = np.argsort(values, kind='mergesort')
+            return {"values": values[order], "ids": object_ids[order]}
+        order = np.argsort(rows, kind='mergesort')
+        keys, starts = np.unique(rows[order], return_index=True)
+        return {
+            "keys": keys,
+            "offsets": np.append(starts, len(rows)).astype(np.int64),
+            "ids": object_ids[order]
+        }
+
+    def _is_string_field(self, field):
+        field_loader = self.set_loader.fields[field]
+        return field_loader.type == np.uint8 and len(field_loader.shape) == 2
+
+    def _get_strings(self, field):
+        if field not in self._strings:
+            strings = convert_ascii_to_str(self.set_loader.fields[field].get())
+            self._strings[field] = np.array(strings, ndmin=1)
+        return self._strings[field]
+
+    def _get_source_mtime(self):
+        return os.path.getmtime(self.set_loader._file_handler.filepath)
+
+    def _get_index_path(self, field):
+        return '{}/{}'.format(self.set_loader.set, field)
+
+    def _load_index(self, field):
+        """Reads the index of a field from the sidecar file (None if not stored)."""
+        if not self.filepath or not os.path.exists(self.filepath):
+            return None
+        try:
+            with h5py.File(self.filepath, 'r') as sidecar:
+                if sidecar.attrs.get('source_mtime') != self._get_source_mtime():
+                    return None
+                group = sidecar.get(self._get_index_path(field))
+                if group is None:
+                    return None
+                return dict((key, group[key][()]) for key in group)
+        except (IOError, OSError):
+            return None
+
+    def _save_index(self, field, index):
+        """Stores the index of a field in the sidecar file (if possible)."""
+        if not self.filepath:
+            return
+        try:
+            with h5py.File(self.filepath, 'a') as sidecar:
+                source_mtime = self._get_source_mtime()
+                if sidecar.attrs.get('source_mtime') != source_mtime:
+                    for key in list(sidecar.keys()):
+                        del sidecar[key]
+                    sidecar.attrs['source_mtime'] = source_mtime
+                path = self._get_index_path(field)
+                if path in sidecar:
+                    del sidecar[path]
+                group = sidecar.create_group(path)
+                for key, data in index.items():
+                    hdf5_write_data(group, key, data)
+        except (IOError, OSError):
+            pass  # the index is kept only in memory
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def __str__(self):
+        return 'ObjectIndex: set<{}>, fields<{}>'.format(self.set_loader.set,
+                                                         sorted(self._indexes))
+
+    def __repr__(self):
+        return str(self)
+
+
+def _compare(data, operator, value):
+    """Element-wise comparison of an array with a value."""
+    if operator == 'in':
+        return np.isin(data, np.asarray(value))
+    return getattr(op, operator)(data, value)
+
+
+def _get_sorted_range(sorted_data, operator, value):
+    """Returns the range of positions of a sorted array satisfying a comparison."""
+    if operator == 'eq':
+        return (np.searchsorted(sorted_data, value, side='left'),
+                np.searchsorted(sorted_data, value, side='right'))
+    elif operator == 'lt':
+        return 0, np.searchsorted(sorted_data, value, side='left')
+    elif operator == 'le':
+        return 0, np.searchsorted(sorted_data, value, side='right')
+    elif operator == 'gt':
+        return np.searchsorted(sorted_data, value, side='right'), len(sorted_data)
+    else:
+        return np.searchsorted(sorted_data, value, side='left'), len(sorted_data)
+
+
+def _get_postings(index, keys_mask):
+    """Returns the sorted object ids of the selected keys of an inverted index."""
+    positions_mask = np.repeat(keys_mask, np.diff(index['offsets']))
+    return np.sort(index['ids'][positions_mask])
@@ -0,0 +1,141 @@
+"""
+Chunk-coherent shuffling of the rows of on-disk fields.
+"""
+
+
+import numpy as np
+
+try:
+    from math import gcd
+except ImportError:
+    from fractions import gcd
+
+
+class ChunkShuffleSampler(object):
+    """Shuffled order of rows that reads the hdf5 chunks (nearly) sequentially.
+
+    Fully random shuffling of the rows of a compressed field stored on disk
+    decompresses a different chunk on almost every read. This sampler
+    shuffles the rows in two levels instead:
+
+    - the rows are split into groups of 'chunks_per_group' consecutive
+      chunks (aligned to the chunk boundaries of the fields) and the order
+      of the groups is shuffled.
+    - the rows of the shuffled groups are then shuffled inside a window of
+      'buffer_size' consecutive rows.
+
+    Therefore, only the chunks of the groups overlapping a window are read
+    at a time, while the rows of different chunks are still mixed.
+
+    The order of each epoch is reproducible from the seed and the epoch
+    number.
+
+    Parameters
+    ----------
+    num_rows : int
+        Number of rows to sample.
+    chunk_rows : int, optional
+        Number of rows of each chunk. If None (e.g. the data is not chunked),
+        rows are shuffled individually.
+    chunks_per_group : int, optional
+        Number of consecutive chunks of each group.
+    buffer_size : int, optional
+        Number of rows of the window where rows are shuffled. Defaults to
+        the rows of four groups.
+    seed : int, optional
+        Seed of the random generator. A random seed is used if None.
+
+    Attributes
+    ----------
+    num_rows : int
+        Number of rows to sample.
+    group_rows : int
+        Number of rows of each group.
+    buffer_size : int
+        Number of rows of the window where rows are shuffled.
+    seed : int
+        Seed of the random generator.
+    epoch : int
+        Epoch of the order returned when iterating over the sampler.
+
+    """
+
+    def __init__(self, num_rows, chunk_rows=None, chunks_per_group=1, buffer_size=None,
+                 seed=None):
+        """Initialize class."""
+        assert num_rows >= 0, 'Must input a valid number of rows.'
+        assert chunks_per_group > 0, 'Must input a valid number of chunks per group.'
+
+        self.num_rows = num_rows
+        self.group_rows = (chunk_rows or 1) * chunks_per_group
+        self.buffer_size = buffer_size or self.group_rows * 4
+        self.seed = seed if seed is not None else np.random.randint(2 ** 31)
+        self.epoch = 0
+
+    def get_indexes(self, epoch=None):
+        """Returns the order of the rows of an epoch.
+
+        Parameters
+        ----------
+        epoch : int, optional
+            Epoch number. Defaults to the current epoch.
+
+        Returns
+        -------
+        np.ndarray
+            Permutation of the row indexes.
+
+        """
+        if epoch is None:
+            epoch = self.epoch
+        rng = np.random.RandomState([self.seed, epoch])
+        num_groups = -(-self.num_rows // self.group_rows)
+        group_starts = rng.permutation(num_groups) * self.group_rows
+        indexes = (group_starts[:, None] + np.arange(self.group_rows)).reshape(-1)
+        indexes = indexes[indexes < self.num_rows]
+        if self.buffer_size > 1:
+            windows = np.arange(len(indexes)) // self.buffer_size
+            indexes = indexes[np.lexsort((rng.rand(len(indexes)), windows))]
+        return indexes
+
+    def set_epoch(self, epoch):
+        """Sets the epoch of the order returned when iterating over the sampler."""
+        self.epoch = epoch
+
+    def __iter__(self):
+        return iter(self.get_indexes().tolist())
+
+    def __len__(self):
+        return self.num_rows
+
+    def __str__(self):
+        return 'ChunkShuffleSampler: rows<{}>, group_rows<{}>, buffer_size<{}>, seed<{}>' \
+            .format(self.num_rows, self.group_rows, self.buffer_size, self.seed)
+
+    def __repr__(self):
+        return str(self)
+
+
+def get_aligned_chunk_rows(field_loaders):
+    """Returns the number of rows aligned to the chunks of the fields read from disk.
+
+    This is the least common multiple of the rows of the chunks of the
+    fields (or the biggest number of rows, if the multiple is too large).
+    Fields loaded into memory or memory-mapped are ignored. Returns None if
+    no field is read from chunks.
+    """
+    chunk_rows = [field_loader._chunk_rows for field_loader in field_loaders
+                  if field_loader._chunk_rows and not _is_numpy_field(field_loader)]
+    if not chunk_rows:
+        return None
+    aligned_rows = 1
+    for rows in chunk_rows:
+        aligned_rows = aligned_rows * rows // gcd(aligned_rows, rows)
+    if aligned_rows > 4 * max(chunk_rows):
+        return max(chunk_rows)
+    return aligned_rows
+
+
+def _is_numpy_field(field_loader):
+    """Returns True if a field is loaded into memory or memory-mapped."""
+    return field_loader.to_memory or field_loader.mmap
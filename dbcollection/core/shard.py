@@ -0,0 +1,358 @@
+"""
+Distributed sharding of the objects of a dataset.
+"""
+
+
+import numpy as np
+
+from dbcollection.core.sampler import get_aligned_chunk_rows
+
+
+SHARD_MODES = ('chunk', 'stride', 'class')
+EQUAL_LENGTH_MODES = ('pad', 'drop', None)
+
+
+def get_shards(num_rows, world_size, by='chunk', chunk_rows=None, labels=None, seed=None,
+               epoch=0, equal_length='pad'):
+    """Splits the rows of a set into a shard (sorted array of rows) per rank.
+
+    Parameters
+    ----------
+    num_rows : int
+        Number of rows to split.
+    world_size : int
+        Number of shards.
+    by : str, optional
+        Splitting mode: 'chunk' assigns (groups of) consecutive chunks of
+        rows to each shard, 'stride' assigns every world_size'th row to each
+        shard and 'class' assigns the rows of each class evenly to all
+        shards (stratified).
+    chunk_rows : int, optional
+        Number of rows of each chunk ('chunk' mode). If None, each shard
+        gets a contiguous range of rows.
+    labels : np.ndarray, optional
+        Class of each row ('class' mode).
+    seed : int, optional
+        Seed of the random generator used to shuffle the assignment of rows
+        to the shards. If None, the rows are assigned in order.
+    epoch : int, optional
+        Epoch number (shuffles the assignment differently every epoch).
+    equal_length : str, optional
+        Pad the shards with repeated rows ('pad') or drop rows ('drop') so
+        all shards have the same length. If None, the shard lengths can
+        differ.
+
+    Returns
+    -------
+    list
+        Sorted array of rows of each shard.
+
+    Raises
+    ------
+    ValueError
+        If the splitting mode or the equal length mode are not valid.
+
+    """
+    assert world_size > 0, 'Must input a valid world size.'
+    if by not in SHARD_MODES:
+        raise ValueError('Invalid shard mode \'{}\'. Valid modes: {}'.format(by, SHARD_MODES))
+    if equal_length not in EQUAL_LENGTH_MODES:
+        raise ValueError('Invalid equal length mode \'{}\'. Valid modes: {}'
+                         .format(equal_length, EQUAL_LENGTH_MODES))
+
+    rng = np.random.RandomState([seed, epoch]) if seed is not None else None
+    if by == 'chunk':
+        shards = _split_by_chunks(num_rows, world_size, chunk_rows, rng)
+    else:
+        order = np.arange(num_rows) if rng is None else rng.permutation(num_rows)
+        if by == 'class':
+            assert labels is not None, 'Must input the labels of the rows.'
+            order = order[np.argsort(np.asarray(labels)[order], kind='mergesort')]
+        shards = [order[rank::world_size] for rank in range(world_size)]
+    shards = [np.sort(shard) for shard in shards]
+    return _equalize_lengths(shards, num_rows, equal_length)
+
+
+def _split_by_chunks(num_rows, world_size, chunk_rows, rng):
+    if not chunk_rows:
+        chunk_rows = 1
+    num_chunks = -(-num_rows // chunk_rows)
+    chunks = np.arange(num_chunks) if rng is None else rng.permutation(num_chunks)
+    shards = []
+    for shard_chunks in np.array_split(chunks, world_size):
+        rows = (shard_chunks[:, None] * chunk_rows + np.arange(chunk_rows)).reshape(-1)
+        shards.append(rows[rows < num_rows])
+    return shards
+
+
+def _equalize_lengths(shards, num_rows, equal_length):
+    if equal_length == 'pad':
+        length = max(len(shard) for shard in shards)
+        return [np.resize(shard if len(shard) else np.arange(num_rows), length)
+                for shard in shards]
+    elif equal_length == 'drop':
+        length = min(len(shard) for shard in shards)
+        return [shard[:length] for shard in shards]
+    return shards
+
+
+class DataLoaderShard(object):
+    """View of a DataLoader restricted to the objects of a rank.
+
+    The objects (rows of 'object_ids') of each set are split among all
+    ranks (see get_shards()) and this view maps the indexes used in get()
+    and object() to the objects of its rank. The fields aligned with the
+    objects (see get_object_aligned_fields()) are mapped the same way. The
+    remaining fields (e.g. lists of classes or filenames referenced by the
+    objects) are not sharded.
+
+    No data is copied: the view reads the data through a SetLoaderSubset of
+    each set.
+
+    All ranks must use the same 'by', 'seed' and 'equal_length' values (and
+    epoch) so the shards do not overlap.
+
+    Parameters
+    ----------
+    data_loader : DataLoader
+        Loader of the dataset.
+    rank : int
+        Rank of the shard (0 <= rank < world_size).
+    world_size : int
+        Number of shards.
+    by : str, optional
+        Splitting mode ('chunk', 'stride' or 'class').
+    seed : int, optional
+        Seed of the random generator used to shuffle the shards every epoch.
+    equal_length : str, optional
+        Pad ('pad') or drop ('drop') rows so all shards have the same
+        length, or keep different lengths (None).
+    class_field : str, optional
+        Field in 'object_fields' with the class of the objects ('class' mode).
+
+    Attributes
+    ----------
+    data_loader : DataLoader
+        Loader of the dataset.
+    rank : int
+        Rank of the shard.
+    world_size : int
+        Number of shards.
+    by : str
+        Splitting mode.
+    seed : int
+        Seed of the random generator.
+    equal_length : str
+        Mode used to equalize the lengths of the shards.
+    class_field : str
+        Field with the class of the objects.
+    epoch : int
+        Current epoch.
+
+    """
+
+    def __init__(self, data_loader, rank, world_size, by='chunk', seed=None,
+                 equal_length='pad', class_field='classes'):
+        """Initialize class."""
+        assert data_loader, 'Must input a valid data loader.'
+        assert 0 <= rank < world_size, 'Must input a valid rank: 0 <= rank < world_size.'
+        if by not in SHARD_MODES:
+            raise ValueError('Invalid shard mode \'{}\'. Valid modes: {}'.format(by, SHARD_MODES))
+        if equal_length not in EQUAL_LENGTH_MODES:
+            raise ValueError('Invalid equal length mode \'{}\'. Valid modes: {}'
+                             .format(equal_length, EQUAL_LENGTH_MODES))
+
+        self.data_loader = data_loader
+        self.rank = rank
+        self.world_size = world_size
+        self.by = by
+        self.seed = seed
+        self.equal_length = equal_length
+        self.class_field = class_field
+        self.epoch = 0
+        self._subsets = {}
+
+    def set_epoch(self, epoch):
+        """Sets the epoch used to shuffle the shards (if a seed was given)."""
+        self.epoch = epoch
+        self._subsets = {}
+
+    def subset(self, set_name):
+        """Returns the view of the objects of the shard of a set.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+
+        Returns
+        -------
+        SetLoaderSubset
+            View of the objects of the shard (see SetLoader.subset()).
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        if set_name not in self._subsets:
+            if set_name not in self.data_loader.sets:
+                self.data_loader._raise_error_invalid_set_name(set_name)
+            set_loader = self.data_loader.sets[set_name]
+            shards = get_shards(set_loader.nelems, self.world_size,
+                                by=self.by,
+                                chunk_rows=self._get_chunk_rows(set_loader),
+                                labels=self._get_labels(set_loader),
+                                seed=self.seed,
+                                epoch=self.epoch,
+                                equal_length=self.equal_length)
+            self._subsets[set_name] = set_loader.subset(shards[self.rank])
+        return self._subsets[set_name]
+
+    def indexes(self, set_name):
+        """Returns the objects (rows of 'object_ids') of the shard of a set.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted array of object indexes (with repeated indexes if padded).
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        return self.subset(set_name).indexes
+
+    def _get_chunk_rows(self, set_loader):
+        if self.by != 'chunk':
+            return None
+        field_loaders = [set_loader.fields[field]
+                         for field in sorted(set_loader._get_object_aligned_fields())]
+        return get_aligned_chunk_rows(field_loaders)
+
+    def _get_labels(self, set_loader):
+        if self.by != 'class':
+            return None
+        obj_id = set_loader.object_field_id(self.class_field)
+        return np.asarray(set_loader.get('object_ids'))[:, obj_id]
+
+    def get(self, set_name, field, index=None, convert_to_str=False):
+        """Retrieves data of a field of the objects of the shard.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        field : str
+            Name of the field.
+        index : int/list/tuple, optional
+            Index number(s) of the objects in the shard. If None, returns
+            the data of all objects of the shard.
+        convert_to_str : bool, optional
+            Convert the output data into a string.
+
+        Returns
+        -------
+        np.ndarray/list/str
+            Numpy array containing the field's data.
+
+        Raises
+        ------
+        KeyError
+            If set name or field are not valid or do not exist.
+
+        """
+        return self.subset(set_name).get(field, index, convert_to_str)
+
+    def object(self, set_name, index=None, convert_to_value=False):
+        """Retrieves the indexes/values of the objects of the shard.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the set.
+        index : int/list/tuple, optional
+            Index number(s) of the objects in the shard. If None, returns
+            all objects of the shard.
+        convert_to_value : bool, optional
+            If False, outputs a list of indexes. If True,
+            it outputs a list of arrays/values instead of indexes.
+
+        Returns
+        -------
+        list
+            Returns a list of indexes or, if convert_to_value is True,
+            a list of data arrays/values.
+
+        Raises
+        ------
+        KeyError
+            If set name is not valid or does not exist.
+
+        """
+        return self.subset(set_name).object(index, convert_to_value)
+
+    def size(self, set_name=None, field='object_ids'):
+        """Size of a field in the shard.
+
+        Parameters
+        ----------
+        set_name : str, optional
+            Name of the set. If None, returns the sizes of all sets.
+        field : str, optional
+            Name of the field.
+
+        Returns
+        -------
+        tuple/dict
+            Shape of the field (or a dictionary of shapes per set).
+
+        Raises
+        ------
+        KeyError
+            If set name or field are not valid or do not exist.
+
+        """
+        if set_name is None:
+            return dict((name, self.size(name, field)) for name in self.data_loader.sets)
+        return self.subset(set_name).size(field)
+
+    def list(self, set_name=None):
+        """List of all field names of a set (see DataLoader.list())."""
+        return self.data_loader.list(set_name)
+
+    def __len__(self):
+        return len(self.data_loader)
+
+    def __getstate__(self):
+        """Pickles only the parameters of the shard (the shards are recomputed)."""
+        return {
+            "data_loader": self.data_loader,
+            "rank": self.rank,
+            "world_size": self.world_size,
+            "by": self.by,
+            "seed": self.seed,
+            "equal_length": self.equal_length,
+            "class_field": self.class_field,
+            "epoch": self.epoch
+        }
+
+    def __setstate__(self, state):
+        epoch = state.pop("epoch")
+        self.__init__(**state)
+        self.epoch = epoch
+
+    def __str__(self):
+        return 'DataLoaderShard: {} (rank {}/{}, by \'{}\')'.format(
+            self.data_loader, self.rank, self.world_size, self.by)
+
+    def __repr__(self):
+        return str(self)
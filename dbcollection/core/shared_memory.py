@@ -0,0 +1,262 @@
+"""
+Numpy arrays shared between processes through memory-mapped files.
+"""
+
+
+import os
+import atexit
+import errno
+import hashlib
+import tempfile
+import threading
+import numpy as np
+
+
+SHARED_MEMORY_DIR = '/dev/shm'
+
+# Windows constants used to check if a process is alive
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+ERROR_ACCESS_DENIED = 5
+STILL_ACTIVE = 259
+
+# os.replace() overwrites existing files on all platforms (py3.3+)
+_replace = getattr(os, 'replace', os.rename)
+
+_lock = threading.Lock()
+_local_refs = {}  # number of SharedArray objects of this process using each segment
+_local_refs_pid = os.getpid()
+
+
+def get_shared_memory_dir():
+    """Returns the directory where the shared memory segments are stored.
+
+    Segments are stored in /dev/shm (RAM-backed) if available, otherwise in
+    the default temporary directory (where they are still shared through
+    the OS page cache).
+    """
+    if os.path.isdir(SHARED_MEMORY_DIR) and os.access(SHARED_MEMORY_DIR, os.W_OK):
+        return SHARED_MEMORY_DIR
+    return tempfile.gettempdir()
+
+
+def get_segment_name(*keys):
+    """Returns a unique segment name for a set of keys."""
+    digest = hashlib.sha1(repr(keys).encode('utf-8')).hexdigest()
+    return 'dbcollection_{}'.format(digest[:20])
+
+
+class SharedArray(object):
+    """Read-only numpy array shared between processes.
+
+    The first process to use a segment creates a memory-mapped file with
+    the data of the array, and every other process (or object) using the
+    same segment name maps the same file (zero-copy). Each process keeps a
+    reference to the segment (a marker file named by its pid) while it is
+    in use, and the last one to release it removes the segment. References
+    of processes that died without releasing the segment are ignored.
+
+    Parameters
+    ----------
+    name : str
+        Name of the segment.
+    dtype : np.dtype
+        Data type of the array.
+    shape : tuple
+        Shape of the array.
+    read_fn : function
+        Function that fills an array with the data of the segment. It is
+        only called when the segment is created.
+    directory : str, optional
+        Directory where the segment is stored.
+
+    Attributes
+    ----------
+    name : str
+        Name of the segment.
+    filepath : str
+        Path of the memory-mapped file of the segment.
+    data : np.memmap
+        Read-only array with the data of the segment.
+
+    """
+
+    def __init__(self, name, dtype, shape, read_fn, directory=None):
+        """Initialize class."""
+        assert name, 'Must input a valid segment name.'
+
+        self.name = name
+        self.filepath = os.path.join(directory or get_shared_memory_dir(), name)
+        self._pid = os.getpid()
+        self._acquire()
+        self.data = self._attach(np.dtype(dtype), tuple(shape), read_fn)
+
+    def _attach(self, dtype, shape, read_fn):
+        if int(np.prod(shape)) * dtype.itemsize == 0:
+            return np.empty(shape, dtype=dtype)  # empty files cannot be mapped
+        for _ in range(2):
+            if not os.path.exists(self.filepath):
+                self._create(dtype, shape, read_fn)
+            try:
+                return np.memmap(self.filepath, mode='r', dtype=dtype, shape=shape)
+            except (IOError, OSError) as err:
+                if err.errno != errno.ENOENT:
+                    raise  # else, it was removed by the last user meanwhile
+        raise IOError('Could not attach to the shared memory segment: {}'.format(self.filepath))
+
+    def _create(self, dtype, shape, read_fn):
+        """Writes the segment to a temporary file and renames it (atomically).
+
+        If another process created the segment meanwhile and it cannot be
+        replaced (e.g. it is mapped by a process on Windows, or os.rename()
+        is used on py2), its segment is kept: both have the same data.
+        """
+        tmp_filepath = '{}.{}.tmp'.format(self.filepath, os.getpid())
+        data = np.memmap(tmp_filepath, mode='w+', dtype=dtype, shape=shape)
+        try:
+            read_fn(data)
+            data.flush()
+        except Exception:
+            os.remove(tmp_filepath)
+            raise
+        finally:
+            del data
+        try:
+            _replace(tmp_filepath, self.filepath)
+        except OSError:
+            os.remove(tmp_filepath)
+            if not os.path.exists(self.filepath):
+                raise
+
+    def _acquire(self):
+        with _lock:
+            local_refs = _get_local_refs()
+            if local_refs.get(self.filepath, 0) == 0:
+                _add_process_reference(self.filepath)
+            local_refs[self.filepath] = local_refs.get(self.filepath, 0) + 1
+
+    def release(self):
+        """Stops using the segment and removes it if there are no other users.
+
+        Forked processes never remove the segment of their parent process.
+        """
+        if self.data is None:
+            return
+        self.data = None
+        if self._pid != os.getpid():
+            return
+        with _lock:
+            local_refs = _get_local_refs()
+            local_refs[self.filepath] -= 1
+            if local_refs[self.filepath] == 0:
+                del local_refs[self.filepath]
+                _remove_process_reference(self.filepath)
+
+    def __getstate__(self):
+        raise TypeError('SharedArray objects cannot be pickled. Attach to the segment by name.')
+
+    def __str__(self):
+        return 'SharedArray: name<{}>, shape<{}>, dtype<{}>'.format(
+            self.name, None if self.data is None else self.data.shape,
+            None if self.data is None else self.data.dtype)
+
+    def __repr__(self):
+        return str(self)
+
+
+def _get_local_refs():
+    """Returns the references of this process (forked processes start with none)."""
+    global _local_refs, _local_refs_pid
+    if _local_refs_pid != os.getpid():
+        _local_refs, _local_refs_pid = {}, os.getpid()
+    return _local_refs
+
+
+def _get_refs_dir(filepath):
+    return filepath + '.refs'
+
+
+def _add_process_reference(filepath):
+    refs_dir = _get_refs_dir(filepath)
+    for _ in range(2):
+        try:
+            os.makedirs(refs_dir)
+        except OSError:
+            pass  # already exists
+        try:
+            open(os.path.join(refs_dir, str(os.getpid())), 'w').close()
+            return
+        except (IOError, OSError) as err:
+            if err.errno != errno.ENOENT:
+                raise  # else, it was removed by the last user meanwhile
+
+
+def _remove_process_reference(filepath):
+    """Removes the reference of this process and the segment if it was the last one."""
+    refs_dir = _get_refs_dir(filepath)
+    _remove_file(os.path.join(refs_dir, str(os.getpid())))
+    if not _has_users(refs_dir):
+        _remove_file(filepath)
+        try:
+            os.rmdir(refs_dir)
+        except OSError:
+            pass  # a new user was added meanwhile
+
+
+def _has_users(refs_dir):
+    """Returns True if any alive process holds a reference to a segment."""
+    try:
+        pids = os.listdir(refs_dir)
+    except OSError:
+        return False
+    has_users = False
+    for pid in pids:
+        if _is_process_alive(int(pid)):
+            has_users = True
+        else:
+            _remove_file(os.path.join(refs_dir, pid))
+    return has_users
+
+
+def _remove_file(filepath):
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
+
+
+def _is_process_alive(pid):
+    """Returns True if a process exists (without sending any signal to it)."""
+    if os.name == 'nt':
+        return _is_windows_process_alive(pid)
+    try:
+        os.kill(pid, 0)  # signal 0 only checks the process (on POSIX systems)
+    except OSError as err:
+        return err.errno == errno.EPERM
+    return True
+
+
+def _is_windows_process_alive(pid):
+    # os.kill() terminates the process on Windows, so query its exit code instead
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    try:
+        exit_code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return True
+        return exit_code.value == STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+@atexit.register
+def _release_process_references():
+    """Releases the segments still referenced by this process at exit."""
+    with _lock:
+        local_refs = _get_local_refs()
+        for filepath in list(local_refs):
+            del local_refs[filepath]
+            _remove_process_reference(filepath)
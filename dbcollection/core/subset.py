@@ -0,0 +1,320 @@
+"""
+Zero-copy views over a subset of the objects of a set.
+"""
+
+
+import numpy as np
+
+from dbcollection.utils.string_ascii import convert_ascii_to_str
+
+
+# fields with a row per object that are not referenced by the 'object_ids' columns
+OBJECT_LEVEL_FIELDS = ('id', 'occlusion')
+
+
+class SetLoaderSubset(object):
+    """View of a SetLoader restricted to a subset of its objects.
+
+    The view stores an array with the rows of 'object_ids' of the subset and
+    maps the indexes used in get(), object() and size() to those rows when
+    the data is read, so no data is copied. The fields aligned with the
+    objects (see get_object_aligned_fields()) are mapped the same way. The
+    remaining fields (e.g. lists of classes or filenames referenced by the
+    objects) are read from the set unchanged.
+
+    Subsets of a subset are views over the same set: their indexes are
+    composed when the view is created, so every read is a single read of
+    the set's fields.
+
+    Parameters
+    ----------
+    set_loader : SetLoader
+        Loader of the set.
+    indexes : list/tuple/np.ndarray
+        Rows of 'object_ids' of the objects of the subset.
+    aligned_fields : frozenset, optional
+        Names of the fields aligned with the objects of the set (see
+        get_object_aligned_fields()). If None, they are retrieved from the
+        set loader, which computes them once.
+
+    Attributes
+    ----------
+    set_loader : SetLoader
+        Loader of the set.
+    indexes : np.ndarray
+        Rows of 'object_ids' of the objects of the subset.
+    set : str
+        Name of the set.
+    object_fields : tuple
+        List of all field names of the set contained by the 'object_ids' list.
+    nelems : int
+        Number of objects of the subset.
+
+    """
+
+    def __init__(self, set_loader, indexes, aligned_fields=None):
+        """Initialize class."""
+        assert set_loader is not None, 'Must input a valid set loader.'
+        self.set_loader = set_loader
+        self.indexes = parse_subset_indexes(indexes, set_loader.nelems)
+        self.set = set_loader.set
+        self.object_fields = set_loader.object_fields
+        self.nelems = len(self.indexes)
+        self._aligned_fields = aligned_fields
+
+    def subset(self, indexes):
+        """Returns a view of a subset of the objects of this subset.
+
+        Parameters
+        ----------
+        indexes : list/tuple/np.ndarray
+            Indexes of the objects in this subset (or a boolean mask).
+
+        Returns
+        -------
+        SetLoaderSubset
+            View of the objects over the same set.
+
+        """
+        return SetLoaderSubset(self.set_loader,
+                               self.indexes[parse_subset_indexes(indexes, self.nelems)],
+                               self._aligned_fields)
+
+    def _map_index(self, index):
+        """Returns the rows of the set of an index (None if all objects)."""
+        if isinstance(index, (int, np.integer)):
+            return int(self.indexes[index])
+        if index is None or len(index) == 0:  # empty lists retrieve all rows
+            return None
+        return self.indexes[np.asarray(index, dtype=np.int64)]
+
+    def get(self, field, index=None, convert_to_str=False):
+        """Retrieves data of a field for the objects of the subset.
+
+        Parameters
+        ----------
+        field : str
+            Field name.
+        index : int/list/tuple, optional
+            Index number(s) of the objects in the subset. If None, returns
+            the data of all objects of the subset.
+        convert_to_str : bool, optional
+            Convert the output data into a string.
+
+        Returns
+        -------
+        np.ndarray/list/str
+            Numpy array containing the field's data.
+
+        Raises
+        ------
+        KeyError
+            If the field does not exist in the set.
+
+        """
+        if not self._is_aligned_field(field):
+            return self.set_loader.get(field, index, convert_to_str)
+        rows = self._map_index(index)
+        if rows is not None:
+            return self.set_loader.get(field, rows, convert_to_str)
+        data = self._get_all_rows(field)
+        if convert_to_str:
+            data = convert_ascii_to_str(data)
+        return data
+
+    def _is_aligned_field(self, field):
+        if self._aligned_fields is None:
+            self._aligned_fields = self.set_loader._get_object_aligned_fields()
+        return field in self._aligned_fields
+
+    def _get_all_rows(self, field):
+        field_loader = self.set_loader.fields[field]
+        if self.nelems == 0:
+            return field_loader[0:0]
+        data = field_loader.get(self.indexes)
+        if self.nelems == 1:
+            data = data[np.newaxis]  # keep the rows dimension
+        return data
+
+    def object(self, index=None, convert_to_value=False):
+        """Retrieves the indexes/values of the objects of the subset.
+
+        Parameters
+        ----------
+        index : int/list/tuple, optional
+            Index number(s) of the objects in the subset. If None, returns
+            all objects of the subset.
+        convert_to_value : bool, optional
+            If False, outputs a list of indexes. If True,
+            it outputs a list of arrays/values instead of indexes.
+
+        Returns
+        -------
+        list
+            Returns a list of indexes or, if convert_to_value is True,
+            a list of data arrays/values.
+
+        """
+        object_ids = self.get('object_ids', index)
+        if convert_to_value:
+            if len(object_ids) == 0:
+                return []
+            return self.set_loader._convert(object_ids)
+        return object_ids
+
+    def object_columns(self, index=None):
+        """Retrieves the values of all fields of the objects as columns.
+
+        See SetLoader.object_columns().
+
+        Parameters
+        ----------
+        index : int/list/tuple/np.ndarray, optional
+            Index number(s) of the objects in the subset. If no index is used,
+            it returns the values of all objects of the subset.
+
+        Returns
+        -------
+        dict
+            Masked array of values for each field in 'object_fields'.
+
+        """
+        object_ids = np.asarray(self.get('object_ids', index))
+        object_ids = object_ids.reshape(-1, len(self.object_fields))
+        return self.set_loader._get_object_columns(object_ids)
+
+    def where(self, **predicates):
+        """Retrieves the indexes (in the subset) of the objects matching a set of predicates.
+
+        See SetLoader.where() for the format of the predicates. The result
+        can be used to create a filtered view with subset().
+
+        Returns
+        -------
+        np.ndarray
+            Sorted array of indexes of the objects in the subset.
+
+        """
+        object_ids = self.set_loader.where(**predicates)
+        return np.flatnonzero(np.isin(self.indexes, object_ids))
+
+    def size(self, field='object_ids'):
+        """Size of a field in the subset.
+
+        Parameters
+        ----------
+        field : str, optional
+            Name of the field in the metadata file.
+
+        Returns
+        -------
+        tuple
+            Returns the size of the field.
+
+        Raises
+        ------
+        KeyError
+            If field is invalid or does not exist in the fields dict.
+
+        """
+        shape = self.set_loader.size(field)
+        if self._is_aligned_field(field):
+            shape = (self.nelems,) + tuple(shape[1:])
+        return shape
+
+    def list(self):
+        """List of all field names of the set."""
+        return self.set_loader.list()
+
+    def object_field_id(self, field):
+        """Retrieves the index position of a field in the 'object_ids' list."""
+        return self.set_loader.object_field_id(field)
+
+    def __len__(self):
+        return self.nelems
+
+    def __getstate__(self):
+        return {"set_loader": self.set_loader, "indexes": self.indexes,
+                "aligned_fields": self._aligned_fields}
+
+    def __setstate__(self, state):
+        self.__init__(state["set_loader"], state["indexes"], state["aligned_fields"])
+
+    def __str__(self):
+        return 'SetLoaderSubset: set<{}>, len<{}>'.format(self.set, self.nelems)
+
+    def __repr__(self):
+        return str(self)
+
+
+def get_object_aligned_fields(set_loader):
+    """Returns the names of the fields of a set with a row per object.
+
+    A field is aligned with the objects if it is 'object_ids', a field of
+    OBJECT_LEVEL_FIELDS or a field of 'object_fields' whose column in
+    'object_ids' is the row of the object (e.g. 'boxes'). Fields shared by
+    several objects (e.g. 'image_filenames' or 'classes') are not aligned,
+    even if they happen to have as many rows as there are objects.
+
+    Parameters
+    ----------
+    set_loader : SetLoader
+        Loader of the set.
+
+    Returns
+    -------
+    frozenset
+        Names of the fields aligned with the objects.
+
+    """
+    fields = set(field for field in OBJECT_LEVEL_FIELDS if field in set_loader.fields)
+    fields.add('object_ids')
+    if set_loader.nelems > 0:
+        object_ids = np.asarray(set_loader.get('object_ids'))
+        object_ids = object_ids.reshape(-1, len(set_loader.object_fields))
+        rows = np.arange(len(object_ids))
+        for i, field in enumerate(set_loader.object_fields):
+            if np.array_equal(object_ids[:, i], rows):
+                fields.add(field)
+    return frozenset(fields)
+
+
+def parse_subset_indexes(indexes, num_rows):
+    """Converts the indexes (or boolean mask) of a subset into an array of rows.
+
+    Parameters
+    ----------
+    indexes : list/tuple/np.ndarray
+        Indexes of the rows (negative values count from the end) or a
+        boolean mask with a value per row.
+    num_rows : int
+        Number of rows.
+
+    Returns
+    -------
+    np.ndarray
+        Array of non-negative row indexes.
+
+    Raises
+    ------
+    TypeError
+        If the indexes are not a 1D list of ints or bools.
+    IndexError
+        If an index is out of range.
+
+    """
+    indexes = np.asarray(indexes)
+    if indexes.ndim != 1:
+        raise TypeError('Invalid input index format.')
+    if indexes.dtype == np.bool_:
+        if len(indexes) != num_rows:
+            raise IndexError('Boolean mask with {} values for {} rows.'
+                             .format(len(indexes), num_rows))
+        return np.flatnonzero(indexes)
+    if indexes.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    if not np.issubdtype(indexes.dtype, np.integer):
+        raise TypeError('Invalid input index format.')
+    if indexes.min() < -num_rows or indexes.max() >= num_rows:
+        raise IndexError('Index out of range for {} rows.'.format(num_rows))
+    return np.where(indexes < 0, indexes + num_rows, indexes).astype(np.int64)
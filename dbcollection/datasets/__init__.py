@@ -9,8 +9,16 @@ and used to manually setup a dataset.
 
 from __future__ import print_function
 import os
+import json
+import shutil
+import tempfile
+import posixpath
+from multiprocessing import Pool
 import h5py
 
+from dbcollection.utils.file_load import ParseCache
+from dbcollection.utils.hdf5 import hdf5_write_union_set
+from dbcollection.utils.os_dir import get_files_fingerprint
 from dbcollection.utils.url import download_extract_all
 
 
@@ -27,6 +35,9 @@ class BaseDataset(object):
         Extracts the downloaded files if they are compacted.
     verbose : bool
         Be verbose
+    num_workers : int, optional
+        Number of worker processes used to process the sets of a task
+        (see BaseTask). If 0, the sets are processed serially.
 
     Attributes
     ----------
@@ -38,6 +49,8 @@ class BaseDataset(object):
         Extracts the downloaded files if they are compacted.
     verbose : bool
         Be verbose
+    num_workers : int
+        Number of worker processes used to process the sets of a task.
     urls : list
         List of URL links to download.
     keywords : list
@@ -62,7 +75,7 @@ class BaseDataset(object):
     default_task = ''  # Should define a default class!
     # Example: default_task='classification'
 
-    def __init__(self, data_path, cache_path, extract_data=True, verbose=True):
+    def __init__(self, data_path, cache_path, extract_data=True, verbose=True, num_workers=0):
         """Initialize class."""
         assert data_path
         assert cache_path
@@ -70,6 +83,7 @@ class BaseDataset(object):
         self.cache_path = cache_path
         self.extract_data = extract_data
         self.verbose = verbose
+        self.num_workers = num_workers
 
     def download(self):
         """
@@ -132,33 +146,84 @@ class BaseDataset(object):
         return task_, suffix, self.tasks[task_]
 
     def process(self, task='default'):
-        """Processes the metadata of a task.
+        """Processes the metadata of a task (or of several tasks).
+
+        When several tasks are processed, the annotation files they have in
+        common (see BaseTask.get_annotation_files()) are parsed only once
+        and the parses are freed after the last task using them is done.
 
         Parameters
         ----------
-        task : str, optional
-            Task name.
+        task : str/list/tuple, optional
+            Task name (or list of task names).
 
         Returns
         -------
         dict
             Returns a dictionary with the task name as key and the filename as value.
 
+        """
+        if isinstance(task, str):
+            task = [task]
+        task_loaders = [self.get_task_loader(task_name) for task_name in task]
+
+        parse_cache = ParseCache() if len(task_loaders) > 1 else None
+        if parse_cache is not None:
+            for _, task_loader in task_loaders:
+                parse_cache.add_consumer(task_loader.get_annotation_files())
+
+        task_filenames = {}
+        for task_name, task_loader in task_loaders:
+            if self.verbose:
+                print('\nProcessing \'{}\' task:'.format(task_name))
+            task_loader.parse_cache = parse_cache
+            task_filenames[task_name] = task_loader.run()
+            if parse_cache is not None:
+                parse_cache.remove_consumer(task_loader.get_annotation_files())
+        return task_filenames
+
+    def get_task_loader(self, task):
+        """Returns the processor of a task.
+
+        Parameters
+        ----------
+        task : str
+            Task name.
+
+        Returns
+        -------
+        str
+            Task name (with its suffix, if any).
+        BaseTask
+            Processor of the metadata of the task.
+
         """
         task_, suffix, task_constructor = self.get_task_constructor(task)
-        if self.verbose:
-            print('\nProcessing \'{}\' task:'.format(task_))
-        task_loader = task_constructor(self.data_path, self.cache_path, suffix, self.verbose)
-        task_filename = task_loader.run()
+        task_loader = task_constructor(self.data_path, self.cache_path, suffix, self.verbose,
+                                       num_workers=self.num_workers)
         if suffix:
-            return {task_ + suffix: task_filename}
+            return task_ + suffix, task_loader
         else:
-            return {task_: task_filename}
+            return task_, task_loader
 
 
 class BaseTask(object):
     """Base class for processing a task of a dataset.
 
+    The sets of a task are processed serially by default. If 'num_workers'
+    is greater than zero, each set is processed by a worker process into a
+    temporary hdf5 file, and the sets are then copied into the task file.
+    Tasks whose sets can be loaded independently (see get_set_names() and
+    load_data_set()) also parse the annotations of each set in the workers;
+    otherwise, the sets are parsed serially (by load_data()) and only
+    stored in parallel.
+
+    The task file is written to a temporary ('.partial') file which is
+    renamed when all sets are stored. Each stored set is recorded in a
+    manifest (with a fingerprint of its input files, see get_input_files()),
+    so an interrupted processing is resumed by skipping the sets whose
+    inputs did not change.
+
     Parameters
     ----------
     data_path : str
@@ -169,6 +234,9 @@ class BaseTask(object):
         Suffix to select optional properties for a task.
     verbose : bool, optional
         Be verbose.
+    num_workers : int, optional
+        Number of worker processes used to process the sets. If 0, the sets
+        are processed serially.
 
     Attributes
     ----------
@@ -180,6 +248,11 @@ class BaseTask(object):
         Suffix to select optional properties for a task.
     verbose : bool, optional
         Be verbose.
+    num_workers : int
+        Number of worker processes used to process the sets.
+    parse_cache : ParseCache
+        Parses of the annotation files shared with other tasks (None if
+        the task is processed alone).
     filename_h5 : str
         hdf5 metadata file name.
 
@@ -188,14 +261,29 @@ class BaseTask(object):
     # name of the task file
     filename_h5 = 'task'
 
-    def __init__(self, data_path, cache_path, suffix=None, verbose=True):
+    # hash the contents of the input files to check if a set must be
+    # processed again when resuming (besides their size/modification time)
+    hash_input_files = False
+
+    # sets stored as the union of other sets, without copying their data
+    # Example: union_sets = {'trainval': ('train', 'val')}
+    union_sets = {}
+    # how each field of the union sets is combined (see hdf5_write_union_set)
+    # Example: union_fields = {'classes': 'shared', 'list_boxes_per_image': ('concat', 'boxes')}
+    union_fields = {}
+
+    def __init__(self, data_path, cache_path, suffix=None, verbose=True, num_workers=0):
         """Initialize class."""
         assert data_path
         assert cache_path
+        assert num_workers >= 0, 'Must input a valid number of workers.'
         self.cache_path = cache_path
         self.data_path = data_path
         self.suffix = suffix
         self.verbose = verbose
+        self.num_workers = num_workers
+        self.parse_cache = None
+        self._input_fingerprints = {}
 
     def load_data(self):
         """
@@ -207,6 +295,104 @@ class BaseTask(object):
         """
         pass  # stub
 
+    def get_set_names(self):
+        """
+        Names of the sets that can be loaded independently with load_data_set().
+
+        Returns None if the sets can only be loaded with load_data().
+
+        """
+        return None
+
+    def load_data_set(self, set_name):
+        """
+        Load data of a single set.
+
+        Parameters
+        ----------
+        set_name : str
+            Set name (see get_set_names()).
+
+        Returns
+        -------
+        dict
+            Data of the set (same format as the items of load_data()).
+
+        """
+        raise NotImplementedError
+
+    def get_annotation_files(self):
+        """
+        List of the annotation files parsed by the task (with load_annotation_file()).
+
+        The parses of the files listed by several tasks are shared when the
+        tasks are processed together.
+
+        """
+        return ()
+
+    def get_input_files(self, set_name):
+        """
+        List of the files/directories the data of a set is loaded from.
+
+        Used to check if a stored set is up to date when resuming an
+        interrupted processing. Defaults to the annotation files of the task
+        (see get_annotation_files()).
+
+        Parameters
+        ----------
+        set_name : str
+            Set name.
+
+        """
+        return self.get_annotation_files()
+
+    def get_input_fingerprint(self, set_name):
+        """
+        Fingerprint of the input files of a set (see get_input_files()).
+
+        Parameters
+        ----------
+        set_name : str
+            Set name.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest of the fingerprint (None if the set has no
+            input files, so it cannot be checked).
+
+        """
+        if set_name not in self._input_fingerprints:
+            input_files = self.get_input_files(set_name)
+            if input_files:
+                fingerprint = get_files_fingerprint(input_files, self.hash_input_files)
+            else:
+                fingerprint = None
+            self._input_fingerprints[set_name] = fingerprint
+        return self._input_fingerprints[set_name]
+
+    def load_annotation_file(self, load_fn, filename):
+        """
+        Parse an annotation file (or reuse the parse of another task).
+
+        Parameters
+        ----------
+        load_fn : function
+            Function that parses the file (e.g. load_json).
+        filename : str
+            File name + path.
+
+        Returns
+        -------
+        dict/list
+            Data structure of the input file.
+
+        """
+        if self.parse_cache is None:
+            return load_fn(filename)
+        return self.parse_cache.load(load_fn, filename)
+
     def add_data_to_source(self, hdf5_handler, data, set_name=None):
         """
         Store data annotations in a nested tree fashion.
@@ -253,36 +439,259 @@ class BaseTask(object):
             file_name = os.path.join(self.cache_path, self.filename_h5 + self.suffix + '.h5')
         else:
             file_name = os.path.join(self.cache_path, self.filename_h5 + '.h5')
-        fileh5 = h5py.File(file_name, 'w', libver='latest')
+        partial_file_name = file_name + '.partial'
+        fileh5 = self.open_partial_file(partial_file_name)
 
         if self.verbose:
             print('\n==> Storing metadata to file: {}'.format(file_name))
 
-        # setup data generator
-        data_gen = self.load_data()
-
-        for data in data_gen:
-            for set_name in data:
+        try:
+            if self.num_workers > 0:
+                self.process_sets_parallel(fileh5)
+            else:
+                self.process_sets(fileh5)
 
+            # add the union sets (the data is read from the other sets)
+            for set_name in sorted(self.union_sets):
                 if self.verbose:
-                    print('\nSaving set metadata: {}'.format(set_name))
-
-                # add data to the **source** group
-                if self.suffix is '_s':
-                    sourceg = fileh5.create_group(set_name + '/source')
-                    self.add_data_to_source(sourceg, data[set_name], set_name)
+                    print('\nSaving union set metadata: {}'.format(set_name))
+                hdf5_write_union_set(fileh5, set_name, self.union_sets[set_name],
+                                     self.union_fields)
+        finally:
+            # close file
+            fileh5.close()
 
-                # add data to the **default** group
-                defaultg = fileh5.create_group(set_name)
-                self.add_data_to_default(defaultg, data[set_name], set_name)
-
-        # close file
-        fileh5.close()
+        # replace the task file only when all sets are stored
+        replace_file(partial_file_name, file_name)
 
         # return information of the task + cache file
         return file_name
 
+    def open_partial_file(self, file_name):
+        """
+        Open the temporary hdf5 file of the task (resuming a previous processing).
+
+        The sets of an existing file are kept if they were completely stored
+        and their input files did not change since (see the 'manifest'
+        attribute). Any other group is removed, including the sets without
+        input files (see get_input_files()), which cannot be checked.
+
+        Parameters
+        ----------
+        file_name : str
+            Path of the temporary hdf5 file.
+
+        Returns
+        -------
+        h5py.File
+            hdf5 file handler.
+
+        """
+        if os.path.exists(file_name):
+            try:
+                fileh5 = h5py.File(file_name, 'a', libver='latest')
+            except (IOError, OSError):
+                os.remove(file_name)  # the file was not closed properly
+            else:
+                stored_sets = dict((set_name, fingerprint) for set_name, fingerprint
+                                   in get_manifest(fileh5).items()
+                                   if self.is_stored_set(fileh5, set_name, fingerprint))
+                for name in list(fileh5):
+                    if not any(set_name == name or set_name.startswith(name + '/')
+                               for set_name in stored_sets):
+                        del fileh5[name]
+                set_manifest(fileh5, stored_sets)
+                if self.verbose and stored_sets:
+                    print('\n==> Resuming from file: {} (stored sets: {})'
+                          .format(file_name, ', '.join(sorted(stored_sets))))
+                return fileh5
+        fileh5 = h5py.File(file_name, 'w', libver='latest')
+        set_manifest(fileh5, {})
+        return fileh5
+
+    def is_stored_set(self, fileh5, set_name, fingerprint):
+        """
+        Returns True if a set of the manifest is stored and its input files did not change.
+        """
+        if set_name not in fileh5 or fingerprint is None:
+            return False
+        return fingerprint == self.get_input_fingerprint(set_name)
+
+    def skip_set(self, fileh5, set_name):
+        """
+        Returns True if a set is already stored (and up to date) in the hdf5 file.
+
+        Otherwise, the fingerprint of the input files of the set is computed
+        before they are read.
+        """
+        if set_name not in get_manifest(fileh5):
+            self.get_input_fingerprint(set_name)
+            return False
+        if self.verbose:
+            print('\nSkipping set (already stored): {}'.format(set_name))
+        return True
+
+    def checkpoint_set(self, fileh5, set_name):
+        """
+        Record a completely stored set in the manifest and flush the hdf5 file.
+        """
+        manifest = get_manifest(fileh5)
+        manifest[set_name] = self.get_input_fingerprint(set_name)
+        set_manifest(fileh5, manifest)
+        fileh5.flush()
+
+    def process_sets(self, fileh5):
+        """
+        Process the sets (serially) and store them in a hdf5 file.
+
+        Parameters
+        ----------
+        fileh5 : h5py.File
+            hdf5 file handler of the task.
+
+        """
+        set_names = self.get_set_names()
+        if set_names is not None:
+            for set_name in set_names:
+                if not self.skip_set(fileh5, set_name):
+                    data = self.load_data_set(set_name)
+                    self.add_set_data(fileh5, data[set_name], set_name)
+                    self.checkpoint_set(fileh5, set_name)
+        else:
+            for data in self.load_data():
+                for set_name in data:
+                    if not self.skip_set(fileh5, set_name):
+                        self.add_set_data(fileh5, data[set_name], set_name)
+                        self.checkpoint_set(fileh5, set_name)
+
+    def add_set_data(self, fileh5, data, set_name):
+        """
+        Store the data of a set in the source/default groups of a hdf5 file.
+
+        Parameters
+        ----------
+        fileh5 : h5py.File
+            hdf5 file handler.
+        data : list/dict
+            List or dict containing the data annotations of the set.
+        set_name : str
+            Set name.
+
+        """
+        if self.verbose:
+            print('\nSaving set metadata: {}'.format(set_name))
+
+        # add data to the **source** group
+        if self.suffix == '_s':
+            sourceg = fileh5.create_group(set_name + '/source')
+            self.add_data_to_source(sourceg, data, set_name)
+
+        # add data to the **default** group
+        defaultg = fileh5.create_group(set_name)
+        self.add_data_to_default(defaultg, data, set_name)
+
+    def process_sets_parallel(self, fileh5):
+        """
+        Process the sets in worker processes and copy them into a hdf5 file.
+
+        Each set is stored by a worker in a temporary hdf5 file (in the
+        cache directory), which is then copied into the task file (the
+        chunks are copied without being decompressed).
+
+        Parameters
+        ----------
+        fileh5 : h5py.File
+            hdf5 file handler of the task.
+
+        """
+        tmp_dir = tempfile.mkdtemp(prefix='.tmp_', dir=self.cache_path)
+        pool = Pool(self.num_workers)
+        try:
+            pending = []
+            set_names = self.get_set_names()
+            if set_names is not None:
+                for set_name in set_names:
+                    if not self.skip_set(fileh5, set_name):
+                        pending.append(self._submit_set(pool, tmp_dir, set_name, None,
+                                                        len(pending)))
+            else:
+                for data in self.load_data():
+                    for set_name in data:
+                        if not self.skip_set(fileh5, set_name):
+                            pending.append(self._submit_set(pool, tmp_dir, set_name,
+                                                            data[set_name], len(pending)))
+            for set_name, result in pending:
+                with h5py.File(result.get(), 'r') as set_fileh5:
+                    parent, name = posixpath.split(set_name)
+                    dest = fileh5.require_group(parent) if parent else fileh5
+                    set_fileh5.copy(set_fileh5[set_name], dest, name)
+                self.checkpoint_set(fileh5, set_name)
+        finally:
+            pool.terminate()
+            pool.join()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _submit_set(self, pool, tmp_dir, set_name, data, index):
+        filename = os.path.join(tmp_dir, '{}.h5'.format(index))
+        return set_name, pool.apply_async(process_set, (self, set_name, data, filename))
+
+    def __getstate__(self):
+        """Pickles the task without the shared parses (e.g. for the worker processes)."""
+        state = self.__dict__.copy()
+        state['parse_cache'] = None
+        return state
+
     def run(self):
         """Run task processing."""
         filename = self.process_metadata()
         return filename
+
+
+def process_set(task, set_name, data, filename):
+    """Stores a set of a task in a new hdf5 file (used by the worker processes).
+
+    Parameters
+    ----------
+    task : BaseTask
+        Task processor.
+    set_name : str
+        Set name.
+    data : list/dict
+        Data annotations of the set. If None, they are loaded with
+        task.load_data_set().
+    filename : str
+        Path of the hdf5 file.
+
+    Returns
+    -------
+    str
+        Path of the hdf5 file.
+
+    """
+    if data is None:
+        data = task.load_data_set(set_name)[set_name]
+    with h5py.File(filename, 'w', libver='latest') as fileh5:
+        task.add_set_data(fileh5, data, set_name)
+    return filename
+
+
+def get_manifest(fileh5):
+    """Returns the manifest (set name -> input fingerprint) of the stored sets of a task file."""
+    if 'manifest' not in fileh5.attrs:
+        return {}
+    return json.loads(fileh5.attrs['manifest'])
+
+
+def set_manifest(fileh5, manifest):
+    """Stores the manifest (set name -> input fingerprint) of the stored sets of a task file."""
+    fileh5.attrs['manifest'] = json.dumps(manifest, sort_keys=True)
+
+
+def replace_file(src, dst):
+    """Renames a file, replacing the destination file if it exists."""
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+    else:  # python 2: os.rename fails on Windows if the destination exists
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
@@ -12,8 +12,9 @@ from dbcollection.datasets import BaseTask
 
 from dbcollection.utils.file_load import load_json
 from dbcollection.utils.string_ascii import convert_str_to_ascii as str2ascii
-from dbcollection.utils.pad import pad_list
-from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.group import group_by
+from dbcollection.utils.hdf5 import (hdf5_write_data, hdf5_write_ragged_data,
+                                     HDF5StreamWriter, HDF5RaggedStreamWriter)
 from dbcollection.utils.db.caltech_pedestrian_extractor.converter import extract_data
 
 
@@ -29,6 +30,13 @@ class Detection(BaseTask):
         "test": ['set06', 'set07', 'set08', 'set09', 'set10']
     }
 
+    @property
+    def extracted_data_path(self):
+        """
+        Path of the extracted .jpg + .json files.
+        """
+        return os.path.join(self.data_path, 'extracted_data')
+
     def convert_extract_data(self):
         """
         Extract + convert .jpg + .json files from the .seq and .vbb files.
@@ -38,68 +46,92 @@ class Detection(BaseTask):
             sets.sort()
             extract_data(self.data_path, self.extracted_data_path, sets)
 
+    def get_input_files(self, set_name):
+        """
+        Return the video (.seq) and annotation (.vbb) directories of a set.
+        """
+        return [os.path.join(self.data_path, dirname, set_data)
+                for dirname in ('', 'annotations') for set_data in self.sets[set_name]]
+
+    def process_metadata(self):
+        """
+        Extract the data files before processing the sets.
+        """
+        self.convert_extract_data()
+        return super(Detection, self).process_metadata()
+
+    def get_set_names(self):
+        """
+        Return the names of the sets.
+        """
+        return list(self.sets)
+
     def load_data(self):
         """
         Load the data from the dataset's files.
         """
-        self.extracted_data_path = os.path.join(self.data_path, 'extracted_data')
+        for set_name in self.get_set_names():
+            yield self.load_data_set(set_name)
 
+    def load_data_set(self, set_name):
+        """
+        Load the data of a set from the dataset's files.
+        """
         # extract data
         self.convert_extract_data()
 
-        for set_name in self.sets:
-            data = {set_name: {}}
+        data = {set_name: {}}
 
-            if self.verbose:
-                print('\n> Loading data files for the set: {}'.format(set_name))
+        if self.verbose:
+            print('\n> Loading data files for the set: {}'.format(set_name))
 
-            # progressbar
-            if self.verbose:
-                prgbar = progressbar.ProgressBar(max_value=len(self.sets[set_name]))
-
-            for i, set_data in enumerate(self.sets[set_name]):
-                data[set_name][set_data] = {}
-
-                extracted_data_dir = os.path.join(self.extracted_data_path, set_data)
-
-                # list all folders
-                folders = os.listdir(extracted_data_dir)
-                folders.sort()
-
-                for video in folders:
-                    # fetch all images filenames
-                    img_fnames = os.listdir(os.path.join(extracted_data_dir, video, 'images'))
-                    img_fnames = [os.path.join(self.data_path, 'extracted_data', set_data,
-                                               video, 'images', fname)
-                                  for fname in img_fnames]
-                    img_fnames.sort()
-                    range_imgs = range(self.skip_step - 1, len(img_fnames), self.skip_step)
-                    img_fnames_list = [img_fnames[i] for i in range_imgs]
-
-                    # fetch all annotations filenames
-                    annotation_fnames = os.listdir(os.path.join(extracted_data_dir, video,
-                                                                'annotations'))
-                    annotation_fnames = [os.path.join(self.data_path, 'extracted_data', set_data,
-                                                      video, 'annotations', fname)
-                                         for fname in annotation_fnames]
-                    annotation_fnames.sort()
-                    range_annot = range(self.skip_step - 1, len(annotation_fnames), self.skip_step)
-                    annotation_fnames_list = [annotation_fnames[i] for i in range_annot]
-
-                    data[set_name][set_data][video] = {
-                        "images": img_fnames_list,
-                        "annotations": annotation_fnames_list
-                    }
-
-                # update progressbar
-                if self.verbose:
-                    prgbar.update(i)
-
-            # reset progressbar
+        # progressbar
+        if self.verbose:
+            prgbar = progressbar.ProgressBar(max_value=len(self.sets[set_name]))
+
+        for i, set_data in enumerate(self.sets[set_name]):
+            data[set_name][set_data] = {}
+
+            extracted_data_dir = os.path.join(self.extracted_data_path, set_data)
+
+            # list all folders
+            folders = os.listdir(extracted_data_dir)
+            folders.sort()
+
+            for video in folders:
+                # fetch all images filenames
+                img_fnames = os.listdir(os.path.join(extracted_data_dir, video, 'images'))
+                img_fnames = [os.path.join(self.data_path, 'extracted_data', set_data,
+                                           video, 'images', fname)
+                              for fname in img_fnames]
+                img_fnames.sort()
+                range_imgs = range(self.skip_step - 1, len(img_fnames), self.skip_step)
+                img_fnames_list = [img_fnames[i] for i in range_imgs]
+
+                # fetch all annotations filenames
+                annotation_fnames = os.listdir(os.path.join(extracted_data_dir, video,
+                                                            'annotations'))
+                annotation_fnames = [os.path.join(self.data_path, 'extracted_data', set_data,
+                                                  video, 'annotations', fname)
+                                     for fname in annotation_fnames]
+                annotation_fnames.sort()
+                range_annot = range(self.skip_step - 1, len(annotation_fnames), self.skip_step)
+                annotation_fnames_list = [annotation_fnames[i] for i in range_annot]
+
+                data[set_name][set_data][video] = {
+                    "images": img_fnames_list,
+                    "annotations": annotation_fnames_list
+                }
+
+            # update progressbar
             if self.verbose:
-                prgbar.finish()
+                prgbar.update(i)
 
-            yield data
+        # reset progressbar
+        if self.verbose:
+            prgbar.finish()
+
+        return data
 
     def add_data_to_source(self, hdf5_handler, data, set_name):
         """
@@ -135,18 +167,30 @@ class Detection(BaseTask):
         Add data of a set to the default file.
         """
         object_fields = ['image_filenames', 'classes', 'boxes', 'boxesv', 'id', 'occlusion']
-        image_filenames = []
-        bbox = []
-        bboxv = []
-        lbl_id = []
-        occlusion = []
-        object_id = []
-
-        list_image_filenames_per_class = []
-        list_boxes_per_image = []
-        list_boxesv_per_image = []
-        list_object_ids_per_image = []
-        list_objects_ids_per_class = []
+
+        # The per-image and per-object fields are streamed to disk while the
+        # annotation files are loaded, so only a buffer of rows is kept in memory.
+        pad_value = -1
+        image_filenames = HDF5StreamWriter(hdf5_handler, 'image_filenames', np.uint8,
+                                           strings=True)
+        bbox = HDF5StreamWriter(hdf5_handler, 'boxes', np.float)
+        bboxv = HDF5StreamWriter(hdf5_handler, 'boxesv', np.float)
+        lbl_id = HDF5StreamWriter(hdf5_handler, 'id', np.int32)
+        occlusion = HDF5StreamWriter(hdf5_handler, 'occlusion', np.float)
+        object_id = HDF5StreamWriter(hdf5_handler, 'object_ids', np.int32)
+        list_boxes_per_image = HDF5RaggedStreamWriter(hdf5_handler, 'list_boxes_per_image',
+                                                      np.int32, fillvalue=pad_value)
+        list_boxesv_per_image = HDF5RaggedStreamWriter(hdf5_handler, 'list_boxesv_per_image',
+                                                       np.int32, fillvalue=pad_value)
+        list_object_ids_per_image = HDF5RaggedStreamWriter(hdf5_handler,
+                                                           'list_object_ids_per_image',
+                                                           np.int32, fillvalue=pad_value)
+        writers = [image_filenames, bbox, bboxv, lbl_id, occlusion, object_id,
+                   list_boxes_per_image, list_boxesv_per_image, list_object_ids_per_image]
+
+        # image and class of the objects (to build the lists)
+        object_image_ids = []
+        object_classes = []
         # list_objects_ids_per_id = []
         # list_objects_ids_per_occlusion= []
 
@@ -200,6 +244,8 @@ class Detection(BaseTask):
                                 object_id.append([img_counter, class_lbl, obj_counter,
                                                   obj_counter, obj_counter, obj_counter])
 
+                                object_image_ids.append(img_counter)
+                                object_classes.append(class_lbl)
                                 obj_per_img.append(obj_counter)
 
                                 # increment counter
@@ -217,6 +263,9 @@ class Detection(BaseTask):
             if self.verbose:
                 prgbar.update(i)
 
+        for writer in writers:
+            writer.close()
+
         # update progressbar
         if self.verbose:
             prgbar.finish()
@@ -225,53 +274,22 @@ class Detection(BaseTask):
             print('> Processing lists...')
 
         # Process lists
-        for i in range(len(self.classes)):
-            imgs_per_class = [val[0] for j, val in enumerate(object_id) if val[1] == i]
-            imgs_per_class = list(set(imgs_per_class))  # get unique values
-            imgs_per_class.sort()
-            list_image_filenames_per_class.append(imgs_per_class)
-
-        for i in range(len(self.classes)):
-            objs_per_class = [j for j, val in enumerate(object_id) if val[1] == i]
-            objs_per_class = list(set(objs_per_class))  # get unique values
-            objs_per_class.sort()
-            list_objects_ids_per_class.append(objs_per_class)
+        list_image_filenames_per_class = group_by(object_classes, len(self.classes),
+                                                  values=object_image_ids, unique=True)
+        list_objects_ids_per_class = group_by(object_classes, len(self.classes))
 
         # add data to hdf5 file
-        hdf5_write_data(hdf5_handler, 'image_filenames', str2ascii(image_filenames),
-                        dtype=np.uint8, fillvalue=0)
         hdf5_write_data(hdf5_handler, 'classes', str2ascii(self.classes),
                         dtype=np.uint8, fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'boxes', np.array(bbox, dtype=np.float),
-                        fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'boxesv', np.array(bboxv, dtype=np.float),
-                        fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'id', np.array(lbl_id, dtype=np.int32),
-                        fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'occlusion', np.array(occlusion, dtype=np.float),
-                        fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'object_ids', np.array(object_id, dtype=np.int32),
-                        fillvalue=-1)
         hdf5_write_data(hdf5_handler, 'object_fields', str2ascii(object_fields),
                         dtype=np.uint8, fillvalue=0)
 
-        pad_value = -1
-        hdf5_write_data(hdf5_handler, 'list_image_filenames_per_class',
-                        np.array(pad_list(list_image_filenames_per_class, pad_value),
-                                 dtype=np.int32),
-                        fillvalue=pad_value)
-        hdf5_write_data(hdf5_handler, 'list_boxes_per_image',
-                        np.array(pad_list(list_boxes_per_image, pad_value), dtype=np.int32),
-                        fillvalue=pad_value)
-        hdf5_write_data(hdf5_handler, 'list_boxesv_per_image',
-                        np.array(pad_list(list_boxesv_per_image, pad_value), dtype=np.int32),
-                        fillvalue=pad_value)
-        hdf5_write_data(hdf5_handler, 'list_object_ids_per_image',
-                        np.array(pad_list(list_object_ids_per_image, pad_value), dtype=np.int32),
-                        fillvalue=pad_value)
-        hdf5_write_data(hdf5_handler, 'list_objects_ids_per_class',
-                        np.array(pad_list(list_objects_ids_per_class, pad_value), dtype=np.int32),
-                        fillvalue=pad_value)
+        hdf5_write_ragged_data(hdf5_handler, 'list_image_filenames_per_class',
+                               list_image_filenames_per_class,
+                               dtype=np.int32, fillvalue=pad_value)
+        hdf5_write_ragged_data(hdf5_handler, 'list_objects_ids_per_class',
+                               list_objects_ids_per_class,
+                               dtype=np.int32, fillvalue=pad_value)
 
         if self.verbose:
             print('> Done.')
@@ -141,7 +141,8 @@ class Classification(BaseTask):
         """
         hdf5_write_data(hdf5_handler, 'classes', data["class_name"], dtype=np.uint8, fillvalue=0)
         hdf5_write_data(hdf5_handler, 'labels', data["labels"], dtype=np.uint8, fillvalue=1)
-        hdf5_write_data(hdf5_handler, 'images', data["data"], dtype=np.uint8, fillvalue=-1)
+        hdf5_write_data(hdf5_handler, 'images', data["data"], dtype=np.uint8, fillvalue=-1,
+                        contiguous=True)
         hdf5_write_data(hdf5_handler, 'object_ids',
                         data["object_ids"], dtype=np.int32, fillvalue=-1)
         hdf5_write_data(hdf5_handler, 'object_fields',
@@ -11,9 +11,8 @@ import progressbar
 
 from dbcollection.datasets import BaseTask
 from dbcollection.utils.string_ascii import convert_str_to_ascii as str2ascii
-from dbcollection.utils.pad import pad_list
 from dbcollection.utils.file_load import load_json
-from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.hdf5 import hdf5_write_data, HDF5StreamWriter, HDF5RaggedStreamWriter
 
 from .load_data_test import load_data_test
 
@@ -45,7 +44,7 @@ class Caption2015(BaseTask):
         # load annotations file
         if self.verbose:
             print('  > Loading annotation file: ' + annotation_path)
-        annotations = load_json(annotation_path)
+        annotations = self.load_annotation_file(load_json, annotation_path)
 
         # progressbar
         if self.verbose:
@@ -97,24 +96,44 @@ class Caption2015(BaseTask):
         return {set_name: [OrderedDict(sorted(data.items())),
                            annotations]}
 
+    def get_set_names(self):
+        """
+        Return the names of the sets.
+        """
+        return list(self.image_dir_path)
+
+    def get_annotation_files(self):
+        """
+        Return the paths of the annotation files of the sets.
+        """
+        return [os.path.join(self.data_path, self.annotation_path[set_name])
+                for set_name in self.get_set_names()]
+
     def load_data(self):
         """
         Load data of the dataset (create a generator).
         """
-        for set_name in self.image_dir_path:
-            if self.verbose:
-                print('\n> Loading data files for the set: ' + set_name)
+        for set_name in self.get_set_names():
+            yield self.load_data_set(set_name)
+
+    def load_data_set(self, set_name):
+        """
+        Load data of a set.
+        """
+        if self.verbose:
+            print('\n> Loading data files for the set: ' + set_name)
 
-            # image dir
-            image_dir = os.path.join(self.data_path, self.image_dir_path[set_name])
+        # image dir
+        image_dir = os.path.join(self.data_path, self.image_dir_path[set_name])
 
-            # annotation file path
-            annot_filepath = os.path.join(self.data_path, self.annotation_path[set_name])
+        # annotation file path
+        annot_filepath = os.path.join(self.data_path, self.annotation_path[set_name])
 
-            if 'test' in set_name:
-                yield load_data_test(set_name, image_dir, annot_filepath, self.verbose)
-            else:
-                yield self.load_data_trainval(set_name, image_dir, annot_filepath)
+        if 'test' in set_name:
+            return load_data_test(set_name, image_dir, annot_filepath, self.verbose,
+                                  self.parse_cache)
+        else:
+            return self.load_data_trainval(set_name, image_dir, annot_filepath)
 
     def add_data_to_source(self, hdf5_handler, data, set_name):
         """
@@ -212,13 +231,31 @@ class Caption2015(BaseTask):
             data_ = data[0]
             annotations = data[1]
 
-        image_filenames = []
-        width = []
-        height = []
-        coco_urls = []
-        image_id = []
-        caption = []
-        object_id = []
+        if is_test:
+            object_fields = ["image_filenames", "coco_urls", "width", "height"]
+        else:
+            object_fields = ["image_filenames", "coco_urls", "width", "height", "captions"]
+
+        # The per-image and per-caption fields are streamed to disk while the
+        # annotations are parsed, so only a buffer of rows is kept in memory.
+        image_filenames = HDF5StreamWriter(hdf5_handler, 'image_filenames', np.uint8,
+                                           strings=True)
+        coco_urls = HDF5StreamWriter(hdf5_handler, 'coco_urls', np.uint8, strings=True)
+        width = HDF5StreamWriter(hdf5_handler, 'width', np.int32)
+        height = HDF5StreamWriter(hdf5_handler, 'height', np.int32)
+        image_id = HDF5StreamWriter(hdf5_handler, 'image_id', np.int32)
+        object_id = HDF5StreamWriter(hdf5_handler, 'object_ids', np.int32)
+        list_object_ids_per_image = HDF5RaggedStreamWriter(hdf5_handler,
+                                                           'list_object_ids_per_image',
+                                                           np.int32)
+        writers = [image_filenames, coco_urls, width, height, image_id, object_id,
+                   list_object_ids_per_image]
+        if not is_test:
+            caption = HDF5StreamWriter(hdf5_handler, 'captions', np.uint8, strings=True)
+            list_captions_per_image = HDF5RaggedStreamWriter(hdf5_handler,
+                                                             'list_captions_per_image',
+                                                             np.int32)
+            writers += [caption, list_captions_per_image]
 
         # coco id lists
         # These are order by entry like in the annotation files.
@@ -227,19 +264,12 @@ class Caption2015(BaseTask):
         coco_images_ids = []
         coco_categories_ids = []
 
-        if is_test:
-            object_fields = ["image_filenames", "coco_urls", "width", "height"]
-        else:
-            object_fields = ["image_filenames", "coco_urls", "width", "height", "captions"]
-
-        list_captions_per_image = []
-        list_object_ids_per_image = []
-
         if self.verbose:
             print('> Adding data to default group:')
             prgbar = progressbar.ProgressBar(max_value=len(data_))
 
         counter = 0
+        image_ids_by_filename = {}
         for i, key in enumerate(data_):
             annotation = data_[key]
             image_filenames.append(annotation["file_name"])
@@ -247,6 +277,7 @@ class Caption2015(BaseTask):
             height.append(annotation["height"])
             coco_urls.append(annotation["coco_url"])
             image_id.append(annotation["id"])
+            image_ids_by_filename.setdefault(annotation["file_name"], i)
 
             if is_test:
                 object_id.append([i, i, i, i])
@@ -272,6 +303,9 @@ class Caption2015(BaseTask):
             if self.verbose:
                 prgbar.update(i)
 
+        for writer in writers:
+            writer.close()
+
         # update progressbar
         if self.verbose:
             prgbar.finish()
@@ -282,7 +316,7 @@ class Caption2015(BaseTask):
             prgbar = progressbar.ProgressBar(max_value=len(annotations['images']))
 
         for i, annot in enumerate(annotations['images']):
-            fname_id = image_filenames.index(os.path.join(image_dir, annot['file_name']))
+            fname_id = image_ids_by_filename[os.path.join(image_dir, annot['file_name'])]
             coco_images_ids.append(fname_id)
 
             # update progressbar
@@ -296,42 +330,14 @@ class Caption2015(BaseTask):
         if is_test:
             coco_categories_ids = list(range(len(category)))
 
-        hdf5_write_data(hdf5_handler, 'image_filenames',
-                        str2ascii(image_filenames), dtype=np.uint8,
-                        fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'coco_urls',
-                        str2ascii(coco_urls), dtype=np.uint8,
-                        fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'width',
-                        np.array(width, dtype=np.int32),
-                        fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'height',
-                        np.array(height, dtype=np.int32),
-                        fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'image_id',
-                        np.array(image_id, dtype=np.int32),
-                        fillvalue=-1)
         hdf5_write_data(hdf5_handler, 'coco_images_ids',
                         np.array(coco_images_ids, dtype=np.int32),
                         fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'object_ids',
-                        np.array(object_id, dtype=np.int32),
-                        fillvalue=-1)
         hdf5_write_data(hdf5_handler, 'object_fields',
                         str2ascii(object_fields), dtype=np.uint8,
                         fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'list_object_ids_per_image',
-                        np.array(pad_list(list_object_ids_per_image, -1), dtype=np.int32),
-                        fillvalue=-1)
 
-        if not is_test:
-            hdf5_write_data(hdf5_handler, 'captions',
-                            str2ascii(caption), dtype=np.uint8,
-                            fillvalue=0)
-            hdf5_write_data(hdf5_handler, 'list_captions_per_image',
-                            np.array(pad_list(list_captions_per_image, -1), dtype=np.int32),
-                            fillvalue=-1)
-        else:
+        if is_test:
             hdf5_write_data(hdf5_handler, 'category',
                             str2ascii(category), dtype=np.uint8,
                             fillvalue=0)
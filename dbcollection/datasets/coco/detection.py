@@ -12,9 +12,11 @@ import progressbar
 from dbcollection.datasets import BaseTask
 
 from dbcollection.utils.string_ascii import convert_str_to_ascii as str2ascii
-from dbcollection.utils.pad import pad_list, squeeze_list
+from dbcollection.utils.pad import squeeze_list
+from dbcollection.utils.group import group_by
 from dbcollection.utils.file_load import load_json
-from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.hdf5 import (hdf5_write_data, hdf5_write_ragged_data,
+                                     HDF5StreamWriter, HDF5RaggedStreamWriter)
 
 from .load_data_test import load_data_test
 
@@ -90,7 +92,7 @@ class Detection2015(BaseTask):
         # load annotations file
         if self.verbose:
             print('  > Loading annotation file: ' + annotation_path)
-        annotations = load_json(annotation_path)
+        annotations = self.load_annotation_file(load_json, annotation_path)
 
         # progressbar
         if self.verbose:
@@ -170,24 +172,44 @@ class Detection2015(BaseTask):
                            filename_ids,
                            images_fname_by_id]}
 
+    def get_set_names(self):
+        """
+        Return the names of the sets.
+        """
+        return list(self.image_dir_path)
+
+    def get_annotation_files(self):
+        """
+        Return the paths of the annotation files of the sets.
+        """
+        return [os.path.join(self.data_path, self.annotation_path[set_name])
+                for set_name in self.get_set_names()]
+
     def load_data(self):
         """
         Load data of the dataset (create a generator).
         """
-        for set_name in self.image_dir_path:
-            if self.verbose:
-                print('\n> Loading data files for the set: ' + set_name)
+        for set_name in self.get_set_names():
+            yield self.load_data_set(set_name)
 
-            # image dir
-            image_dir = os.path.join(self.data_path, self.image_dir_path[set_name])
+    def load_data_set(self, set_name):
+        """
+        Load data of a set.
+        """
+        if self.verbose:
+            print('\n> Loading data files for the set: ' + set_name)
 
-            # annotation file path
-            annot_filepath = os.path.join(self.data_path, self.annotation_path[set_name])
+        # image dir
+        image_dir = os.path.join(self.data_path, self.image_dir_path[set_name])
 
-            if 'test' in set_name:
-                yield load_data_test(set_name, image_dir, annot_filepath, self.verbose)
-            else:
-                yield self.load_data_trainval(set_name, image_dir, annot_filepath)
+        # annotation file path
+        annot_filepath = os.path.join(self.data_path, self.annotation_path[set_name])
+
+        if 'test' in set_name:
+            return load_data_test(set_name, image_dir, annot_filepath, self.verbose,
+                                  self.parse_cache)
+        else:
+            return self.load_data_trainval(set_name, image_dir, annot_filepath)
 
     def add_data_to_source(self, hdf5_handler, data, set_name):
         """
@@ -324,18 +346,40 @@ class Detection2015(BaseTask):
             filename_ids = data[6]
             images_fname_by_id = data[7]
 
-        image_filenames = []
-        coco_urls = []
-        width = []
-        height = []
-        image_id = []
+        if is_test:
+            object_fields = ["image_filenames", "coco_urls", "width", "height"]
+        else:
+            object_fields = ["image_filenames", "coco_urls", "width", "height",
+                             "category", "supercategory", "boxes", "area",
+                             "iscrowd", "segmentation",
+                             "image_id", "category_id", "annotation_id"]
+
+        # The per-image and per-object fields are streamed to disk while the
+        # annotations are parsed, so only a buffer of rows is kept in memory.
+        image_filenames = HDF5StreamWriter(hdf5_handler, 'image_filenames', np.uint8,
+                                           strings=True)
+        coco_urls = HDF5StreamWriter(hdf5_handler, 'coco_urls', np.uint8, strings=True)
+        width = HDF5StreamWriter(hdf5_handler, 'width', np.int32)
+        height = HDF5StreamWriter(hdf5_handler, 'height', np.int32)
+        image_id = HDF5StreamWriter(hdf5_handler, 'image_id', np.int32)
+        object_id = HDF5StreamWriter(hdf5_handler, 'object_ids', np.int32)
+        list_object_ids_per_image = HDF5RaggedStreamWriter(hdf5_handler,
+                                                           'list_object_ids_per_image',
+                                                           np.int32)
+        writers = [image_filenames, coco_urls, width, height, image_id, object_id,
+                   list_object_ids_per_image]
+        if not is_test:
+            annotation_id = HDF5StreamWriter(hdf5_handler, 'annotation_id', np.int32)
+            area = HDF5StreamWriter(hdf5_handler, 'area', np.int32)
+            bbox = HDF5StreamWriter(hdf5_handler, 'boxes', np.float)
+            segmentation = HDF5StreamWriter(hdf5_handler, 'segmentation', np.float)
+            list_boxes_per_image = HDF5RaggedStreamWriter(hdf5_handler, 'list_boxes_per_image',
+                                                          np.int32)
+            writers += [annotation_id, area, bbox, segmentation, list_boxes_per_image]
 
-        annotation_id = []
-        area = []
         iscrowd = [0, 1]
-        segmentation = []
-        bbox = []
-        object_id = []
+        category_ids = dict((name, i) for i, name in enumerate(category))
+        supercategory_ids = dict((name, i) for i, name in enumerate(supercategory))
 
         # coco id lists
         # These are order by entry like in the annotation files.
@@ -345,27 +389,17 @@ class Detection2015(BaseTask):
         coco_categories_ids = []
         coco_annotations_ids = []
 
-        if is_test:
-            object_fields = ["image_filenames", "coco_urls", "width", "height"]
-        else:
-            object_fields = ["image_filenames", "coco_urls", "width", "height",
-                             "category", "supercategory", "boxes", "area",
-                             "iscrowd", "segmentation",
-                             "image_id", "category_id", "annotation_id"]
-
-        list_image_filenames_per_category = []
-        list_image_filenames_per_supercategory = []
-        list_boxes_per_image = []
-        list_object_ids_per_image = []
-        list_objects_ids_per_category = []
-        list_objects_ids_per_supercategory = []
+        # image/category/supercategory ids of the objects (to build the lists)
+        object_image_ids = []
+        object_category_ids = []
+        object_supercategory_ids = []
 
         if self.verbose:
             print('> Adding data to default group:')
             prgbar = progressbar.ProgressBar(max_value=len(data[0]))
 
         counter = 0
-        segmentation_t1_counter, segmentation_t2_counter = 0, 0
+        image_ids_by_filename = {}
         tmp_coco_annotations_ids = {}
 
         for i, fname_idx in enumerate(data_):
@@ -378,6 +412,7 @@ class Detection2015(BaseTask):
             height.append(annotation["height"])
             coco_urls.append(annotation["coco_url"])
             image_id.append(annotation["id"])
+            image_ids_by_filename.setdefault(annotation["file_name"], i)
 
             if is_test:
                 # *** object_id ***
@@ -395,17 +430,22 @@ class Detection2015(BaseTask):
                         annotation_id.append(obj["id"])
                         segmentation.append(obj["segmentation"])
 
+                        category_idx = category_ids[obj["category"]]
+                        supercategory_idx = supercategory_ids[obj["supercategory"]]
+
                         # *** object_id ***
                         # [filename, coco_url, width, height,
                         # category, supercategory,
                         # bbox, area, iscrowd, segmentation,
                         # "image_id", "category_id", "annotation_id"]
                         object_id.append([i, i, i, i,
-                                          category.index(obj["category"]), supercategory.index(
-                                              obj["supercategory"]),
+                                          category_idx, supercategory_idx,
                                           counter, counter, obj["iscrowd"], counter,
-                                          i, category.index(obj["category"]), counter])
+                                          i, category_idx, counter])
 
+                        object_image_ids.append(i)
+                        object_category_ids.append(category_idx)
+                        object_supercategory_ids.append(supercategory_idx)
                         boxes_per_image.append(counter)
 
                         # temporary var
@@ -421,6 +461,9 @@ class Detection2015(BaseTask):
             if self.verbose:
                 prgbar.update(i)
 
+        for writer in writers:
+            writer.close()
+
         # update progressbar
         if self.verbose:
             prgbar.finish()
@@ -431,7 +474,7 @@ class Detection2015(BaseTask):
 
         # set coco id lists
         for i, annot in enumerate(annotations['images']):
-            fname_id = image_filenames.index(os.path.join(image_dir, annot['file_name']))
+            fname_id = image_ids_by_filename[os.path.join(image_dir, annot['file_name'])]
             coco_images_ids.append(fname_id)
 
             # update progressbar
@@ -464,60 +507,28 @@ class Detection2015(BaseTask):
             if self.verbose:
                 print('> Processing lists...')
 
-            for i in range(len(category)):
-                imgs_per_category = [val[0] for _, val in enumerate(object_id) if val[4] == i]
-                imgs_per_category = list(set(imgs_per_category))  # get unique values
-                imgs_per_category.sort()
-                list_image_filenames_per_category.append(imgs_per_category)
-
-            for i in range(len(supercategory)):
-                imgs_per_supercategory = [val[0] for _, val in enumerate(object_id) if val[5] == i]
-                imgs_per_supercategory = list(set(imgs_per_supercategory))  # get unique values
-                imgs_per_supercategory.sort()
-                list_image_filenames_per_supercategory.append(imgs_per_supercategory)
-
-            for i in range(len(category)):
-                obj_per_category = [j for j, val in enumerate(object_id) if val[4] == i]
-                obj_per_category = list(set(obj_per_category))  # get unique values
-                obj_per_category.sort()
-                list_objects_ids_per_category.append(obj_per_category)
-
-            for i in range(len(supercategory)):
-                obj_per_supercategory = [j for j, val in enumerate(object_id) if val[5] == i]
-                obj_per_supercategory = list(set(obj_per_supercategory))  # get unique values
-                obj_per_supercategory.sort()
-                list_objects_ids_per_supercategory.append(obj_per_supercategory)
+            list_image_filenames_per_category = group_by(object_category_ids, len(category),
+                                                         values=object_image_ids, unique=True)
+            list_image_filenames_per_supercategory = group_by(object_supercategory_ids,
+                                                              len(supercategory),
+                                                              values=object_image_ids,
+                                                              unique=True)
+            list_objects_ids_per_category = group_by(object_category_ids, len(category))
+            list_objects_ids_per_supercategory = group_by(object_supercategory_ids,
+                                                          len(supercategory))
 
             if self.verbose:
                 print('> Done.')
 
-        hdf5_write_data(hdf5_handler, 'image_filenames',
-                        str2ascii(image_filenames), dtype=np.uint8,
-                        fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'coco_urls',
-                        str2ascii(coco_urls), dtype=np.uint8,
-                        fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'width',
-                        np.array(width, dtype=np.int32),
-                        fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'height',
-                        np.array(height, dtype=np.int32),
-                        fillvalue=-1)
         hdf5_write_data(hdf5_handler, 'category',
                         str2ascii(category), dtype=np.uint8,
                         fillvalue=0)
         hdf5_write_data(hdf5_handler, 'supercategory',
                         str2ascii(supercategory), dtype=np.uint8,
                         fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'image_id',
-                        np.array(image_id, dtype=np.int32),
-                        fillvalue=-1)
         hdf5_write_data(hdf5_handler, 'category_id',
                         np.array(category_id, dtype=np.int32),
                         fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'object_ids',
-                        np.array(object_id, dtype=np.int32),
-                        fillvalue=-1)
         hdf5_write_data(hdf5_handler, 'object_fields',
                         str2ascii(object_fields), dtype=np.uint8,
                         fillvalue=0)
@@ -527,68 +538,28 @@ class Detection2015(BaseTask):
         hdf5_write_data(hdf5_handler, 'coco_categories_ids',
                         np.array(coco_categories_ids, dtype=np.int32),
                         fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'list_object_ids_per_image',
-                        np.array(pad_list(list_object_ids_per_image, -1), dtype=np.int32),
-                        fillvalue=-1)
 
         if not is_test:
-            hdf5_write_data(hdf5_handler, 'annotation_id',
-                            np.array(annotation_id, dtype=np.int32),
-                            fillvalue=-1)
-            hdf5_write_data(hdf5_handler, 'boxes',
-                            np.array(bbox, dtype=np.float),
-                            fillvalue=-1)
             hdf5_write_data(hdf5_handler, 'iscrowd',
                             np.array(iscrowd, dtype=np.uint8),
                             fillvalue=0)
-
-            nrows = len(segmentation)
-            ncols = max([len(l) for l in segmentation])
-            dset = hdf5_handler.create_dataset('segmentation',
-                                               (nrows, ncols),
-                                               dtype=np.float,
-                                               chunks=True,
-                                               compression="gzip",
-                                               compression_opts=4,
-                                               fillvalue=-1)
-            if self.verbose:
-                print('   -- Saving segmentation masks to disk (this will take some time)')
-                prgbar = progressbar.ProgressBar(max_value=nrows)
-            for i in range(nrows):
-                dset[i, :len(segmentation[i])] = np.array(segmentation[i], dtype=np.float)
-                if self.verbose:
-                    prgbar.update(i)
-
-            if self.verbose:
-                prgbar.finish()
-
-            hdf5_write_data(hdf5_handler, 'area',
-                            np.array(area, dtype=np.int32),
-                            fillvalue=-1)
             hdf5_write_data(hdf5_handler, 'coco_annotations_ids',
                             np.array(coco_annotations_ids, dtype=np.int32),
                             fillvalue=-1)
 
             pad_value = -1
-            hdf5_write_data(hdf5_handler, 'list_image_filenames_per_category',
-                            np.array(pad_list(list_image_filenames_per_category,
-                                              pad_value), dtype=np.int32),
-                            fillvalue=pad_value)
-            hdf5_write_data(hdf5_handler, 'list_image_filenames_per_supercategory',
-                            np.array(pad_list(list_image_filenames_per_supercategory,
-                                              pad_value), dtype=np.int32),
-                            fillvalue=pad_value)
-            hdf5_write_data(hdf5_handler, 'list_boxes_per_image',
-                            np.array(pad_list(list_boxes_per_image, pad_value), dtype=np.int32),
-                            fillvalue=pad_value)
-            hdf5_write_data(hdf5_handler, 'list_objects_ids_per_category',
-                            np.array(pad_list(list_objects_ids_per_category,
-                                              pad_value), dtype=np.int32),
-                            fillvalue=pad_value)
-            hdf5_write_data(hdf5_handler, 'list_objects_ids_per_supercategory',
-                            np.array(pad_list(list_objects_ids_per_supercategory,
-                                              pad_value), dtype=np.int32),
-                            fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_image_filenames_per_category',
+                                   list_image_filenames_per_category,
+                                   dtype=np.int32, fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_image_filenames_per_supercategory',
+                                   list_image_filenames_per_supercategory,
+                                   dtype=np.int32, fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_objects_ids_per_category',
+                                   list_objects_ids_per_category,
+                                   dtype=np.int32, fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_objects_ids_per_supercategory',
+                                   list_objects_ids_per_supercategory,
+                                   dtype=np.int32, fillvalue=pad_value)
 
 
 # ---------------------------------------------------------
@@ -4,16 +4,21 @@ from collections import OrderedDict
 from dbcollection.utils.file_load import load_json
 
 
-def load_data_test(set_name, image_dir, annotation_path, verbose=True):
+def load_data_test(set_name, image_dir, annotation_path, verbose=True, parse_cache=None):
     """
     Load test data annotations.
+
+    The annotation file is parsed with 'parse_cache' (a ParseCache), if given.
     """
     data = {}
 
     # load annotation file
     if verbose:
         print('> Loading annotation file: ' + annotation_path)
-    annotations = load_json(annotation_path)
+    if parse_cache is not None:
+        annotations = parse_cache.load(load_json, annotation_path)
+    else:
+        annotations = load_json(annotation_path)
 
     # parse annotations
     # images
@@ -15,8 +15,7 @@ from dbcollection.datasets import BaseTask
 from dbcollection.utils.file_load import load_txt, load_matlab
 from dbcollection.utils.os_dir import construct_set_from_dir, dir_get_size
 from dbcollection.utils.string_ascii import convert_str_to_ascii as str2ascii
-from dbcollection.utils.pad import pad_list
-from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.hdf5 import hdf5_write_data, HDF5StreamWriter
 
 
 class Classification(BaseTask):
@@ -141,41 +140,66 @@ class Classification(BaseTask):
         """
         # do nothing
 
-    def load_data(self):
+    def get_input_files(self, set_name):
         """
-        Load the data from the files.
+        Return the annotation files and the images directory of a set.
+        """
+        if set_name == 'train':
+            data_dir = self.get_dir_path(self.dirnames_train)
+        else:
+            data_dir = self.get_dir_path(self.dirnames_val)
+        input_files = [self.get_file_path('meta.mat'), data_dir]
+        if set_name == 'val' and dir_get_size(data_dir)[1] == 0:
+            input_files.append(self.get_file_path('ILSVRC2012_validation_ground_truth.txt'))
+        return input_files
+
+    def process_metadata(self):
+        """
+        Setup the data dirs before processing the sets.
         """
         # setup dirs (used only for raw256)
         self.setup_dirs()
+        return super(Classification, self).process_metadata()
 
-        # load annotations
-        if self.verbose:
-            print('\n==> Fetching annotations + image files...')
-        annotations = self.get_annotations()
+    def get_set_names(self):
+        """
+        Return the names of the sets.
+        """
+        return ['train', 'val']
 
-        # get correct set paths
-        dir_paths = {
-            "train": self.get_dir_path(self.dirnames_train),
-            "val": self.get_dir_path(self.dirnames_val)
-        }
+    def load_data(self):
+        """
+        Load the data from the files.
+        """
+        for set_name in self.get_set_names():
+            yield self.load_data_set(set_name)
 
-        # cycle the train and val data
-        for set_name in dir_paths:
-            data_dir = dir_paths[set_name]
+    def load_data_set(self, set_name):
+        """
+        Load the data of a set from the files.
+        """
+        # setup dirs (used only for raw256)
+        self.setup_dirs()
 
-            if set_name is 'train':
+        if self.verbose:
+            print('\n==> Fetching image files of the set: {}'.format(set_name))
+
+        # get correct set path
+        if set_name == 'train':
+            data_dir = self.get_dir_path(self.dirnames_train)
+            data = construct_set_from_dir(data_dir, self.verbose)
+        else:
+            data_dir = self.get_dir_path(self.dirnames_val)
+            _, folders = dir_get_size(data_dir)
+            if folders > 0:
                 data = construct_set_from_dir(data_dir, self.verbose)
             else:
-                _, folders = dir_get_size(data_dir)
-                if folders > 0:
-                    data = construct_set_from_dir(data_dir, self.verbose)
-                else:
-                    data = self.fetch_val_dir_data(data_dir)
+                data = self.fetch_val_dir_data(data_dir)
 
-            # sort filenames
-            data = self.sort(data)
+        # sort filenames
+        data = self.sort(data)
 
-            yield {set_name: data}
+        return {set_name: data}
 
     def store_data_source(self, hdf5_handler, data, set_name):
         """
@@ -204,9 +228,21 @@ class Classification(BaseTask):
         if self.verbose:
             prgbar.finish()
 
-    def convert_data_to_arrays(self, data, set_name):
+    def add_data_to_source(self, hdf5_handler, data, set_name=None):
+        """
+        Store data annotations in a nested tree fashion.
+
+        It closely follows the tree structure of the data.
+        """
+        self.store_data_source(hdf5_handler, data, set_name)
+
+    def add_data_to_default(self, hdf5_handler, data, set_name=None):
         """
-        Convert folders/filenames to arrays.
+        Add data of a set to the default group.
+
+        For each field, the data is organized into a single big matrix. The
+        filenames and object ids are streamed to disk class by class, so only
+        a buffer of rows is kept in memory.
         """
         # load annotations
         annotations = self.get_annotations()
@@ -216,64 +252,35 @@ class Classification(BaseTask):
         classes.sort()
         label_list = [annotations[cname]['label'] for _, cname in enumerate(classes)]
         description_list = [annotations[cname]['description'] for _, cname in enumerate(classes)]
-        object_ids = []
-        filenames = []
-        list_image_filenames_per_class = []
+
+        image_filenames = HDF5StreamWriter(hdf5_handler, 'image_filenames', np.uint8,
+                                           strings=True)
+        object_ids = HDF5StreamWriter(hdf5_handler, 'object_ids', np.int32)
+        list_image_filenames_per_class = HDF5StreamWriter(hdf5_handler,
+                                                          'list_image_filenames_per_class',
+                                                          np.int32, fillvalue=-1)
 
         # cycle all classes
-        count_fname = 0
         for class_id, cname in enumerate(classes):
-            range_ini = len(filenames)
+            range_ini = image_filenames.nrows
 
             for filename in data[cname]:
-                filenames.append(os.path.join(self.data_path, set_name, cname, filename))
-                object_ids.append([count_fname, class_id])
-                count_fname += 1
+                object_ids.append([image_filenames.nrows, class_id])
+                image_filenames.append(os.path.join(self.data_path, set_name, cname, filename))
 
             # organize filenames by class id
-            list_image_filenames_per_class.append(list(range(range_ini, len(filenames))))
-
-        # pad list with zeros in order to have all lists of the same size
-        list_image_filenames_per_class = pad_list(list_image_filenames_per_class, -1)
-
-        return {
-            "classes": str2ascii(classes),
-            "labels": str2ascii(label_list),
-            "image_filenames": str2ascii(filenames),
-            "descriptions": str2ascii(description_list),
-            "object_fields": str2ascii(['image_filenames', 'classes']),
-            "object_ids": np.array(object_ids, dtype=np.int32),
-            "list_image_filenames_per_class": np.array(list_image_filenames_per_class,
-                                                       dtype=np.int32)
-        }
+            list_image_filenames_per_class.append(list(range(range_ini, image_filenames.nrows)))
 
-    def add_data_to_source(self, hdf5_handler, data, set_name=None):
-        """
-        Store data annotations in a nested tree fashion.
-
-        It closely follows the tree structure of the data.
-        """
-        self.store_data_source(hdf5_handler, data, set_name)
+        image_filenames.close()
+        object_ids.close()
+        list_image_filenames_per_class.close()
 
-    def add_data_to_default(self, hdf5_handler, data, set_name=None):
-        """
-        Add data of a set to the default group.
-
-        For each field, the data is organized into a single big matrix.
-        """
-        data_array = self.convert_data_to_arrays(data, set_name)
-        hdf5_write_data(hdf5_handler, 'image_filenames',
-                        data_array["image_filenames"], dtype=np.uint8, fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'classes', data_array["classes"], dtype=np.uint8, fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'labels', data_array["labels"], dtype=np.uint8, fillvalue=0)
+        hdf5_write_data(hdf5_handler, 'classes', str2ascii(classes), dtype=np.uint8, fillvalue=0)
+        hdf5_write_data(hdf5_handler, 'labels', str2ascii(label_list), dtype=np.uint8, fillvalue=0)
         hdf5_write_data(hdf5_handler, 'descriptions',
-                        data_array["descriptions"], dtype=np.uint8, fillvalue=0)
-        hdf5_write_data(hdf5_handler, 'object_ids',
-                        data_array["object_ids"], dtype=np.int32, fillvalue=-1)
+                        str2ascii(description_list), dtype=np.uint8, fillvalue=0)
         hdf5_write_data(hdf5_handler, 'object_fields',
-                        data_array["object_fields"], dtype=np.uint8, fillvalue=-1)
-        hdf5_write_data(hdf5_handler, 'list_image_filenames_per_class',
-                        data_array["list_image_filenames_per_class"], dtype=np.int32, fillvalue=-1)
+                        str2ascii(['image_filenames', 'classes']), dtype=np.uint8, fillvalue=-1)
 
 
 # ---------------------------------------------------------
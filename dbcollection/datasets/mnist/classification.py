@@ -143,7 +143,7 @@ class Classification(BaseTask):
                         fillvalue=0)
         hdf5_write_data(hdf5_handler, 'images',
                         data["images"], dtype=np.uint8,
-                        fillvalue=-1)
+                        fillvalue=-1, contiguous=True)
         hdf5_write_data(hdf5_handler, 'labels',
                         data["labels"], dtype=np.uint8,
                         fillvalue=0)
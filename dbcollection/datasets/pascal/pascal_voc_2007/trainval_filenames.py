@@ -1,5012 +0,0 @@
-filenames = [
-    "000005",
-    "000007",
-    "000009",
-    "000012",
-    "000016",
-    "000017",
-    "000019",
-    "000020",
-    "000021",
-    "000023",
-    "000024",
-    "000026",
-    "000030",
-    "000032",
-    "000033",
-    "000034",
-    "000035",
-    "000036",
-    "000039",
-    "000041",
-    "000042",
-    "000044",
-    "000046",
-    "000047",
-    "000048",
-    "000050",
-    "000051",
-    "000052",
-    "000060",
-    "000061",
-    "000063",
-    "000064",
-    "000065",
-    "000066",
-    "000072",
-    "000073",
-    "000077",
-    "000078",
-    "000081",
-    "000083",
-    "000089",
-    "000091",
-    "000093",
-    "000095",
-    "000099",
-    "000101",
-    "000102",
-    "000104",
-    "000107",
-    "000109",
-    "000110",
-    "000112",
-    "000113",
-    "000117",
-    "000118",
-    "000120",
-    "000121",
-    "000122",
-    "000123",
-    "000125",
-    "000129",
-    "000130",
-    "000131",
-    "000132",
-    "000133",
-    "000134",
-    "000138",
-    "000140",
-    "000141",
-    "000142",
-    "000143",
-    "000146",
-    "000147",
-    "000150",
-    "000153",
-    "000154",
-    "000156",
-    "000158",
-    "000159",
-    "000161",
-    "000162",
-    "000163",
-    "000164",
-    "000165",
-    "000169",
-    "000170",
-    "000171",
-    "000173",
-    "000174",
-    "000177",
-    "000180",
-    "000184",
-    "000187",
-    "000189",
-    "000190",
-    "000192",
-    "000193",
-    "000194",
-    "000198",
-    "000200",
-    "000203",
-    "000207",
-    "000208",
-    "000209",
-    "000210",
-    "000211",
-    "000214",
-    "000215",
-    "000218",
-    "000219",
-    "000220",
-    "000221",
-    "000222",
-    "000224",
-    "000225",
-    "000228",
-    "000229",
-    "000232",
-    "000233",
-    "000235",
-    "000236",
-    "000241",
-    "000242",
-    "000244",
-    "000245",
-    "000246",
-    "000249",
-    "000250",
-    "000251",
-    "000256",
-    "000257",
-    "000259",
-    "000262",
-    "000263",
-    "000266",
-    "000268",
-    "000269",
-    "000270",
-    "000275",
-    "000276",
-    "000278",
-    "000282",
-    "000285",
-    "000288",
-    "000289",
-    "000294",
-    "000296",
-    "000298",
-    "000302",
-    "000303",
-    "000304",
-    "000305",
-    "000306",
-    "000307",
-    "000308",
-    "000311",
-    "000312",
-    "000317",
-    "000318",
-    "000320",
-    "000321",
-    "000322",
-    "000323",
-    "000325",
-    "000328",
-    "000329",
-    "000331",
-    "000332",
-    "000334",
-    "000336",
-    "000337",
-    "000338",
-    "000340",
-    "000343",
-    "000344",
-    "000347",
-    "000349",
-    "000352",
-    "000354",
-    "000355",
-    "000359",
-    "000363",
-    "000367",
-    "000370",
-    "000372",
-    "000373",
-    "000374",
-    "000379",
-    "000380",
-    "000381",
-    "000382",
-    "000387",
-    "000391",
-    "000394",
-    "000395",
-    "000396",
-    "000400",
-    "000403",
-    "000404",
-    "000406",
-    "000407",
-    "000408",
-    "000411",
-    "000416",
-    "000417",
-    "000419",
-    "000420",
-    "000424",
-    "000427",
-    "000428",
-    "000430",
-    "000431",
-    "000433",
-    "000435",
-    "000438",
-    "000439",
-    "000443",
-    "000446",
-    "000448",
-    "000450",
-    "000454",
-    "000459",
-    "000460",
-    "000461",
-    "000462",
-    "000463",
-    "000464",
-    "000468",
-    "000469",
-    "000470",
-    "000474",
-    "000476",
-    "000477",
-    "000480",
-    "000482",
-    "000483",
-    "000484",
-    "000486",
-    "000489",
-    "000491",
-    "000492",
-    "000494",
-    "000496",
-    "000498",
-    "000499",
-    "000500",
-    "000501",
-    "000503",
-    "000508",
-    "000509",
-    "000513",
-    "000514",
-    "000515",
-    "000516",
-    "000518",
-    "000519",
-    "000520",
-    "000522",
-    "000523",
-    "000524",
-    "000525",
-    "000526",
-    "000528",
-    "000530",
-    "000531",
-    "000535",
-    "000537",
-    "000540",
-    "000541",
-    "000543",
-    "000544",
-    "000545",
-    "000549",
-    "000550",
-    "000552",
-    "000554",
-    "000555",
-    "000559",
-    "000563",
-    "000564",
-    "000565",
-    "000577",
-    "000579",
-    "000581",
-    "000582",
-    "000583",
-    "000588",
-    "000589",
-    "000590",
-    "000591",
-    "000592",
-    "000597",
-    "000598",
-    "000599",
-    "000601",
-    "000605",
-    "000608",
-    "000609",
-    "000610",
-    "000612",
-    "000613",
-    "000619",
-    "000620",
-    "000622",
-    "000625",
-    "000626",
-    "000628",
-    "000632",
-    "000633",
-    "000635",
-    "000637",
-    "000645",
-    "000647",
-    "000648",
-    "000653",
-    "000654",
-    "000656",
-    "000657",
-    "000660",
-    "000661",
-    "000663",
-    "000667",
-    "000671",
-    "000672",
-    "000675",
-    "000676",
-    "000677",
-    "000680",
-    "000682",
-    "000684",
-    "000685",
-    "000686",
-    "000688",
-    "000689",
-    "000690",
-    "000694",
-    "000695",
-    "000699",
-    "000700",
-    "000702",
-    "000705",
-    "000707",
-    "000709",
-    "000710",
-    "000711",
-    "000712",
-    "000713",
-    "000714",
-    "000717",
-    "000720",
-    "000726",
-    "000728",
-    "000729",
-    "000730",
-    "000731",
-    "000733",
-    "000738",
-    "000739",
-    "000740",
-    "000742",
-    "000746",
-    "000748",
-    "000750",
-    "000752",
-    "000753",
-    "000754",
-    "000755",
-    "000756",
-    "000760",
-    "000761",
-    "000763",
-    "000764",
-    "000767",
-    "000768",
-    "000770",
-    "000771",
-    "000772",
-    "000774",
-    "000776",
-    "000777",
-    "000780",
-    "000782",
-    "000786",
-    "000787",
-    "000791",
-    "000793",
-    "000794",
-    "000796",
-    "000797",
-    "000799",
-    "000800",
-    "000802",
-    "000804",
-    "000805",
-    "000806",
-    "000808",
-    "000810",
-    "000812",
-    "000814",
-    "000815",
-    "000816",
-    "000818",
-    "000820",
-    "000822",
-    "000823",
-    "000826",
-    "000827",
-    "000828",
-    "000829",
-    "000830",
-    "000831",
-    "000832",
-    "000834",
-    "000842",
-    "000843",
-    "000845",
-    "000847",
-    "000848",
-    "000849",
-    "000850",
-    "000851",
-    "000854",
-    "000855",
-    "000857",
-    "000859",
-    "000860",
-    "000862",
-    "000863",
-    "000865",
-    "000867",
-    "000868",
-    "000871",
-    "000872",
-    "000874",
-    "000876",
-    "000878",
-    "000879",
-    "000880",
-    "000882",
-    "000885",
-    "000887",
-    "000888",
-    "000889",
-    "000892",
-    "000895",
-    "000896",
-    "000898",
-    "000899",
-    "000900",
-    "000902",
-    "000903",
-    "000904",
-    "000906",
-    "000908",
-    "000911",
-    "000912",
-    "000915",
-    "000917",
-    "000918",
-    "000919",
-    "000920",
-    "000921",
-    "000923",
-    "000926",
-    "000929",
-    "000931",
-    "000934",
-    "000935",
-    "000936",
-    "000937",
-    "000943",
-    "000946",
-    "000947",
-    "000948",
-    "000949",
-    "000950",
-    "000951",
-    "000954",
-    "000958",
-    "000962",
-    "000964",
-    "000965",
-    "000966",
-    "000967",
-    "000971",
-    "000972",
-    "000973",
-    "000977",
-    "000980",
-    "000982",
-    "000987",
-    "000989",
-    "000991",
-    "000993",
-    "000996",
-    "000997",
-    "000999",
-    "001001",
-    "001002",
-    "001004",
-    "001008",
-    "001009",
-    "001010",
-    "001011",
-    "001012",
-    "001014",
-    "001015",
-    "001017",
-    "001018",
-    "001024",
-    "001027",
-    "001028",
-    "001036",
-    "001041",
-    "001042",
-    "001043",
-    "001045",
-    "001050",
-    "001052",
-    "001053",
-    "001056",
-    "001057",
-    "001060",
-    "001061",
-    "001062",
-    "001064",
-    "001066",
-    "001068",
-    "001069",
-    "001071",
-    "001072",
-    "001073",
-    "001074",
-    "001077",
-    "001078",
-    "001079",
-    "001082",
-    "001083",
-    "001084",
-    "001091",
-    "001092",
-    "001093",
-    "001097",
-    "001101",
-    "001102",
-    "001104",
-    "001106",
-    "001107",
-    "001109",
-    "001110",
-    "001112",
-    "001113",
-    "001119",
-    "001121",
-    "001124",
-    "001125",
-    "001127",
-    "001129",
-    "001130",
-    "001136",
-    "001137",
-    "001140",
-    "001142",
-    "001143",
-    "001144",
-    "001145",
-    "001147",
-    "001148",
-    "001149",
-    "001151",
-    "001152",
-    "001154",
-    "001156",
-    "001158",
-    "001160",
-    "001161",
-    "001164",
-    "001166",
-    "001168",
-    "001170",
-    "001171",
-    "001172",
-    "001174",
-    "001175",
-    "001176",
-    "001182",
-    "001184",
-    "001185",
-    "001186",
-    "001187",
-    "001191",
-    "001192",
-    "001194",
-    "001199",
-    "001200",
-    "001201",
-    "001203",
-    "001204",
-    "001205",
-    "001206",
-    "001207",
-    "001209",
-    "001211",
-    "001212",
-    "001214",
-    "001215",
-    "001221",
-    "001224",
-    "001225",
-    "001226",
-    "001229",
-    "001230",
-    "001231",
-    "001233",
-    "001234",
-    "001236",
-    "001237",
-    "001239",
-    "001240",
-    "001241",
-    "001247",
-    "001248",
-    "001250",
-    "001254",
-    "001258",
-    "001259",
-    "001260",
-    "001263",
-    "001265",
-    "001266",
-    "001268",
-    "001269",
-    "001270",
-    "001272",
-    "001273",
-    "001274",
-    "001277",
-    "001279",
-    "001281",
-    "001284",
-    "001286",
-    "001287",
-    "001288",
-    "001289",
-    "001290",
-    "001292",
-    "001293",
-    "001294",
-    "001298",
-    "001299",
-    "001304",
-    "001309",
-    "001310",
-    "001311",
-    "001312",
-    "001314",
-    "001315",
-    "001316",
-    "001323",
-    "001324",
-    "001325",
-    "001326",
-    "001327",
-    "001330",
-    "001332",
-    "001333",
-    "001334",
-    "001337",
-    "001341",
-    "001343",
-    "001345",
-    "001346",
-    "001348",
-    "001350",
-    "001352",
-    "001360",
-    "001361",
-    "001362",
-    "001364",
-    "001365",
-    "001371",
-    "001375",
-    "001378",
-    "001383",
-    "001384",
-    "001385",
-    "001386",
-    "001387",
-    "001388",
-    "001390",
-    "001393",
-    "001395",
-    "001397",
-    "001400",
-    "001402",
-    "001404",
-    "001405",
-    "001406",
-    "001408",
-    "001409",
-    "001413",
-    "001414",
-    "001418",
-    "001420",
-    "001421",
-    "001426",
-    "001427",
-    "001430",
-    "001432",
-    "001434",
-    "001436",
-    "001439",
-    "001441",
-    "001442",
-    "001443",
-    "001444",
-    "001445",
-    "001450",
-    "001451",
-    "001453",
-    "001455",
-    "001457",
-    "001460",
-    "001463",
-    "001464",
-    "001465",
-    "001466",
-    "001467",
-    "001468",
-    "001470",
-    "001472",
-    "001475",
-    "001479",
-    "001480",
-    "001481",
-    "001483",
-    "001484",
-    "001485",
-    "001486",
-    "001488",
-    "001490",
-    "001492",
-    "001493",
-    "001494",
-    "001497",
-    "001498",
-    "001499",
-    "001501",
-    "001504",
-    "001509",
-    "001510",
-    "001512",
-    "001514",
-    "001515",
-    "001517",
-    "001521",
-    "001522",
-    "001523",
-    "001524",
-    "001526",
-    "001528",
-    "001529",
-    "001531",
-    "001532",
-    "001536",
-    "001537",
-    "001539",
-    "001541",
-    "001543",
-    "001544",
-    "001545",
-    "001548",
-    "001553",
-    "001554",
-    "001555",
-    "001556",
-    "001557",
-    "001559",
-    "001561",
-    "001563",
-    "001565",
-    "001571",
-    "001576",
-    "001577",
-    "001579",
-    "001580",
-    "001582",
-    "001586",
-    "001588",
-    "001590",
-    "001593",
-    "001594",
-    "001595",
-    "001597",
-    "001598",
-    "001603",
-    "001604",
-    "001607",
-    "001608",
-    "001610",
-    "001611",
-    "001612",
-    "001614",
-    "001617",
-    "001618",
-    "001622",
-    "001627",
-    "001628",
-    "001630",
-    "001632",
-    "001633",
-    "001636",
-    "001638",
-    "001640",
-    "001642",
-    "001643",
-    "001647",
-    "001649",
-    "001650",
-    "001651",
-    "001653",
-    "001654",
-    "001661",
-    "001662",
-    "001669",
-    "001673",
-    "001675",
-    "001676",
-    "001677",
-    "001678",
-    "001680",
-    "001682",
-    "001683",
-    "001684",
-    "001685",
-    "001686",
-    "001688",
-    "001689",
-    "001690",
-    "001691",
-    "001693",
-    "001699",
-    "001707",
-    "001708",
-    "001711",
-    "001713",
-    "001714",
-    "001717",
-    "001718",
-    "001721",
-    "001723",
-    "001724",
-    "001725",
-    "001726",
-    "001727",
-    "001729",
-    "001730",
-    "001732",
-    "001733",
-    "001734",
-    "001738",
-    "001739",
-    "001741",
-    "001746",
-    "001747",
-    "001749",
-    "001750",
-    "001752",
-    "001754",
-    "001755",
-    "001756",
-    "001758",
-    "001759",
-    "001761",
-    "001765",
-    "001766",
-    "001768",
-    "001771",
-    "001772",
-    "001775",
-    "001777",
-    "001778",
-    "001780",
-    "001782",
-    "001784",
-    "001785",
-    "001787",
-    "001789",
-    "001793",
-    "001795",
-    "001797",
-    "001799",
-    "001800",
-    "001801",
-    "001806",
-    "001807",
-    "001809",
-    "001810",
-    "001816",
-    "001818",
-    "001821",
-    "001825",
-    "001827",
-    "001828",
-    "001830",
-    "001832",
-    "001833",
-    "001834",
-    "001836",
-    "001837",
-    "001840",
-    "001841",
-    "001842",
-    "001843",
-    "001845",
-    "001847",
-    "001849",
-    "001853",
-    "001854",
-    "001855",
-    "001858",
-    "001860",
-    "001861",
-    "001862",
-    "001864",
-    "001870",
-    "001872",
-    "001875",
-    "001877",
-    "001878",
-    "001881",
-    "001882",
-    "001887",
-    "001888",
-    "001892",
-    "001894",
-    "001896",
-    "001898",
-    "001899",
-    "001901",
-    "001902",
-    "001903",
-    "001904",
-    "001906",
-    "001907",
-    "001911",
-    "001915",
-    "001918",
-    "001920",
-    "001922",
-    "001927",
-    "001928",
-    "001930",
-    "001931",
-    "001932",
-    "001933",
-    "001934",
-    "001936",
-    "001937",
-    "001938",
-    "001940",
-    "001941",
-    "001944",
-    "001945",
-    "001948",
-    "001950",
-    "001952",
-    "001954",
-    "001958",
-    "001960",
-    "001962",
-    "001963",
-    "001964",
-    "001970",
-    "001971",
-    "001972",
-    "001976",
-    "001977",
-    "001978",
-    "001980",
-    "001981",
-    "001982",
-    "001985",
-    "001989",
-    "001995",
-    "001999",
-    "002000",
-    "002001",
-    "002002",
-    "002004",
-    "002006",
-    "002011",
-    "002012",
-    "002015",
-    "002019",
-    "002020",
-    "002021",
-    "002022",
-    "002023",
-    "002024",
-    "002025",
-    "002027",
-    "002030",
-    "002034",
-    "002036",
-    "002037",
-    "002039",
-    "002042",
-    "002043",
-    "002045",
-    "002047",
-    "002049",
-    "002051",
-    "002054",
-    "002055",
-    "002056",
-    "002058",
-    "002061",
-    "002063",
-    "002064",
-    "002067",
-    "002068",
-    "002069",
-    "002070",
-    "002082",
-    "002083",
-    "002086",
-    "002088",
-    "002090",
-    "002091",
-    "002094",
-    "002095",
-    "002096",
-    "002098",
-    "002099",
-    "002101",
-    "002102",
-    "002104",
-    "002108",
-    "002109",
-    "002112",
-    "002114",
-    "002116",
-    "002117",
-    "002120",
-    "002124",
-    "002125",
-    "002126",
-    "002129",
-    "002132",
-    "002134",
-    "002135",
-    "002136",
-    "002139",
-    "002140",
-    "002142",
-    "002145",
-    "002146",
-    "002151",
-    "002152",
-    "002153",
-    "002155",
-    "002156",
-    "002158",
-    "002163",
-    "002165",
-    "002166",
-    "002169",
-    "002170",
-    "002171",
-    "002172",
-    "002174",
-    "002176",
-    "002178",
-    "002179",
-    "002180",
-    "002181",
-    "002182",
-    "002183",
-    "002184",
-    "002186",
-    "002187",
-    "002190",
-    "002191",
-    "002192",
-    "002193",
-    "002194",
-    "002196",
-    "002197",
-    "002199",
-    "002201",
-    "002202",
-    "002208",
-    "002209",
-    "002212",
-    "002213",
-    "002214",
-    "002215",
-    "002218",
-    "002219",
-    "002220",
-    "002221",
-    "002224",
-    "002226",
-    "002228",
-    "002233",
-    "002234",
-    "002237",
-    "002238",
-    "002241",
-    "002244",
-    "002247",
-    "002248",
-    "002249",
-    "002251",
-    "002253",
-    "002255",
-    "002256",
-    "002257",
-    "002259",
-    "002260",
-    "002261",
-    "002263",
-    "002265",
-    "002266",
-    "002267",
-    "002268",
-    "002270",
-    "002272",
-    "002273",
-    "002276",
-    "002277",
-    "002278",
-    "002279",
-    "002280",
-    "002281",
-    "002284",
-    "002285",
-    "002287",
-    "002288",
-    "002290",
-    "002291",
-    "002293",
-    "002300",
-    "002302",
-    "002305",
-    "002306",
-    "002307",
-    "002308",
-    "002310",
-    "002311",
-    "002315",
-    "002318",
-    "002320",
-    "002321",
-    "002323",
-    "002324",
-    "002328",
-    "002329",
-    "002330",
-    "002332",
-    "002333",
-    "002334",
-    "002335",
-    "002337",
-    "002340",
-    "002342",
-    "002343",
-    "002345",
-    "002347",
-    "002348",
-    "002350",
-    "002352",
-    "002354",
-    "002355",
-    "002359",
-    "002361",
-    "002362",
-    "002364",
-    "002366",
-    "002367",
-    "002368",
-    "002369",
-    "002371",
-    "002372",
-    "002373",
-    "002374",
-    "002375",
-    "002376",
-    "002377",
-    "002378",
-    "002382",
-    "002384",
-    "002385",
-    "002387",
-    "002391",
-    "002392",
-    "002393",
-    "002401",
-    "002403",
-    "002404",
-    "002405",
-    "002407",
-    "002410",
-    "002411",
-    "002413",
-    "002415",
-    "002417",
-    "002419",
-    "002420",
-    "002423",
-    "002425",
-    "002427",
-    "002433",
-    "002435",
-    "002436",
-    "002437",
-    "002439",
-    "002441",
-    "002442",
-    "002443",
-    "002444",
-    "002445",
-    "002448",
-    "002450",
-    "002452",
-    "002454",
-    "002456",
-    "002458",
-    "002459",
-    "002460",
-    "002461",
-    "002462",
-    "002465",
-    "002466",
-    "002468",
-    "002470",
-    "002471",
-    "002472",
-    "002476",
-    "002477",
-    "002478",
-    "002479",
-    "002480",
-    "002481",
-    "002483",
-    "002490",
-    "002491",
-    "002492",
-    "002493",
-    "002494",
-    "002496",
-    "002497",
-    "002500",
-    "002501",
-    "002502",
-    "002504",
-    "002505",
-    "002508",
-    "002512",
-    "002513",
-    "002514",
-    "002518",
-    "002519",
-    "002520",
-    "002523",
-    "002524",
-    "002525",
-    "002529",
-    "002533",
-    "002534",
-    "002537",
-    "002539",
-    "002540",
-    "002542",
-    "002544",
-    "002545",
-    "002546",
-    "002547",
-    "002549",
-    "002554",
-    "002555",
-    "002558",
-    "002559",
-    "002561",
-    "002563",
-    "002564",
-    "002565",
-    "002566",
-    "002567",
-    "002569",
-    "002571",
-    "002572",
-    "002578",
-    "002579",
-    "002584",
-    "002585",
-    "002586",
-    "002589",
-    "002590",
-    "002593",
-    "002594",
-    "002595",
-    "002598",
-    "002599",
-    "002600",
-    "002603",
-    "002605",
-    "002606",
-    "002609",
-    "002611",
-    "002613",
-    "002615",
-    "002618",
-    "002621",
-    "002625",
-    "002627",
-    "002632",
-    "002633",
-    "002634",
-    "002635",
-    "002636",
-    "002637",
-    "002641",
-    "002643",
-    "002645",
-    "002646",
-    "002647",
-    "002648",
-    "002649",
-    "002653",
-    "002657",
-    "002658",
-    "002659",
-    "002662",
-    "002664",
-    "002666",
-    "002667",
-    "002668",
-    "002669",
-    "002670",
-    "002675",
-    "002677",
-    "002678",
-    "002680",
-    "002682",
-    "002683",
-    "002684",
-    "002689",
-    "002690",
-    "002691",
-    "002693",
-    "002695",
-    "002696",
-    "002697",
-    "002699",
-    "002702",
-    "002704",
-    "002706",
-    "002709",
-    "002710",
-    "002713",
-    "002714",
-    "002715",
-    "002717",
-    "002718",
-    "002721",
-    "002722",
-    "002723",
-    "002727",
-    "002730",
-    "002732",
-    "002734",
-    "002735",
-    "002737",
-    "002738",
-    "002741",
-    "002744",
-    "002745",
-    "002747",
-    "002749",
-    "002751",
-    "002755",
-    "002757",
-    "002759",
-    "002760",
-    "002762",
-    "002763",
-    "002765",
-    "002766",
-    "002767",
-    "002772",
-    "002774",
-    "002775",
-    "002776",
-    "002778",
-    "002779",
-    "002782",
-    "002783",
-    "002784",
-    "002785",
-    "002786",
-    "002791",
-    "002794",
-    "002795",
-    "002796",
-    "002798",
-    "002800",
-    "002801",
-    "002803",
-    "002804",
-    "002807",
-    "002810",
-    "002812",
-    "002815",
-    "002816",
-    "002817",
-    "002820",
-    "002826",
-    "002827",
-    "002833",
-    "002834",
-    "002835",
-    "002836",
-    "002838",
-    "002841",
-    "002842",
-    "002844",
-    "002845",
-    "002847",
-    "002848",
-    "002854",
-    "002855",
-    "002858",
-    "002859",
-    "002864",
-    "002866",
-    "002867",
-    "002868",
-    "002869",
-    "002870",
-    "002873",
-    "002875",
-    "002879",
-    "002880",
-    "002881",
-    "002884",
-    "002886",
-    "002889",
-    "002891",
-    "002893",
-    "002896",
-    "002899",
-    "002901",
-    "002906",
-    "002910",
-    "002912",
-    "002913",
-    "002914",
-    "002915",
-    "002916",
-    "002917",
-    "002919",
-    "002924",
-    "002931",
-    "002932",
-    "002933",
-    "002934",
-    "002935",
-    "002937",
-    "002938",
-    "002939",
-    "002940",
-    "002941",
-    "002942",
-    "002943",
-    "002944",
-    "002946",
-    "002947",
-    "002952",
-    "002953",
-    "002954",
-    "002956",
-    "002957",
-    "002958",
-    "002960",
-    "002962",
-    "002963",
-    "002965",
-    "002966",
-    "002967",
-    "002969",
-    "002975",
-    "002976",
-    "002977",
-    "002978",
-    "002984",
-    "002986",
-    "002987",
-    "002988",
-    "002989",
-    "002990",
-    "002992",
-    "002994",
-    "002995",
-    "003000",
-    "003002",
-    "003003",
-    "003004",
-    "003005",
-    "003007",
-    "003008",
-    "003009",
-    "003011",
-    "003013",
-    "003015",
-    "003017",
-    "003021",
-    "003023",
-    "003024",
-    "003027",
-    "003028",
-    "003031",
-    "003032",
-    "003034",
-    "003038",
-    "003039",
-    "003042",
-    "003044",
-    "003045",
-    "003047",
-    "003051",
-    "003053",
-    "003054",
-    "003056",
-    "003057",
-    "003058",
-    "003061",
-    "003063",
-    "003064",
-    "003065",
-    "003066",
-    "003072",
-    "003074",
-    "003077",
-    "003078",
-    "003082",
-    "003083",
-    "003085",
-    "003086",
-    "003088",
-    "003089",
-    "003090",
-    "003092",
-    "003093",
-    "003094",
-    "003098",
-    "003100",
-    "003102",
-    "003103",
-    "003105",
-    "003106",
-    "003107",
-    "003108",
-    "003110",
-    "003112",
-    "003116",
-    "003117",
-    "003118",
-    "003120",
-    "003121",
-    "003122",
-    "003124",
-    "003126",
-    "003127",
-    "003129",
-    "003133",
-    "003134",
-    "003135",
-    "003137",
-    "003138",
-    "003140",
-    "003142",
-    "003145",
-    "003146",
-    "003147",
-    "003149",
-    "003150",
-    "003154",
-    "003155",
-    "003157",
-    "003159",
-    "003161",
-    "003162",
-    "003163",
-    "003164",
-    "003165",
-    "003169",
-    "003170",
-    "003175",
-    "003176",
-    "003177",
-    "003178",
-    "003181",
-    "003183",
-    "003184",
-    "003185",
-    "003186",
-    "003188",
-    "003189",
-    "003194",
-    "003195",
-    "003199",
-    "003200",
-    "003202",
-    "003204",
-    "003205",
-    "003207",
-    "003210",
-    "003211",
-    "003213",
-    "003214",
-    "003216",
-    "003218",
-    "003219",
-    "003223",
-    "003228",
-    "003229",
-    "003231",
-    "003233",
-    "003236",
-    "003239",
-    "003240",
-    "003242",
-    "003243",
-    "003244",
-    "003247",
-    "003250",
-    "003253",
-    "003254",
-    "003255",
-    "003256",
-    "003258",
-    "003259",
-    "003260",
-    "003261",
-    "003262",
-    "003269",
-    "003270",
-    "003271",
-    "003272",
-    "003273",
-    "003274",
-    "003279",
-    "003280",
-    "003282",
-    "003284",
-    "003285",
-    "003290",
-    "003292",
-    "003293",
-    "003294",
-    "003296",
-    "003299",
-    "003300",
-    "003301",
-    "003303",
-    "003307",
-    "003308",
-    "003311",
-    "003313",
-    "003316",
-    "003320",
-    "003325",
-    "003327",
-    "003330",
-    "003331",
-    "003335",
-    "003336",
-    "003337",
-    "003338",
-    "003339",
-    "003343",
-    "003344",
-    "003349",
-    "003350",
-    "003351",
-    "003354",
-    "003355",
-    "003356",
-    "003359",
-    "003360",
-    "003362",
-    "003363",
-    "003365",
-    "003367",
-    "003369",
-    "003370",
-    "003373",
-    "003374",
-    "003376",
-    "003377",
-    "003379",
-    "003380",
-    "003382",
-    "003386",
-    "003390",
-    "003391",
-    "003392",
-    "003395",
-    "003396",
-    "003397",
-    "003398",
-    "003401",
-    "003403",
-    "003404",
-    "003406",
-    "003407",
-    "003408",
-    "003410",
-    "003412",
-    "003413",
-    "003415",
-    "003416",
-    "003417",
-    "003419",
-    "003420",
-    "003421",
-    "003422",
-    "003424",
-    "003425",
-    "003429",
-    "003430",
-    "003433",
-    "003435",
-    "003436",
-    "003439",
-    "003441",
-    "003443",
-    "003444",
-    "003449",
-    "003450",
-    "003451",
-    "003452",
-    "003453",
-    "003455",
-    "003458",
-    "003461",
-    "003462",
-    "003464",
-    "003465",
-    "003466",
-    "003468",
-    "003469",
-    "003470",
-    "003477",
-    "003484",
-    "003487",
-    "003489",
-    "003491",
-    "003492",
-    "003493",
-    "003496",
-    "003497",
-    "003499",
-    "003500",
-    "003506",
-    "003508",
-    "003509",
-    "003510",
-    "003511",
-    "003516",
-    "003518",
-    "003519",
-    "003521",
-    "003522",
-    "003524",
-    "003525",
-    "003528",
-    "003529",
-    "003530",
-    "003536",
-    "003537",
-    "003539",
-    "003546",
-    "003548",
-    "003549",
-    "003550",
-    "003551",
-    "003554",
-    "003555",
-    "003556",
-    "003564",
-    "003565",
-    "003566",
-    "003567",
-    "003575",
-    "003576",
-    "003577",
-    "003580",
-    "003585",
-    "003586",
-    "003587",
-    "003588",
-    "003589",
-    "003593",
-    "003594",
-    "003596",
-    "003597",
-    "003599",
-    "003603",
-    "003604",
-    "003605",
-    "003606",
-    "003608",
-    "003609",
-    "003611",
-    "003614",
-    "003618",
-    "003620",
-    "003621",
-    "003622",
-    "003623",
-    "003625",
-    "003627",
-    "003628",
-    "003629",
-    "003632",
-    "003634",
-    "003635",
-    "003636",
-    "003638",
-    "003639",
-    "003640",
-    "003642",
-    "003644",
-    "003645",
-    "003646",
-    "003648",
-    "003651",
-    "003654",
-    "003655",
-    "003656",
-    "003657",
-    "003658",
-    "003660",
-    "003662",
-    "003663",
-    "003664",
-    "003667",
-    "003669",
-    "003671",
-    "003673",
-    "003674",
-    "003675",
-    "003678",
-    "003679",
-    "003681",
-    "003684",
-    "003685",
-    "003688",
-    "003690",
-    "003691",
-    "003694",
-    "003695",
-    "003696",
-    "003698",
-    "003699",
-    "003700",
-    "003703",
-    "003704",
-    "003705",
-    "003706",
-    "003708",
-    "003709",
-    "003711",
-    "003713",
-    "003714",
-    "003717",
-    "003721",
-    "003722",
-    "003727",
-    "003729",
-    "003732",
-    "003735",
-    "003740",
-    "003743",
-    "003748",
-    "003749",
-    "003750",
-    "003751",
-    "003752",
-    "003753",
-    "003754",
-    "003758",
-    "003759",
-    "003760",
-    "003763",
-    "003767",
-    "003772",
-    "003773",
-    "003774",
-    "003779",
-    "003780",
-    "003781",
-    "003783",
-    "003784",
-    "003786",
-    "003788",
-    "003790",
-    "003791",
-    "003792",
-    "003793",
-    "003796",
-    "003797",
-    "003798",
-    "003803",
-    "003806",
-    "003807",
-    "003808",
-    "003809",
-    "003811",
-    "003814",
-    "003817",
-    "003818",
-    "003820",
-    "003821",
-    "003824",
-    "003826",
-    "003827",
-    "003828",
-    "003830",
-    "003834",
-    "003835",
-    "003837",
-    "003838",
-    "003844",
-    "003845",
-    "003846",
-    "003847",
-    "003848",
-    "003849",
-    "003855",
-    "003856",
-    "003857",
-    "003859",
-    "003860",
-    "003861",
-    "003863",
-    "003865",
-    "003866",
-    "003868",
-    "003869",
-    "003871",
-    "003872",
-    "003874",
-    "003876",
-    "003877",
-    "003879",
-    "003885",
-    "003886",
-    "003887",
-    "003889",
-    "003890",
-    "003891",
-    "003895",
-    "003898",
-    "003899",
-    "003905",
-    "003907",
-    "003911",
-    "003912",
-    "003913",
-    "003915",
-    "003918",
-    "003919",
-    "003921",
-    "003923",
-    "003924",
-    "003926",
-    "003932",
-    "003935",
-    "003936",
-    "003937",
-    "003939",
-    "003941",
-    "003945",
-    "003946",
-    "003947",
-    "003948",
-    "003949",
-    "003953",
-    "003954",
-    "003956",
-    "003957",
-    "003960",
-    "003961",
-    "003963",
-    "003965",
-    "003966",
-    "003969",
-    "003970",
-    "003971",
-    "003973",
-    "003974",
-    "003979",
-    "003983",
-    "003984",
-    "003986",
-    "003987",
-    "003988",
-    "003990",
-    "003991",
-    "003992",
-    "003993",
-    "003994",
-    "003996",
-    "003997",
-    "003998",
-    "004003",
-    "004005",
-    "004008",
-    "004009",
-    "004010",
-    "004011",
-    "004012",
-    "004013",
-    "004014",
-    "004015",
-    "004016",
-    "004017",
-    "004019",
-    "004020",
-    "004023",
-    "004025",
-    "004028",
-    "004031",
-    "004033",
-    "004034",
-    "004035",
-    "004037",
-    "004039",
-    "004046",
-    "004047",
-    "004051",
-    "004052",
-    "004057",
-    "004058",
-    "004060",
-    "004066",
-    "004067",
-    "004069",
-    "004073",
-    "004075",
-    "004076",
-    "004077",
-    "004082",
-    "004085",
-    "004087",
-    "004089",
-    "004091",
-    "004092",
-    "004093",
-    "004095",
-    "004100",
-    "004102",
-    "004105",
-    "004106",
-    "004108",
-    "004110",
-    "004111",
-    "004113",
-    "004117",
-    "004120",
-    "004121",
-    "004122",
-    "004129",
-    "004131",
-    "004133",
-    "004135",
-    "004136",
-    "004137",
-    "004138",
-    "004140",
-    "004141",
-    "004142",
-    "004143",
-    "004145",
-    "004146",
-    "004148",
-    "004149",
-    "004150",
-    "004152",
-    "004158",
-    "004163",
-    "004164",
-    "004168",
-    "004169",
-    "004170",
-    "004171",
-    "004174",
-    "004178",
-    "004185",
-    "004186",
-    "004189",
-    "004190",
-    "004191",
-    "004192",
-    "004193",
-    "004194",
-    "004195",
-    "004196",
-    "004200",
-    "004201",
-    "004203",
-    "004204",
-    "004205",
-    "004209",
-    "004212",
-    "004215",
-    "004220",
-    "004221",
-    "004223",
-    "004224",
-    "004228",
-    "004229",
-    "004230",
-    "004231",
-    "004232",
-    "004237",
-    "004239",
-    "004241",
-    "004242",
-    "004244",
-    "004246",
-    "004247",
-    "004253",
-    "004255",
-    "004256",
-    "004257",
-    "004258",
-    "004259",
-    "004263",
-    "004264",
-    "004265",
-    "004269",
-    "004270",
-    "004271",
-    "004272",
-    "004273",
-    "004274",
-    "004275",
-    "004279",
-    "004280",
-    "004281",
-    "004283",
-    "004284",
-    "004286",
-    "004287",
-    "004291",
-    "004292",
-    "004293",
-    "004295",
-    "004296",
-    "004298",
-    "004300",
-    "004303",
-    "004304",
-    "004307",
-    "004310",
-    "004312",
-    "004315",
-    "004318",
-    "004321",
-    "004322",
-    "004323",
-    "004325",
-    "004326",
-    "004327",
-    "004329",
-    "004331",
-    "004333",
-    "004338",
-    "004339",
-    "004341",
-    "004345",
-    "004346",
-    "004347",
-    "004349",
-    "004351",
-    "004352",
-    "004354",
-    "004356",
-    "004359",
-    "004360",
-    "004361",
-    "004364",
-    "004365",
-    "004367",
-    "004368",
-    "004369",
-    "004370",
-    "004371",
-    "004372",
-    "004376",
-    "004379",
-    "004380",
-    "004384",
-    "004386",
-    "004387",
-    "004389",
-    "004390",
-    "004391",
-    "004392",
-    "004396",
-    "004397",
-    "004404",
-    "004405",
-    "004409",
-    "004411",
-    "004421",
-    "004423",
-    "004424",
-    "004429",
-    "004430",
-    "004432",
-    "004433",
-    "004434",
-    "004436",
-    "004437",
-    "004438",
-    "004439",
-    "004441",
-    "004446",
-    "004450",
-    "004452",
-    "004455",
-    "004457",
-    "004459",
-    "004463",
-    "004464",
-    "004466",
-    "004468",
-    "004470",
-    "004471",
-    "004474",
-    "004479",
-    "004481",
-    "004484",
-    "004487",
-    "004488",
-    "004490",
-    "004493",
-    "004494",
-    "004495",
-    "004496",
-    "004498",
-    "004499",
-    "004500",
-    "004502",
-    "004507",
-    "004508",
-    "004509",
-    "004510",
-    "004512",
-    "004514",
-    "004517",
-    "004518",
-    "004519",
-    "004520",
-    "004524",
-    "004526",
-    "004527",
-    "004528",
-    "004530",
-    "004532",
-    "004535",
-    "004537",
-    "004539",
-    "004540",
-    "004542",
-    "004544",
-    "004548",
-    "004549",
-    "004551",
-    "004552",
-    "004553",
-    "004555",
-    "004558",
-    "004562",
-    "004563",
-    "004565",
-    "004566",
-    "004570",
-    "004571",
-    "004574",
-    "004576",
-    "004579",
-    "004581",
-    "004584",
-    "004585",
-    "004587",
-    "004588",
-    "004591",
-    "004592",
-    "004595",
-    "004597",
-    "004600",
-    "004601",
-    "004604",
-    "004605",
-    "004606",
-    "004607",
-    "004609",
-    "004611",
-    "004612",
-    "004618",
-    "004622",
-    "004623",
-    "004625",
-    "004626",
-    "004627",
-    "004628",
-    "004630",
-    "004631",
-    "004632",
-    "004634",
-    "004636",
-    "004643",
-    "004644",
-    "004647",
-    "004648",
-    "004649",
-    "004651",
-    "004652",
-    "004653",
-    "004654",
-    "004655",
-    "004656",
-    "004660",
-    "004662",
-    "004671",
-    "004672",
-    "004673",
-    "004674",
-    "004675",
-    "004676",
-    "004679",
-    "004682",
-    "004683",
-    "004685",
-    "004686",
-    "004687",
-    "004689",
-    "004691",
-    "004692",
-    "004693",
-    "004694",
-    "004699",
-    "004701",
-    "004702",
-    "004705",
-    "004706",
-    "004707",
-    "004708",
-    "004710",
-    "004714",
-    "004715",
-    "004718",
-    "004719",
-    "004722",
-    "004723",
-    "004727",
-    "004732",
-    "004735",
-    "004737",
-    "004742",
-    "004743",
-    "004746",
-    "004747",
-    "004748",
-    "004750",
-    "004753",
-    "004754",
-    "004760",
-    "004761",
-    "004768",
-    "004770",
-    "004773",
-    "004776",
-    "004777",
-    "004779",
-    "004782",
-    "004783",
-    "004785",
-    "004786",
-    "004788",
-    "004789",
-    "004790",
-    "004792",
-    "004793",
-    "004794",
-    "004796",
-    "004797",
-    "004799",
-    "004801",
-    "004805",
-    "004808",
-    "004812",
-    "004814",
-    "004815",
-    "004816",
-    "004818",
-    "004823",
-    "004825",
-    "004826",
-    "004828",
-    "004830",
-    "004831",
-    "004832",
-    "004834",
-    "004836",
-    "004837",
-    "004839",
-    "004840",
-    "004841",
-    "004842",
-    "004846",
-    "004848",
-    "004849",
-    "004850",
-    "004852",
-    "004856",
-    "004857",
-    "004859",
-    "004863",
-    "004866",
-    "004867",
-    "004868",
-    "004869",
-    "004872",
-    "004873",
-    "004876",
-    "004878",
-    "004879",
-    "004882",
-    "004885",
-    "004886",
-    "004890",
-    "004895",
-    "004896",
-    "004897",
-    "004898",
-    "004902",
-    "004903",
-    "004905",
-    "004907",
-    "004910",
-    "004911",
-    "004912",
-    "004913",
-    "004916",
-    "004926",
-    "004928",
-    "004929",
-    "004931",
-    "004935",
-    "004936",
-    "004938",
-    "004939",
-    "004943",
-    "004946",
-    "004948",
-    "004950",
-    "004951",
-    "004953",
-    "004954",
-    "004955",
-    "004956",
-    "004958",
-    "004960",
-    "004961",
-    "004962",
-    "004963",
-    "004966",
-    "004967",
-    "004968",
-    "004972",
-    "004973",
-    "004974",
-    "004976",
-    "004977",
-    "004982",
-    "004983",
-    "004984",
-    "004985",
-    "004986",
-    "004987",
-    "004990",
-    "004991",
-    "004992",
-    "004994",
-    "004995",
-    "004997",
-    "004998",
-    "004999",
-    "005001",
-    "005003",
-    "005004",
-    "005006",
-    "005007",
-    "005014",
-    "005016",
-    "005018",
-    "005020",
-    "005023",
-    "005024",
-    "005026",
-    "005027",
-    "005028",
-    "005029",
-    "005032",
-    "005033",
-    "005036",
-    "005037",
-    "005039",
-    "005042",
-    "005045",
-    "005047",
-    "005052",
-    "005054",
-    "005055",
-    "005056",
-    "005057",
-    "005058",
-    "005061",
-    "005062",
-    "005063",
-    "005064",
-    "005065",
-    "005067",
-    "005068",
-    "005071",
-    "005072",
-    "005073",
-    "005077",
-    "005078",
-    "005079",
-    "005081",
-    "005084",
-    "005085",
-    "005086",
-    "005090",
-    "005093",
-    "005094",
-    "005097",
-    "005101",
-    "005102",
-    "005104",
-    "005107",
-    "005108",
-    "005110",
-    "005111",
-    "005114",
-    "005116",
-    "005121",
-    "005122",
-    "005124",
-    "005128",
-    "005129",
-    "005130",
-    "005131",
-    "005134",
-    "005135",
-    "005136",
-    "005138",
-    "005143",
-    "005144",
-    "005145",
-    "005146",
-    "005150",
-    "005153",
-    "005156",
-    "005159",
-    "005160",
-    "005161",
-    "005168",
-    "005169",
-    "005171",
-    "005173",
-    "005175",
-    "005176",
-    "005177",
-    "005179",
-    "005181",
-    "005183",
-    "005185",
-    "005186",
-    "005189",
-    "005190",
-    "005191",
-    "005195",
-    "005199",
-    "005202",
-    "005203",
-    "005208",
-    "005209",
-    "005210",
-    "005212",
-    "005214",
-    "005215",
-    "005217",
-    "005219",
-    "005220",
-    "005222",
-    "005223",
-    "005224",
-    "005229",
-    "005230",
-    "005231",
-    "005236",
-    "005239",
-    "005242",
-    "005244",
-    "005245",
-    "005246",
-    "005248",
-    "005253",
-    "005254",
-    "005257",
-    "005258",
-    "005259",
-    "005260",
-    "005262",
-    "005263",
-    "005264",
-    "005267",
-    "005268",
-    "005269",
-    "005270",
-    "005273",
-    "005274",
-    "005278",
-    "005281",
-    "005283",
-    "005285",
-    "005288",
-    "005290",
-    "005292",
-    "005293",
-    "005297",
-    "005298",
-    "005303",
-    "005304",
-    "005305",
-    "005306",
-    "005307",
-    "005310",
-    "005311",
-    "005312",
-    "005314",
-    "005315",
-    "005318",
-    "005319",
-    "005320",
-    "005325",
-    "005326",
-    "005327",
-    "005328",
-    "005331",
-    "005336",
-    "005337",
-    "005338",
-    "005340",
-    "005343",
-    "005344",
-    "005345",
-    "005346",
-    "005348",
-    "005349",
-    "005350",
-    "005351",
-    "005352",
-    "005355",
-    "005358",
-    "005360",
-    "005363",
-    "005365",
-    "005367",
-    "005368",
-    "005369",
-    "005370",
-    "005371",
-    "005373",
-    "005374",
-    "005378",
-    "005379",
-    "005380",
-    "005383",
-    "005384",
-    "005385",
-    "005387",
-    "005388",
-    "005389",
-    "005391",
-    "005393",
-    "005395",
-    "005396",
-    "005397",
-    "005398",
-    "005404",
-    "005405",
-    "005406",
-    "005407",
-    "005408",
-    "005410",
-    "005413",
-    "005414",
-    "005416",
-    "005417",
-    "005418",
-    "005419",
-    "005420",
-    "005421",
-    "005423",
-    "005424",
-    "005429",
-    "005430",
-    "005431",
-    "005433",
-    "005434",
-    "005436",
-    "005438",
-    "005439",
-    "005440",
-    "005441",
-    "005445",
-    "005448",
-    "005450",
-    "005451",
-    "005453",
-    "005454",
-    "005455",
-    "005457",
-    "005461",
-    "005465",
-    "005467",
-    "005469",
-    "005470",
-    "005471",
-    "005475",
-    "005478",
-    "005481",
-    "005483",
-    "005485",
-    "005486",
-    "005487",
-    "005489",
-    "005496",
-    "005497",
-    "005499",
-    "005507",
-    "005508",
-    "005509",
-    "005510",
-    "005511",
-    "005514",
-    "005515",
-    "005517",
-    "005518",
-    "005519",
-    "005521",
-    "005522",
-    "005524",
-    "005526",
-    "005527",
-    "005530",
-    "005531",
-    "005535",
-    "005536",
-    "005539",
-    "005541",
-    "005542",
-    "005544",
-    "005547",
-    "005549",
-    "005550",
-    "005552",
-    "005554",
-    "005559",
-    "005563",
-    "005566",
-    "005568",
-    "005573",
-    "005574",
-    "005576",
-    "005577",
-    "005579",
-    "005582",
-    "005583",
-    "005584",
-    "005585",
-    "005586",
-    "005588",
-    "005590",
-    "005591",
-    "005592",
-    "005593",
-    "005599",
-    "005600",
-    "005601",
-    "005603",
-    "005605",
-    "005606",
-    "005608",
-    "005609",
-    "005611",
-    "005613",
-    "005614",
-    "005615",
-    "005618",
-    "005620",
-    "005624",
-    "005625",
-    "005629",
-    "005630",
-    "005631",
-    "005636",
-    "005637",
-    "005639",
-    "005640",
-    "005641",
-    "005644",
-    "005645",
-    "005647",
-    "005648",
-    "005652",
-    "005653",
-    "005654",
-    "005655",
-    "005657",
-    "005658",
-    "005660",
-    "005662",
-    "005664",
-    "005668",
-    "005669",
-    "005672",
-    "005674",
-    "005676",
-    "005679",
-    "005680",
-    "005682",
-    "005685",
-    "005686",
-    "005687",
-    "005693",
-    "005695",
-    "005696",
-    "005697",
-    "005699",
-    "005700",
-    "005701",
-    "005702",
-    "005704",
-    "005705",
-    "005710",
-    "005713",
-    "005714",
-    "005715",
-    "005716",
-    "005718",
-    "005719",
-    "005723",
-    "005728",
-    "005729",
-    "005730",
-    "005731",
-    "005732",
-    "005735",
-    "005736",
-    "005738",
-    "005740",
-    "005741",
-    "005742",
-    "005743",
-    "005747",
-    "005749",
-    "005752",
-    "005755",
-    "005756",
-    "005757",
-    "005760",
-    "005761",
-    "005762",
-    "005764",
-    "005765",
-    "005768",
-    "005769",
-    "005773",
-    "005779",
-    "005780",
-    "005781",
-    "005782",
-    "005783",
-    "005784",
-    "005786",
-    "005788",
-    "005789",
-    "005790",
-    "005791",
-    "005794",
-    "005796",
-    "005799",
-    "005803",
-    "005805",
-    "005806",
-    "005811",
-    "005812",
-    "005813",
-    "005814",
-    "005815",
-    "005817",
-    "005818",
-    "005819",
-    "005821",
-    "005824",
-    "005825",
-    "005826",
-    "005828",
-    "005829",
-    "005830",
-    "005831",
-    "005836",
-    "005838",
-    "005839",
-    "005840",
-    "005841",
-    "005843",
-    "005845",
-    "005850",
-    "005851",
-    "005852",
-    "005853",
-    "005854",
-    "005856",
-    "005859",
-    "005860",
-    "005861",
-    "005863",
-    "005864",
-    "005867",
-    "005868",
-    "005873",
-    "005874",
-    "005875",
-    "005877",
-    "005878",
-    "005879",
-    "005881",
-    "005884",
-    "005885",
-    "005888",
-    "005889",
-    "005893",
-    "005894",
-    "005895",
-    "005897",
-    "005899",
-    "005901",
-    "005903",
-    "005905",
-    "005906",
-    "005908",
-    "005909",
-    "005910",
-    "005911",
-    "005912",
-    "005914",
-    "005917",
-    "005918",
-    "005919",
-    "005920",
-    "005923",
-    "005928",
-    "005930",
-    "005938",
-    "005940",
-    "005947",
-    "005948",
-    "005951",
-    "005952",
-    "005954",
-    "005956",
-    "005960",
-    "005961",
-    "005963",
-    "005964",
-    "005968",
-    "005970",
-    "005971",
-    "005975",
-    "005979",
-    "005980",
-    "005981",
-    "005983",
-    "005984",
-    "005985",
-    "005988",
-    "005989",
-    "005990",
-    "005991",
-    "005992",
-    "005995",
-    "005996",
-    "005998",
-    "006000",
-    "006001",
-    "006004",
-    "006005",
-    "006009",
-    "006011",
-    "006012",
-    "006018",
-    "006020",
-    "006023",
-    "006025",
-    "006026",
-    "006027",
-    "006028",
-    "006029",
-    "006030",
-    "006033",
-    "006035",
-    "006038",
-    "006041",
-    "006042",
-    "006043",
-    "006045",
-    "006046",
-    "006055",
-    "006058",
-    "006061",
-    "006062",
-    "006065",
-    "006066",
-    "006067",
-    "006069",
-    "006070",
-    "006071",
-    "006073",
-    "006074",
-    "006078",
-    "006079",
-    "006084",
-    "006088",
-    "006089",
-    "006091",
-    "006095",
-    "006096",
-    "006097",
-    "006098",
-    "006100",
-    "006103",
-    "006104",
-    "006105",
-    "006107",
-    "006108",
-    "006111",
-    "006117",
-    "006120",
-    "006123",
-    "006124",
-    "006125",
-    "006128",
-    "006129",
-    "006130",
-    "006131",
-    "006133",
-    "006134",
-    "006135",
-    "006136",
-    "006139",
-    "006140",
-    "006141",
-    "006146",
-    "006148",
-    "006150",
-    "006151",
-    "006153",
-    "006156",
-    "006158",
-    "006159",
-    "006161",
-    "006162",
-    "006163",
-    "006166",
-    "006170",
-    "006171",
-    "006172",
-    "006174",
-    "006175",
-    "006176",
-    "006177",
-    "006179",
-    "006180",
-    "006181",
-    "006183",
-    "006184",
-    "006185",
-    "006187",
-    "006188",
-    "006189",
-    "006190",
-    "006196",
-    "006198",
-    "006201",
-    "006202",
-    "006203",
-    "006206",
-    "006208",
-    "006209",
-    "006210",
-    "006212",
-    "006214",
-    "006215",
-    "006216",
-    "006218",
-    "006219",
-    "006220",
-    "006221",
-    "006222",
-    "006223",
-    "006224",
-    "006225",
-    "006229",
-    "006230",
-    "006233",
-    "006234",
-    "006235",
-    "006236",
-    "006238",
-    "006240",
-    "006241",
-    "006243",
-    "006247",
-    "006249",
-    "006250",
-    "006251",
-    "006252",
-    "006254",
-    "006258",
-    "006259",
-    "006260",
-    "006261",
-    "006262",
-    "006264",
-    "006267",
-    "006269",
-    "006270",
-    "006272",
-    "006275",
-    "006276",
-    "006277",
-    "006279",
-    "006281",
-    "006282",
-    "006284",
-    "006285",
-    "006286",
-    "006289",
-    "006290",
-    "006291",
-    "006295",
-    "006296",
-    "006299",
-    "006300",
-    "006301",
-    "006304",
-    "006305",
-    "006306",
-    "006309",
-    "006314",
-    "006318",
-    "006319",
-    "006320",
-    "006321",
-    "006323",
-    "006325",
-    "006329",
-    "006330",
-    "006335",
-    "006337",
-    "006338",
-    "006339",
-    "006341",
-    "006344",
-    "006346",
-    "006348",
-    "006349",
-    "006350",
-    "006351",
-    "006352",
-    "006353",
-    "006355",
-    "006357",
-    "006362",
-    "006363",
-    "006366",
-    "006367",
-    "006369",
-    "006371",
-    "006374",
-    "006375",
-    "006377",
-    "006381",
-    "006382",
-    "006385",
-    "006387",
-    "006391",
-    "006392",
-    "006395",
-    "006396",
-    "006398",
-    "006400",
-    "006404",
-    "006409",
-    "006411",
-    "006417",
-    "006418",
-    "006419",
-    "006421",
-    "006424",
-    "006425",
-    "006427",
-    "006428",
-    "006429",
-    "006430",
-    "006433",
-    "006434",
-    "006436",
-    "006437",
-    "006438",
-    "006440",
-    "006442",
-    "006443",
-    "006444",
-    "006445",
-    "006447",
-    "006448",
-    "006449",
-    "006450",
-    "006455",
-    "006456",
-    "006458",
-    "006459",
-    "006462",
-    "006463",
-    "006465",
-    "006466",
-    "006468",
-    "006470",
-    "006472",
-    "006473",
-    "006474",
-    "006475",
-    "006476",
-    "006480",
-    "006482",
-    "006483",
-    "006484",
-    "006486",
-    "006488",
-    "006492",
-    "006495",
-    "006497",
-    "006499",
-    "006501",
-    "006503",
-    "006506",
-    "006507",
-    "006509",
-    "006512",
-    "006515",
-    "006519",
-    "006520",
-    "006523",
-    "006524",
-    "006529",
-    "006530",
-    "006532",
-    "006534",
-    "006536",
-    "006538",
-    "006542",
-    "006543",
-    "006547",
-    "006548",
-    "006549",
-    "006550",
-    "006551",
-    "006553",
-    "006556",
-    "006560",
-    "006562",
-    "006564",
-    "006565",
-    "006569",
-    "006570",
-    "006572",
-    "006575",
-    "006576",
-    "006578",
-    "006583",
-    "006584",
-    "006585",
-    "006587",
-    "006588",
-    "006593",
-    "006595",
-    "006597",
-    "006599",
-    "006602",
-    "006603",
-    "006605",
-    "006606",
-    "006609",
-    "006610",
-    "006611",
-    "006612",
-    "006617",
-    "006618",
-    "006619",
-    "006621",
-    "006622",
-    "006625",
-    "006626",
-    "006627",
-    "006628",
-    "006631",
-    "006632",
-    "006635",
-    "006636",
-    "006637",
-    "006638",
-    "006643",
-    "006645",
-    "006647",
-    "006648",
-    "006652",
-    "006654",
-    "006657",
-    "006658",
-    "006660",
-    "006661",
-    "006664",
-    "006666",
-    "006667",
-    "006668",
-    "006670",
-    "006671",
-    "006673",
-    "006674",
-    "006677",
-    "006678",
-    "006679",
-    "006681",
-    "006682",
-    "006684",
-    "006687",
-    "006689",
-    "006690",
-    "006694",
-    "006695",
-    "006696",
-    "006697",
-    "006698",
-    "006699",
-    "006702",
-    "006703",
-    "006704",
-    "006706",
-    "006707",
-    "006708",
-    "006709",
-    "006714",
-    "006718",
-    "006719",
-    "006722",
-    "006725",
-    "006726",
-    "006727",
-    "006730",
-    "006731",
-    "006734",
-    "006735",
-    "006736",
-    "006738",
-    "006739",
-    "006740",
-    "006747",
-    "006748",
-    "006751",
-    "006753",
-    "006755",
-    "006759",
-    "006760",
-    "006761",
-    "006762",
-    "006765",
-    "006766",
-    "006768",
-    "006769",
-    "006772",
-    "006773",
-    "006777",
-    "006781",
-    "006782",
-    "006783",
-    "006784",
-    "006786",
-    "006789",
-    "006794",
-    "006797",
-    "006799",
-    "006800",
-    "006802",
-    "006803",
-    "006805",
-    "006806",
-    "006808",
-    "006810",
-    "006813",
-    "006814",
-    "006819",
-    "006821",
-    "006822",
-    "006824",
-    "006825",
-    "006827",
-    "006828",
-    "006829",
-    "006833",
-    "006835",
-    "006836",
-    "006838",
-    "006839",
-    "006840",
-    "006841",
-    "006842",
-    "006844",
-    "006845",
-    "006847",
-    "006848",
-    "006849",
-    "006850",
-    "006852",
-    "006855",
-    "006858",
-    "006859",
-    "006860",
-    "006862",
-    "006864",
-    "006865",
-    "006866",
-    "006867",
-    "006868",
-    "006869",
-    "006874",
-    "006876",
-    "006878",
-    "006880",
-    "006883",
-    "006884",
-    "006886",
-    "006887",
-    "006892",
-    "006893",
-    "006896",
-    "006899",
-    "006900",
-    "006903",
-    "006908",
-    "006909",
-    "006910",
-    "006911",
-    "006912",
-    "006914",
-    "006916",
-    "006917",
-    "006918",
-    "006919",
-    "006922",
-    "006924",
-    "006930",
-    "006931",
-    "006932",
-    "006933",
-    "006934",
-    "006935",
-    "006939",
-    "006940",
-    "006943",
-    "006944",
-    "006945",
-    "006947",
-    "006948",
-    "006949",
-    "006950",
-    "006952",
-    "006953",
-    "006956",
-    "006958",
-    "006959",
-    "006962",
-    "006963",
-    "006965",
-    "006966",
-    "006968",
-    "006971",
-    "006972",
-    "006976",
-    "006981",
-    "006983",
-    "006987",
-    "006988",
-    "006989",
-    "006990",
-    "006994",
-    "006995",
-    "007002",
-    "007003",
-    "007004",
-    "007006",
-    "007007",
-    "007008",
-    "007009",
-    "007011",
-    "007016",
-    "007018",
-    "007020",
-    "007021",
-    "007022",
-    "007023",
-    "007025",
-    "007029",
-    "007031",
-    "007033",
-    "007035",
-    "007036",
-    "007038",
-    "007039",
-    "007040",
-    "007042",
-    "007045",
-    "007046",
-    "007048",
-    "007049",
-    "007050",
-    "007052",
-    "007054",
-    "007056",
-    "007058",
-    "007059",
-    "007062",
-    "007064",
-    "007065",
-    "007068",
-    "007070",
-    "007071",
-    "007072",
-    "007073",
-    "007074",
-    "007075",
-    "007077",
-    "007078",
-    "007079",
-    "007080",
-    "007084",
-    "007086",
-    "007088",
-    "007089",
-    "007090",
-    "007092",
-    "007093",
-    "007095",
-    "007097",
-    "007100",
-    "007101",
-    "007104",
-    "007105",
-    "007108",
-    "007109",
-    "007113",
-    "007114",
-    "007117",
-    "007121",
-    "007122",
-    "007123",
-    "007125",
-    "007128",
-    "007129",
-    "007130",
-    "007132",
-    "007133",
-    "007138",
-    "007139",
-    "007140",
-    "007141",
-    "007144",
-    "007146",
-    "007147",
-    "007148",
-    "007149",
-    "007150",
-    "007152",
-    "007153",
-    "007154",
-    "007159",
-    "007162",
-    "007163",
-    "007165",
-    "007166",
-    "007167",
-    "007168",
-    "007172",
-    "007174",
-    "007177",
-    "007180",
-    "007182",
-    "007184",
-    "007185",
-    "007187",
-    "007189",
-    "007191",
-    "007193",
-    "007194",
-    "007197",
-    "007200",
-    "007204",
-    "007205",
-    "007208",
-    "007210",
-    "007211",
-    "007212",
-    "007213",
-    "007214",
-    "007215",
-    "007216",
-    "007217",
-    "007219",
-    "007222",
-    "007223",
-    "007224",
-    "007227",
-    "007230",
-    "007234",
-    "007236",
-    "007241",
-    "007243",
-    "007244",
-    "007245",
-    "007247",
-    "007249",
-    "007250",
-    "007256",
-    "007258",
-    "007259",
-    "007260",
-    "007261",
-    "007263",
-    "007266",
-    "007270",
-    "007271",
-    "007274",
-    "007275",
-    "007276",
-    "007279",
-    "007280",
-    "007283",
-    "007284",
-    "007285",
-    "007289",
-    "007292",
-    "007294",
-    "007295",
-    "007296",
-    "007297",
-    "007298",
-    "007299",
-    "007300",
-    "007302",
-    "007305",
-    "007308",
-    "007311",
-    "007314",
-    "007318",
-    "007322",
-    "007323",
-    "007325",
-    "007327",
-    "007329",
-    "007330",
-    "007334",
-    "007336",
-    "007343",
-    "007344",
-    "007346",
-    "007350",
-    "007351",
-    "007356",
-    "007359",
-    "007361",
-    "007363",
-    "007365",
-    "007369",
-    "007370",
-    "007372",
-    "007373",
-    "007374",
-    "007375",
-    "007376",
-    "007381",
-    "007383",
-    "007385",
-    "007388",
-    "007389",
-    "007390",
-    "007394",
-    "007396",
-    "007398",
-    "007408",
-    "007410",
-    "007411",
-    "007413",
-    "007414",
-    "007416",
-    "007417",
-    "007419",
-    "007421",
-    "007422",
-    "007424",
-    "007425",
-    "007427",
-    "007431",
-    "007432",
-    "007433",
-    "007435",
-    "007436",
-    "007437",
-    "007438",
-    "007439",
-    "007443",
-    "007445",
-    "007446",
-    "007448",
-    "007449",
-    "007451",
-    "007454",
-    "007457",
-    "007458",
-    "007460",
-    "007461",
-    "007465",
-    "007466",
-    "007467",
-    "007468",
-    "007470",
-    "007474",
-    "007475",
-    "007477",
-    "007479",
-    "007480",
-    "007481",
-    "007482",
-    "007483",
-    "007484",
-    "007486",
-    "007489",
-    "007490",
-    "007491",
-    "007493",
-    "007497",
-    "007498",
-    "007503",
-    "007506",
-    "007511",
-    "007513",
-    "007517",
-    "007519",
-    "007521",
-    "007523",
-    "007524",
-    "007525",
-    "007526",
-    "007527",
-    "007528",
-    "007530",
-    "007533",
-    "007535",
-    "007536",
-    "007537",
-    "007538",
-    "007540",
-    "007543",
-    "007544",
-    "007546",
-    "007547",
-    "007551",
-    "007555",
-    "007558",
-    "007559",
-    "007563",
-    "007565",
-    "007566",
-    "007568",
-    "007570",
-    "007571",
-    "007572",
-    "007575",
-    "007576",
-    "007578",
-    "007579",
-    "007585",
-    "007586",
-    "007590",
-    "007592",
-    "007594",
-    "007600",
-    "007601",
-    "007603",
-    "007605",
-    "007606",
-    "007611",
-    "007612",
-    "007614",
-    "007615",
-    "007618",
-    "007619",
-    "007621",
-    "007622",
-    "007624",
-    "007626",
-    "007629",
-    "007631",
-    "007633",
-    "007637",
-    "007639",
-    "007640",
-    "007642",
-    "007647",
-    "007649",
-    "007650",
-    "007653",
-    "007654",
-    "007655",
-    "007656",
-    "007657",
-    "007662",
-    "007663",
-    "007664",
-    "007666",
-    "007667",
-    "007668",
-    "007670",
-    "007671",
-    "007672",
-    "007673",
-    "007675",
-    "007677",
-    "007678",
-    "007679",
-    "007680",
-    "007682",
-    "007683",
-    "007685",
-    "007687",
-    "007688",
-    "007691",
-    "007692",
-    "007694",
-    "007696",
-    "007697",
-    "007699",
-    "007702",
-    "007704",
-    "007705",
-    "007709",
-    "007712",
-    "007713",
-    "007715",
-    "007718",
-    "007720",
-    "007721",
-    "007723",
-    "007724",
-    "007727",
-    "007729",
-    "007731",
-    "007732",
-    "007735",
-    "007736",
-    "007740",
-    "007742",
-    "007743",
-    "007745",
-    "007746",
-    "007748",
-    "007749",
-    "007751",
-    "007753",
-    "007754",
-    "007758",
-    "007760",
-    "007762",
-    "007763",
-    "007765",
-    "007767",
-    "007768",
-    "007772",
-    "007773",
-    "007775",
-    "007776",
-    "007777",
-    "007779",
-    "007781",
-    "007786",
-    "007790",
-    "007791",
-    "007793",
-    "007795",
-    "007798",
-    "007799",
-    "007803",
-    "007809",
-    "007810",
-    "007812",
-    "007813",
-    "007814",
-    "007815",
-    "007819",
-    "007820",
-    "007821",
-    "007824",
-    "007826",
-    "007831",
-    "007833",
-    "007834",
-    "007836",
-    "007838",
-    "007840",
-    "007841",
-    "007843",
-    "007845",
-    "007847",
-    "007853",
-    "007854",
-    "007855",
-    "007856",
-    "007857",
-    "007859",
-    "007863",
-    "007864",
-    "007865",
-    "007868",
-    "007869",
-    "007872",
-    "007873",
-    "007876",
-    "007877",
-    "007878",
-    "007883",
-    "007884",
-    "007885",
-    "007886",
-    "007889",
-    "007890",
-    "007897",
-    "007898",
-    "007899",
-    "007900",
-    "007901",
-    "007902",
-    "007905",
-    "007908",
-    "007909",
-    "007910",
-    "007911",
-    "007914",
-    "007915",
-    "007916",
-    "007919",
-    "007920",
-    "007921",
-    "007923",
-    "007924",
-    "007925",
-    "007926",
-    "007928",
-    "007931",
-    "007932",
-    "007933",
-    "007935",
-    "007939",
-    "007940",
-    "007943",
-    "007946",
-    "007947",
-    "007950",
-    "007953",
-    "007954",
-    "007956",
-    "007958",
-    "007959",
-    "007963",
-    "007964",
-    "007968",
-    "007970",
-    "007971",
-    "007974",
-    "007976",
-    "007979",
-    "007980",
-    "007984",
-    "007987",
-    "007991",
-    "007996",
-    "007997",
-    "007998",
-    "007999",
-    "008001",
-    "008002",
-    "008004",
-    "008005",
-    "008008",
-    "008009",
-    "008012",
-    "008017",
-    "008019",
-    "008023",
-    "008024",
-    "008026",
-    "008029",
-    "008031",
-    "008032",
-    "008033",
-    "008036",
-    "008037",
-    "008040",
-    "008042",
-    "008043",
-    "008044",
-    "008048",
-    "008049",
-    "008051",
-    "008053",
-    "008057",
-    "008060",
-    "008061",
-    "008062",
-    "008063",
-    "008064",
-    "008067",
-    "008068",
-    "008069",
-    "008072",
-    "008075",
-    "008076",
-    "008079",
-    "008082",
-    "008083",
-    "008084",
-    "008085",
-    "008086",
-    "008087",
-    "008091",
-    "008093",
-    "008095",
-    "008096",
-    "008098",
-    "008100",
-    "008101",
-    "008103",
-    "008105",
-    "008106",
-    "008107",
-    "008108",
-    "008112",
-    "008115",
-    "008116",
-    "008117",
-    "008121",
-    "008122",
-    "008125",
-    "008127",
-    "008130",
-    "008132",
-    "008137",
-    "008138",
-    "008139",
-    "008140",
-    "008141",
-    "008142",
-    "008144",
-    "008150",
-    "008151",
-    "008159",
-    "008160",
-    "008163",
-    "008164",
-    "008166",
-    "008168",
-    "008169",
-    "008171",
-    "008173",
-    "008174",
-    "008175",
-    "008177",
-    "008180",
-    "008186",
-    "008188",
-    "008189",
-    "008190",
-    "008191",
-    "008197",
-    "008199",
-    "008200",
-    "008202",
-    "008203",
-    "008204",
-    "008208",
-    "008209",
-    "008211",
-    "008213",
-    "008216",
-    "008218",
-    "008220",
-    "008222",
-    "008223",
-    "008224",
-    "008225",
-    "008226",
-    "008229",
-    "008232",
-    "008235",
-    "008236",
-    "008241",
-    "008244",
-    "008248",
-    "008250",
-    "008251",
-    "008252",
-    "008253",
-    "008254",
-    "008258",
-    "008260",
-    "008261",
-    "008262",
-    "008263",
-    "008268",
-    "008269",
-    "008272",
-    "008275",
-    "008279",
-    "008280",
-    "008281",
-    "008282",
-    "008284",
-    "008285",
-    "008292",
-    "008293",
-    "008294",
-    "008295",
-    "008296",
-    "008297",
-    "008299",
-    "008300",
-    "008301",
-    "008302",
-    "008306",
-    "008307",
-    "008310",
-    "008311",
-    "008312",
-    "008313",
-    "008315",
-    "008316",
-    "008317",
-    "008318",
-    "008319",
-    "008320",
-    "008322",
-    "008323",
-    "008326",
-    "008327",
-    "008329",
-    "008332",
-    "008335",
-    "008336",
-    "008338",
-    "008341",
-    "008342",
-    "008345",
-    "008346",
-    "008349",
-    "008351",
-    "008355",
-    "008359",
-    "008360",
-    "008364",
-    "008365",
-    "008368",
-    "008370",
-    "008372",
-    "008374",
-    "008376",
-    "008381",
-    "008384",
-    "008385",
-    "008386",
-    "008387",
-    "008388",
-    "008390",
-    "008391",
-    "008397",
-    "008398",
-    "008403",
-    "008409",
-    "008410",
-    "008413",
-    "008415",
-    "008416",
-    "008422",
-    "008423",
-    "008424",
-    "008425",
-    "008426",
-    "008427",
-    "008429",
-    "008430",
-    "008433",
-    "008434",
-    "008437",
-    "008438",
-    "008442",
-    "008443",
-    "008444",
-    "008445",
-    "008449",
-    "008450",
-    "008452",
-    "008453",
-    "008454",
-    "008456",
-    "008461",
-    "008462",
-    "008465",
-    "008466",
-    "008467",
-    "008468",
-    "008470",
-    "008472",
-    "008475",
-    "008477",
-    "008478",
-    "008482",
-    "008483",
-    "008484",
-    "008485",
-    "008492",
-    "008494",
-    "008495",
-    "008498",
-    "008499",
-    "008502",
-    "008503",
-    "008506",
-    "008509",
-    "008512",
-    "008513",
-    "008514",
-    "008517",
-    "008518",
-    "008519",
-    "008521",
-    "008522",
-    "008523",
-    "008524",
-    "008526",
-    "008529",
-    "008530",
-    "008533",
-    "008534",
-    "008535",
-    "008536",
-    "008541",
-    "008542",
-    "008549",
-    "008550",
-    "008553",
-    "008556",
-    "008557",
-    "008558",
-    "008559",
-    "008562",
-    "008564",
-    "008568",
-    "008572",
-    "008573",
-    "008576",
-    "008581",
-    "008582",
-    "008584",
-    "008585",
-    "008586",
-    "008587",
-    "008588",
-    "008592",
-    "008595",
-    "008596",
-    "008601",
-    "008602",
-    "008604",
-    "008606",
-    "008607",
-    "008608",
-    "008610",
-    "008612",
-    "008615",
-    "008617",
-    "008618",
-    "008620",
-    "008621",
-    "008624",
-    "008628",
-    "008633",
-    "008635",
-    "008636",
-    "008638",
-    "008639",
-    "008644",
-    "008645",
-    "008647",
-    "008653",
-    "008654",
-    "008655",
-    "008663",
-    "008665",
-    "008667",
-    "008670",
-    "008676",
-    "008680",
-    "008683",
-    "008687",
-    "008688",
-    "008690",
-    "008691",
-    "008692",
-    "008695",
-    "008698",
-    "008699",
-    "008701",
-    "008702",
-    "008706",
-    "008709",
-    "008710",
-    "008713",
-    "008716",
-    "008717",
-    "008718",
-    "008720",
-    "008722",
-    "008723",
-    "008725",
-    "008727",
-    "008728",
-    "008730",
-    "008731",
-    "008732",
-    "008733",
-    "008738",
-    "008739",
-    "008741",
-    "008742",
-    "008744",
-    "008747",
-    "008748",
-    "008749",
-    "008750",
-    "008752",
-    "008753",
-    "008755",
-    "008756",
-    "008757",
-    "008759",
-    "008760",
-    "008764",
-    "008766",
-    "008768",
-    "008769",
-    "008770",
-    "008771",
-    "008772",
-    "008773",
-    "008775",
-    "008776",
-    "008783",
-    "008784",
-    "008790",
-    "008793",
-    "008794",
-    "008796",
-    "008799",
-    "008801",
-    "008805",
-    "008806",
-    "008809",
-    "008810",
-    "008811",
-    "008813",
-    "008814",
-    "008815",
-    "008817",
-    "008819",
-    "008822",
-    "008823",
-    "008826",
-    "008831",
-    "008833",
-    "008835",
-    "008836",
-    "008837",
-    "008838",
-    "008840",
-    "008841",
-    "008843",
-    "008847",
-    "008848",
-    "008849",
-    "008854",
-    "008856",
-    "008858",
-    "008859",
-    "008862",
-    "008865",
-    "008867",
-    "008871",
-    "008872",
-    "008873",
-    "008874",
-    "008876",
-    "008878",
-    "008879",
-    "008880",
-    "008883",
-    "008884",
-    "008885",
-    "008886",
-    "008888",
-    "008890",
-    "008891",
-    "008892",
-    "008900",
-    "008905",
-    "008909",
-    "008911",
-    "008913",
-    "008914",
-    "008917",
-    "008919",
-    "008920",
-    "008921",
-    "008923",
-    "008926",
-    "008927",
-    "008929",
-    "008930",
-    "008931",
-    "008932",
-    "008933",
-    "008936",
-    "008939",
-    "008940",
-    "008942",
-    "008943",
-    "008944",
-    "008948",
-    "008951",
-    "008953",
-    "008955",
-    "008958",
-    "008960",
-    "008961",
-    "008962",
-    "008965",
-    "008966",
-    "008967",
-    "008968",
-    "008969",
-    "008970",
-    "008971",
-    "008973",
-    "008975",
-    "008976",
-    "008978",
-    "008979",
-    "008980",
-    "008982",
-    "008983",
-    "008985",
-    "008987",
-    "008988",
-    "008989",
-    "008995",
-    "008997",
-    "008999",
-    "009000",
-    "009002",
-    "009004",
-    "009005",
-    "009006",
-    "009007",
-    "009015",
-    "009016",
-    "009018",
-    "009019",
-    "009020",
-    "009022",
-    "009024",
-    "009027",
-    "009029",
-    "009032",
-    "009034",
-    "009035",
-    "009036",
-    "009037",
-    "009039",
-    "009042",
-    "009045",
-    "009048",
-    "009049",
-    "009051",
-    "009053",
-    "009058",
-    "009059",
-    "009060",
-    "009063",
-    "009064",
-    "009066",
-    "009068",
-    "009072",
-    "009073",
-    "009078",
-    "009079",
-    "009080",
-    "009085",
-    "009086",
-    "009087",
-    "009089",
-    "009091",
-    "009094",
-    "009098",
-    "009099",
-    "009100",
-    "009105",
-    "009106",
-    "009108",
-    "009112",
-    "009113",
-    "009114",
-    "009116",
-    "009117",
-    "009121",
-    "009123",
-    "009126",
-    "009128",
-    "009129",
-    "009131",
-    "009133",
-    "009136",
-    "009138",
-    "009141",
-    "009144",
-    "009147",
-    "009148",
-    "009150",
-    "009151",
-    "009153",
-    "009155",
-    "009157",
-    "009159",
-    "009160",
-    "009161",
-    "009162",
-    "009163",
-    "009166",
-    "009168",
-    "009173",
-    "009174",
-    "009175",
-    "009177",
-    "009178",
-    "009179",
-    "009180",
-    "009181",
-    "009184",
-    "009185",
-    "009186",
-    "009187",
-    "009189",
-    "009191",
-    "009192",
-    "009193",
-    "009194",
-    "009195",
-    "009196",
-    "009197",
-    "009200",
-    "009202",
-    "009205",
-    "009208",
-    "009209",
-    "009212",
-    "009213",
-    "009214",
-    "009215",
-    "009218",
-    "009221",
-    "009224",
-    "009227",
-    "009230",
-    "009236",
-    "009238",
-    "009239",
-    "009242",
-    "009244",
-    "009245",
-    "009246",
-    "009247",
-    "009249",
-    "009250",
-    "009251",
-    "009252",
-    "009254",
-    "009255",
-    "009259",
-    "009268",
-    "009269",
-    "009270",
-    "009271",
-    "009272",
-    "009273",
-    "009278",
-    "009279",
-    "009281",
-    "009282",
-    "009283",
-    "009285",
-    "009286",
-    "009287",
-    "009288",
-    "009289",
-    "009290",
-    "009291",
-    "009295",
-    "009296",
-    "009299",
-    "009303",
-    "009306",
-    "009307",
-    "009308",
-    "009309",
-    "009312",
-    "009315",
-    "009316",
-    "009318",
-    "009323",
-    "009324",
-    "009325",
-    "009326",
-    "009327",
-    "009330",
-    "009331",
-    "009333",
-    "009334",
-    "009336",
-    "009337",
-    "009339",
-    "009342",
-    "009343",
-    "009347",
-    "009348",
-    "009349",
-    "009350",
-    "009351",
-    "009354",
-    "009358",
-    "009359",
-    "009362",
-    "009365",
-    "009368",
-    "009371",
-    "009373",
-    "009374",
-    "009375",
-    "009377",
-    "009378",
-    "009382",
-    "009386",
-    "009388",
-    "009389",
-    "009392",
-    "009393",
-    "009394",
-    "009398",
-    "009401",
-    "009405",
-    "009406",
-    "009407",
-    "009408",
-    "009409",
-    "009410",
-    "009411",
-    "009412",
-    "009413",
-    "009414",
-    "009417",
-    "009418",
-    "009419",
-    "009420",
-    "009421",
-    "009422",
-    "009424",
-    "009429",
-    "009432",
-    "009433",
-    "009434",
-    "009437",
-    "009438",
-    "009439",
-    "009440",
-    "009443",
-    "009445",
-    "009446",
-    "009448",
-    "009454",
-    "009455",
-    "009456",
-    "009457",
-    "009458",
-    "009459",
-    "009460",
-    "009461",
-    "009463",
-    "009464",
-    "009465",
-    "009466",
-    "009468",
-    "009469",
-    "009470",
-    "009472",
-    "009476",
-    "009477",
-    "009479",
-    "009480",
-    "009481",
-    "009484",
-    "009488",
-    "009490",
-    "009491",
-    "009494",
-    "009496",
-    "009497",
-    "009499",
-    "009500",
-    "009502",
-    "009504",
-    "009507",
-    "009508",
-    "009512",
-    "009515",
-    "009516",
-    "009517",
-    "009518",
-    "009519",
-    "009520",
-    "009523",
-    "009524",
-    "009526",
-    "009527",
-    "009528",
-    "009531",
-    "009532",
-    "009533",
-    "009537",
-    "009540",
-    "009541",
-    "009542",
-    "009543",
-    "009545",
-    "009546",
-    "009549",
-    "009550",
-    "009551",
-    "009557",
-    "009558",
-    "009560",
-    "009562",
-    "009565",
-    "009566",
-    "009567",
-    "009568",
-    "009571",
-    "009573",
-    "009576",
-    "009577",
-    "009579",
-    "009580",
-    "009584",
-    "009585",
-    "009586",
-    "009587",
-    "009588",
-    "009591",
-    "009596",
-    "009597",
-    "009598",
-    "009600",
-    "009603",
-    "009605",
-    "009609",
-    "009611",
-    "009613",
-    "009614",
-    "009615",
-    "009617",
-    "009618",
-    "009619",
-    "009620",
-    "009621",
-    "009623",
-    "009627",
-    "009629",
-    "009634",
-    "009636",
-    "009637",
-    "009638",
-    "009641",
-    "009644",
-    "009647",
-    "009649",
-    "009650",
-    "009654",
-    "009655",
-    "009656",
-    "009658",
-    "009659",
-    "009664",
-    "009666",
-    "009667",
-    "009668",
-    "009670",
-    "009671",
-    "009676",
-    "009678",
-    "009679",
-    "009681",
-    "009684",
-    "009685",
-    "009686",
-    "009687",
-    "009691",
-    "009692",
-    "009693",
-    "009695",
-    "009698",
-    "009699",
-    "009700",
-    "009702",
-    "009703",
-    "009706",
-    "009707",
-    "009709",
-    "009710",
-    "009711",
-    "009712",
-    "009713",
-    "009717",
-    "009718",
-    "009719",
-    "009721",
-    "009724",
-    "009726",
-    "009729",
-    "009732",
-    "009733",
-    "009734",
-    "009735",
-    "009737",
-    "009738",
-    "009743",
-    "009745",
-    "009746",
-    "009747",
-    "009748",
-    "009749",
-    "009754",
-    "009755",
-    "009756",
-    "009758",
-    "009761",
-    "009762",
-    "009763",
-    "009764",
-    "009767",
-    "009772",
-    "009773",
-    "009774",
-    "009776",
-    "009778",
-    "009780",
-    "009781",
-    "009785",
-    "009789",
-    "009790",
-    "009792",
-    "009794",
-    "009796",
-    "009797",
-    "009800",
-    "009801",
-    "009805",
-    "009807",
-    "009808",
-    "009809",
-    "009810",
-    "009813",
-    "009816",
-    "009819",
-    "009822",
-    "009823",
-    "009825",
-    "009828",
-    "009830",
-    "009831",
-    "009832",
-    "009833",
-    "009834",
-    "009836",
-    "009839",
-    "009841",
-    "009842",
-    "009845",
-    "009848",
-    "009851",
-    "009852",
-    "009855",
-    "009858",
-    "009859",
-    "009860",
-    "009862",
-    "009863",
-    "009865",
-    "009867",
-    "009868",
-    "009869",
-    "009870",
-    "009872",
-    "009874",
-    "009877",
-    "009878",
-    "009879",
-    "009880",
-    "009881",
-    "009882",
-    "009884",
-    "009886",
-    "009887",
-    "009894",
-    "009896",
-    "009897",
-    "009898",
-    "009900",
-    "009902",
-    "009904",
-    "009905",
-    "009908",
-    "009911",
-    "009913",
-    "009917",
-    "009918",
-    "009920",
-    "009923",
-    "009926",
-    "009932",
-    "009935",
-    "009938",
-    "009939",
-    "009940",
-    "009942",
-    "009944",
-    "009945",
-    "009946",
-    "009947",
-    "009949",
-    "009950",
-    "009954",
-    "009955",
-    "009958",
-    "009959",
-    "009961"]
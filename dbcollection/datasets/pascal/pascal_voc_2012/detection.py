@@ -12,8 +12,8 @@ from dbcollection.datasets import BaseTask
 
 from dbcollection.utils.file_load import load_xml
 from dbcollection.utils.string_ascii import convert_str_to_ascii as str2ascii
-from dbcollection.utils.pad import pad_list
-from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.group import group_by
+from dbcollection.utils.hdf5 import hdf5_write_data, hdf5_write_ragged_data
 
 
 class Detection(BaseTask):
@@ -29,84 +29,118 @@ class Detection(BaseTask):
 
     parts = ['head', 'hand', 'foot']
 
+    # 'trainval' is stored as the union of the 'train' and 'val' sets
+    union_sets = {'trainval': ('train', 'val')}
+    union_fields = {
+        'classes': 'shared',
+        'category_id': 'shared',
+        'difficult': 'shared',
+        'truncated': 'shared',
+        'id': ('concat', 'object_ids'),
+        'list_image_filenames_per_class': ('merge', 'image_filenames'),
+        'list_boxes_per_image': ('concat', 'boxes'),
+        'list_object_ids_per_image': ('concat', 'object_ids'),
+        'list_object_ids_per_class': ('merge', 'object_ids'),
+        'list_object_ids_no_difficult': ('concat', 'object_ids'),
+        'list_object_ids_difficult': ('concat', 'object_ids'),
+        'list_object_ids_no_truncated': ('concat', 'object_ids'),
+        'list_object_ids_truncated': ('concat', 'object_ids'),
+    }
+
     def get_set_fnames_fids(self):
         """
-        Return the train/val/trainval/test set filenames + fileids.
+        Return the train/val/test set filenames + fileids.
         """
         from .train_filenames import filenames as train_fnames
         from .val_filenames import filenames as val_fnames
-        from .trainval_filenames import filenames as trainval_fnames
         from .test_filenames import filenames as test_fnames
 
-        # get ids for each file (this is required for the coco API)
-        train_ids = [i for i, name in enumerate(trainval_fnames) if name in train_fnames]
-        val_ids = [i for i, name in enumerate(trainval_fnames) if name in val_fnames]
-        trainval_ids = list(range(len(trainval_fnames)))
+        # get ids for each file (this is required for the coco API):
+        # the position of the file in the sorted list of trainval files
+        trainval_ids = {name: i for i, name in enumerate(sorted(train_fnames + val_fnames))}
+        train_ids = [trainval_ids[name] for name in train_fnames]
+        val_ids = [trainval_ids[name] for name in val_fnames]
         test_ids = list(range(len(test_fnames)))
 
         return {
             'train': [train_fnames, train_ids],
             'val': [val_fnames, val_ids],
-            'trainval': [trainval_fnames, trainval_ids],
             'test': [test_fnames, test_ids]
         }
 
+    def get_set_names(self):
+        """
+        Return the names of the sets.
+        """
+        return ['train', 'val', 'test']
+
+    def get_annotation_files(self):
+        """
+        Return the paths of the annotation files of the sets.
+        """
+        annotations_path = os.path.join(self.data_path, 'VOCdevkit', 'VOC2012', 'Annotations')
+        set_fnames_fids = self.get_set_fnames_fids()
+        return [os.path.join(annotations_path, fname + '.xml')
+                for set_name in set_fnames_fids for fname in set_fnames_fids[set_name][0]]
+
     def load_data(self):
         """
         Load data of the dataset.
         """
+        for set_name in self.get_set_names():
+            yield self.load_data_set(set_name)
+
+    def load_data_set(self, set_name):
+        """
+        Load data of a set.
+        """
         self.annotations_path = os.path.join(self.data_path, 'VOCdevkit', 'VOC2012', 'Annotations')
         self.images_path = os.path.join(self.data_path, 'VOCdevkit', 'VOC2012', 'JPEGImages')
 
-        # set id list
-        set_filenames_ids = self.get_set_fnames_fids()
-
-        for set_name in set_filenames_ids:
+        # index list
+        fnames, set_ids = self.get_set_fnames_fids()[set_name]
 
-            # index list
-            fnames, set_ids = set_filenames_ids[set_name]
+        data = []
 
-            data = []
+        if self.verbose:
+            print('\n==> Processing metadata for the set: {}'.format(set_name))
+            print('> Loading data files...')
 
-            if self.verbose:
-                print('\n==> Processing metadata for the set: {}'.format(set_name))
-                print('> Loading data files...')
+        # progressbar
+        if self.verbose:
+            prgbar = progressbar.ProgressBar(max_value=len(fnames))
+
+        for i, fname in enumerate(fnames):
+            # setup file names
+            annot_filename = os.path.join(self.annotations_path, fname + '.xml')
+            image_filename = os.path.join(self.images_path, fname + '.jpg')
+
+            # load annotation
+            try:
+                annotation = self.load_annotation_file(load_xml, annot_filename)
+
+                if set_name != 'test':
+                    if isinstance(annotation['annotation']['object'], list):
+                        for j in range(len(annotation['annotation']['object'])):
+                            if 'truncated' not in annotation['annotation']['object'][j]:
+                                annotation['annotation']['object'][j]['truncated'] = 0
+                    else:
+                        if 'truncated' not in annotation['annotation']['object']:
+                            annotation['annotation']['object']['truncated'] = 0
+            except OSError:
+                annotation = {}
+
+            data.append([image_filename, set_ids[i], annotation])
 
-            # progressbar
+            # update progressbar
             if self.verbose:
-                prgbar = progressbar.ProgressBar(max_value=len(fnames))
-
-            for i, fname in enumerate(fnames):
-                # setup file names
-                annot_filename = os.path.join(self.annotations_path, fname + '.xml')
-                image_filename = os.path.join(self.images_path, fname + '.jpg')
-
-                # load annotation
-                try:
-                    annotation = load_xml(annot_filename)
+                prgbar.update(i)
 
-                    if set_name != 'test':
-                        if isinstance(annotation['annotation']['object'], list):
-                            for j in range(len(annotation['annotation']['object'])):
-                                if 'truncated' not in annotation['annotation']['object'][j]:
-                                    annotation['annotation']['object'][j]['truncated'] = 0
-                        else:
-                            if 'truncated' not in annotation['annotation']['object']:
-                                annotation['annotation']['object']['truncated'] = 0
-                except OSError:
-                    annotation = {}
-
-                data.append([image_filename, set_ids[i], annotation])
-
-                # update progressbar
-                if self.verbose:
-                    prgbar.update(i)
-
-            # reset progressbar
-            if self.verbose:
-                prgbar.finish()
+        # reset progressbar
+        if self.verbose:
+            prgbar.finish()
 
-            yield {set_name: data}
+        return {set_name: data}
 
     def add_data_to_source(self, hdf5_handler, data, set_name):
         """
@@ -191,15 +225,6 @@ class Detection(BaseTask):
         image_id = []  # for mscoco
         category_id = list(range(1, len(self.classes) + 1))  # for mscoco
 
-        list_image_filenames_per_class = []
-        list_boxes_per_image = []
-        list_object_ids_per_image = []
-        list_objects_ids_per_class = []
-        list_objects_ids_no_difficult = []
-        list_objects_ids_difficult = []
-        list_objects_ids_no_truncated = []
-        list_objects_ids_truncated = []
-
         if self.verbose:
             print('> Adding data to default group...')
             prgbar = progressbar.ProgressBar(max_value=len(data))
@@ -270,45 +295,17 @@ class Detection(BaseTask):
                 print('> Processing lists...')
 
             # process lists
-            for i in range(len(self.classes)):
-                imgs_per_class = [val[0] for j, val in enumerate(object_id) if val[1] == i]
-                imgs_per_class = list(set(imgs_per_class))  # get unique values
-                imgs_per_class.sort()
-                list_image_filenames_per_class.append(imgs_per_class)
-
-            for i in range(len(image_filenames)):
-                boxes_per_img = [val[2] for j, val in enumerate(object_id) if val[0] == i]
-                boxes_per_img = list(set(boxes_per_img))  # get unique values
-                boxes_per_img.sort()
-                list_boxes_per_image.append(boxes_per_img)
-
-            for i in range(len(image_filenames)):
-                objs_per_img = [j for j, val in enumerate(object_id) if val[0] == i]
-                objs_per_img = list(set(objs_per_img))  # get unique values
-                objs_per_img.sort()
-                list_object_ids_per_image.append(objs_per_img)
-
-            for i in range(len(self.classes)):
-                objs_per_class = [j for j, val in enumerate(object_id) if val[1] == i]
-                objs_per_class = list(set(objs_per_class))  # get unique values
-                objs_per_class.sort()
-                list_objects_ids_per_class.append(objs_per_class)
-
-            objs_no_difficult = [j for j, val in enumerate(object_id) if val[4] == 0]
-            objs_no_difficult.sort()
-            list_objects_ids_no_difficult = objs_no_difficult
-
-            objs_difficult = [j for j, val in enumerate(object_id) if val[4] == 1]
-            objs_difficult.sort()
-            list_objects_ids_difficult = objs_difficult
-
-            objs_no_truncated = [j for j, val in enumerate(object_id) if val[5] == 0]
-            objs_no_truncated.sort()
-            list_objects_ids_no_truncated = objs_no_truncated
-
-            objs_truncated = [j for j, val in enumerate(object_id) if val[5] == 1]
-            objs_truncated.sort()
-            list_objects_ids_truncated = objs_truncated
+            object_ids = np.array(object_id, dtype=np.int32).reshape(-1, len(object_fields))
+            list_image_filenames_per_class = group_by(object_ids[:, 1], len(self.classes),
+                                                      values=object_ids[:, 0], unique=True)
+            list_boxes_per_image = group_by(object_ids[:, 0], len(image_filenames),
+                                            values=object_ids[:, 2], unique=True)
+            list_object_ids_per_image = group_by(object_ids[:, 0], len(image_filenames))
+            list_objects_ids_per_class = group_by(object_ids[:, 1], len(self.classes))
+            list_objects_ids_no_difficult, list_objects_ids_difficult = \
+                group_by(object_ids[:, 4], num_groups=2)
+            list_objects_ids_no_truncated, list_objects_ids_truncated = \
+                group_by(object_ids[:, 5], num_groups=2)
 
         hdf5_write_data(hdf5_handler, 'image_filenames',
                         str2ascii(image_filenames),
@@ -346,18 +343,18 @@ class Detection(BaseTask):
                             dtype=np.uint8, fillvalue=0)
 
             pad_value = -1
-            hdf5_write_data(hdf5_handler, 'list_image_filenames_per_class',
-                            np.array(pad_list(list_image_filenames_per_class, -1), dtype=np.int32),
-                            fillvalue=pad_value)
-            hdf5_write_data(hdf5_handler, 'list_boxes_per_image',
-                            np.array(pad_list(list_boxes_per_image, -1), dtype=np.int32),
-                            fillvalue=pad_value)
-            hdf5_write_data(hdf5_handler, 'list_object_ids_per_image',
-                            np.array(pad_list(list_object_ids_per_image, -1), dtype=np.int32),
-                            fillvalue=pad_value)
-            hdf5_write_data(hdf5_handler, 'list_object_ids_per_class',
-                            np.array(pad_list(list_objects_ids_per_class, -1), dtype=np.int32),
-                            fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_image_filenames_per_class',
+                                   list_image_filenames_per_class,
+                                   dtype=np.int32, fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_boxes_per_image',
+                                   list_boxes_per_image,
+                                   dtype=np.int32, fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_object_ids_per_image',
+                                   list_object_ids_per_image,
+                                   dtype=np.int32, fillvalue=pad_value)
+            hdf5_write_ragged_data(hdf5_handler, 'list_object_ids_per_class',
+                                   list_objects_ids_per_class,
+                                   dtype=np.int32, fillvalue=pad_value)
             hdf5_write_data(hdf5_handler, 'list_object_ids_no_difficult',
                             np.array(list_objects_ids_no_difficult, dtype=np.int32),
                             fillvalue=pad_value)
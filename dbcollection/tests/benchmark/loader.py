@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+
+"""
+Benchmark the read path of the metadata loaders.
+
+Generates synthetic task files (with different storage layouts) and measures
+the throughput of FieldLoader.get(), FieldLoader.__getitem__() and
+SetLoader.object() for sequential, strided, random single and random batch
+accesses, with the fields on disk and loaded into memory. The results are
+stored in a JSON file so they can be compared across releases.
+
+Example:
+
+    $ python dbcollection/tests/benchmark/loader.py --num-rows 100000 --output results.json
+
+"""
+
+
+from __future__ import print_function, division
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+
+import h5py
+import numpy as np
+
+from dbcollection.core.loader import DataLoader
+from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
+
+
+LAYOUTS = {
+    "contiguous": {"contiguous": True},
+    "chunked": {"chunks": True, "compression": None, "compression_opts": None},
+    "gzip": {"chunks": True, "compression": "gzip", "compression_opts": 4},
+    "lzf": {"chunks": True, "compression": "lzf", "compression_opts": None},
+}
+
+PATTERNS = ('sequential', 'strided', 'random_single', 'random_batch')
+METHODS = ('get', 'getitem', 'object')
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description='Benchmark the metadata loaders.')
+    parser.add_argument('--output', default='benchmark_loader.json',
+                        help='Path of the JSON file to store the results.')
+    parser.add_argument('--num-rows', type=int, default=10000,
+                        help='Number of rows (objects) of the synthetic set.')
+    parser.add_argument('--row-size', type=int, default=64,
+                        help='Number of values of each row of the data field.')
+    parser.add_argument('--chunk-rows', type=int, default=None,
+                        help='Number of rows of each chunk (default: chosen by h5py).')
+    parser.add_argument('--layouts', nargs='+', default=sorted(LAYOUTS), choices=sorted(LAYOUTS),
+                        help='Storage layouts of the fields.')
+    parser.add_argument('--patterns', nargs='+', default=list(PATTERNS), choices=PATTERNS,
+                        help='Access patterns.')
+    parser.add_argument('--methods', nargs='+', default=list(METHODS), choices=METHODS,
+                        help='Read methods.')
+    parser.add_argument('--num-accesses', type=int, default=1000,
+                        help='Number of reads of each benchmark.')
+    parser.add_argument('--batch-size', type=int, default=32,
+                        help='Number of rows of each read of the random batch pattern.')
+    parser.add_argument('--stride', type=int, default=97,
+                        help='Distance between rows of the strided pattern.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of runs of each benchmark (the best one is stored).')
+    parser.add_argument('--chunk-cache-bytes', type=int, default=None,
+                        help='Size of the decompressed chunk cache of the loaders.')
+    parser.add_argument('--seed', type=int, default=4,
+                        help='Seed of the random number generator.')
+    parser.add_argument('--tmp-dir', default=None,
+                        help='Directory where the synthetic task files are stored.')
+    return parser.parse_args(args)
+
+
+def generate_task_file(filepath, num_rows, row_size, layout, chunk_rows=None, seed=4):
+    """Writes a synthetic task file with a single 'train' set.
+
+    The set contains a float 'data' field, an int 'label' field, a 'classes'
+    string field and the 'object_ids' field relating them (one object per
+    row of 'data').
+    """
+    rng = np.random.RandomState(seed)
+    options = dict(LAYOUTS[layout])
+    classes = ['class_{}'.format(i) for i in range(10)]
+    fields = {
+        "data": rng.rand(num_rows, row_size).astype(np.float32),
+        "label": rng.randint(0, len(classes), num_rows).astype(np.int32),
+        "classes": str_to_ascii(classes),
+    }
+    with h5py.File(filepath, 'w', libver='latest') as hdf5_file:
+        group = hdf5_file.create_group('train')
+        for field, data in fields.items():
+            field_options = dict(options)
+            if chunk_rows and not field_options.get("contiguous"):
+                field_options["chunks"] = (min(chunk_rows, len(data)),) + data.shape[1:]
+            hdf5_write_data(group, field, data, **field_options)
+        object_ids = np.stack([np.arange(num_rows), fields["label"]], axis=1).astype(np.int32)
+        hdf5_write_data(group, 'object_ids', object_ids, **options)
+        hdf5_write_data(group, 'object_fields', str_to_ascii(['data', 'classes']),
+                        contiguous=True)
+
+
+def get_indexes(pattern, num_rows, num_accesses, batch_size=32, stride=97, seed=4):
+    """Returns the list of indexes read by each access of a pattern."""
+    rng = np.random.RandomState(seed)
+    if pattern == 'sequential':
+        return [int(i) for i in np.arange(num_accesses) % num_rows]
+    elif pattern == 'strided':
+        return [int(i) for i in (np.arange(num_accesses) * stride) % num_rows]
+    elif pattern == 'random_single':
+        return [int(i) for i in rng.randint(0, num_rows, num_accesses)]
+    elif pattern == 'random_batch':
+        return [rng.randint(0, num_rows, batch_size) for _ in range(num_accesses)]
+    else:
+        raise ValueError('Invalid pattern: {}'.format(pattern))
+
+
+def get_read_fn(data_loader, method):
+    """Returns a function that reads the indexes of an access with a method."""
+    set_loader = data_loader.sets['train']
+    field_loader = set_loader.fields['data']
+    if method == 'get':
+        return field_loader.get
+    elif method == 'getitem':
+        def read_getitem(index):
+            if isinstance(index, int):
+                return field_loader[index]
+            return field_loader[np.unique(index).tolist()]  # h5py requires increasing indexes
+        return read_getitem
+    elif method == 'object':
+        return lambda index: set_loader.object(index, convert_to_value=True)
+    else:
+        raise ValueError('Invalid method: {}'.format(method))
+
+
+def run_benchmark(read_fn, indexes, repeat=3):
+    """Returns the best time, number of rows and bytes of reading all indexes."""
+    best_seconds, nbytes = None, 0
+    for _ in range(repeat):
+        start = time.time()
+        outputs = [read_fn(index) for index in indexes]
+        seconds = time.time() - start
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds = seconds
+            nbytes = sum(get_nbytes(output) for output in outputs)
+    rows = sum(1 if isinstance(index, int) else len(index) for index in indexes)
+    return best_seconds, rows, nbytes
+
+
+def get_nbytes(output):
+    if isinstance(output, np.ndarray):
+        return output.nbytes
+    if isinstance(output, (list, tuple)):
+        return sum(get_nbytes(value) for value in output)
+    return 0
+
+
+def run(args):
+    """Runs all benchmarks and returns the results."""
+    tmp_dir = tempfile.mkdtemp(dir=args.tmp_dir)
+    results = []
+    try:
+        for layout in args.layouts:
+            filepath = os.path.join(tmp_dir, '{}.h5'.format(layout))
+            generate_task_file(filepath, args.num_rows, args.row_size, layout,
+                               args.chunk_rows, args.seed)
+            for to_memory in (False, True):
+                data_loader = DataLoader('benchmark', 'default', tmp_dir, filepath,
+                                         chunk_cache_bytes=args.chunk_cache_bytes)
+                if to_memory:
+                    for field in data_loader.sets['train'].fields:
+                        data_loader.sets['train'].fields[field].to_memory = True
+                for method in args.methods:
+                    read_fn = get_read_fn(data_loader, method)
+                    for pattern in args.patterns:
+                        indexes = get_indexes(pattern, args.num_rows, args.num_accesses,
+                                              args.batch_size, args.stride, args.seed)
+                        seconds, rows, nbytes = run_benchmark(read_fn, indexes, args.repeat)
+                        result = {
+                            "layout": layout,
+                            "to_memory": to_memory,
+                            "method": method,
+                            "pattern": pattern,
+                            "calls": len(indexes),
+                            "rows": rows,
+                            "nbytes": nbytes,
+                            "seconds": seconds,
+                            "calls_per_second": len(indexes) / seconds if seconds else None,
+                            "rows_per_second": rows / seconds if seconds else None,
+                            "mb_per_second": nbytes / seconds / 1024 ** 2 if seconds else None,
+                        }
+                        results.append(result)
+                        print_result(result)
+                data_loader.hdf5_file.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def print_result(result):
+    print('{:<10} {:<7} {:<8} {:<14} {:>12.1f} rows/s {:>10.2f} MB/s'.format(
+        result["layout"], 'memory' if result["to_memory"] else 'disk', result["method"],
+        result["pattern"], result["rows_per_second"] or 0, result["mb_per_second"] or 0))
+
+
+def get_metadata(args):
+    try:
+        import dbcollection
+        version = dbcollection.__version__
+    except Exception:
+        version = None
+    return {
+        "dbcollection": version,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "h5py": h5py.version.version,
+        "hdf5": h5py.version.hdf5_version,
+        "platform": platform.platform(),
+        "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "params": vars(args),
+    }
+
+
+def main(args=None):
+    args = parse_args(args)
+    results = run(args)
+    with open(args.output, 'w') as file_json:
+        json.dump({"metadata": get_metadata(args), "results": results}, file_json,
+                  sort_keys=True, indent=4)
+    print('\nResults stored in: {}'.format(args.output))
+    return results
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
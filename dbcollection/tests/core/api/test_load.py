@@ -100,6 +100,77 @@ class TestClassLoadAPI:
         assert load_api.data_dir == test_data["data_dir"]
         assert load_api.verbose == test_data["verbose"]
 
+    def test_init_with_mmap(self, mocker, mocks_init_class, test_data):
+        load_api = LoadAPI(name=test_data["dataset"],
+                           task=test_data["task"],
+                           data_dir=test_data["data_dir"],
+                           verbose=test_data["verbose"],
+                           mmap=True)
+
+        assert load_api.mmap is True
+
+    def test_init_with_shared_memory(self, mocker, mocks_init_class, test_data):
+        load_api = LoadAPI(name=test_data["dataset"],
+                           task=test_data["task"],
+                           data_dir=test_data["data_dir"],
+                           verbose=test_data["verbose"],
+                           shared_memory=True)
+
+        assert load_api.shared_memory is True
+
+    def test_init_with_hdf5_options(self, mocker, mocks_init_class, test_data):
+        load_api = LoadAPI(name=test_data["dataset"],
+                           task=test_data["task"],
+                           data_dir=test_data["data_dir"],
+                           verbose=test_data["verbose"],
+                           hdf5_options={'rdcc_nbytes': 'auto'})
+
+        assert load_api.hdf5_options == {'rdcc_nbytes': 'auto'}
+
+    def test_init_with_stats(self, mocker, mocks_init_class, test_data):
+        load_api = LoadAPI(name=test_data["dataset"],
+                           task=test_data["task"],
+                           data_dir=test_data["data_dir"],
+                           verbose=test_data["verbose"],
+                           stats=True,
+                           stats_filepath='/some/path/stats.json')
+
+        assert load_api.stats is True
+        assert load_api.stats_filepath == '/some/path/stats.json'
+
+    def test_init_with_image_options(self, mocker, mocks_init_class, test_data):
+        load_api = LoadAPI(name=test_data["dataset"],
+                           task=test_data["task"],
+                           data_dir=test_data["data_dir"],
+                           verbose=test_data["verbose"],
+                           image_cache_bytes=10 ** 6,
+                           image_workers=2,
+                           image_pool='process')
+
+        assert load_api.image_cache_bytes == 10 ** 6
+        assert load_api.image_workers == 2
+        assert load_api.image_pool == 'process'
+
+    @pytest.mark.parametrize('options', [
+        {'image_cache_bytes': '1MB'}, {'image_workers': -1}, {'image_pool': None}
+    ])
+    def test_init__raises_error_invalid_image_options(self, mocker, mocks_init_class, test_data,
+                                                      options):
+        with pytest.raises(TypeError):
+            LoadAPI(name=test_data["dataset"],
+                    task=test_data["task"],
+                    data_dir=test_data["data_dir"],
+                    verbose=test_data["verbose"],
+                    **options)
+
+    def test_init__raises_error_invalid_hdf5_options(self, mocker, mocks_init_class, test_data):
+        with pytest.raises(TypeError):
+            LoadAPI(name=test_data["dataset"],
+                    task=test_data["task"],
+                    data_dir=test_data["data_dir"],
+                    verbose=test_data["verbose"],
+                    hdf5_options='core')
+
     def test_init__raises_error_no_input_args(self, mocker):
         with pytest.raises(TypeError):
             LoadAPI()
@@ -170,6 +241,25 @@ class TestClassLoadAPI:
         assert mock_loader.called
         assert data_loader == ["data_loader_dummy"]
 
+    def test_get_loader_obj(self, mocker, load_api_cls):
+        mock_loader = mocker.patch("dbcollection.core.api.load.DataLoader", return_value="data_loader_dummy")
+
+        data_loader = load_api_cls.get_loader_obj("/some/path/data/", "/some/path/to/file")
+
+        mock_loader.assert_called_once_with(name=load_api_cls.name,
+                                            task=load_api_cls.task,
+                                            data_dir="/some/path/data/",
+                                            hdf5_filepath="/some/path/to/file",
+                                            mmap=False,
+                                            shared_memory=False,
+                                            hdf5_options=None,
+                                            stats=False,
+                                            stats_filepath=None,
+                                            image_cache_bytes=None,
+                                            image_workers=4,
+                                            image_pool='thread')
+        assert data_loader == "data_loader_dummy"
+
     def test_get_data_dir_path_from_cache(self, mocker, load_api_cls):
         mock_get_metadata = mocker.patch.object(LoadAPI, "get_dataset_metadata", return_value={'data_dir': '/some/path/data'})
 
@@ -58,6 +58,15 @@ class TestCallProcess:
         assert_mock_init_class(mocks_init_class)
         assert mock_run.called
 
+    def test_call_with_num_workers(self, mocker, mocks_init_class, test_data):
+        mock_init = mocker.spy(ProcessAPI, "__init__")
+        mock_run = mocker.patch.object(ProcessAPI, "run")
+
+        process(test_data["dataset"], test_data["task"], test_data["verbose"], num_workers=4)
+
+        assert mock_init.call_args[1]["num_workers"] == 4
+        assert mock_run.called
+
     def test_call__raises_error_no_inputs(self, mocker):
         with pytest.raises(TypeError):
             process()
@@ -88,6 +97,24 @@ class TestClassProcessAPI:
         assert process_api.name == test_data["dataset"]
         assert process_api.task == test_data["task"]
         assert process_api.verbose == test_data["verbose"]
+        assert process_api.num_workers == 0
+
+    def test_init_with_num_workers(self, mocker, mocks_init_class, test_data):
+        process_api = ProcessAPI(name=test_data['dataset'],
+                                 task=test_data['task'],
+                                 verbose=test_data['verbose'],
+                                 num_workers=2)
+
+        assert process_api.num_workers == 2
+
+    @pytest.mark.parametrize('num_workers', [-1, 1.5, None])
+    def test_init__raises_error_invalid_num_workers(self, mocker, mocks_init_class, test_data,
+                                                    num_workers):
+        with pytest.raises(TypeError):
+            ProcessAPI(name=test_data['dataset'],
+                       task=test_data['task'],
+                       verbose=test_data['verbose'],
+                       num_workers=num_workers)
 
     def test_init__raises_error_no_input_args(self, mocker, mocks_init_class, test_data):
         with pytest.raises(TypeError):
@@ -145,6 +172,20 @@ class TestClassProcessAPI:
         assert mock_process_metadata.called
         assert result == {}
 
+    def test_process_dataset_several_tasks(self, mocker, process_api_cls):
+        mocker.patch.object(ProcessAPI, 'get_dataset_data_dir_path', return_value='/some/path/data/dir')
+        mocker.patch.object(ProcessAPI, 'get_dataset_cache_dir_path', return_value='/some/path/cache/dir')
+        mocker.patch.object(ProcessAPI, "parse_task_name", side_effect=lambda task: task)
+        mock_check_exists = mocker.patch.object(ProcessAPI, "check_if_task_exists_in_database")
+        mock_process_metadata = mocker.patch.object(ProcessAPI, "process_dataset_metadata", return_value={})
+        process_api_cls.task = ['taskA', 'taskB']
+
+        process_api_cls.process_dataset()
+
+        assert mock_check_exists.call_count == 2
+        mock_process_metadata.assert_called_with('/some/path/data/dir', '/some/path/cache/dir',
+                                                 ['taskA', 'taskB'])
+
     def test_get_dataset_data_dir_path(self, mocker, process_api_cls):
         mock_get_metadata = mocker.patch.object(ProcessAPI, "get_dataset_metadata_from_cache", return_value={'data_dir': '/some/dir/path'})
 
@@ -194,3 +235,8 @@ class TestClassProcessAPI:
         result = process_api_cls.process_dataset_metadata('/some/path/data', '/some/path/cache', 'taskA')
 
         assert mock_constructor.called
+        mock_constructor.return_value.assert_called_once_with(data_path='/some/path/data',
+                                                              cache_path='/some/path/cache',
+                                                              extract_data=False,
+                                                              verbose=False,
+                                                              num_workers=0)
@@ -0,0 +1,113 @@
+"""
+Test dbcollection/core/chunk_cache.py.
+"""
+
+
+import numpy as np
+import pytest
+
+from dbcollection.core.chunk_cache import ChunkCache
+
+
+def read_block(value, size=10):
+    return lambda: np.full(size, value, dtype=np.uint8)
+
+
+class TestChunkCache:
+    """Unit tests for the ChunkCache class."""
+
+    def test__init(self):
+        cache = ChunkCache(100)
+
+        assert cache.max_bytes == 100
+        assert cache.nbytes == 0
+        assert len(cache) == 0
+
+    def test__init__numpy_integer_size(self):
+        cache = ChunkCache(np.prod([10, 10], dtype=np.int64))
+
+        assert cache.max_bytes == 100
+        assert type(cache.max_bytes) is int
+
+    @pytest.mark.parametrize('max_bytes', [0, 100.0, '100'])
+    def test__init__raises_error_invalid_size(self, max_bytes):
+        with pytest.raises(AssertionError):
+            ChunkCache(max_bytes)
+
+    def test_get_block_miss_then_hit(self):
+        cache = ChunkCache(100)
+
+        block1 = cache.get_block(('a', 0), read_block(1))
+        block2 = cache.get_block(('a', 0), read_block(2))
+
+        assert np.array_equal(block1, block2)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_get_block_is_read_only(self):
+        cache = ChunkCache(100)
+
+        block = cache.get_block(('a', 0), read_block(1))
+
+        with pytest.raises(ValueError):
+            block[0] = 5
+
+    def test_get_block_evicts_least_recently_used(self):
+        cache = ChunkCache(20)
+
+        cache.get_block(('a', 0), read_block(0))
+        cache.get_block(('a', 1), read_block(1))
+        cache.get_block(('a', 0), read_block(0))
+        cache.get_block(('a', 2), read_block(2))
+
+        assert cache.evictions == 1
+        assert cache.nbytes == 20
+        assert cache.get_block(('a', 0), read_block(9))[0] == 0
+        assert cache.get_block(('a', 1), read_block(9))[0] == 9
+
+    def test_get_block_bigger_than_budget_is_not_stored(self):
+        cache = ChunkCache(5)
+
+        block = cache.get_block(('a', 0), read_block(3))
+
+        assert block[0] == 3
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+    def test_clear(self):
+        cache = ChunkCache(100)
+        cache.get_block(('a', 0), read_block(1))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0,
+                                 "blocks": 0, "nbytes": 0, "max_bytes": 100}
+
+    def test_stats(self):
+        cache = ChunkCache(100)
+        cache.get_block(('a', 0), read_block(1))
+        cache.get_block(('a', 0), read_block(1))
+
+        stats = cache.stats()
+
+        assert stats == {"hits": 1, "misses": 1, "evictions": 0,
+                         "blocks": 1, "nbytes": 10, "max_bytes": 100}
+
+    def test_lookup(self):
+        cache = ChunkCache(100)
+        cache.add_block(('a', 0), np.zeros(10, dtype=np.uint8))
+
+        assert cache.lookup(('a', 0)) is not None
+        assert cache.lookup(('a', 1)) is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_add_block_is_read_only(self):
+        cache = ChunkCache(100)
+
+        block = cache.add_block(('a', 0), np.zeros(10, dtype=np.uint8))
+
+        with pytest.raises(ValueError):
+            block[0] = 5
+        assert cache.nbytes == 10
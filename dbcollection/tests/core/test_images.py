@@ -0,0 +1,207 @@
+"""
+Test dbcollection/core/images.py.
+"""
+
+
+import os
+import pickle
+import h5py
+import numpy as np
+import pytest
+from PIL import Image
+
+from dbcollection.core.images import ImageReader, load_image
+from dbcollection.core.loader import DataLoader
+from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
+
+
+@pytest.fixture()
+def image_files(tmpdir):
+    filenames = []
+    for i in range(4):
+        filename = 'images/img_{}.png'.format(i)
+        filepath = str(tmpdir.join(filename))
+        if not os.path.exists(os.path.dirname(filepath)):
+            os.makedirs(os.path.dirname(filepath))
+        pixels = np.full((6, 8, 3), i * 10, dtype=np.uint8)
+        Image.fromarray(pixels).save(filepath)
+        filenames.append(filename)
+    return str(tmpdir), filenames
+
+
+@pytest.fixture()
+def data_loader(image_files):
+    data_dir, filenames = image_files
+    filepath = os.path.join(data_dir, 'images.h5')
+    with h5py.File(filepath, 'w') as h5obj:
+        group = h5obj.create_group('train')
+        group['object_fields'] = str_to_ascii(['image_filenames'])
+        hdf5_write_data(group, 'object_ids', np.arange(4, dtype=np.int32).reshape(4, 1))
+        hdf5_write_data(group, 'image_filenames', str_to_ascii(filenames), fillvalue=0)
+    return DataLoader('some_db', 'task', data_dir, filepath, image_cache_bytes=10 ** 6)
+
+
+def get_filepaths(image_files):
+    data_dir, filenames = image_files
+    return [os.path.join(data_dir, filename) for filename in filenames]
+
+
+class TestLoadImage:
+    """Unit tests for the load_image function."""
+
+    def test_load_image(self, image_files):
+        image = load_image(get_filepaths(image_files)[1])
+
+        assert image.shape == (6, 8, 3)
+        assert image.dtype == np.uint8
+        assert np.all(image == 10)
+
+    def test_load_image_resize(self, image_files):
+        image = load_image(get_filepaths(image_files)[1], size=(3, 5))
+
+        assert image.shape == (3, 5, 3)
+
+    def test_load_image_convert_mode(self, image_files):
+        image = load_image(get_filepaths(image_files)[1], mode='L')
+
+        assert image.shape == (6, 8)
+
+
+class TestImageReader:
+    """Unit tests for the ImageReader class."""
+
+    def test__init(self):
+        reader = ImageReader()
+
+        assert reader.cache is None
+        assert reader.num_workers == 4
+        assert reader.pool == 'thread'
+        assert reader.mode == 'RGB'
+
+    def test__init__raises_error_invalid_pool(self):
+        with pytest.raises(ValueError):
+            ImageReader(pool='greenlet')
+
+    @pytest.mark.parametrize('num_workers, pool', [(0, 'thread'), (2, 'thread'), (2, 'process')])
+    def test_read(self, image_files, num_workers, pool):
+        reader = ImageReader(num_workers=num_workers, pool=pool)
+
+        images = reader.read(get_filepaths(image_files))
+        reader.close()
+
+        assert len(images) == 4
+        assert [int(image[0, 0, 0]) for image in images] == [0, 10, 20, 30]
+
+    def test_read_resize(self, image_files):
+        reader = ImageReader()
+
+        images = reader.read(get_filepaths(image_files)[:2], size=(2, 2))
+
+        assert all(image.shape == (2, 2, 3) for image in images)
+
+    def test_read_uses_cache(self, image_files):
+        reader = ImageReader(cache_bytes=10 ** 6)
+        filepaths = get_filepaths(image_files)
+
+        reader.read(filepaths[:2])
+        images = reader.read(filepaths[1:3])
+
+        assert reader.cache.hits == 1
+        assert reader.cache.misses == 3
+        assert [int(image[0, 0, 0]) for image in images] == [10, 20]
+        with pytest.raises(ValueError):
+            images[0][0, 0, 0] = 5
+
+    def test_read_decodes_repeated_files_once(self, image_files):
+        reader = ImageReader(cache_bytes=10 ** 6)
+        filepath = get_filepaths(image_files)[0]
+
+        images = reader.read([filepath, filepath])
+
+        assert len(images) == 2
+        assert len(reader.cache) == 1
+
+    def test_read_cache_keys_include_size(self, image_files):
+        reader = ImageReader(cache_bytes=10 ** 6)
+        filepath = get_filepaths(image_files)[0]
+
+        reader.read([filepath])
+        image = reader.read([filepath], size=(2, 2))[0]
+
+        assert image.shape == (2, 2, 3)
+        assert len(reader.cache) == 2
+
+    def test_pickle(self):
+        reader = ImageReader(cache_bytes=100, num_workers=2, pool='process', mode='L')
+
+        new_reader = pickle.loads(pickle.dumps(reader))
+
+        assert new_reader.cache.max_bytes == 100
+        assert new_reader.num_workers == 2
+        assert new_reader.pool == 'process'
+        assert new_reader.mode == 'L'
+
+
+class TestDataLoaderImages:
+    """Unit tests for reading the images of a DataLoader."""
+
+    def test_images(self, data_loader):
+        images = data_loader.images('train', [2, 0])
+
+        assert [int(image[0, 0, 0]) for image in images] == [20, 0]
+
+    def test_images_single_index(self, data_loader):
+        image = data_loader.images('train', 3, size=(4, 4))
+
+        assert image.shape == (4, 4, 3)
+        assert int(image[0, 0, 0]) == 30
+
+    def test_images_empty_index(self, mocker, data_loader):
+        mock_read = mocker.spy(data_loader.image_reader, 'read')
+
+        assert data_loader.images('train', []) == []
+        assert not mock_read.called
+
+    def test_images_raise_error_without_index(self, data_loader):
+        with pytest.raises(AssertionError):
+            data_loader.images('train', None)
+
+    def test_images_raise_error_invalid_set(self, data_loader):
+        with pytest.raises(KeyError):
+            data_loader.images('val', 0)
+
+    @pytest.mark.parametrize('prefetch', [0, 2])
+    def test_iter_images(self, data_loader, prefetch):
+        batches = list(data_loader.iter_images('train', batch_size=3, prefetch=prefetch))
+
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert int(batches[1][0][0, 0, 0]) == 30
+
+    def test_iter_images_indexes(self, data_loader):
+        batches = list(data_loader.iter_images('train', [3, 1], batch_size=1))
+
+        assert [int(batch[0][0, 0, 0]) for batch in batches] == [30, 10]
+
+    def test_close_stops_workers(self, data_loader):
+        data_loader.images('train', [0, 1])
+        workers = data_loader.image_reader._workers
+
+        data_loader.close()
+
+        assert data_loader.image_reader._workers is None
+        assert not any(worker.is_alive() for worker in workers._pool)
+        assert len(data_loader.images('train', [2, 3])) == 2  # workers restarted
+
+    def test_pickle_keeps_image_reader_options(self, data_loader):
+        new_loader = pickle.loads(pickle.dumps(data_loader))
+
+        assert new_loader.image_reader.cache.max_bytes == 10 ** 6
+
+    def test_image_reader_options(self, data_loader):
+        new_loader = DataLoader('some_db', 'task', data_loader.data_dir,
+                                data_loader.hdf5_filepath, image_workers=0, image_pool='process')
+
+        assert new_loader.image_reader.num_workers == 0
+        assert new_loader.image_reader.pool == 'process'
+        assert len(new_loader.images('train', [0, 1])) == 2
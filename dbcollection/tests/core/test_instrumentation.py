@@ -0,0 +1,187 @@
+"""
+Test dbcollection/core/instrumentation.py.
+"""
+
+
+import os
+import json
+import pickle
+from multiprocessing import Pool
+import numpy as np
+import pytest
+
+from dbcollection.core.instrumentation import (AccessStats, instrument, count_index_rows,
+                                               count_item_rows, merge_stats_files)
+
+
+class DummyLoader(object):
+
+    def __init__(self, stats=None):
+        self.stats = stats
+        self.chunk_cache = None
+        self.data = np.arange(20, dtype=np.int64).reshape(10, 2)
+
+    def _get_stats_key(self):
+        return 'train', 'data'
+
+    def __len__(self):
+        return len(self.data)
+
+    @instrument(count_index_rows)
+    def get(self, index=None):
+        return self.data if index is None else self.data[index]
+
+    @instrument(count_item_rows)
+    def __getitem__(self, index):
+        return self.data[index]
+
+
+def test_record():
+    stats = AccessStats()
+
+    stats.record('train', 'data', rows=2, nbytes=32, seconds=3e-6, cache_hits=1)
+    stats.record('train', 'data', rows=1, nbytes=16, seconds=100e-6)
+
+    field_stats = stats.to_dict()['train']['data']
+    assert field_stats["calls"] == 2
+    assert field_stats["rows"] == 3
+    assert field_stats["nbytes"] == 48
+    assert field_stats["cache_hits"] == 1
+    assert field_stats["max_seconds"] == 100e-6
+    assert field_stats["latency_histogram"] == {"4": 1, "128": 1}
+
+
+def test_to_dict_single_set():
+    stats = AccessStats()
+    stats.record('train', 'data', 1, 8, 1e-6)
+    stats.record('test', 'data', 1, 8, 1e-6)
+
+    assert list(stats.to_dict('test').keys()) == ['test']
+
+
+def test_instrumented_methods():
+    stats = AccessStats()
+    loader = DummyLoader(stats)
+
+    loader.get()
+    loader.get([1, 3, 5])
+    loader[2:4, 0]
+    loader[7]
+
+    field_stats = stats.to_dict()['train']['data']
+    assert field_stats["calls"] == 4
+    assert field_stats["rows"] == 10 + 3 + 2 + 1
+    assert field_stats["nbytes"] == 160 + 48 + 16 + 16
+
+
+def test_instrumented_methods_disabled():
+    loader = DummyLoader()
+
+    assert np.array_equal(loader.get([1, 2]), loader.data[[1, 2]])
+    assert np.array_equal(loader[3], loader.data[3])
+
+
+@pytest.mark.parametrize('index, rows', [
+    (None, 10), (3, 1), ([1, 2, 2], 3), ([], 10)
+])
+def test_count_index_rows(index, rows):
+    assert count_index_rows(index, DummyLoader()) == rows
+
+
+@pytest.mark.parametrize('index, rows', [
+    (3, 1), (slice(2, 8, 2), 3), ((slice(None), 0), 10), ([4, 1], 2),
+    (np.arange(10) > 6, 3)
+])
+def test_count_item_rows(index, rows):
+    assert count_item_rows(index, DummyLoader()) == rows
+
+
+def test_dump(tmpdir):
+    filepath = str(tmpdir.join('stats.json'))
+    stats = AccessStats(filepath)
+    stats.record('train', 'data', 1, 8, 1e-6)
+
+    stats.dump()
+
+    with open(filepath, 'r') as file_json:
+        assert json.load(file_json) == stats.to_dict()
+
+
+def test_dump_at_exit_only_in_owner_process(mocker, tmpdir):
+    stats = AccessStats(str(tmpdir.join('stats.json')))
+    mock_dump = mocker.patch.object(AccessStats, 'dump')
+    mocker.patch('dbcollection.core.instrumentation.os.getpid', return_value=-1)
+
+    stats._dump_at_exit()
+
+    assert not mock_dump.called
+
+
+def test_pickle_starts_empty(tmpdir):
+    filepath = str(tmpdir.join('stats.json'))
+    stats = AccessStats(filepath)
+    stats.record('train', 'data', 1, 8, 1e-6)
+
+    new_stats = pickle.loads(pickle.dumps(stats))
+
+    assert len(new_stats) == 0
+    assert new_stats.filepath == filepath
+    assert new_stats.get_process_filepath() == filepath  # same process
+
+
+def test_get_process_filepath_in_other_process(mocker, tmpdir):
+    stats = AccessStats(str(tmpdir.join('stats.json')))
+    mocker.patch('dbcollection.core.instrumentation.os.getpid', return_value=123)
+
+    assert stats.get_process_filepath() == str(tmpdir.join('stats.123.json'))
+
+
+def record_in_worker(stats):
+    stats.record('train', 'data', 2, 16, 1e-6)
+    return os.getpid()
+
+
+def test_worker_processes_store_their_own_files(tmpdir):
+    filepath = str(tmpdir.join('stats.json'))
+    stats = AccessStats(filepath)
+    stats.record('train', 'data', 1, 8, 1e-6)
+
+    pool = Pool(1)
+    pid = pool.apply(record_in_worker, (stats,))
+    pool.close()
+    pool.join()
+    stats.dump()
+
+    with open(str(tmpdir.join('stats.{}.json'.format(pid))), 'r') as file_json:
+        assert json.load(file_json)['train']['data']['rows'] == 2
+    assert merge_stats_files(filepath)['train']['data']['rows'] == 3
+
+
+def test_merge_stats_files(tmpdir):
+    filepath = str(tmpdir.join('stats.json'))
+    stats, worker_stats = AccessStats(), AccessStats()
+    stats.record('train', 'data', 1, 8, 1e-6)
+    stats.record('train', 'data', 1, 8, 3e-6)
+    worker_stats.record('train', 'data', 4, 32, 1e-6)
+    worker_stats.record('test', 'data', 1, 8, 1e-6)
+    stats.dump(filepath)
+    worker_stats.dump(str(tmpdir.join('stats.42.json')))
+    stats.dump(str(tmpdir.join('stats.other.json')))  # not a file of a process
+
+    merged = merge_stats_files(filepath)
+
+    assert sorted(merged) == ['test', 'train']
+    assert merged['train']['data']['calls'] == 3
+    assert merged['train']['data']['rows'] == 6
+    assert merged['train']['data']['nbytes'] == 48
+    assert merged['train']['data']['max_seconds'] == 3e-6
+    assert merged['train']['data']['latency_histogram'] == {'1': 2, '4': 1}
+
+
+def test_print_info(capsys):
+    stats = AccessStats()
+    stats.record('train', 'data', 4, 64, 10e-6)
+
+    stats.print_info()
+
+    assert 'train/data: calls: 1, rows: 4, bytes: 64' in capsys.readouterr().out
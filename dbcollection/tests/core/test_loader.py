@@ -5,11 +5,19 @@ Test dbcollection/utils/loader.py.
 
 import os
 import sys
+import pickle
+import shutil
+import multiprocessing
 import numpy as np
 import h5py
 import pytest
 
-from dbcollection.core.loader import FieldLoader, SetLoader, DataLoader
+from dbcollection.core.chunk_cache import ChunkCache
+from dbcollection.core.loader import (FieldLoader, RaggedFieldLoader, SetLoader, DataLoader,
+                                     UnionSetLoader, HDF5FileHandler,
+                                     get_auto_chunk_cache_options)
+from dbcollection.utils.hdf5 import hdf5_write_data, hdf5_write_ragged_data, hdf5_write_union_set
+from dbcollection.utils.pad import pad_list
 from dbcollection.utils.string_ascii import convert_ascii_to_str as ascii_to_str
 from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
 
@@ -244,7 +252,7 @@ class TestFieldLoader:
             idx = [0, 0]
             data = field_loader.get(idx)
 
-            assert np.array_equal(data, set_data['data'][list(set(idx))])
+            assert np.array_equal(data, set_data['data'][idx])
 
         def test_get_single_obj_list_of_equal_indexes_in_memory(self):
             field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
@@ -253,7 +261,7 @@ class TestFieldLoader:
             idx = [0, 0]
             data = field_loader.get(idx)
 
-            assert np.array_equal(data, set_data['data'][list(set(idx))])
+            assert np.array_equal(data, set_data['data'][idx])
 
         def test_get_single_obj_list(self):
             field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
@@ -403,7 +411,7 @@ class TestFieldLoader:
             idx = [8, 2, 5, 1]
             data = field_loader.get(idx)
 
-            assert not np.array_equal(data, set_data['data'][idx])
+            assert np.array_equal(data, set_data['data'][idx])
 
         def test_get_multiple_objs_unordered_in_memory(self):
             field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
@@ -412,7 +420,49 @@ class TestFieldLoader:
             idx = [8, 2, 5, 1]
             data = field_loader.get(idx)
 
-            assert not np.array_equal(data, set_data['data'][idx])
+            assert np.array_equal(data, set_data['data'][idx])
+
+        def test_get_multiple_objs_unordered_with_duplicates(self):
+            field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+
+            idx = [8, 2, 8, 5, 1, 2]
+            data = field_loader.get(idx)
+
+            assert np.array_equal(data, set_data['data'][idx])
+
+        def test_get_multiple_objs_unordered_with_duplicates_in_memory(self):
+            field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+
+            field_loader.to_memory = True
+            idx = [8, 2, 8, 5, 1, 2]
+            data = field_loader.get(idx)
+
+            assert np.array_equal(data, set_data['data'][idx])
+
+        def test_get_multiple_objs_numpy_array(self):
+            field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+
+            idx = np.array([7, 3, 3, 0], dtype=np.int64)
+            data = field_loader.get(idx)
+
+            assert np.array_equal(data, set_data['data'][idx])
+
+        def test_get_single_obj_numpy_int(self):
+            field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+
+            idx = np.int64(4)
+            data = field_loader.get(idx)
+
+            assert np.array_equal(data, set_data['data'][idx])
+
+        def test_get_multi_obj_unordered_convert_to_string(self):
+            data_field = 'strings_list'
+            field_loader, set_data = db_generator.get_test_data_FieldLoader('train', data_field)
+
+            idx = [4, 0, 4]
+            data = field_loader.get(idx, convert_to_str=True)
+
+            assert data == ['string_4', 'string_0', 'string_4']
 
         def test_get_all_obj(self):
             field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
@@ -473,6 +523,19 @@ class TestFieldLoader:
 
         assert isinstance(field_loader.data, h5py._hl.dataset.Dataset)
 
+    def test_nbytes(self):
+        field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+
+        assert field_loader.nbytes == set_data['data'].nbytes
+
+    def test_access_count(self):
+        field_loader, _ = db_generator.get_test_data_FieldLoader('train')
+
+        field_loader.get(0)
+        field_loader[1]
+
+        assert field_loader.access_count == 2
+
     def test__len__(self):
         field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
 
@@ -540,6 +603,126 @@ class TestFieldLoader:
             assert np.array_equal(data, set_data['data'][0][0])
 
 
+class TestFieldLoaderMmap:
+    """Unit tests for accessing fields through memory-mapped arrays."""
+
+    def test_mmap_contiguous_field(self):
+        field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+
+        field_loader.mmap = True
+
+        assert field_loader.mmap
+        assert isinstance(field_loader.data, np.memmap)
+        assert np.array_equal(field_loader.get(), set_data['data'])
+
+    def test_mmap_init(self):
+        h5obj = db_generator.load_hdf5_file()
+
+        field_loader = FieldLoader(h5obj['/train/data'], mmap=True)
+
+        assert field_loader.mmap
+
+    def test_mmap_get(self):
+        field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+
+        field_loader.mmap = True
+
+        assert np.array_equal(field_loader.get(3), set_data['data'][3])
+        assert np.array_equal(field_loader.get([5, 1, 5]), set_data['data'][[5, 1, 5]])
+        assert np.array_equal(field_loader[2, 4], set_data['data'][2, 4])
+
+    def test_mmap_chunked_field_falls_back_to_hdf5(self, tmpdir):
+        h5obj = h5py.File(str(tmpdir.join('chunked.h5')), 'w')
+        data = np.arange(20).reshape(10, 2)
+        hdf5_write_data(h5obj.create_group('train'), 'data', data)
+        field_loader = FieldLoader(h5obj['/train/data'])
+
+        field_loader.mmap = True
+
+        assert not field_loader.mmap
+        assert isinstance(field_loader.data, h5py._hl.dataset.Dataset)
+        assert np.array_equal(field_loader.get([3, 1]), data[[3, 1]])
+        h5obj.close()
+
+    def test_mmap_to_memory_to_disk(self):
+        field_loader, _ = db_generator.get_test_data_FieldLoader('train')
+
+        field_loader.mmap = True
+        field_loader.to_memory = True
+        assert not isinstance(field_loader.data, np.memmap)
+        field_loader.to_memory = False
+
+        assert isinstance(field_loader.data, np.memmap)
+
+    def test_mmap_disable(self):
+        field_loader, _ = db_generator.get_test_data_FieldLoader('train')
+
+        field_loader.mmap = True
+        field_loader.mmap = False
+
+        assert not field_loader.mmap
+        assert isinstance(field_loader.data, h5py._hl.dataset.Dataset)
+
+    def test__str__mmap(self):
+        field_loader, _ = db_generator.get_test_data_FieldLoader('train')
+
+        field_loader.mmap = True
+
+        assert str(field_loader).startswith('FieldLoader: <numpy.memmap "data": shape (10, 10)')
+
+
+class TestFieldLoaderChunkCache:
+    """Unit tests for reading chunked fields through a ChunkCache."""
+
+    @pytest.fixture()
+    def chunked_field(self, tmpdir):
+        data = np.arange(200).reshape(20, 10)
+        h5obj = h5py.File(str(tmpdir.join('chunked.h5')), 'w')
+        hdf5_write_data(h5obj.create_group('train'), 'data', data, chunks=(4, 10))
+        field_loader = FieldLoader(h5obj['/train/data'], chunk_cache=ChunkCache(10000))
+        yield field_loader, data
+        h5obj.close()
+
+    def test_get_single_obj(self, chunked_field):
+        field_loader, data = chunked_field
+
+        for idx in range(len(data)):
+            assert np.array_equal(field_loader.get(idx), data[idx])
+
+        assert field_loader.chunk_cache.misses == 5
+        assert field_loader.chunk_cache.hits == 15
+
+    def test_get_negative_index(self, chunked_field):
+        field_loader, data = chunked_field
+
+        assert np.array_equal(field_loader.get(-1), data[-1])
+
+    def test_get_multiple_objs_unordered(self, chunked_field):
+        field_loader, data = chunked_field
+
+        idx = [17, 1, 2, 17, 9]
+        out = field_loader.get(idx)
+
+        assert np.array_equal(out, data[idx])
+        assert field_loader.chunk_cache.misses == 3
+
+    def test__index__single_obj(self, chunked_field):
+        field_loader, data = chunked_field
+
+        assert np.array_equal(field_loader[5], data[5])
+        assert field_loader[5, 3] == data[5, 3]
+        assert np.array_equal(field_loader[2:6], data[2:6])
+
+    def test_in_memory_skips_cache(self, chunked_field):
+        field_loader, data = chunked_field
+
+        field_loader.to_memory = True
+        out = field_loader.get([3, 1])
+
+        assert np.array_equal(out, data[[3, 1]])
+        assert field_loader.chunk_cache.misses == 0
+
+
 def get_expected_object_values(set_data, fields, idx):
     """Get the expected values of an object index from the test dataset."""
     assert set_data
@@ -583,6 +766,133 @@ def compare_single_lists(listA, listB):
     return True
 
 
+class TestRaggedFieldLoader:
+    """Unit tests for fields stored in a ragged layout."""
+
+    lists = [[0, 1, 2], [], [3], [4, 5, 6, 7], [8]]
+
+    @pytest.fixture()
+    def set_loader(self, tmpdir):
+        h5obj = h5py.File(str(tmpdir.join('ragged.h5')), 'w')
+        group = h5obj.create_group('train')
+        group['object_fields'] = str_to_ascii(['number'])
+        group['object_ids'] = np.arange(5).reshape(5, 1)
+        group['number'] = np.arange(5)
+        hdf5_write_ragged_data(group, 'list_ragged', self.lists, dtype=np.int32, contiguous=True)
+        hdf5_write_data(group, 'list_padded', np.array(pad_list(self.lists, -1), dtype=np.int32))
+        yield SetLoader(h5obj['train'])
+        h5obj.close()
+
+    def test_field_loader_class(self, set_loader):
+        assert isinstance(set_loader.fields['list_ragged'], RaggedFieldLoader)
+        assert not isinstance(set_loader.fields['list_padded'], RaggedFieldLoader)
+
+    def test_shape(self, set_loader):
+        field_loader = set_loader.fields['list_ragged']
+
+        assert field_loader.shape == (5, 4)
+        assert field_loader.type == np.int32
+        assert field_loader.fillvalue == -1
+        assert len(field_loader) == 5
+
+    def test_nbytes(self, set_loader):
+        # 9 int32 values + 6 int64 offsets
+        assert set_loader.fields['list_ragged'].nbytes == 9 * 4 + 6 * 8
+
+    def test_size_does_not_load_field(self, set_loader):
+        assert set_loader.size('list_ragged') == (5, 4)
+        assert not set_loader.fields.is_loaded('list_ragged')
+
+    def test_get_padded_view(self, set_loader):
+        padded = set_loader.get('list_padded')
+
+        assert np.array_equal(set_loader.get('list_ragged'), padded)
+        assert np.array_equal(set_loader.get('list_ragged', 3), padded[3])
+        assert np.array_equal(set_loader.get('list_ragged', [4, 1, 4]), padded[[4, 1, 4]])
+        assert np.array_equal(set_loader.get('list_ragged', -2), padded[-2])
+
+    def test_getitem_padded_view(self, set_loader):
+        field_loader = set_loader.fields['list_ragged']
+        padded = set_loader.get('list_padded')
+
+        assert np.array_equal(field_loader[0], padded[0])
+        assert np.array_equal(field_loader[1:4], padded[1:4])
+        assert np.array_equal(field_loader[3, 1:3], padded[3, 1:3])
+        assert np.array_equal(field_loader[::-2, 0], padded[::-2, 0])
+
+    @pytest.mark.parametrize('field', ['list_ragged', 'list_padded'])
+    def test_get_list(self, set_loader, field):
+        field_loader = set_loader.fields[field]
+
+        assert field_loader.get_list(3).tolist() == self.lists[3]
+        assert field_loader.get_list(1).tolist() == []
+        assert [row.tolist() for row in field_loader.get_list([3, 1, 0])] == \
+            [self.lists[3], self.lists[1], self.lists[0]]
+        assert [row.tolist() for row in field_loader.get_list()] == self.lists
+        assert field_loader.get_list([]) == []
+
+    def test_get_list_reads_only_requested_rows(self, set_loader, mocker):
+        values = set_loader.hdf5_group['list_ragged/values']
+        reads = []
+
+        class ValuesReader(object):
+            def __getitem__(self, idx):
+                reads.append((idx.start, idx.stop))
+                return values[idx]
+
+        mocker.patch.object(RaggedFieldLoader, 'data', new_callable=mocker.PropertyMock,
+                            return_value=ValuesReader())
+        rows = set_loader.fields['list_ragged'].get_list([4, 0, 4, 1])
+
+        assert [row.tolist() for row in rows] == \
+            [self.lists[4], self.lists[0], self.lists[4], self.lists[1]]
+        assert reads == [(0, 3), (8, 9)]  # rows 0 and 1 are adjacent
+
+    def test_get_list_raises_error_invalid_index(self, set_loader):
+        with pytest.raises(IndexError):
+            set_loader.fields['list_ragged'].get_list(5)
+
+    def test_to_memory(self, set_loader):
+        field_loader = set_loader.fields['list_ragged']
+
+        field_loader.to_memory = True
+
+        assert isinstance(field_loader.data, np.ndarray)
+        assert field_loader.get_list(3).tolist() == self.lists[3]
+        assert np.array_equal(field_loader.get([2, 0]), set_loader.get('list_padded', [2, 0]))
+
+    def test_mmap(self, set_loader):
+        field_loader = set_loader.fields['list_ragged']
+
+        field_loader.mmap = True
+
+        assert field_loader.mmap
+        assert isinstance(field_loader.data, np.memmap)
+        assert [row.tolist() for row in field_loader.get_list([4, 3])] == \
+            [self.lists[4], self.lists[3]]
+
+    def test_to_memory_shared(self, set_loader):
+        field_loader = RaggedFieldLoader(set_loader.hdf5_group['list_ragged'], shared_memory=True)
+
+        field_loader.to_memory = True
+
+        assert isinstance(field_loader.data, np.memmap)
+        assert field_loader.get_list(3).tolist() == self.lists[3]
+        field_loader.to_memory = False
+
+    def test_pickle(self, set_loader):
+        field_loader = pickle.loads(pickle.dumps(set_loader.fields['list_ragged']))
+
+        assert isinstance(field_loader, RaggedFieldLoader)
+        assert field_loader.get_list(0).tolist() == self.lists[0]
+
+    def test__str__(self, set_loader):
+        field_loader = set_loader.fields['list_ragged']
+
+        assert str(field_loader) == 'FieldLoader: <HDF5 ragged dataset "list_ragged": ' \
+                                    'shape (5, 4), type "int32", values 9>'
+
+
 class TestSetLoader:
     """Unit tests for the SetLoader class."""
 
@@ -661,7 +971,7 @@ class TestSetLoader:
             idx = [0, 0]
             data = set_loader.get(field, idx)
 
-            assert np.array_equal(data, set_data[field][list(set(idx))])
+            assert np.array_equal(data, set_data[field][idx])
 
         def test_get_data_two_objs_in_memory(self):
             set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
@@ -671,7 +981,7 @@ class TestSetLoader:
             set_loader.fields[field].to_memory = True
             data = set_loader.get(field, idx)
 
-            assert np.array_equal(data, set_data[field][list(set(idx))])
+            assert np.array_equal(data, set_data[field][idx])
 
         def test_get_data_multiple_objs(self):
             set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
@@ -781,6 +1091,213 @@ class TestSetLoader:
 
             assert compare_lists(data, expected)
 
+    class TestObjectColumns:
+        """Group tests for the object_columns() method."""
+
+        @pytest.fixture()
+        def set_with_undefined_ids(self, tmpdir):
+            h5obj = h5py.File(str(tmpdir.join('objects.h5')), 'w')
+            group = h5obj.create_group('train')
+            group['boxes'] = np.arange(20).reshape(5, 4)
+            group['labels'] = np.array([10, 11, 12])
+            group['object_fields'] = str_to_ascii(['boxes', 'labels'])
+            group['object_ids'] = np.array([[0, 2], [1, -1], [4, 0], [3, -1]])
+            yield SetLoader(h5obj['train'])
+            h5obj.close()
+
+        def test_object_columns(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            idx = [4, 0, 4]
+            columns = set_loader.object_columns(idx)
+
+            for field in set_loader.object_fields:
+                assert np.array_equal(columns[field], set_data[field][idx])
+                assert not columns[field].mask.any()
+
+        def test_object_columns_single_obj(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            columns = set_loader.object_columns(2)
+
+            assert np.array_equal(columns['data'], set_data['data'][[2]])
+
+        def test_object_columns_all_objs(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            columns = set_loader.object_columns()
+
+            assert np.array_equal(columns['number'], set_data['number'])
+
+        def test_object_columns_masks_undefined_ids(self, set_with_undefined_ids):
+            set_loader = set_with_undefined_ids
+
+            columns = set_loader.object_columns([3, 0, 1])
+
+            assert np.array_equal(columns['boxes'], [[12, 13, 14, 15], [0, 1, 2, 3], [4, 5, 6, 7]])
+            assert columns['labels'].mask.tolist() == [True, False, True]
+            assert columns['labels'][1] == 12
+
+        def test_object_values_undefined_ids(self, set_with_undefined_ids):
+            set_loader = set_with_undefined_ids
+
+            data = set_loader.object([1, 2], convert_to_value=True)
+
+            assert np.array_equal(data[0][0], [4, 5, 6, 7])
+            assert data[0][1] == []
+            assert np.array_equal(data[1][0], [16, 17, 18, 19])
+            assert data[1][1] == 10
+
+    class TestIterBatches:
+        """Group tests for the iter_batches() method."""
+
+        def test_iter_batches(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            batches = list(set_loader.iter_batches(['data', 'number'], batch_size=4))
+
+            assert len(batches) == 3
+            assert np.array_equal(batches[0]['data'], set_data['data'][0:4])
+            assert np.array_equal(batches[2]['number'], set_data['number'][8:10])
+
+        def test_iter_batches_default_fields(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            batch = next(set_loader.iter_batches(batch_size=2))
+
+            assert list(batch.keys()) == ['object_ids']
+            assert np.array_equal(batch['object_ids'], set_data['object_ids'][0:2])
+
+        def test_iter_batches_default_fields_per_image_and_object(self, tmpdir):
+            with h5py.File(str(tmpdir.join('objects.h5')), 'w') as h5obj:
+                group = h5obj.create_group('train')
+                group['image_filenames'] = str_to_ascii(['a.jpg', 'b.jpg', 'c.jpg'])
+                group['boxes'] = np.arange(20).reshape(5, 4)
+                group['object_fields'] = str_to_ascii(['image_filenames', 'boxes'])
+                group['object_ids'] = np.array([[0, 0], [0, 1], [1, 2], [2, 3], [2, 4]])
+                set_loader = SetLoader(group)
+
+                batches = list(set_loader.iter_batches(batch_size=2))
+
+                assert [len(batch['object_ids']) for batch in batches] == [2, 2, 1]
+                assert np.array_equal(batches[1]['object_ids'], [[1, 2], [2, 3]])
+
+        def test_iter_batches_drop_last(self):
+            set_loader, _, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            batches = list(set_loader.iter_batches('data', batch_size=4, drop_last=True))
+
+            assert [len(batch['data']) for batch in batches] == [4, 4]
+
+        def test_iter_batches_shuffle_is_seeded(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            batches1 = list(set_loader.iter_batches('number', batch_size=3, shuffle=True, seed=4))
+            batches2 = list(set_loader.iter_batches('number', batch_size=3, shuffle=True, seed=4))
+
+            numbers = np.concatenate([batch['number'] for batch in batches1])
+            assert sorted(numbers.tolist()) == sorted(set_data['number'].tolist())
+            for batch1, batch2 in zip(batches1, batches2):
+                assert np.array_equal(batch1['number'], batch2['number'])
+
+        def test_iter_batches_without_prefetch(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            batches = list(set_loader.iter_batches('data', batch_size=1, prefetch=0))
+
+            assert len(batches) == 10
+            assert np.array_equal(batches[5]['data'], set_data['data'][[5]])
+
+        def test_iter_batches_stop_early(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            batches = set_loader.iter_batches('data', batch_size=2, prefetch=3)
+            batch = next(batches)
+            batches.close()
+
+            assert np.array_equal(batch['data'], set_data['data'][0:2])
+
+        def test_iter_batches_raises_error_invalid_field(self):
+            set_loader, _, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            with pytest.raises(KeyError):
+                set_loader.iter_batches('invalid_field')
+
+        def test_iter_batches_raises_error_fields_different_sizes(self):
+            set_loader, _, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            with pytest.raises(ValueError):
+                set_loader.iter_batches(['data', 'object_ids', 'object_fields'])
+
+        def test_iter_batches_raises_error_invalid_batch_size(self):
+            set_loader, _, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            with pytest.raises(AssertionError):
+                set_loader.iter_batches('data', batch_size=0)
+
+        def test_iter_batches_shuffle_chunks(self):
+            set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+            batches = list(set_loader.iter_batches('number', batch_size=3, shuffle='chunks', seed=4))
+
+            numbers = np.concatenate([batch['number'] for batch in batches])
+            assert sorted(numbers.tolist()) == sorted(set_data['number'].tolist())
+
+    def test_subset(self):
+        set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+        subset = set_loader.subset([2, 0])
+
+        assert len(subset) == 2
+        assert np.array_equal(subset.object(0), set_data['object_ids'][2])
+        assert np.array_equal(subset.object(), set_data['object_ids'][[2, 0]])
+
+    def test_subset_raise_error_invalid_index(self):
+        set_loader, _, _ = db_generator.get_test_dataset_SetLoader('train')
+
+        with pytest.raises(IndexError):
+            set_loader.subset([len(set_loader)])
+
+    class TestSampler:
+        """Group tests for the sampler() method."""
+
+        @pytest.fixture()
+        def set_loader(self, tmpdir):
+            h5obj = h5py.File(str(tmpdir.join('chunks.h5')), 'w')
+            group = h5obj.create_group('train')
+            group['object_fields'] = str_to_ascii(['data', 'label'])
+            group['object_ids'] = np.stack([np.arange(100)] * 2, axis=1)
+            hdf5_write_data(group, 'data', np.zeros((100, 4)), chunks=(10, 4))
+            hdf5_write_data(group, 'label', np.zeros(100), chunks=(4,))
+            hdf5_write_data(group, 'number', np.arange(100), contiguous=True)
+            yield SetLoader(h5obj['train'])
+            h5obj.close()
+
+        def test_sampler_is_aligned_to_chunks(self, set_loader):
+            sampler = set_loader.sampler(['data', 'label'], buffer_size=1, seed=0)
+
+            indexes = sampler.get_indexes()
+            assert sampler.group_rows == 20  # least common multiple of 10 and 4
+            assert sorted(indexes.tolist()) == list(range(100))
+            for i in range(0, 100, 20):
+                assert len(set(indexes[i:i + 20] // 20)) == 1
+
+        def test_sampler_ignores_fields_in_memory(self, set_loader):
+            set_loader.fields['label'].to_memory = True
+
+            sampler = set_loader.sampler(['data', 'label'], chunks_per_group=2)
+
+            assert sampler.group_rows == 20
+
+        def test_sampler_not_chunked(self, set_loader):
+            sampler = set_loader.sampler('number')
+
+            assert sampler.group_rows == 1
+
+        def test_sampler_raises_error_invalid_field(self, set_loader):
+            with pytest.raises(KeyError):
+                set_loader.sampler('invalid_field')
+
     def test_size(self):
         set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
 
@@ -837,6 +1354,129 @@ class TestSetLoader:
         assert str(set_loader) == matching_str
 
 
+class TestUnionSetLoader:
+    """Unit tests for sets stored as the union of other sets."""
+
+    @pytest.fixture()
+    def data_loader(self, tmpdir):
+        filepath = str(tmpdir.join('union.h5'))
+        sets = {
+            "train": {
+                "object_ids": [[0, 0, 0], [0, 1, 1], [1, 1, 2]],
+                "boxes": [[0, 0, 1, 1], [1, 1, 2, 2], [2, 2, 3, 3]],
+                "list_boxes_per_image": [[0, 1], [2]],
+                "list_object_ids_per_class": [[0], [1, 2]],
+            },
+            "val": {
+                "object_ids": [[0, 1, 0], [-1, 0, 1]],
+                "boxes": [[4, 4, 5, 5], [5, 5, 6, 6]],
+                "list_boxes_per_image": [[0], [1]],
+                "list_object_ids_per_class": [[1], [0]],
+            },
+        }
+        h5obj = h5py.File(filepath, 'w')
+        for set_name, fields in sets.items():
+            group = h5obj.create_group(set_name)
+            group['object_fields'] = str_to_ascii(['image_filenames', 'classes', 'boxes'])
+            group['classes'] = str_to_ascii(['cat', 'dog'])
+            images = ['{}_{}.jpg'.format(set_name, i) for i in range(len(fields["list_boxes_per_image"]))]
+            hdf5_write_data(group, 'image_filenames', str_to_ascii(images), fillvalue=0)
+            hdf5_write_data(group, 'object_ids', np.array(fields["object_ids"], dtype=np.int32))
+            hdf5_write_data(group, 'boxes', np.array(fields["boxes"], dtype=np.float32))
+            hdf5_write_data(group, 'list_boxes_per_image',
+                            np.array(pad_list(fields["list_boxes_per_image"], -1), dtype=np.int32))
+            hdf5_write_ragged_data(group, 'list_object_ids_per_class',
+                                   fields["list_object_ids_per_class"], dtype=np.int32)
+        hdf5_write_union_set(h5obj, 'trainval', ('train', 'val'), {
+            'classes': 'shared',
+            'list_boxes_per_image': ('concat', 'boxes'),
+            'list_object_ids_per_class': ('merge', 'object_ids'),
+        })
+        h5obj.close()
+        return DataLoader('some_db', 'task', str(tmpdir), filepath)
+
+    def test_union_set_loader(self, data_loader):
+        set_loader = data_loader.sets['trainval']
+
+        assert isinstance(set_loader, UnionSetLoader)
+        assert len(set_loader) == 5
+        assert list(set_loader.object_fields) == ['image_filenames', 'classes', 'boxes']
+        assert sorted(set_loader.list()) == sorted(data_loader.sets['train'].list())
+
+    def test_object_ids_are_remapped(self, data_loader):
+        object_ids = data_loader.get('trainval', 'object_ids')
+
+        assert object_ids.tolist() == [[0, 0, 0], [0, 1, 1], [1, 1, 2], [2, 1, 3], [-1, 0, 4]]
+
+    def test_concat_fields(self, data_loader):
+        assert data_loader.size('trainval', 'boxes') == (5, 4)
+        assert data_loader.get('trainval', 'boxes', 3).tolist() == [4, 4, 5, 5]
+        assert data_loader.get('trainval', 'image_filenames', [2, 0], convert_to_str=True) == \
+            ['val_0.jpg', 'train_0.jpg']
+
+    def test_shared_fields(self, data_loader):
+        assert data_loader.size('trainval', 'classes') == (2, 4)
+        assert data_loader.get('trainval', 'classes', convert_to_str=True) == ['cat', 'dog']
+
+    def test_list_fields_are_remapped(self, data_loader):
+        assert data_loader.get('trainval', 'list_boxes_per_image').tolist() == \
+            [[0, 1], [2, -1], [3, -1], [4, -1]]
+        assert data_loader.get('trainval', 'list_object_ids_per_class').tolist() == \
+            [[0, 4, -1], [1, 2, 3]]
+
+    def test_object_values(self, data_loader):
+        values = data_loader.object('trainval', 4, convert_to_value=True)
+
+        assert values[0] == []
+        assert ascii_to_str(values[1]) == 'cat'
+        assert values[2].tolist() == [5, 5, 6, 6]
+
+    def test_getitem(self, data_loader):
+        field_loader = data_loader.sets['trainval'].fields['object_ids']
+
+        assert field_loader[3].tolist() == [2, 1, 3]
+        assert field_loader[1:4, 2].tolist() == [1, 2, 3]
+
+    def test_getitem_raise_error_out_of_range(self, data_loader):
+        field_loader = data_loader.sets['trainval'].fields['boxes']
+
+        with pytest.raises(IndexError):
+            field_loader[5]
+
+    def test_to_memory(self, data_loader):
+        field_loader = data_loader.sets['trainval'].fields['boxes']
+
+        field_loader.to_memory = True
+
+        assert field_loader.to_memory
+        assert data_loader.sets['train'].fields['boxes'].to_memory
+        assert field_loader.get(4).tolist() == [5, 5, 6, 6]
+
+    def test_to_memory_plan_counts_union_fields_once(self, data_loader):
+        budget_bytes = data_loader.sets['train'].fields['boxes'].nbytes + \
+            data_loader.sets['val'].fields['boxes'].nbytes
+
+        plan = data_loader.to_memory(budget_bytes, policy='priority', priority={'boxes': 1},
+                                     verbose=False)
+
+        assert all(field["to_memory"] for field in plan["fields"])
+        assert plan["nbytes"] == budget_bytes
+        assert data_loader.sets['trainval'].fields['boxes'].to_memory
+
+    def test_where(self, data_loader):
+        object_ids = data_loader.where('trainval', classes='dog')
+
+        assert object_ids.tolist() == [1, 2, 3]
+
+    def test_pickle(self, data_loader):
+        set_loader = data_loader.sets['trainval']
+
+        new_set_loader = pickle.loads(pickle.dumps(set_loader))
+
+        assert isinstance(new_set_loader, UnionSetLoader)
+        assert np.array_equal(new_set_loader.get('object_ids'), set_loader.get('object_ids'))
+
+
 class TestDataLoader:
     """Unit tests for the DataLoader class."""
 
@@ -853,6 +1493,148 @@ class TestDataLoader:
         assert data_loader.data_dir == data_dir
         assert data_loader.hdf5_filepath == hdf5_file
         assert 'train' in data_loader.sets
+        assert data_loader.chunk_cache is None
+
+    def test__init__loads_sets_lazily(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        assert data_loader.sets.loaded() == ()
+        assert data_loader.object_fields.loaded() == ()
+
+        set_loader = data_loader.sets['train']
+
+        assert data_loader.sets.loaded() == ('train',)
+        assert data_loader.sets['train'] is set_loader
+        assert set_loader.fields.loaded() == ()
+
+    def test_size_and_list_do_not_load_fields(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+
+        size = data_loader.size('train', 'data')
+        fields = data_loader.list('train')
+
+        assert size == dataset['train']['data'].shape
+        assert fields == tuple(sorted(dataset['train']))
+        assert data_loader.sets['train'].fields.loaded() == ()
+
+    def test_get_loads_single_field(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+
+        data_loader.get('train', 'data', 0)
+
+        assert data_loader.sets['train'].fields.loaded() == ('data',)
+
+    def test__init__with_mmap(self):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file, mmap=True)
+
+        assert data_loader.sets['train'].fields['data'].mmap
+
+    def test__init__with_chunk_cache(self):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file,
+                                 chunk_cache_bytes=1024)
+
+        assert isinstance(data_loader.chunk_cache, ChunkCache)
+        assert data_loader.sets['train'].chunk_cache is data_loader.chunk_cache
+        assert data_loader.sets['train'].fields['data'].chunk_cache is data_loader.chunk_cache
+
+    @pytest.fixture()
+    def hdf5_file_copy(self, tmpdir):
+        """Copy of the test file (the HDF5 library ignores the options of files already open)."""
+        filepath = str(tmpdir.join('copy.h5'))
+        shutil.copyfile(db_generator.get_test_hdf5_filepath_DataLoader(), filepath)
+        return filepath
+
+    def test__init__with_hdf5_options(self, hdf5_file_copy):
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file_copy,
+                                 hdf5_options={'rdcc_nbytes': 4 * 1024 ** 2, 'rdcc_nslots': 10007})
+
+        _, nslots, nbytes, _ = data_loader.hdf5_file.id.get_access_plist().get_cache()
+        assert (nslots, nbytes) == (10007, 4 * 1024 ** 2)
+
+    def test__init__with_hdf5_options_auto_chunk_cache(self, hdf5_file_copy):
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file_copy,
+                                 hdf5_options={'rdcc_nbytes': 'auto'})
+
+        auto_options = get_auto_chunk_cache_options(hdf5_file_copy)
+        _, nslots, nbytes, _ = data_loader.hdf5_file.id.get_access_plist().get_cache()
+        assert (nslots, nbytes) == (auto_options["rdcc_nslots"], auto_options["rdcc_nbytes"])
+
+    def test__init__with_hdf5_options_does_not_pass_cache_options_to_h5py(self, mocker,
+                                                                        hdf5_file_copy):
+        mock_file = mocker.patch('dbcollection.core.loader.h5py.File', wraps=h5py.File)
+
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file_copy,
+                                 hdf5_options={'rdcc_nbytes': 4 * 1024 ** 2, 'rdcc_w0': 0.5})
+
+        assert not any(key.startswith('rdcc_') for call in mock_file.call_args_list
+                       for key in call[1])
+        _, _, nbytes, w0 = data_loader.hdf5_file.id.get_access_plist().get_cache()
+        assert (nbytes, w0) == (4 * 1024 ** 2, 0.5)
+
+    def test__init__with_hdf5_options_core_driver_and_chunk_cache(self, hdf5_file_copy):
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file_copy,
+                                 hdf5_options={'driver': 'core', 'rdcc_nbytes': 2 * 1024 ** 2,
+                                               'rdcc_nslots': 1009})
+
+        _, nslots, nbytes, _ = data_loader.hdf5_file.id.get_access_plist().get_cache()
+        assert (nslots, nbytes) == (1009, 2 * 1024 ** 2)
+        assert data_loader.hdf5_file.driver == 'core'
+
+    def test__init__with_hdf5_options_core_driver(self, hdf5_file_copy):
+        dataset = db_generator.dataset
+
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file_copy,
+                                 hdf5_options={'driver': 'core'}, mmap=True)
+
+        assert data_loader.hdf5_file.driver == 'core'
+        assert np.array_equal(data_loader.get('train', 'data', 1), dataset['train']['data'][1])
+
+    def test__init__with_stats(self):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file, stats=True)
+
+        data_loader.get('train', 'data', [0, 2])
+        data_loader.sets['train'].fields['number'][1:4]
+        data_loader.object('train', 0)
+
+        stats = data_loader.get_stats('train')
+        assert sorted(stats['train'].keys()) == ['data', 'number', 'object()', 'object_ids']
+        assert stats['train']['data']["rows"] == 2
+        assert stats['train']['number']["rows"] == 3
+        assert stats['train']['object()']["calls"] == 1
+
+    def test_get_stats_disabled(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+        data_loader.get('train', 'data', 0)
+
+        assert data_loader.stats is None
+        assert data_loader.get_stats() == {}
+
+    def test_info_with_stats(self, capsys):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file, stats=True)
+        data_loader.get('train', 'data', 0)
+
+        data_loader.info('train')
+
+        assert 'train/data: calls: 1, rows: 1' in capsys.readouterr().out
+
+    def test_get_auto_chunk_cache_options(self, tmpdir):
+        filepath = str(tmpdir.join('chunks.h5'))
+        with h5py.File(filepath, 'w') as h5obj:
+            h5obj.create_dataset('small', data=np.zeros((100, 10), dtype=np.uint8), chunks=(10, 10))
+            h5obj.create_dataset('large', data=np.zeros((1000, 256)), chunks=(100, 256))
+            h5obj['contiguous'] = np.zeros((10, 10))
+
+        options = get_auto_chunk_cache_options(filepath)
+
+        assert options["rdcc_nbytes"] == 32 * 100 * 256 * 8
+        assert options["rdcc_nslots"] >= 2 ** 20
+        assert all(options["rdcc_nslots"] % i for i in range(2, 1000))
 
     class TestGet:
         """Group tests for the get() method."""
@@ -978,6 +1760,125 @@ class TestDataLoader:
 
             assert np.array_equal(data, dataset[set_name]['object_ids'])
 
+    def test_object_columns(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+
+        columns = data_loader.object_columns('train', [3, 1])
+
+        assert np.array_equal(columns['data'], dataset['train']['data'][[3, 1]])
+
+    def test_object_columns_raise_error_invalid_set(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        with pytest.raises(KeyError):
+            data_loader.object_columns('val', [3, 1])
+
+    def test_where(self, mocker):
+        mock_where = mocker.patch.object(SetLoader, 'where', return_value=np.array([1, 4]))
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        object_ids = data_loader.where('train', number__gt=3)
+
+        mock_where.assert_called_once_with(number__gt=3)
+        assert object_ids.tolist() == [1, 4]
+
+    def test_where_raise_error_invalid_set(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        with pytest.raises(KeyError):
+            data_loader.where('val', number=3)
+
+    def test_select(self, mocker):
+        mock_select = mocker.patch.object(SetLoader, 'select', return_value={})
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        data_loader.select('train', 'data', number__gt=3)
+
+        mock_select.assert_called_once_with('data', number__gt=3)
+
+    def test_sampler(self, mocker):
+        mock_sampler = mocker.patch.object(SetLoader, 'sampler', return_value='sampler')
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        sampler = data_loader.sampler('train', 'data', seed=3)
+
+        mock_sampler.assert_called_once_with('data', 1, None, 3)
+        assert sampler == 'sampler'
+
+    def test_sampler_raise_error_invalid_set(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        with pytest.raises(KeyError):
+            data_loader.sampler('val')
+
+    def test_to_memory_frequency_policy(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+        for i in range(3):
+            data_loader.get('train', 'number', i)
+        for i in range(2):
+            data_loader.get('train', 'data', i)
+        data_loader.get('test', 'data', 0)
+        budget_bytes = dataset['train']['number'].nbytes + dataset['train']['data'].nbytes
+
+        plan = data_loader.to_memory(budget_bytes, verbose=False)
+
+        assert [(field["set"], field["field"], field["score"], field["to_memory"])
+                for field in plan["fields"]] == [('train', 'number', 3, True),
+                                                 ('train', 'data', 2, True),
+                                                 ('test', 'data', 1, False)]
+        assert plan["nbytes"] == budget_bytes
+        assert data_loader.sets['train'].fields['number'].to_memory
+        assert data_loader.sets['train'].fields['data'].to_memory
+        assert not data_loader.sets['test'].fields['data'].to_memory
+
+    def test_to_memory_priority_policy(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+        budget_bytes = dataset['train']['data'].nbytes
+
+        plan = data_loader.to_memory(budget_bytes, policy='priority',
+                                     priority={'data': 1, ('train', 'data'): 2}, verbose=False)
+
+        assert [(field["set"], field["field"], field["to_memory"])
+                for field in plan["fields"]] == [('train', 'data', True), ('test', 'data', False)]
+        assert data_loader.sets['train'].fields['data'].to_memory
+        assert not data_loader.sets['test'].fields['data'].to_memory
+
+    def test_to_memory_size_policy(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        plan = data_loader.to_memory(0, policy='size', verbose=False)
+
+        nbytes = [field["nbytes"] for field in plan["fields"]]
+        assert nbytes == sorted(nbytes)
+        assert not any(field["to_memory"] for field in plan["fields"])
+        assert plan["nbytes"] == 0
+
+    def test_to_memory_unpins_fields_out_of_budget(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+        data_loader.sets['train'].fields['data'].to_memory = True
+
+        data_loader.to_memory(10 ** 6, policy='priority', priority={'number': 1}, verbose=False)
+
+        assert not data_loader.sets['train'].fields['data'].to_memory
+        assert data_loader.sets['train'].fields['number'].to_memory
+
+    def test_to_memory_keeps_fields_already_in_memory(self, mocker):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+        priority = {'data': 1, 'number': 1}
+        data_loader.to_memory(10 ** 6, policy='priority', priority=priority, verbose=False)
+        mock_read = mocker.spy(FieldLoader, '_read_to_memory')
+
+        data_loader.to_memory(10 ** 6, policy='priority', priority=priority, verbose=False)
+
+        assert mock_read.call_count == 0
+        assert data_loader.sets['train'].fields['data'].to_memory
+
+    def test_to_memory_raise_error_invalid_policy(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        with pytest.raises(ValueError):
+            data_loader.to_memory(100, policy='random')
+
     class TestSize:
         """Group tests for the size() method."""
 
@@ -1102,6 +2003,35 @@ class TestDataLoader:
             set_name = 'val'
             data_loader.info(set_name)
 
+    def test_subset(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+
+        subset = data_loader.subset('train', [1])
+
+        assert subset.size() == (1,) + dataset['train']['object_ids'].shape[1:]
+
+    def test_subset_raise_error_invalid_set(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        with pytest.raises(KeyError):
+            data_loader.subset('val', [0])
+
+    def test_shard(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+
+        set_name = 'train'
+        shards = [data_loader.shard(rank, 2, by='stride', equal_length=None) for rank in range(2)]
+
+        num_objects = len(dataset[set_name]['object_ids'])
+        assert sum(shard.size(set_name)[0] for shard in shards) == num_objects
+        assert np.array_equal(shards[1].object(set_name, 0), dataset[set_name]['object_ids'][1])
+
+    def test_shard_raise_error_invalid_mode(self):
+        data_loader, _, _ = db_generator.get_test_dataset_DataLoader()
+
+        with pytest.raises(ValueError):
+            data_loader.shard(0, 2, by='random')
+
     def test__len__(self):
         data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
 
@@ -1115,3 +2045,214 @@ class TestDataLoader:
         matching_str = "DataLoader: some_db ('task' task)"
 
         assert str(data_loader) == matching_str
+
+
+def fetch_data_from_loader(args):
+    data_loader, idx = args
+    return data_loader.get('train', 'data', idx)
+
+
+class TestMultiProcess:
+    """Unit tests for using the loaders across processes."""
+
+    def test_file_handler_reopens_after_pid_change(self, mocker):
+        file_handler = HDF5FileHandler(db_generator.get_test_hdf5_filepath_DataLoader())
+        hdf5_file = file_handler.file
+
+        mocker.patch('dbcollection.core.loader.os.getpid', return_value=-1)
+
+        assert file_handler.file is not hdf5_file
+        assert file_handler.generation == 1
+
+    def test_file_handler_reopens_with_options(self, mocker):
+        file_handler = HDF5FileHandler(db_generator.get_test_hdf5_filepath_DataLoader(),
+                                       options={'driver': 'core'})
+
+        mocker.patch('dbcollection.core.loader.os.getpid', return_value=-1)
+
+        assert file_handler.file.driver == 'core'
+
+    def test_data_loader_reopens_after_pid_change(self, mocker):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+        field_loader = data_loader.sets['train'].fields['data']
+        hdf5_handler = field_loader.hdf5_handler
+
+        mocker.patch('dbcollection.core.loader.os.getpid', return_value=-1)
+        data = data_loader.get('train', 'data', [3, 1])
+
+        assert np.array_equal(data, dataset['train']['data'][[3, 1]])
+        assert field_loader.hdf5_handler is not hdf5_handler
+        assert field_loader.hdf5_handler.id.valid
+
+    def test_pickle_data_loader(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+        data_loader.sets['train'].fields['number'].to_memory = True
+
+        pickled = pickle.dumps(data_loader)
+        new_data_loader = pickle.loads(pickled)
+
+        assert len(pickled) < 1000
+        assert new_data_loader.db_name == data_loader.db_name
+        assert new_data_loader.sets['train'].fields['number'].to_memory
+        assert np.array_equal(new_data_loader.get('train', 'data', 2), dataset['train']['data'][2])
+
+    def test_pickle_data_loader_with_chunk_cache(self):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file,
+                                 chunk_cache_bytes=1024, mmap=True)
+
+        new_data_loader = pickle.loads(pickle.dumps(data_loader))
+
+        assert new_data_loader.chunk_cache.max_bytes == 1024
+        assert new_data_loader.chunk_cache is not data_loader.chunk_cache
+        assert new_data_loader.mmap
+
+    def test_pickle_data_loader_with_stats_filepath(self, tmpdir):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+        stats_filepath = str(tmpdir.join('stats.json'))
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file,
+                                 stats_filepath=stats_filepath)
+
+        new_data_loader = pickle.loads(pickle.dumps(data_loader))
+
+        assert new_data_loader.stats.filepath == stats_filepath
+        assert new_data_loader.stats is not data_loader.stats
+        assert new_data_loader.sets['train'].fields['data'].stats is new_data_loader.stats
+
+    def test_pickle_set_loader_shares_stats(self, tmpdir):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+        stats_filepath = str(tmpdir.join('stats.json'))
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file,
+                                 stats_filepath=stats_filepath)
+        data_loader.sets['train'].fields['data']
+
+        set_loader = pickle.loads(pickle.dumps(data_loader.sets['train']))
+
+        assert set_loader.stats.filepath == stats_filepath
+        assert set_loader.fields['data'].stats is set_loader.stats
+
+    def test_pickle_data_loader_with_hdf5_options(self):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+        data_loader = DataLoader('some_db', 'task', './some/dir', hdf5_file,
+                                 hdf5_options={'driver': 'core'})
+
+        new_data_loader = pickle.loads(pickle.dumps(data_loader))
+        new_field_loader = pickle.loads(pickle.dumps(data_loader.sets['train'].fields['data']))
+
+        assert new_data_loader.hdf5_options == {'driver': 'core'}
+        assert new_data_loader.hdf5_file.driver == 'core'
+        assert new_field_loader.hdf5_handler.file.driver == 'core'
+
+    def test_pickle_set_loader(self):
+        set_loader, set_data, _ = db_generator.get_test_dataset_SetLoader('train')
+
+        new_set_loader = pickle.loads(pickle.dumps(set_loader))
+
+        assert new_set_loader.set == 'train'
+        assert np.array_equal(new_set_loader.get('data', [4, 0]), set_data['data'][[4, 0]])
+
+    def test_pickle_field_loader(self):
+        field_loader, set_data = db_generator.get_test_data_FieldLoader('train')
+        field_loader.to_memory = True
+
+        new_field_loader = pickle.loads(pickle.dumps(field_loader))
+
+        assert new_field_loader.name == 'data'
+        assert new_field_loader.obj_id == 1
+        assert new_field_loader.to_memory
+        assert np.array_equal(new_field_loader.get(), set_data['data'])
+
+    @pytest.mark.skipif(not hasattr(os, 'fork') or not hasattr(multiprocessing, 'get_context'),
+                        reason="requires fork()")
+    def test_forked_workers(self):
+        data_loader, dataset, _ = db_generator.get_test_dataset_DataLoader()
+        data_loader.get('train', 'data', 0)
+
+        pool = multiprocessing.get_context('fork').Pool(2)
+        try:
+            outputs = pool.map(fetch_data_from_loader, [(data_loader, i) for i in range(10)])
+        finally:
+            pool.close()
+            pool.join()
+
+        for i, data in enumerate(outputs):
+            assert np.array_equal(data, dataset['train']['data'][i])
+
+
+def get_shared_memory_filepath(args):
+    data_loader, field = args
+    return data_loader.sets['train'].fields[field]._shared_array.filepath
+
+
+class TestSharedMemory:
+    """Unit tests for sharing the fields loaded into memory between processes."""
+
+    @pytest.fixture()
+    def data_loaders(self):
+        hdf5_file = db_generator.get_test_hdf5_filepath_DataLoader()
+        data_loaders = [DataLoader('some_db', 'task', './some/dir', hdf5_file, shared_memory=True)
+                        for _ in range(2)]
+        yield data_loaders
+        for data_loader in data_loaders:
+            for set_name in data_loader.sets.loaded():
+                for field in data_loader.sets[set_name].fields.loaded():
+                    data_loader.sets[set_name].fields[field].to_memory = False
+
+    def test_to_memory_shared(self, data_loaders):
+        _, dataset, _ = db_generator.get_test_dataset_DataLoader()
+        field_loader = data_loaders[0].sets['train'].fields['data']
+
+        field_loader.to_memory = True
+
+        assert field_loader.shared_memory
+        assert isinstance(field_loader.data, np.memmap)
+        assert not field_loader.data.flags.writeable
+        assert np.array_equal(field_loader.get([3, 1]), dataset['train']['data'][[3, 1]])
+        assert str(field_loader).startswith('FieldLoader: <shared numpy.memmap "data"')
+
+    def test_loaders_attach_to_the_same_segment(self, data_loaders):
+        field_loaders = [data_loader.sets['train'].fields['data'] for data_loader in data_loaders]
+        for field_loader in field_loaders:
+            field_loader.to_memory = True
+        filepath = field_loaders[0]._shared_array.filepath
+
+        assert field_loaders[1]._shared_array.filepath == filepath
+        field_loaders[0].to_memory = False
+        assert os.path.exists(filepath)
+        field_loaders[1].to_memory = False
+        assert not os.path.exists(filepath)
+
+    def test_different_fields_use_different_segments(self, data_loaders):
+        data_loaders[0].sets['train'].fields['data'].to_memory = True
+        data_loaders[0].sets['train'].fields['number'].to_memory = True
+
+        assert get_shared_memory_filepath((data_loaders[0], 'data')) != \
+            get_shared_memory_filepath((data_loaders[0], 'number'))
+
+    def test_pickle_data_loader(self, data_loaders):
+        data_loaders[0].sets['train'].fields['data'].to_memory = True
+
+        new_data_loader = pickle.loads(pickle.dumps(data_loaders[0]))
+        new_field_loader = new_data_loader.sets['train'].fields['data']
+
+        assert new_data_loader.shared_memory
+        assert new_field_loader._shared_array.filepath == \
+            get_shared_memory_filepath((data_loaders[0], 'data'))
+        new_field_loader.to_memory = False
+
+    @pytest.mark.skipif(not hasattr(os, 'fork') or not hasattr(multiprocessing, 'get_context'),
+                        reason="requires fork()")
+    def test_workers_attach_to_the_same_segment(self, data_loaders):
+        data_loaders[0].sets['train'].fields['data'].to_memory = True
+
+        pool = multiprocessing.get_context('fork').Pool(2)
+        try:
+            filepaths = pool.map(get_shared_memory_filepath, [(data_loaders[0], 'data')] * 4)
+        finally:
+            pool.close()
+            pool.join()
+
+        filepath = get_shared_memory_filepath((data_loaders[0], 'data'))
+        assert set(filepaths) == set([filepath])
+        data_loaders[0].sets['train'].fields['data'].to_memory = False
+        assert not os.path.exists(filepath)
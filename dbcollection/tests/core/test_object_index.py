@@ -0,0 +1,146 @@
+"""
+Test dbcollection/core/object_index.py.
+"""
+
+
+import os
+import h5py
+import numpy as np
+import pytest
+
+from dbcollection.core.loader import SetLoader
+from dbcollection.core.object_index import ObjectIndex
+from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
+
+
+@pytest.fixture()
+def hdf5_filepath(tmpdir):
+    filepath = str(tmpdir.join('detection.h5'))
+    with h5py.File(filepath, 'w') as h5obj:
+        group = h5obj.create_group('train')
+        group['category'] = str_to_ascii(['person', 'car', 'dog'])
+        group['iscrowd'] = np.array([0, 1], dtype=np.uint8)
+        group['area'] = np.array([100., 2000., 50., 5000., 1500.])
+        group['boxes'] = np.arange(20, dtype=np.float32).reshape(5, 4)
+        group['object_fields'] = str_to_ascii(['category', 'iscrowd', 'area', 'boxes'])
+        group['object_ids'] = np.array([[0, 0, 0, 0],
+                                        [1, 0, 1, 1],
+                                        [0, 1, 2, 2],
+                                        [0, 0, 3, 3],
+                                        [2, 0, 4, 4],
+                                        [0, -1, 1, 0]], dtype=np.int32)
+    return filepath
+
+
+@pytest.fixture()
+def set_loader(hdf5_filepath):
+    h5obj = h5py.File(hdf5_filepath, 'r')
+    yield SetLoader(h5obj['train'])
+    h5obj.close()
+
+
+def load_set(hdf5_filepath):
+    return SetLoader(h5py.File(hdf5_filepath, 'r')['train'])
+
+
+@pytest.mark.parametrize('predicates, object_ids', [
+    ({}, [0, 1, 2, 3, 4, 5]),
+    ({'category': 'person'}, [0, 2, 3, 5]),
+    ({'category__ne': 'person'}, [1, 4]),
+    ({'category__in': ['car', 'dog']}, [1, 4]),
+    ({'iscrowd': 0}, [0, 1, 3, 4]),
+    ({'iscrowd__ne': 0}, [2]),
+    ({'area__gt': 1500}, [1, 3, 5]),
+    ({'area__ge': 1500}, [1, 3, 4, 5]),
+    ({'area__lt': 100}, [2]),
+    ({'area__le': 100}, [0, 2]),
+    ({'area__in': [50, 5000]}, [2, 3]),
+    ({'boxes': 0}, [0, 5]),
+    ({'boxes__in': [1, 3]}, [1, 3]),
+    ({'boxes__ge': 3}, [3, 4]),
+    ({'category': 'person', 'iscrowd': 0, 'area__gt': 1000}, [3]),
+    ({'category': 'person', 'area__ge': 2000}, [3, 5]),
+    ({'category': 'cat'}, []),
+])
+def test_where(set_loader, predicates, object_ids):
+    result = set_loader.where(**predicates)
+
+    assert result.tolist() == object_ids
+
+
+def test_where_raises_error_invalid_field(set_loader):
+    with pytest.raises(KeyError):
+        set_loader.where(width=10)
+
+
+def test_where_raises_error_invalid_operator(set_loader):
+    with pytest.raises(ValueError):
+        set_loader.where(area__between=(10, 20))
+
+
+def test_select(set_loader):
+    columns = set_loader.select(['area', 'category'], category='person', iscrowd=0)
+
+    assert sorted(columns.keys()) == ['area', 'category']
+    assert columns['area'].tolist() == [100., 5000.]
+    assert np.array_equal(columns['category'], str_to_ascii(['person', 'person']))
+
+
+def test_select_all_fields(set_loader):
+    columns = set_loader.select(boxes=0)
+
+    assert sorted(columns.keys()) == ['area', 'boxes', 'category', 'iscrowd']
+    assert columns['iscrowd'].mask.tolist() == [False, True]
+
+
+def test_select_no_matches(set_loader):
+    columns = set_loader.select('area', area__gt=10000)
+
+    assert columns['area'].shape == (0,)
+
+
+def test_select_raises_error_invalid_field(set_loader):
+    with pytest.raises(KeyError):
+        set_loader.select('width', area__gt=10)
+
+
+def test_index_is_stored_in_sidecar_file(set_loader, hdf5_filepath):
+    set_loader.where(area__gt=10, category='car')
+
+    sidecar_filepath = set_loader.object_index.filepath
+    assert sidecar_filepath == os.path.splitext(hdf5_filepath)[0] + '.index.h5'
+    with h5py.File(sidecar_filepath, 'r') as sidecar:
+        assert sorted(sidecar['train'].keys()) == ['area', 'category']
+        assert sorted(sidecar['train/category'].keys()) == ['ids', 'keys', 'offsets']
+        assert sorted(sidecar['train/area'].keys()) == ['ids', 'values']
+
+
+def test_index_is_loaded_from_sidecar_file(mocker, set_loader, hdf5_filepath):
+    set_loader.where(area__gt=1000)
+    mock_build = mocker.patch.object(ObjectIndex, '_build_index')
+
+    result = load_set(hdf5_filepath).where(area__gt=1000)
+
+    assert not mock_build.called
+    assert result.tolist() == [1, 3, 4, 5]
+
+
+def test_index_is_rebuilt_if_metadata_file_changes(mocker, set_loader, hdf5_filepath):
+    set_loader.where(area__gt=1000)
+    mtime = os.path.getmtime(hdf5_filepath)
+    os.utime(hdf5_filepath, (mtime + 10, mtime + 10))
+    spy_build = mocker.spy(ObjectIndex, '_build_index')
+
+    result = load_set(hdf5_filepath).where(area__gt=1000)
+
+    assert spy_build.call_count == 1
+    assert result.tolist() == [1, 3, 4, 5]
+
+
+def test_index_without_sidecar_file(set_loader, tmpdir):
+    object_index = ObjectIndex(set_loader, str(tmpdir.join('missing_dir', 'index.h5')))
+
+    result = object_index.query({'category': 'dog'})
+
+    assert result.tolist() == [4]
+    assert len(object_index) == 1
@@ -0,0 +1,56 @@
+"""
+Test dbcollection/core/sampler.py.
+"""
+
+
+import numpy as np
+import pytest
+
+from dbcollection.core.sampler import ChunkShuffleSampler
+
+
+@pytest.mark.parametrize('num_rows, chunk_rows, chunks_per_group, buffer_size', [
+    (100, 10, 1, None), (103, 10, 2, 7), (5, 10, 1, None), (50, None, 1, None), (0, 10, 1, None)
+])
+def test_get_indexes_is_permutation(num_rows, chunk_rows, chunks_per_group, buffer_size):
+    sampler = ChunkShuffleSampler(num_rows, chunk_rows, chunks_per_group, buffer_size, seed=0)
+
+    indexes = sampler.get_indexes()
+
+    assert sorted(indexes.tolist()) == list(range(num_rows))
+
+
+def test_get_indexes_is_reproducible():
+    sampler = ChunkShuffleSampler(100, 10, seed=3)
+
+    assert np.array_equal(sampler.get_indexes(1), ChunkShuffleSampler(100, 10, seed=3).get_indexes(1))
+    assert not np.array_equal(sampler.get_indexes(0), sampler.get_indexes(1))
+
+
+def test_groups_are_contiguous_without_buffer():
+    sampler = ChunkShuffleSampler(100, chunk_rows=10, chunks_per_group=2, buffer_size=1, seed=0)
+
+    indexes = sampler.get_indexes()
+
+    for i in range(0, 100, 20):
+        assert indexes[i:i + 20].tolist() == list(range(indexes[i], indexes[i] + 20))
+
+
+def test_rows_are_shuffled_within_buffer():
+    sampler = ChunkShuffleSampler(1000, chunk_rows=10, buffer_size=40, seed=0)
+
+    indexes = sampler.get_indexes()
+
+    for i in range(0, 1000, 40):
+        window_chunks = set(indexes[i:i + 40] // 10)
+        assert len(window_chunks) == 4  # the rows of 4 chunks are mixed
+    assert not np.array_equal(indexes[:10], np.sort(indexes[:10]))
+
+
+def test_iter_uses_epoch():
+    sampler = ChunkShuffleSampler(30, chunk_rows=5, seed=1)
+
+    sampler.set_epoch(2)
+
+    assert list(sampler) == sampler.get_indexes(2).tolist()
+    assert len(sampler) == 30
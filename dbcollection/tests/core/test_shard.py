@@ -0,0 +1,182 @@
+"""
+Test dbcollection/core/shard.py.
+"""
+
+
+import pickle
+import h5py
+import numpy as np
+import pytest
+
+from dbcollection.core.loader import DataLoader
+from dbcollection.core.shard import DataLoaderShard, get_shards
+from dbcollection.core.subset import get_object_aligned_fields
+from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
+
+
+@pytest.fixture()
+def data_loader(tmpdir):
+    filepath = str(tmpdir.join('shard.h5'))
+    with h5py.File(filepath, 'w') as h5obj:
+        group = h5obj.create_group('train')
+        group['object_fields'] = str_to_ascii(['data', 'classes'])
+        labels = np.arange(22) % 3
+        hdf5_write_data(group, 'object_ids', np.stack([np.arange(22), labels], axis=1),
+                        chunks=(4, 2))
+        hdf5_write_data(group, 'data', np.arange(44).reshape(22, 2), chunks=(4, 2))
+        group['classes'] = str_to_ascii(['a', 'b', 'c'])
+    return DataLoader('some_db', 'task', str(tmpdir), filepath)
+
+
+def get_rank_shards(data_loader, world_size, **kwargs):
+    return [data_loader.shard(rank, world_size, **kwargs).indexes('train')
+            for rank in range(world_size)]
+
+
+@pytest.mark.parametrize('by', ['chunk', 'stride', 'class'])
+@pytest.mark.parametrize('seed', [None, 3])
+def test_get_shards_split_all_rows(by, seed):
+    labels = np.arange(22) % 3
+
+    shards = get_shards(22, 4, by=by, chunk_rows=4, labels=labels, seed=seed, equal_length=None)
+
+    assert sorted(np.concatenate(shards).tolist()) == list(range(22))
+
+
+def test_get_shards_by_chunk():
+    shards = get_shards(22, 3, by='chunk', chunk_rows=4, equal_length=None)
+
+    assert [shard.tolist() for shard in shards] == [list(range(0, 8)), list(range(8, 16)),
+                                                    list(range(16, 22))]
+
+
+def test_get_shards_by_stride():
+    shards = get_shards(10, 3, by='stride', equal_length=None)
+
+    assert shards[1].tolist() == [1, 4, 7]
+
+
+def test_get_shards_by_class_is_stratified():
+    labels = np.array([0] * 8 + [1] * 4)
+
+    shards = get_shards(12, 4, by='class', labels=labels, seed=0)
+
+    for shard in shards:
+        assert labels[shard].tolist() == [0, 0, 1]
+
+
+def test_get_shards_pad():
+    shards = get_shards(10, 3, by='stride', equal_length='pad')
+
+    assert [len(shard) for shard in shards] == [4, 4, 4]
+    assert shards[2].tolist() == [2, 5, 8, 2]
+
+
+def test_get_shards_drop():
+    shards = get_shards(10, 3, by='stride', equal_length='drop')
+
+    assert [len(shard) for shard in shards] == [3, 3, 3]
+
+
+def test_get_shards_seeded_by_epoch():
+    shards_epoch0 = get_shards(100, 2, by='stride', seed=1, epoch=0)
+    shards_epoch1 = get_shards(100, 2, by='stride', seed=1, epoch=1)
+
+    assert np.array_equal(shards_epoch0[0], get_shards(100, 2, by='stride', seed=1, epoch=0)[0])
+    assert not np.array_equal(shards_epoch0[0], shards_epoch1[0])
+
+
+def test_get_shards_raises_error_invalid_mode():
+    with pytest.raises(ValueError):
+        get_shards(10, 2, by='random')
+
+
+def test_shard_by_chunk_is_aligned_to_chunks(data_loader):
+    shards = get_rank_shards(data_loader, 2, equal_length=None)
+
+    assert shards[0].tolist() == list(range(0, 12))
+    assert shards[1].tolist() == list(range(12, 22))
+
+
+def test_shard_get(data_loader):
+    shard = data_loader.shard(1, 2, by='stride')
+
+    assert shard.get('train', 'data', 2).tolist() == [10, 11]
+    assert shard.get('train', 'data', [0, 1]).tolist() == [[2, 3], [6, 7]]
+    assert shard.get('train', 'data').shape == (11, 2)
+    assert shard.get('train', 'classes').shape == (3, 2)  # not sharded
+
+
+def test_shard_object(data_loader):
+    shard = data_loader.shard(1, 2, by='stride')
+
+    assert shard.object('train', 0).tolist() == [1, 1]
+    assert shard.object('train').shape == (11, 2)
+    assert shard.object('train', 1, convert_to_value=True)[0].tolist() == [6, 7]
+
+
+def test_shard_size(data_loader):
+    shard = data_loader.shard(0, 3, by='stride', equal_length='drop')
+
+    assert shard.size('train') == (7, 2)
+    assert shard.size('train', 'classes') == (3, 2)
+    assert shard.size() == {'train': (7, 2)}
+
+
+def test_shard_by_class(data_loader):
+    shard = data_loader.shard(0, 2, by='class', seed=0)
+
+    labels = shard.object('train')[:, 1]
+    assert sorted(set(labels.tolist())) == [0, 1, 2]
+
+
+def test_shard_set_epoch(data_loader):
+    shard = data_loader.shard(0, 2, by='stride', seed=5)
+    indexes = shard.indexes('train')
+
+    shard.set_epoch(1)
+
+    assert not np.array_equal(shard.indexes('train'), indexes)
+
+
+def test_shard_set_epoch_computes_aligned_fields_once(mocker, data_loader):
+    spy = mocker.patch('dbcollection.core.loader.get_object_aligned_fields',
+                       wraps=get_object_aligned_fields)
+    shard = data_loader.shard(0, 2, by='chunk', seed=5)
+
+    for epoch in range(3):
+        shard.set_epoch(epoch)
+        shard.get('train', 'data')
+
+    assert spy.call_count == 1
+
+
+def test_shard_single_object(data_loader):
+    shard = data_loader.shard(21, 22, by='stride')
+
+    assert shard.get('train', 'data').tolist() == [[42, 43]]
+    assert shard.object('train').tolist() == [[21, 0]]
+
+
+def test_shard_raises_error_invalid_rank(data_loader):
+    with pytest.raises(AssertionError):
+        data_loader.shard(2, 2)
+
+
+def test_shard_raises_error_invalid_set(data_loader):
+    shard = data_loader.shard(0, 2)
+
+    with pytest.raises(KeyError):
+        shard.indexes('val')
+
+
+def test_pickle(data_loader):
+    shard = data_loader.shard(1, 2, by='stride', seed=2)
+    shard.set_epoch(3)
+
+    new_shard = pickle.loads(pickle.dumps(shard))
+
+    assert isinstance(new_shard, DataLoaderShard)
+    assert new_shard.epoch == 3
+    assert np.array_equal(new_shard.indexes('train'), shard.indexes('train'))
@@ -0,0 +1,154 @@
+"""
+Test dbcollection/core/shared_memory.py.
+"""
+
+
+import os
+import sys
+import subprocess
+import numpy as np
+import pytest
+
+from dbcollection.core import shared_memory
+from dbcollection.core.shared_memory import SharedArray, get_segment_name, get_shared_memory_dir
+
+
+@pytest.fixture()
+def data():
+    return np.arange(20, dtype=np.int32).reshape(10, 2)
+
+
+def create_shared_array(data, directory, read_fn=None):
+    def fill(out):
+        out[...] = data
+    return SharedArray('segment', data.dtype, data.shape, read_fn or fill, str(directory))
+
+
+def test_get_segment_name():
+    name = get_segment_name('/path/to/file.h5', 10.0, '/train/images')
+
+    assert name.startswith('dbcollection_')
+    assert name == get_segment_name('/path/to/file.h5', 10.0, '/train/images')
+    assert name != get_segment_name('/path/to/file.h5', 11.0, '/train/images')
+
+
+def test_get_shared_memory_dir():
+    assert os.path.isdir(get_shared_memory_dir())
+
+
+def test_create(data, tmpdir):
+    shared_array = create_shared_array(data, tmpdir)
+
+    assert isinstance(shared_array.data, np.memmap)
+    assert np.array_equal(shared_array.data, data)
+    assert not shared_array.data.flags.writeable
+    assert os.path.exists(shared_array.filepath)
+    shared_array.release()
+
+
+def test_attach_does_not_read_data(mocker, data, tmpdir):
+    shared_array = create_shared_array(data, tmpdir)
+    mock_read = mocker.Mock()
+
+    other_shared_array = create_shared_array(data, tmpdir, mock_read)
+
+    assert not mock_read.called
+    assert np.array_equal(other_shared_array.data, data)
+    shared_array.release()
+    other_shared_array.release()
+
+
+def test_release_last_user_removes_segment(data, tmpdir):
+    shared_array = create_shared_array(data, tmpdir)
+    other_shared_array = create_shared_array(data, tmpdir)
+
+    shared_array.release()
+    assert os.path.exists(other_shared_array.filepath)
+    other_shared_array.release()
+
+    assert shared_array.data is None
+    assert not os.path.exists(shared_array.filepath)
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_release_keeps_segment_used_by_other_process(data, tmpdir):
+    shared_array = create_shared_array(data, tmpdir)
+    open(os.path.join(shared_array.filepath + '.refs', '1'), 'w').close()  # pid 1 is always alive
+
+    shared_array.release()
+
+    assert os.path.exists(shared_array.filepath)
+
+
+def test_release_ignores_dead_processes(mocker, data, tmpdir):
+    shared_array = create_shared_array(data, tmpdir)
+    open(os.path.join(shared_array.filepath + '.refs', '123456789'), 'w').close()
+
+    shared_array.release()
+
+    assert not os.path.exists(shared_array.filepath)
+
+
+def test_release_forked_process_does_not_remove_segment(mocker, data, tmpdir):
+    shared_array = create_shared_array(data, tmpdir)
+    mocker.patch('dbcollection.core.shared_memory.os.getpid', return_value=-1)
+
+    shared_array.release()
+
+    assert os.path.exists(shared_array.filepath)
+
+
+def test_create_failure_does_not_leave_segment(data, tmpdir):
+    def read_fn(out):
+        raise IOError('read error')
+
+    with pytest.raises(IOError):
+        create_shared_array(data, tmpdir, read_fn)
+
+    assert not os.path.exists(os.path.join(str(tmpdir), 'segment'))
+
+
+def test_create_keeps_segment_created_meanwhile(mocker, data, tmpdir):
+    shared_array = create_shared_array(data, tmpdir)
+
+    def rename(src, dst):  # os.rename() on Windows
+        if os.path.exists(dst):
+            raise OSError('file exists: {}'.format(dst))
+        os.rename(src, dst)
+
+    mocker.patch('dbcollection.core.shared_memory._replace', side_effect=rename)
+    shared_array._create(data.dtype, data.shape, lambda out: None)
+
+    assert sorted(os.listdir(str(tmpdir))) == ['segment', 'segment.refs']
+    assert np.array_equal(np.memmap(shared_array.filepath, mode='r', dtype=data.dtype,
+                                    shape=data.shape), data)
+
+
+def test_is_process_alive_does_not_signal_the_process():
+    process = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        assert shared_memory._is_process_alive(process.pid)
+        assert process.poll() is None  # still running
+    finally:
+        process.kill()
+        process.wait()
+
+    assert not shared_memory._is_process_alive(process.pid)
+
+
+def test_is_process_alive_on_windows_does_not_call_kill(mocker):
+    mocker.patch('dbcollection.core.shared_memory.os.name', 'nt')
+    mock_kill = mocker.patch('dbcollection.core.shared_memory.os.kill')
+    mock_alive = mocker.patch('dbcollection.core.shared_memory._is_windows_process_alive',
+                              return_value=True)
+
+    assert shared_memory._is_process_alive(123)
+    assert not mock_kill.called
+    mock_alive.assert_called_once_with(123)
+
+
+def test_empty_array(tmpdir):
+    shared_array = create_shared_array(np.zeros((0, 3)), tmpdir)
+
+    assert shared_array.data.shape == (0, 3)
+    shared_array.release()
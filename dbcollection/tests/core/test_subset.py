@@ -0,0 +1,179 @@
+"""
+Test dbcollection/core/subset.py.
+"""
+
+
+import pickle
+import h5py
+import numpy as np
+import pytest
+
+from dbcollection.core.loader import DataLoader
+from dbcollection.core.subset import (SetLoaderSubset, get_object_aligned_fields,
+                                      parse_subset_indexes)
+from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
+
+
+@pytest.fixture()
+def set_loader(tmpdir):
+    filepath = str(tmpdir.join('subset.h5'))
+    with h5py.File(filepath, 'w') as h5obj:
+        group = h5obj.create_group('train')
+        group['object_fields'] = str_to_ascii(['data', 'classes'])
+        labels = np.arange(10) % 3
+        hdf5_write_data(group, 'object_ids', np.stack([np.arange(10), labels], axis=1),
+                        chunks=(4, 2))
+        hdf5_write_data(group, 'data', np.arange(20).reshape(10, 2), chunks=(4, 2))
+        group['classes'] = str_to_ascii(['a', 'b', 'c'])
+    return DataLoader('some_db', 'task', str(tmpdir), filepath).sets['train']
+
+
+@pytest.mark.parametrize('indexes, expected', [
+    ([3, 1, 1], [3, 1, 1]), ([-1], [9]), ([], []),
+    (np.arange(10) % 2 == 0, [0, 2, 4, 6, 8])
+])
+def test_parse_subset_indexes(indexes, expected):
+    assert parse_subset_indexes(indexes, 10).tolist() == expected
+
+
+@pytest.mark.parametrize('indexes, error', [
+    ([10], IndexError), ([-11], IndexError), ([True, False], IndexError),
+    ([[1, 2]], TypeError), ([1.5], TypeError)
+])
+def test_parse_subset_indexes_raises_error(indexes, error):
+    with pytest.raises(error):
+        parse_subset_indexes(indexes, 10)
+
+
+def test_get(set_loader):
+    subset = SetLoaderSubset(set_loader, [7, 2, 5])
+
+    assert subset.get('data', 0).tolist() == [14, 15]
+    assert subset.get('data', [2, 1]).tolist() == [[10, 11], [4, 5]]
+    assert subset.get('data').tolist() == [[14, 15], [4, 5], [10, 11]]
+    assert subset.get('data', -1).tolist() == [10, 11]
+
+
+def test_get_field_not_aligned_with_objects(set_loader):
+    subset = SetLoaderSubset(set_loader, [7, 2])
+
+    assert subset.get('classes', 0, convert_to_str=True) == 'a'
+    assert subset.get('classes').shape == (3, 2)
+
+
+@pytest.fixture()
+def detection_set_loader(tmpdir):
+    """Set with 4 images and 4 objects (2 per image, in images 0 and 2)."""
+    filepath = str(tmpdir.join('detection.h5'))
+    with h5py.File(filepath, 'w') as h5obj:
+        group = h5obj.create_group('train')
+        group['object_fields'] = str_to_ascii(['image_filenames', 'boxes'])
+        group['object_ids'] = np.array([[0, 0], [0, 1], [2, 2], [2, 3]])
+        group['image_filenames'] = str_to_ascii(['img0', 'img1', 'img2', 'img3'])
+        group['boxes'] = np.arange(16).reshape(4, 4)
+        group['id'] = np.array([10, 11, 12, 13])
+        group['sizes'] = np.array([[1, 1], [2, 2], [3, 3], [4, 4]])
+    return DataLoader('some_db', 'task', str(tmpdir), filepath).sets['train']
+
+
+def test_get_object_aligned_fields(set_loader, detection_set_loader):
+    assert get_object_aligned_fields(set_loader) == {'object_ids', 'data'}
+    assert get_object_aligned_fields(detection_set_loader) == {'object_ids', 'boxes', 'id'}
+
+
+def test_get_per_image_field_with_as_many_rows_as_objects(detection_set_loader):
+    subset = SetLoaderSubset(detection_set_loader, [3, 0])
+
+    assert subset.get('boxes', 0).tolist() == [12, 13, 14, 15]
+    assert subset.get('id').tolist() == [13, 10]
+    assert subset.get('image_filenames', 1, convert_to_str=True) == 'img1'
+    assert subset.get('sizes').shape == (4, 2)
+    assert subset.size('sizes') == (4, 2)
+
+
+def test_get_single_and_empty_subsets(set_loader):
+    assert SetLoaderSubset(set_loader, [4]).get('data').tolist() == [[8, 9]]
+    assert SetLoaderSubset(set_loader, []).get('data').shape == (0, 2)
+
+
+def test_object(set_loader):
+    subset = SetLoaderSubset(set_loader, [7, 2])
+
+    assert subset.object(1).tolist() == [2, 2]
+    assert subset.object().tolist() == [[7, 1], [2, 2]]
+    values = subset.object(0, convert_to_value=True)
+    assert values[0].tolist() == [14, 15]
+    assert SetLoaderSubset(set_loader, []).object(convert_to_value=True) == []
+
+
+def test_object_columns(set_loader):
+    subset = SetLoaderSubset(set_loader, [7, 2])
+
+    columns = subset.object_columns()
+
+    assert columns['data'].data.tolist() == [[14, 15], [4, 5]]
+
+
+def test_size(set_loader):
+    subset = SetLoaderSubset(set_loader, [7, 2, 5])
+
+    assert subset.size() == (3, 2)
+    assert subset.size('data') == (3, 2)
+    assert subset.size('classes') == (3, 2)
+    assert len(subset) == 3
+
+
+def test_list(set_loader):
+    subset = SetLoaderSubset(set_loader, [7, 2])
+
+    assert subset.list() == set_loader.list()
+
+
+def test_subset_of_subset(set_loader):
+    subset = SetLoaderSubset(set_loader, [1, 3, 5, 7, 9])
+
+    new_subset = subset.subset([4, 0])
+
+    assert new_subset.set_loader is set_loader
+    assert new_subset.indexes.tolist() == [9, 1]
+    assert new_subset.get('data', 0).tolist() == [18, 19]
+
+
+def test_subset_of_subset_computes_aligned_fields_once(mocker, set_loader):
+    spy = mocker.patch('dbcollection.core.loader.get_object_aligned_fields',
+                       wraps=get_object_aligned_fields)
+
+    subset = set_loader.subset([1, 3, 5, 7, 9]).subset([4, 0, 2]).subset([1])
+
+    assert subset.get('data').tolist() == [[2, 3]]
+    assert set_loader.subset([0]).size('data') == (1, 2)
+    assert spy.call_count == 1
+
+
+def test_subset_with_mask(set_loader):
+    subset = SetLoaderSubset(set_loader, [1, 3, 5, 7, 9])
+    labels = subset.object()[:, 1]
+
+    new_subset = subset.subset(labels == 0)
+
+    assert new_subset.indexes.tolist() == [3, 9]
+
+
+def test_where(set_loader):
+    subset = SetLoaderSubset(set_loader, [1, 3, 5, 7, 9])
+
+    indexes = subset.where(classes='a')
+
+    assert indexes.tolist() == [1, 4]
+    assert subset.subset(indexes).indexes.tolist() == [3, 9]
+
+
+def test_pickle(set_loader):
+    subset = SetLoaderSubset(set_loader, [1, 3, 5]).subset([2, 0])
+
+    new_subset = pickle.loads(pickle.dumps(subset))
+
+    assert isinstance(new_subset, SetLoaderSubset)
+    assert new_subset.indexes.tolist() == [5, 1]
+    assert np.array_equal(new_subset.get('data'), subset.get('data'))
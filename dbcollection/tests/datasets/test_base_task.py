@@ -0,0 +1,233 @@
+"""
+Test the BaseTask class of dbcollection/datasets/__init__.py.
+"""
+
+
+import os
+import h5py
+import numpy as np
+import pytest
+
+from dbcollection.datasets import BaseDataset, BaseTask, replace_file
+from dbcollection.utils.file_load import load_json
+from dbcollection.utils.hdf5 import hdf5_write_data
+from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
+
+
+SETS = {
+    'train': [[0, 1], [2, 3], [4, 5]],
+    'val': [[6, 7]],
+    'test': [[8, 9], [10, 11]],
+}
+
+
+class DummyTask(BaseTask):
+    """Task with sets loaded all at once."""
+
+    filename_h5 = 'dummy'
+
+    def load_data(self):
+        for set_name in sorted(SETS):
+            yield {set_name: SETS[set_name]}
+
+    def add_data_to_default(self, hdf5_handler, data, set_name=None):
+        hdf5_write_data(hdf5_handler, 'data', np.array(data, dtype=np.int32))
+        hdf5_write_data(hdf5_handler, 'object_fields', str_to_ascii(['data', 'data']))
+
+
+class DummySplitTask(DummyTask):
+    """Task with sets that can be loaded independently."""
+
+    def get_set_names(self):
+        return sorted(SETS)
+
+    def load_data(self):
+        for set_name in self.get_set_names():
+            yield self.load_data_set(set_name)
+
+    def load_data_set(self, set_name):
+        return {set_name: SETS[set_name]}
+
+
+@pytest.mark.parametrize('task_constructor', [DummyTask, DummySplitTask])
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_process_metadata(tmpdir, task_constructor, num_workers):
+    task = task_constructor(str(tmpdir), str(tmpdir), verbose=False, num_workers=num_workers)
+
+    filename = task.process_metadata()
+
+    assert filename == os.path.join(str(tmpdir), 'dummy.h5')
+    with h5py.File(filename, 'r') as fileh5:
+        assert sorted(fileh5) == sorted(SETS)
+        for set_name in SETS:
+            assert np.array_equal(fileh5[set_name]['data'][()], SETS[set_name])
+    assert os.listdir(str(tmpdir)) == ['dummy.h5']  # temporary files are removed
+
+
+def test_process_metadata_union_sets(tmpdir):
+    task = DummySplitTask(str(tmpdir), str(tmpdir), verbose=False, num_workers=2)
+    task.union_sets = {'trainval': ('train', 'val')}
+
+    filename = task.process_metadata()
+
+    with h5py.File(filename, 'r') as fileh5:
+        assert 'trainval' in fileh5
+
+
+class ResumableTask(DummySplitTask):
+    """Task that records the loaded sets and can fail on a set."""
+
+    fail_set = None
+    loaded_sets = []
+
+    def get_input_files(self, set_name):
+        return [os.path.join(self.data_path, 'inputs.txt')]
+
+    def load_data_set(self, set_name):
+        if set_name == self.fail_set:
+            raise RuntimeError('Processing interrupted')
+        self.loaded_sets.append(set_name)
+        return super(ResumableTask, self).load_data_set(set_name)
+
+
+@pytest.fixture()
+def resumable_task(tmpdir):
+    tmpdir.join('inputs.txt').write('v1')
+    ResumableTask.loaded_sets = []
+    return ResumableTask(str(tmpdir), str(tmpdir), verbose=False)
+
+
+def test_process_metadata_interrupted_keeps_partial_file(tmpdir, resumable_task):
+    resumable_task.fail_set = 'val'
+
+    with pytest.raises(RuntimeError):
+        resumable_task.process_metadata()
+
+    assert not tmpdir.join('dummy.h5').exists()
+    with h5py.File(str(tmpdir.join('dummy.h5.partial')), 'r') as fileh5:
+        assert sorted(fileh5) == ['test', 'train']
+
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_process_metadata_resumes_stored_sets(tmpdir, resumable_task, num_workers):
+    resumable_task.fail_set = 'val'
+    with pytest.raises(RuntimeError):
+        resumable_task.process_metadata()
+
+    task = ResumableTask(str(tmpdir), str(tmpdir), verbose=False, num_workers=num_workers)
+    ResumableTask.loaded_sets = []
+    filename = task.process_metadata()
+
+    if num_workers == 0:
+        assert ResumableTask.loaded_sets == ['val']
+    with h5py.File(filename, 'r') as fileh5:
+        assert sorted(fileh5) == sorted(SETS)
+        assert np.array_equal(fileh5['train/data'][()], SETS['train'])
+    assert not tmpdir.join('dummy.h5.partial').exists()
+
+
+def test_process_metadata_reprocesses_sets_with_changed_inputs(tmpdir, resumable_task):
+    resumable_task.fail_set = 'val'
+    with pytest.raises(RuntimeError):
+        resumable_task.process_metadata()
+    tmpdir.join('inputs.txt').write('v2 (updated)')
+
+    task = ResumableTask(str(tmpdir), str(tmpdir), verbose=False)
+    ResumableTask.loaded_sets = []
+    task.process_metadata()
+
+    assert ResumableTask.loaded_sets == ['test', 'train', 'val']
+
+
+class ResumableTaskNoInputs(ResumableTask):
+    """Task without input files (its stored sets cannot be checked)."""
+
+    def get_input_files(self, set_name):
+        return []
+
+
+def test_process_metadata_reprocesses_sets_without_inputs(tmpdir):
+    task = ResumableTaskNoInputs(str(tmpdir), str(tmpdir), verbose=False)
+    task.fail_set = 'val'
+    with pytest.raises(RuntimeError):
+        task.process_metadata()
+
+    task = ResumableTaskNoInputs(str(tmpdir), str(tmpdir), verbose=False)
+    ResumableTask.loaded_sets = []
+    task.process_metadata()
+
+    assert ResumableTask.loaded_sets == ['test', 'train', 'val']
+
+
+PARSED_FILES = []
+
+
+def load_json_counted(filename):
+    PARSED_FILES.append(filename)
+    return load_json(filename)
+
+
+class DummyJsonTask(BaseTask):
+    """Task that parses a json annotation file."""
+
+    def get_annotation_files(self):
+        return [os.path.join(self.data_path, 'annotations.json')]
+
+    def load_data(self):
+        annotations = self.load_annotation_file(load_json_counted, self.get_annotation_files()[0])
+        yield {'train': annotations['data']}
+
+    def add_data_to_default(self, hdf5_handler, data, set_name=None):
+        hdf5_write_data(hdf5_handler, 'data', np.array(data, dtype=np.int32))
+
+
+class DummyDetectionTask(DummyJsonTask):
+    filename_h5 = 'detection'
+
+
+class DummyKeypointsTask(DummyJsonTask):
+    filename_h5 = 'keypoints'
+
+
+class DummyDataset(BaseDataset):
+    tasks = {'detection': DummyDetectionTask, 'keypoints': DummyKeypointsTask}
+    default_task = 'detection'
+
+
+def test_process_several_tasks_shares_annotation_parses(tmpdir):
+    with open(str(tmpdir.join('annotations.json')), 'w') as f:
+        f.write('{"data": [[0, 1], [2, 3]]}')
+    dataset = DummyDataset(str(tmpdir), str(tmpdir), verbose=False)
+    del PARSED_FILES[:]
+
+    filenames = dataset.process(['detection', 'keypoints'])
+
+    assert filenames == {'detection': os.path.join(str(tmpdir), 'detection.h5'),
+                         'keypoints': os.path.join(str(tmpdir), 'keypoints.h5')}
+    assert len(PARSED_FILES) == 1
+    for filename in filenames.values():
+        with h5py.File(filename, 'r') as fileh5:
+            assert np.array_equal(fileh5['train/data'][()], [[0, 1], [2, 3]])
+
+
+def test_process_metadata_replaces_existing_file(tmpdir):
+    tmpdir.join('dummy.h5').write('old task file')
+
+    filename = DummyTask(str(tmpdir), str(tmpdir), verbose=False).process_metadata()
+
+    with h5py.File(filename, 'r') as fileh5:
+        assert sorted(fileh5) == sorted(SETS)
+    assert not tmpdir.join('dummy.h5.partial').exists()
+
+
+@pytest.mark.parametrize('has_replace', [True, False])
+def test_replace_file(monkeypatch, tmpdir, has_replace):
+    if not has_replace:
+        monkeypatch.delattr(os, 'replace', raising=False)
+    tmpdir.join('file.partial').write('new')
+    tmpdir.join('file').write('old')
+
+    replace_file(str(tmpdir.join('file.partial')), str(tmpdir.join('file')))
+
+    assert tmpdir.join('file').read() == 'new'
+    assert not tmpdir.join('file.partial').exists()
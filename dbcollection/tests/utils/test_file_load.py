@@ -0,0 +1,60 @@
+"""
+Test dbcollection/utils/file_load.py.
+"""
+
+
+import json
+import pytest
+
+from dbcollection.utils.file_load import ParseCache, load_json
+
+
+@pytest.fixture()
+def json_files(tmpdir):
+    fnames = []
+    for i in range(2):
+        fname = str(tmpdir.join('annotations_{}.json'.format(i)))
+        with open(fname, 'w') as f:
+            json.dump({"id": i}, f)
+        fnames.append(fname)
+    return fnames
+
+
+class TestParseCache:
+    """Unit tests for the ParseCache class."""
+
+    def test_load_shared_file(self, json_files):
+        cache = ParseCache()
+        cache.add_consumer(json_files)
+        cache.add_consumer(json_files[:1])
+
+        data1 = cache.load(load_json, json_files[0])
+        data2 = cache.load(load_json, json_files[0])
+
+        assert data1 == {"id": 0}
+        assert data2 is data1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_load_does_not_keep_unshared_files(self, json_files):
+        cache = ParseCache()
+        cache.add_consumer(json_files)
+        cache.add_consumer(json_files[:1])
+
+        cache.load(load_json, json_files[1])
+
+        assert len(cache) == 0
+
+    def test_remove_consumer_frees_parses(self, json_files):
+        cache = ParseCache()
+        cache.add_consumer(json_files[:1])
+        cache.add_consumer(json_files[:1])
+        cache.load(load_json, json_files[0])
+
+        cache.remove_consumer(json_files[:1])
+        assert len(cache) == 1
+
+        cache.load(load_json, json_files[0])
+        cache.remove_consumer(json_files[:1])
+        assert len(cache) == 0
+        assert cache.hits == 1
@@ -0,0 +1,49 @@
+"""
+Test dbcollection/utils/group.py.
+"""
+
+
+import numpy as np
+import pytest
+from dbcollection.utils.group import group_by
+
+
+@pytest.mark.parametrize("keys, num_groups, output", [
+    ([1, 0, 1, 2], None, [[1], [0, 2], [3]]),
+    ([1, 0, 1], 4, [[1], [0, 2], [], []]),
+    ([2, -1, 2, 5], 3, [[], [], [0, 2]]),
+    ([], None, []),
+    ([], 2, [[], []]),
+])
+def test_group_by(keys, num_groups, output):
+    assert group_by(keys, num_groups) == output
+
+
+def test_group_by_values():
+    assert group_by([1, 0, 1, 1], values=[9, 8, 3, 9]) == [[8], [9, 3, 9]]
+
+
+def test_group_by_unique_values():
+    assert group_by([1, 0, 1, 1], values=[9, 8, 3, 9], unique=True) == [[8], [3, 9]]
+
+
+def test_group_by_pad():
+    output = group_by([1, 0, 1], num_groups=3, pad=True, fillvalue=-1)
+
+    assert np.array_equal(output, [[1, -1], [0, 2], [-1, -1]])
+
+
+def test_group_by_pad_empty_groups():
+    output = group_by([], num_groups=2, pad=True)
+
+    assert output.shape == (2, 0)
+
+
+def test_group_by_same_as_loop():
+    rng = np.random.RandomState(0)
+    keys = rng.randint(0, 10, size=200)
+    values = rng.randint(0, 50, size=200)
+
+    output = group_by(keys, 10, values=values, unique=True)
+
+    assert output == [sorted(set(values[keys == i].tolist())) for i in range(10)]
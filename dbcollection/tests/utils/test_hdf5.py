@@ -0,0 +1,145 @@
+"""
+Test dbcollection/utils/hdf5.py.
+"""
+
+
+import json
+import h5py
+import numpy as np
+import pytest
+
+from dbcollection.utils.hdf5 import (hdf5_write_data, hdf5_write_ragged_data, hdf5_write_union_set,
+                                    hdf5_write_stream, HDF5StreamWriter)
+from dbcollection.utils.string_ascii import convert_str_to_ascii as str_to_ascii
+
+
+@pytest.fixture()
+def hdf5_file(tmpdir):
+    h5obj = h5py.File(str(tmpdir.join('test.h5')), 'w')
+    yield h5obj
+    h5obj.close()
+
+
+def test_hdf5_write_data(hdf5_file):
+    data = np.arange(20).reshape(10, 2)
+
+    h5_field = hdf5_write_data(hdf5_file, 'data', data)
+
+    assert np.array_equal(h5_field[()], data)
+    assert h5_field.chunks is not None
+    assert h5_field.compression == 'gzip'
+
+
+def test_hdf5_write_data_contiguous(hdf5_file):
+    data = np.arange(20).reshape(10, 2)
+
+    h5_field = hdf5_write_data(hdf5_file, 'data', data, dtype=np.int32, contiguous=True)
+
+    assert np.array_equal(h5_field[()], data)
+    assert h5_field.dtype == np.int32
+    assert h5_field.chunks is None
+    assert h5_field.compression is None
+    assert h5_field.id.get_offset() is not None
+
+
+def test_hdf5_write_ragged_data(hdf5_file):
+    data = [[0, 1, 2], [], [3], [4, 5]]
+
+    h5_group = hdf5_write_ragged_data(hdf5_file, 'list_data', data, dtype=np.int32)
+
+    assert np.array_equal(h5_group['values'][()], [0, 1, 2, 3, 4, 5])
+    assert h5_group['values'].dtype == np.int32
+    assert np.array_equal(h5_group['offsets'][()], [0, 3, 3, 4, 6])
+    assert h5_group.attrs['fillvalue'] == -1
+    assert h5_group.attrs['width'] == 3
+
+
+def test_hdf5_write_ragged_data_empty_lists(hdf5_file):
+    h5_group = hdf5_write_ragged_data(hdf5_file, 'list_data', [[], []], dtype=np.int32)
+
+    assert h5_group['values'].shape == (0,)
+    assert np.array_equal(h5_group['offsets'][()], [0, 0, 0])
+    assert h5_group.attrs['width'] == 0
+
+
+@pytest.mark.parametrize('buffer_size', [1, 3, 100])
+def test_hdf5_write_stream(hdf5_file, buffer_size):
+    rows = (i * 2 for i in range(10))
+
+    h5_field = hdf5_write_stream(hdf5_file, 'data', rows, np.int32, buffer_size=buffer_size)
+
+    assert np.array_equal(h5_field[()], np.arange(10) * 2)
+    assert h5_field.dtype == np.int32
+    assert h5_field.compression == 'gzip'
+
+
+@pytest.mark.parametrize('buffer_size', [1, 2, 100])
+def test_hdf5_write_stream_pads_rows(hdf5_file, buffer_size):
+    rows = [[0], [1, 2, 3], [], [4, 5]]
+
+    h5_field = hdf5_write_stream(hdf5_file, 'data', rows, np.float32, buffer_size=buffer_size)
+
+    assert np.array_equal(h5_field[()], [[0, -1, -1], [1, 2, 3], [-1, -1, -1], [4, 5, -1]])
+
+
+@pytest.mark.parametrize('buffer_size', [1, 2, 100])
+def test_hdf5_write_stream_strings(hdf5_file, buffer_size):
+    rows = ['a', 'abc', 'ab']
+
+    h5_field = hdf5_write_stream(hdf5_file, 'data', rows, np.uint8, buffer_size=buffer_size,
+                                 strings=True)
+
+    assert np.array_equal(h5_field[()], str_to_ascii(rows))
+
+
+def test_hdf5_write_stream_empty(hdf5_file):
+    h5_field = hdf5_write_stream(hdf5_file, 'data', [], np.int32)
+
+    assert h5_field.shape == (0,)
+
+
+@pytest.mark.parametrize('buffer_size', [1, 2, 100])
+def test_hdf5_write_stream_ragged(hdf5_file, buffer_size):
+    data = [[0, 1, 2], [], [3], [4, 5]]
+
+    h5_group = hdf5_write_stream(hdf5_file, 'list_data', iter(data), np.int32, ragged=True,
+                                 buffer_size=buffer_size)
+    expected = hdf5_write_ragged_data(hdf5_file, 'expected', data, dtype=np.int32)
+
+    assert np.array_equal(h5_group['values'][()], expected['values'][()])
+    assert np.array_equal(h5_group['offsets'][()], expected['offsets'][()])
+    assert dict(h5_group.attrs) == dict(expected.attrs)
+
+
+def test_hdf5_stream_writer_buffers_rows(hdf5_file):
+    writer = HDF5StreamWriter(hdf5_file, 'data', np.int32, buffer_size=4)
+
+    writer.extend(range(6))
+
+    assert writer.nrows == 6
+    assert hdf5_file['data'].shape[0] == 4
+    writer.close()
+    assert np.array_equal(hdf5_file['data'][()], np.arange(6))
+
+
+def test_hdf5_write_union_set(hdf5_file):
+    for set_name in ('train', 'val'):
+        hdf5_file[set_name + '/object_fields'] = np.zeros((2, 4), dtype=np.uint8)
+        hdf5_file[set_name + '/classes'] = np.arange(3)
+
+    h5_group = hdf5_write_union_set(hdf5_file, 'trainval', ('train', 'val'), {
+        'classes': 'shared', 'list_boxes_per_image': ('concat', 'boxes')})
+
+    assert sorted(h5_group.keys()) == ['classes', 'object_fields']
+    assert h5_group['classes'].id == hdf5_file['train/classes'].id  # hard link
+    assert json.loads(h5_group.attrs['union']) == {
+        "sets": ['train', 'val'],
+        "fields": {"list_boxes_per_image": ['concat', 'boxes']}
+    }
+
+
+def test_hdf5_write_union_set_raises_error_invalid_mode(hdf5_file):
+    hdf5_file['train/object_fields'] = np.zeros((2, 4), dtype=np.uint8)
+
+    with pytest.raises(ValueError):
+        hdf5_write_union_set(hdf5_file, 'trainval', ('train',), {'classes': 'copy'})
@@ -0,0 +1,35 @@
+"""
+Test dbcollection/utils/os_dir.py.
+"""
+
+
+from dbcollection.utils.os_dir import get_files_fingerprint
+
+
+class TestGetFilesFingerprint:
+    """Unit tests for the get_files_fingerprint method."""
+
+    def test_same_files_same_fingerprint(self, tmpdir):
+        tmpdir.join('a.txt').write('data')
+        paths = [str(tmpdir.join('a.txt')), str(tmpdir.join('missing.txt'))]
+
+        assert get_files_fingerprint(paths) == get_files_fingerprint(paths[::-1])
+
+    def test_changed_file_changes_fingerprint(self, tmpdir):
+        tmpdir.join('a.txt').write('data')
+        fingerprint = get_files_fingerprint([str(tmpdir)])
+
+        tmpdir.join('a.txt').write('new data')
+
+        assert get_files_fingerprint([str(tmpdir)]) != fingerprint
+
+    def test_hash_contents_detects_same_size_changes(self, tmpdir):
+        filepath = tmpdir.join('a.txt')
+        filepath.write('data')
+        stat = filepath.stat()
+        fingerprint = get_files_fingerprint([str(filepath)], hash_contents=True)
+
+        filepath.write('atad')
+        filepath.setmtime(stat.mtime)
+
+        assert get_files_fingerprint([str(filepath)], hash_contents=True) != fingerprint
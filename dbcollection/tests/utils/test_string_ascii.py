@@ -63,3 +63,23 @@ def test_convert_ascii_to_str_single_string(sample, output):
 def test_convert_ascii_to_str_multiple_strings(sample, output):
     res = convert_ascii_to_str(np.array(sample, dtype=np.uint8))
     assert(output == res)
+
+def test_convert_ascii_to_str_removes_inner_zeros():
+    sample = np.array([[97, 0, 98, 0], [99, 100, 0, 0], [0, 0, 0, 0]], dtype=np.uint8)
+    res = convert_ascii_to_str(sample)
+    assert(['ab', 'cd', ''] == res)
+
+def test_convert_ascii_to_str_non_uint8_array():
+    sample = np.array([[111, 110, 101, 0], [116, 119, 111, 0]], dtype=np.int32)
+    res = convert_ascii_to_str(sample)
+    assert(['one', 'two'] == res)
+
+def test_convert_str_to_ascii_and_back_many_strings():
+    sample = ['image_{}.jpg'.format(i) for i in range(1000)]
+    res = convert_ascii_to_str(convert_str_to_ascii(sample))
+    assert(sample == res)
+
+def test_convert_str_to_ascii_and_back_latin1_strings():
+    sample = [u'caf\xe9', u'na\xefve']
+    res = convert_ascii_to_str(convert_str_to_ascii(sample))
+    assert(sample == res)
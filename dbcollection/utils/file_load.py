@@ -3,6 +3,7 @@ Library to load different types of file into memory.
 """
 
 
+import os
 import sys
 import json
 import scipy.io as scipy
@@ -107,3 +108,91 @@ def load_xml(fname):
     """
     assert fname, 'Must input a valid file name.'
     return xmltodict.parse(open(fname, mode='r').read())
+
+
+class ParseCache(object):
+    """Memoized parses of annotation files shared by several consumers.
+
+    Each consumer (e.g. a task of a dataset) registers the files it is going
+    to parse before it starts and unregisters them once it is done. A parse
+    is only kept in memory while other registered consumers still need it,
+    so the memory used is bounded by the files shared by pending consumers.
+
+    The parses are shared as they are (not copied), so consumers must not
+    modify them.
+
+    Attributes
+    ----------
+    hits : int
+        Number of parses served from memory.
+    misses : int
+        Number of files parsed.
+
+    """
+
+    def __init__(self):
+        """Initialize class."""
+        self._parses = {}
+        self._consumers = {}
+        self.hits = 0
+        self.misses = 0
+
+    def add_consumer(self, fnames):
+        """Registers a consumer of a list of files.
+
+        Parameters
+        ----------
+        fnames : list/tuple
+            File names + paths.
+
+        """
+        for fname in fnames:
+            key = os.path.abspath(fname)
+            self._consumers[key] = self._consumers.get(key, 0) + 1
+
+    def remove_consumer(self, fnames):
+        """Unregisters a consumer of a list of files and frees the unneeded parses.
+
+        Parameters
+        ----------
+        fnames : list/tuple
+            File names + paths (same as in add_consumer()).
+
+        """
+        for fname in fnames:
+            key = os.path.abspath(fname)
+            consumers = self._consumers.get(key, 0) - 1
+            if consumers > 0:
+                self._consumers[key] = consumers
+            else:
+                self._consumers.pop(key, None)
+                self._parses.pop(key, None)
+
+    def load(self, load_fn, fname):
+        """Parses a file, or returns its parse if it is in memory.
+
+        Parameters
+        ----------
+        load_fn : function
+            Function that parses the file (e.g. load_json).
+        fname : str
+            File name + path.
+
+        Returns
+        -------
+        dict/list
+            Data structure of the input file.
+
+        """
+        key = os.path.abspath(fname)
+        if key in self._parses:
+            self.hits += 1
+            return self._parses[key]
+        self.misses += 1
+        data = load_fn(fname)
+        if self._consumers.get(key, 0) > 1:
+            self._parses[key] = data
+        return data
+
+    def __len__(self):
+        return len(self._parses)
@@ -0,0 +1,98 @@
+"""
+Library of methods for grouping the indexes/values
+of a list by key (e.g., objects per class or per image).
+"""
+
+
+import numpy as np
+
+
+def group_by(keys, num_groups=None, values=None, unique=False, pad=False, fillvalue=-1):
+    """Groups the indexes (or values) of the elements of a list by key.
+
+    All groups are built at once by sorting the keys (O(N log N)), instead
+    of scanning all elements for each key.
+
+    Parameters
+    ----------
+    keys : list/np.ndarray
+        Key (group index) of each element. Keys out of the range
+        [0, num_groups) are ignored.
+    num_groups : int, optional
+        Number of groups. If None, it is set to the highest key + 1.
+    values : list/np.ndarray, optional
+        Value of each element to add to its group. If None, the indexes
+        of the elements are used.
+    unique : bool, optional
+        Sort the values of each group and remove duplicates. If False, the
+        values of each group are kept in the order of the elements.
+    pad : bool, optional
+        Return a matrix with the values of a group per row, padded with
+        'fillvalue', instead of a list of lists.
+    fillvalue : int/float, optional
+        Value to pad the groups.
+
+    Returns
+    -------
+    list/np.ndarray
+        List with the values of each group (or a matrix if 'pad' is True).
+
+    Examples
+    --------
+    Group the indexes of objects by class.
+
+    >>> from dbcollection.utils.group import group_by
+    >>> group_by([1, 0, 1, 2])
+    [[1], [0, 2], [3]]
+    >>> group_by([1, 0, 1], values=[5, 7, 5], unique=True)  # unique values per group
+    [[7], [5]]
+    >>> group_by([1, 0, 1], num_groups=3, pad=True)  # pad groups with -1 (default)
+    array([[ 1, -1],
+           [ 0,  2],
+           [-1, -1]])
+
+    """
+    values, offsets = _sort_groups(keys, num_groups, values, unique)
+    lengths = np.diff(offsets)
+
+    if pad:
+        width = lengths.max() if len(lengths) else 0
+        out = np.full((len(lengths), width), fillvalue, dtype=np.result_type(values, fillvalue))
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        cols = np.arange(len(values)) - np.repeat(offsets[:-1], lengths)
+        out[rows, cols] = values
+        return out
+
+    values = values.tolist()
+    return [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def _sort_groups(keys, num_groups, values, unique):
+    """Sorts the values by key and returns them with the offsets of each group."""
+    keys = np.asarray(keys, dtype=np.int64).reshape(-1)
+    if values is None:
+        values = np.arange(len(keys))
+    else:
+        values = np.asarray(values).reshape(-1)
+    assert len(values) == len(keys), 'Must input a value per key.'
+    if num_groups is None:
+        num_groups = int(keys.max()) + 1 if len(keys) else 0
+
+    valid = (keys >= 0) & (keys < num_groups)
+    if not valid.all():
+        keys, values = keys[valid], values[valid]
+
+    if unique:
+        order = np.lexsort((values, keys))
+    else:
+        order = np.argsort(keys, kind='mergesort')  # stable
+    keys, values = keys[order], values[order]
+
+    if unique and len(keys) > 1:
+        is_first = np.ones(len(keys), dtype=bool)
+        is_first[1:] = (keys[1:] != keys[:-1]) | (values[1:] != values[:-1])
+        keys, values = keys[is_first], values[is_first]
+
+    offsets = np.zeros(num_groups + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=num_groups), out=offsets[1:])
+    return values, offsets
@@ -3,11 +3,17 @@ hdf5 utility functions.
 """
 
 
+import json
+from itertools import chain
+
 import numpy as np
 
+from dbcollection.utils.string_ascii import convert_str_to_ascii
+
 
 def hdf5_write_data(h5_handler, field_name, data, dtype=None, chunks=True,
-                    compression="gzip", compression_opts=4, fillvalue=-1):
+                    compression="gzip", compression_opts=4, fillvalue=-1,
+                    contiguous=False):
     """Write/store data into a hdf5 file.
 
     Parameters
@@ -28,6 +34,10 @@ def hdf5_write_data(h5_handler, field_name, data, dtype=None, chunks=True,
         Compression option (range: [1,10])
     fillvalue : int/float, optional
         Value to pad the data.
+    contiguous : bool, optional
+        Store the data uncompressed with a contiguous layout if True.
+        This overrides the 'chunks' and 'compression' options and allows
+        the field to be memory-mapped when loaded.
 
     Returns
     -------
@@ -41,6 +51,9 @@ def hdf5_write_data(h5_handler, field_name, data, dtype=None, chunks=True,
     if dtype is None:
         dtype = data.dtype
 
+    if contiguous:
+        chunks, compression, compression_opts = None, None, None
+
     h5_field = h5_handler.create_dataset(name=field_name,
                                          data=data,
                                          shape=data.shape,
@@ -50,3 +63,436 @@ def hdf5_write_data(h5_handler, field_name, data, dtype=None, chunks=True,
                                          compression_opts=compression_opts,
                                          fillvalue=fillvalue)
     return h5_field
+
+
+def hdf5_write_ragged_data(h5_handler, field_name, data, dtype=None, chunks=True,
+                           compression="gzip", compression_opts=4, fillvalue=-1,
+                           contiguous=False):
+    """Write/store a list of variable-length lists into a hdf5 file.
+
+    Instead of padding all lists to the length of the longest one, the data is
+    stored in a ragged (CSR) layout: a group containing a 'values' dataset with
+    all lists concatenated and an 'offsets' dataset, where the i'th list is
+    stored in values[offsets[i]:offsets[i+1]].
+
+    Parameters
+    ----------
+    h5_handler : h5py._hl.group.Group
+        Handler for an HDF5 group object.
+    field_name : str
+        Field name.
+    data : list
+        List of lists of values.
+    dtype : np.dtype, optional
+        Data type.
+    chunks : bool, optional
+        Store data as chunks if True.
+    compression : str, optional
+        Compression algorithm type.
+    compression_opts : int, optional
+        Compression option (range: [1,10])
+    fillvalue : int/float, optional
+        Value used to pad the lists when the data is retrieved as a matrix.
+    contiguous : bool, optional
+        Store the values uncompressed with a contiguous layout if True.
+
+    Returns
+    -------
+    h5py._hl.group.Group
+        Handler for an HDF5 group object.
+    """
+    assert h5_handler, "Must input a hdf5 file handler"
+    assert field_name, 'Must input a field name.'
+    assert isinstance(data, (list, tuple)), 'Data must be a list of lists.'
+
+    lengths = np.array([len(row) for row in data], dtype=np.int64)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.array(list(chain.from_iterable(data)), dtype=dtype)
+
+    h5_group = h5_handler.create_group(field_name)
+    hdf5_write_data(h5_group, 'values', values, chunks=chunks, compression=compression,
+                    compression_opts=compression_opts, fillvalue=fillvalue,
+                    contiguous=contiguous)
+    hdf5_write_data(h5_group, 'offsets', offsets, chunks=chunks, compression=compression,
+                    compression_opts=compression_opts, fillvalue=0)
+    h5_group.attrs['fillvalue'] = fillvalue
+    h5_group.attrs['width'] = lengths.max() if len(lengths) else 0
+    return h5_group
+
+
+class HDF5StreamWriter(object):
+    """Writes a field into a hdf5 file incrementally (row by row).
+
+    The rows are buffered and appended in blocks to a resizable chunked
+    dataset, so only 'buffer_size' rows are kept in memory at a time. The
+    dataset grows geometrically and it is trimmed to the number of rows
+    written when the writer is closed.
+
+    Rows can be scalars or lists/arrays of values (or strings, if 'strings'
+    is True). Rows of different lengths are padded with 'fillvalue' to the
+    length of the longest row written (the dataset is widened when a longer
+    row is appended), so the stored data is the same as the one stored by
+    hdf5_write_data() for the padded matrix of all rows.
+
+    Parameters
+    ----------
+    h5_handler : h5py._hl.group.Group
+        Handler for an HDF5 group object.
+    field_name : str
+        Field name.
+    dtype : np.dtype
+        Data type.
+    buffer_size : int, optional
+        Number of rows buffered in memory before they are written.
+    strings : bool, optional
+        The rows are strings, stored as ASCII arrays (see
+        convert_str_to_ascii()).
+    chunks : bool/tuple, optional
+        Chunk shape (or True to let h5py guess it from the first block).
+    compression : str, optional
+        Compression algorithm type.
+    compression_opts : int, optional
+        Compression option (range: [1,10])
+    fillvalue : int/float, optional
+        Value to pad the data.
+
+    Attributes
+    ----------
+    h5_handler : h5py._hl.group.Group
+        Handler for an HDF5 group object.
+    field_name : str
+        Field name.
+    dtype : np.dtype
+        Data type.
+    buffer_size : int
+        Number of rows buffered in memory before they are written.
+    nrows : int
+        Number of rows written (including the buffered rows).
+    width : int
+        Length of the longest row written (0 for scalar rows).
+
+    """
+
+    def __init__(self, h5_handler, field_name, dtype, buffer_size=4096, strings=False,
+                 chunks=True, compression="gzip", compression_opts=4, fillvalue=-1):
+        """Initialize class."""
+        assert h5_handler, "Must input a hdf5 file handler"
+        assert field_name, 'Must input a field name.'
+        assert buffer_size > 0, 'Must input a valid buffer size.'
+        self.h5_handler = h5_handler
+        self.field_name = field_name
+        self.dtype = np.dtype(dtype)
+        self.buffer_size = buffer_size
+        self.strings = strings
+        self.chunks = chunks
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.fillvalue = 0 if strings else fillvalue
+        self.nrows = 0
+        self.width = 0
+        self._buffer = []
+        self._dataset = None
+
+    def append(self, row):
+        """Appends a row to the field."""
+        self._buffer.append(row)
+        self.nrows += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def extend(self, rows):
+        """Appends all rows of an iterable (e.g. a generator) to the field."""
+        for row in rows:
+            self.append(row)
+
+    def flush(self):
+        """Writes the buffered rows to the dataset."""
+        if not self._buffer:
+            return
+        block = self._get_block(self._buffer)
+        self._buffer = []
+        nrows = self.nrows - len(block)
+        if self._dataset is None:
+            self._dataset = self.h5_handler.create_dataset(
+                name=self.field_name,
+                shape=block.shape,
+                maxshape=(None,) * block.ndim,
+                dtype=self.dtype,
+                chunks=self.chunks,
+                compression=self.compression,
+                compression_opts=self.compression_opts,
+                fillvalue=self.fillvalue)
+        else:
+            self._reserve(nrows + len(block), block.shape[1:])
+        if block.ndim > 1:
+            self._dataset[nrows:nrows + len(block), :block.shape[1]] = block
+        else:
+            self._dataset[nrows:nrows + len(block)] = block
+
+    def _get_block(self, rows):
+        if self.strings:
+            block = convert_str_to_ascii(list(rows)).reshape(len(rows), -1)
+        elif any(isinstance(row, (list, tuple, np.ndarray)) for row in rows):
+            lengths = [len(row) for row in rows]
+            block = np.full((len(rows), max(lengths)), self.fillvalue, dtype=self.dtype)
+            for i, row in enumerate(rows):
+                block[i, :lengths[i]] = row
+        else:
+            block = np.asarray(rows, dtype=self.dtype)
+        if block.ndim > 1:
+            self.width = max(self.width, block.shape[1])
+        return block
+
+    def _reserve(self, nrows, row_shape):
+        """Grows the dataset to fit a number of rows (and wider rows)."""
+        shape = self._dataset.shape
+        new_shape = (shape[0] if shape[0] >= nrows else max(nrows, 2 * shape[0]),)
+        new_shape += tuple(max(size, new_size) for size, new_size in zip(shape[1:], row_shape))
+        if new_shape != shape:
+            self._dataset.resize(new_shape)
+
+    def close(self):
+        """Writes the buffered rows and trims the dataset to the rows written.
+
+        Returns
+        -------
+        h5py._hl.dataset.Dataset
+            Handler for an HDF5 dataset object.
+
+        """
+        self.flush()
+        if self._dataset is None:
+            shape = (0, 0) if self.strings else (0,)
+            self._dataset = self.h5_handler.create_dataset(
+                name=self.field_name,
+                shape=shape,
+                maxshape=(None,) * len(shape),
+                dtype=self.dtype,
+                chunks=self.chunks,
+                compression=self.compression,
+                compression_opts=self.compression_opts,
+                fillvalue=self.fillvalue)
+        elif self._dataset.shape[0] != self.nrows:
+            self._dataset.resize(self.nrows, axis=0)
+        return self._dataset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def __str__(self):
+        return 'HDF5StreamWriter: field<{}>, rows<{}>'.format(self.field_name, self.nrows)
+
+    def __repr__(self):
+        return str(self)
+
+
+class HDF5RaggedStreamWriter(object):
+    """Writes a field of variable-length lists into a hdf5 file incrementally.
+
+    The lists are stored in the same ragged layout as the one of
+    hdf5_write_ragged_data(), with its 'values' and 'offsets' datasets
+    written by HDF5StreamWriters.
+
+    Parameters
+    ----------
+    h5_handler : h5py._hl.group.Group
+        Handler for an HDF5 group object.
+    field_name : str
+        Field name.
+    dtype : np.dtype
+        Data type.
+    buffer_size : int, optional
+        Number of values (and offsets) buffered in memory before they are
+        written.
+    chunks : bool/tuple, optional
+        Chunk shape (or True to let h5py guess it).
+    compression : str, optional
+        Compression algorithm type.
+    compression_opts : int, optional
+        Compression option (range: [1,10])
+    fillvalue : int/float, optional
+        Value used to pad the lists when the data is retrieved as a matrix.
+
+    Attributes
+    ----------
+    nrows : int
+        Number of lists written.
+    width : int
+        Length of the longest list written.
+
+    """
+
+    def __init__(self, h5_handler, field_name, dtype, buffer_size=4096, chunks=True,
+                 compression="gzip", compression_opts=4, fillvalue=-1):
+        """Initialize class."""
+        assert h5_handler, "Must input a hdf5 file handler"
+        assert field_name, 'Must input a field name.'
+        self.h5_group = h5_handler.create_group(field_name)
+        self.fillvalue = fillvalue
+        self.values = HDF5StreamWriter(self.h5_group, 'values', dtype, buffer_size,
+                                       chunks=chunks, compression=compression,
+                                       compression_opts=compression_opts, fillvalue=fillvalue)
+        self.offsets = HDF5StreamWriter(self.h5_group, 'offsets', np.int64, buffer_size,
+                                        chunks=chunks, compression=compression,
+                                        compression_opts=compression_opts, fillvalue=0)
+        self.offsets.append(0)
+        self.nrows = 0
+        self.width = 0
+
+    def append(self, row):
+        """Appends a list of values to the field."""
+        self.values.extend(row)
+        self.offsets.append(self.values.nrows)
+        self.nrows += 1
+        self.width = max(self.width, len(row))
+
+    def extend(self, rows):
+        """Appends all lists of an iterable (e.g. a generator) to the field."""
+        for row in rows:
+            self.append(row)
+
+    def close(self):
+        """Writes the buffered values and offsets.
+
+        Returns
+        -------
+        h5py._hl.group.Group
+            Handler for an HDF5 group object.
+
+        """
+        self.values.close()
+        self.offsets.close()
+        self.h5_group.attrs['fillvalue'] = self.fillvalue
+        self.h5_group.attrs['width'] = self.width
+        return self.h5_group
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def __str__(self):
+        return 'HDF5RaggedStreamWriter: field<{}>, rows<{}>'.format(
+            self.h5_group.name, self.nrows)
+
+    def __repr__(self):
+        return str(self)
+
+
+def hdf5_write_stream(h5_handler, field_name, rows, dtype, ragged=False, **kwargs):
+    """Writes the rows of an iterable (e.g. a generator) into a hdf5 file.
+
+    See HDF5StreamWriter (or HDF5RaggedStreamWriter, if 'ragged' is True)
+    for the other options.
+
+    Parameters
+    ----------
+    h5_handler : h5py._hl.group.Group
+        Handler for an HDF5 group object.
+    field_name : str
+        Field name.
+    rows : iterable
+        Rows of the field.
+    dtype : np.dtype
+        Data type.
+    ragged : bool, optional
+        Store the rows (lists) in the ragged layout of hdf5_write_ragged_data().
+
+    Returns
+    -------
+    h5py._hl.dataset.Dataset/h5py._hl.group.Group
+        Handler for the HDF5 dataset (or group, if ragged) object.
+
+    """
+    if ragged:
+        writer = HDF5RaggedStreamWriter(h5_handler, field_name, dtype, **kwargs)
+    else:
+        writer = HDF5StreamWriter(h5_handler, field_name, dtype, **kwargs)
+    writer.extend(rows)
+    return writer.close()
+
+
+UNION_FIELD_MODES = ('shared', 'concat', 'merge')
+
+
+def hdf5_write_union_set(h5_handler, set_name, sets, fields=None):
+    """Store a set as the union of other sets without copying their data.
+
+    The union set is stored as a group with the list of sets it is composed
+    of and how each field is combined (in the 'union' attribute). The rows
+    of the fields of the sets are concatenated by the loaders when the data
+    is read (see UnionSetLoader).
+
+    Fields are combined in one of the following modes:
+
+    - 'shared': the field is equal in all sets (e.g. list of classes). It is
+      stored as a hard link to the field of the first set.
+    - 'concat' (default): the rows of the field in all sets are concatenated.
+    - 'merge': the rows of the field have the same meaning in all sets (e.g.
+      a list of objects per class). The values of the i'th row of all sets
+      are combined into the i'th row of the union.
+
+    Fields whose values are row indexes of another field (e.g. 'object_ids'
+    or the 'list_*' fields) are remapped by adding the number of rows of the
+    referenced field in the preceding sets. The columns of 'object_ids' are
+    remapped w.r.t. the fields in 'object_fields'. The remaining fields must
+    be declared as a (mode, referenced field) pair.
+
+    Parameters
+    ----------
+    h5_handler : h5py._hl.group.Group
+        Handler for the hdf5 group containing the sets (e.g. the file).
+    set_name : str
+        Name of the union set.
+    sets : list/tuple
+        Names of the sets to combine (in order).
+    fields : dict, optional
+        Mode (or (mode, referenced field) pair) of each field. By default,
+        fields are concatenated without remapping their values.
+
+    Returns
+    -------
+    h5py._hl.group.Group
+        Handler for an HDF5 group object.
+
+    Raises
+    ------
+    ValueError
+        If the mode of a field is not valid.
+
+    Examples
+    --------
+    >>> hdf5_write_union_set(fileh5, 'trainval', ('train', 'val'), {
+    ...     'classes': 'shared',
+    ...     'list_boxes_per_image': ('concat', 'boxes'),
+    ...     'list_object_ids_per_class': ('merge', 'object_ids')})
+
+    """
+    assert h5_handler, "Must input a hdf5 file handler"
+    assert set_name, 'Must input a set name.'
+    assert sets, 'Must input the sets of the union.'
+
+    union_fields = {}
+    for field, mode in (fields or {}).items():
+        mode, target = (mode, None) if isinstance(mode, str) else tuple(mode)
+        if mode not in UNION_FIELD_MODES:
+            raise ValueError('Invalid union mode \'{}\' for field \'{}\'. Valid modes: {}'
+                             .format(mode, field, UNION_FIELD_MODES))
+        if mode != 'shared':
+            union_fields[field] = (mode, target)
+
+    source_group = h5_handler[sets[0]]
+    h5_group = h5_handler.create_group(set_name)
+    h5_group['object_fields'] = source_group['object_fields']  # hard links
+    for field, mode in (fields or {}).items():
+        if mode == 'shared':
+            h5_group[field] = source_group[field]
+    h5_group.attrs['union'] = json.dumps({"sets": list(sets), "fields": union_fields})
+    return h5_group
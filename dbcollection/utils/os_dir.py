@@ -5,6 +5,7 @@ This module contains methods for parsing directories
 
 from __future__ import print_function
 import os
+import hashlib
 import progressbar
 
 
@@ -140,3 +141,46 @@ def construct_dataset_from_dir(dir_path, verbose=True):
         dataset[set_name] = construct_set_from_dir(dir_set)
 
     return dataset
+
+
+def get_files_fingerprint(paths, hash_contents=False):
+    """Returns a fingerprint of a list of files and directories.
+
+    The fingerprint is a hash of the path, size and modification time of
+    each file (the files of the directories are listed recursively). Missing
+    paths are part of the fingerprint as well.
+
+    Parameters
+    ----------
+    paths : list/tuple
+        Paths of files and/or directories.
+    hash_contents : bool, optional
+        Hash the contents of the files as well (slower, but detects changes
+        that keep the size and modification time).
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the fingerprint.
+
+    """
+    fingerprint = hashlib.sha1()
+    for path in sorted(os.path.abspath(path) for path in paths):
+        if os.path.isdir(path):
+            filenames = sorted(os.path.join(root, filename)
+                               for root, _, filenames in os.walk(path) for filename in filenames)
+        else:
+            filenames = [path]
+        for filename in filenames:
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                fingerprint.update('{}:missing;'.format(filename).encode('utf-8'))
+                continue
+            fingerprint.update('{}:{}:{};'.format(filename, stat.st_size, stat.st_mtime)
+                               .encode('utf-8'))
+            if hash_contents:
+                with open(filename, 'rb') as f:
+                    for block in iter(lambda: f.read(1 << 20), b''):
+                        fingerprint.update(block)
+    return fingerprint.hexdigest()
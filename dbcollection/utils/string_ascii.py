@@ -4,6 +4,7 @@ String-to-ascii and ascii-to-string convertion methods.
 
 
 import numpy as np
+import six
 
 
 def str_to_ascii(input_str):
@@ -31,7 +32,7 @@ def str_to_ascii(input_str):
     array([115, 116, 114, 105, 110, 103,  49], dtype=uint8)
 
     """
-    return np.array([ord(c) for c in input_str], dtype=np.uint8)
+    return _encode_strings([input_str]).reshape(-1)
 
 
 def ascii_to_str(input_array):
@@ -57,7 +58,8 @@ def ascii_to_str(input_array):
     'string1'
 
     """
-    return "".join([chr(item) for item in input_array])
+    input_array = np.asarray(input_array, dtype=np.uint8)
+    return _decode_bytes(input_array.tobytes())
 
 
 def convert_str_to_ascii(inp_str):
@@ -103,15 +105,12 @@ def convert_str_to_ascii(inp_str):
     if not isinstance(inp_str, list):
         inp_str = [inp_str]
 
-    # get max size of the list strings
-    max_size = max([len(a) for a in inp_str])
+    # encode all strings at once into a zero padded matrix
+    encoded = _encode_strings(inp_str)
 
-    # allocate array
-    ascii_array = np.zeros([len(inp_str), max_size + 1], dtype=np.uint8)
-
-    # iteratively copy data to the array
-    for i, val in enumerate(inp_str):
-        ascii_array[i, :len(val)] = str_to_ascii(val)
+    # allocate array with an extra zero at the end of each string
+    ascii_array = np.zeros([len(inp_str), encoded.shape[1] + 1], dtype=np.uint8)
+    ascii_array[:, :encoded.shape[1]] = encoded
 
     if len(inp_str) > 1:
         return ascii_array
@@ -144,8 +143,61 @@ def convert_ascii_to_str(input_array):
     ['string1']
 
     """
-    list_str = input_array.tolist()
+    input_array = np.asarray(input_array)
     if input_array.ndim > 1:
-        return [ascii_to_str(list(filter(lambda x: x > 0, str_))) for str_ in list_str]
+        return _decode_strings(input_array).tolist()
     else:
-        return ascii_to_str(list(filter(lambda x: x > 0, list_str)))
+        return _decode_strings(input_array[None, :]).tolist()[0]
+
+
+def _encode_strings(strings):
+    """Encodes a list of strings into a zero padded matrix of ASCII values.
+
+    All strings are converted at once to a fixed-width bytes array,
+    which is then viewed as a uint8 matrix. The width of the matrix
+    is equal to the size of the longest string.
+    """
+    try:
+        fixed = np.array(strings, dtype=np.bytes_)
+    except UnicodeError:
+        fixed = np.char.encode(np.array(strings, dtype='U'), 'latin-1')
+    if fixed.ndim != 1:
+        raise TypeError('Input must be a string or a list of strings.')
+    max_size = int(np.char.str_len(fixed).max()) if fixed.size else 0
+    matrix = fixed.view(np.uint8).reshape(len(strings), fixed.dtype.itemsize)
+    return matrix[:, :max_size]
+
+
+def _decode_strings(input_array):
+    """Decodes a zero padded matrix of ASCII values into an array of strings.
+
+    The matrix is viewed as a fixed-width bytes array (which drops the
+    trailing zeros of each row) and decoded in a single pass. Rows with
+    zeros in the middle of the string are decoded by removing all zeros.
+    """
+    input_array = np.ascontiguousarray(input_array, dtype=np.uint8)
+    if input_array.shape[-1] == 0:
+        return np.full(input_array.shape[:-1], '', dtype=object)
+
+    inner_zeros = (input_array[..., :-1] == 0) & (input_array[..., 1:] != 0)
+    if inner_zeros.any():
+        input_array = input_array.copy()
+        for idx in zip(*np.nonzero(inner_zeros.any(axis=-1))):
+            row = input_array[idx]
+            nonzero = row[row > 0]
+            row[:] = 0
+            row[:len(nonzero)] = nonzero
+
+    fixed = input_array.view('S{}'.format(input_array.shape[-1]))[..., 0]
+    if six.PY2:
+        return fixed
+    try:
+        return fixed.astype('U')
+    except UnicodeError:
+        return np.char.decode(fixed, 'latin-1')
+
+
+def _decode_bytes(data):
+    if six.PY2:
+        return data
+    return data.decode('latin-1')